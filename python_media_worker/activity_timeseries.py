@@ -0,0 +1,126 @@
+"""Sorted, binary-searchable time series for director and audit lookups.
+
+Activity, motion and subject tracks travel through the worker as lists of
+dicts or ``(time, value)`` tuples, and the director samples them thousands
+of times per render.  ``TimeSeries`` holds one track as sorted NumPy arrays,
+so nearest-sample lookups are a ``searchsorted``, windowed medians only
+touch the samples inside the window, and range means come from prefix sums.
+
+Call sites keep passing the original lists; the worker memoizes the
+conversion per list for the current job with ``job_cache.JobScopedCache``.
+"""
+
+import numpy as np
+
+
+class TimeSeries:
+    __slots__ = ("times", "values", "_prefix")
+
+    # Targets gathered per block in ``rolling_median``; bounds the padded matrix.
+    _ROLLING_BLOCK = 4096
+
+    def __init__(self, times, values):
+        times = np.asarray(times, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        # Stable, so samples sharing a timestamp keep their list order.
+        order = np.argsort(times, kind="stable")
+        self.times = times[order]
+        self.values = values[order]
+        self._prefix = None
+
+    @classmethod
+    def from_points(cls, points, time_of, value_of):
+        """Build from arbitrary points, skipping those ``time_of``/``value_of`` reject."""
+        times = []
+        values = []
+        for point in points or []:
+            try:
+                point_time = float(time_of(point))
+                point_value = float(value_of(point))
+            except Exception:
+                continue
+            times.append(point_time)
+            values.append(point_value)
+        return cls(times, values)
+
+    def __len__(self):
+        return int(self.times.size)
+
+    def nearest_index(self, timestamp):
+        """Index of the sample closest to ``timestamp`` (the earlier one on a tie)."""
+        if not self.times.size:
+            return None
+        target = float(timestamp)
+        right = int(np.searchsorted(self.times, target, side="left"))
+        if right <= 0:
+            return 0
+        if right >= self.times.size:
+            return int(self.times.size - 1)
+        left = right - 1
+        # Equal timestamps: the first of the run is the first in list order.
+        if target - self.times[left] <= self.times[right] - target:
+            return int(np.searchsorted(self.times, self.times[left], side="left"))
+        return right
+
+    def nearest(self, timestamp, default=None):
+        index = self.nearest_index(timestamp)
+        return default if index is None else float(self.values[index])
+
+    def index_at_or_before(self, timestamp):
+        index = int(np.searchsorted(self.times, float(timestamp), side="right")) - 1
+        if index < 0:
+            return None
+        return int(np.searchsorted(self.times, self.times[index], side="left"))
+
+    def index_at_or_after(self, timestamp):
+        index = int(np.searchsorted(self.times, float(timestamp), side="left"))
+        return index if index < self.times.size else None
+
+    def values_within(self, timestamp, half_window):
+        """Values with ``|time - timestamp| <= half_window``."""
+        target = float(timestamp)
+        lo = int(np.searchsorted(self.times, target - half_window, side="left"))
+        hi = int(np.searchsorted(self.times, target + half_window, side="right"))
+        return self.values[lo:hi]
+
+    def median_within(self, timestamp, half_window, default=None):
+        values = self.values_within(timestamp, half_window)
+        values = values[~np.isnan(values)]
+        return float(np.median(values)) if values.size else default
+
+    def rolling_median(self, timestamps, half_window):
+        """``median_within`` for many timestamps; NaN where no sample is in range."""
+        targets = np.asarray(timestamps, dtype=np.float64)
+        lows = np.searchsorted(self.times, targets - half_window, side="left")
+        highs = np.searchsorted(self.times, targets + half_window, side="right")
+        lows = lows.ravel()
+        counts = highs.ravel() - lows
+        medians = np.full(lows.shape, np.nan)
+        width = int(counts.max()) if counts.size else 0
+        if width:
+            # One padded [targets, width] gather; NaN padding and NaN samples
+            # sort to the end, so the middle of the first ``valid`` entries is
+            # the median, averaging the two middles like ``np.median``.
+            offsets = np.arange(width)
+            for first in range(0, lows.size, self._ROLLING_BLOCK):
+                block = slice(first, first + self._ROLLING_BLOCK)
+                positions = lows[block, None] + offsets
+                inside = offsets < counts[block, None]
+                windows = np.where(inside, self.values[np.minimum(positions, self.times.size - 1)], np.nan)
+                windows.sort(axis=1)
+                valid = np.count_nonzero(~np.isnan(windows), axis=1)
+                rows = np.flatnonzero(valid)
+                lower = windows[rows, (valid[rows] - 1) // 2]
+                upper = windows[rows, valid[rows] // 2]
+                medians[block][rows] = (lower + upper) / 2.0
+        return medians.reshape(targets.shape)
+
+    def mean_between(self, start, end, default=None):
+        """Mean of samples with ``start <= time < end`` in O(log N)."""
+        if self._prefix is None:
+            self._prefix = np.concatenate([[0.0], np.cumsum(np.nan_to_num(self.values))])
+        lo = int(np.searchsorted(self.times, float(start), side="left"))
+        hi = int(np.searchsorted(self.times, float(end), side="left"))
+        if hi <= lo:
+            return default
+        return float((self._prefix[hi] - self._prefix[lo]) / (hi - lo))
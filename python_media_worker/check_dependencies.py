@@ -1,11 +1,4 @@
 import sys
-try:
-    from scenedetect import VideoManager, SceneManager
-    from scenedetect.detectors import ContentDetector
-    print("scenedetect: OK")
-except ImportError:
-    print("scenedetect: MISSING")
-
 try:
     import cv2
     print("cv2: OK")
@@ -0,0 +1,271 @@
+"""Chunked, parallel Whisper transcription helpers.
+
+Long inputs are split at silence boundaries into ~30-120 s chunks, each chunk
+is decoded straight to a 16 kHz mono float32 array, and chunks are
+transcribed concurrently against one model instance that was loaded with
+several CTranslate2 workers (faster-whisper releases the GIL while decoding).
+Where no silence falls inside the allowed chunk range the split is forced at
+the maximum length and neighbouring chunks overlap slightly; stitching keeps
+each word (or word-less segment) only in the chunk that owns its midpoint,
+so overlap audio is transcribed twice but emitted once.
+
+Nothing here imports the worker module; the transcription callable is passed
+in so the chunking/stitching logic stays testable without Whisper.
+"""
+
+import logging
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+logger = logging.getLogger("MediaWorker")
+
+TRANSCRIPTION_SAMPLE_RATE = 16000
+TRANSCRIPTION_CHUNK_MIN_SECONDS = 30.0
+TRANSCRIPTION_CHUNK_TARGET_SECONDS = 75.0
+TRANSCRIPTION_CHUNK_MAX_SECONDS = 120.0
+TRANSCRIPTION_CHUNK_OVERLAP_SECONDS = 1.5
+
+
+def plan_transcription_chunks(
+    duration,
+    silence_intervals=None,
+    min_seconds=TRANSCRIPTION_CHUNK_MIN_SECONDS,
+    target_seconds=TRANSCRIPTION_CHUNK_TARGET_SECONDS,
+    max_seconds=TRANSCRIPTION_CHUNK_MAX_SECONDS,
+    overlap_seconds=TRANSCRIPTION_CHUNK_OVERLAP_SECONDS,
+):
+    """Split ``[0, duration)`` into chunks that end inside silences when possible.
+
+    Each chunk has an owned range ``[start, end)`` (chunks tile the input) and
+    an audio range ``[audio_start, audio_end)`` that is widened by
+    ``overlap_seconds`` on sides that were force-split mid-speech.
+    """
+    safe_duration = max(0.0, float(duration or 0.0))
+    min_seconds = max(1.0, float(min_seconds))
+    max_seconds = max(min_seconds, float(max_seconds))
+    target_seconds = min(max_seconds, max(min_seconds, float(target_seconds)))
+    split_points = sorted(
+        (float(start) + float(end)) / 2.0
+        for start, end in silence_intervals or []
+        if float(end) > float(start)
+    )
+
+    chunks = []
+    cursor = 0.0
+    while cursor < safe_duration - 1e-6:
+        remaining = safe_duration - cursor
+        if remaining <= max_seconds:
+            end, forced = safe_duration, False
+        else:
+            candidates = [point for point in split_points if cursor + min_seconds <= point <= cursor + max_seconds]
+            if candidates:
+                end = min(candidates, key=lambda point: abs(point - (cursor + target_seconds)))
+                forced = False
+            else:
+                end, forced = cursor + max_seconds, True
+            # Never leave a sliver shorter than the minimum chunk at the tail.
+            if safe_duration - end < min_seconds:
+                end, forced = safe_duration, False
+        chunks.append({"index": len(chunks), "start": cursor, "end": end, "forced_end": forced})
+        cursor = end
+
+    for index, chunk in enumerate(chunks):
+        forced_start = index > 0 and chunks[index - 1]["forced_end"]
+        chunk["audio_start"] = max(0.0, chunk["start"] - (overlap_seconds if forced_start else 0.0))
+        chunk["audio_end"] = min(safe_duration, chunk["end"] + (overlap_seconds if chunk["forced_end"] else 0.0))
+        for key in ("start", "end", "audio_start", "audio_end"):
+            chunk[key] = round(chunk[key], 3)
+    return chunks
+
+
+def load_transcription_audio_window(input_path, start_time, duration, sample_rate=TRANSCRIPTION_SAMPLE_RATE):
+    """Decode one window of ``input_path`` to mono float32 samples for Whisper."""
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-ss",
+        f"{max(0.0, float(start_time or 0.0)):.3f}",
+        "-t",
+        f"{max(0.01, float(duration or 0.0)):.3f}",
+        "-i",
+        input_path,
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        str(int(sample_rate)),
+        "-f",
+        "s16le",
+        "-",
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"chunk audio decode failed: {result.stderr.decode('utf-8', errors='ignore')[-400:]}"
+        )
+    return np.frombuffer(result.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def iter_transcription_audio_blocks(
+    input_path,
+    sample_rate=TRANSCRIPTION_SAMPLE_RATE,
+    block_seconds=10.0,
+    audio_filter=None,
+    log_file=None,
+):
+    """Yield ``input_path`` as consecutive 16 kHz mono int16 blocks from one ffmpeg pipe.
+
+    ``audio_filter`` runs on the decoded source audio before resampling
+    (``silencedetect`` here, so one decode also yields silences); its log
+    goes to ``log_file`` at info level when one is given.
+    """
+    cmd = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "info" if log_file is not None else "error", "-i", input_path, "-vn"]
+    if audio_filter:
+        cmd.extend(["-af", audio_filter])
+    cmd.extend(["-ac", "1", "-ar", str(int(sample_rate)), "-f", "s16le", "-"])
+    block_bytes = max(2, int(float(block_seconds) * sample_rate)) * 2
+    with tempfile.TemporaryFile() as own_log_file:
+        stderr_file = log_file if log_file is not None else own_log_file
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+        try:
+            while True:
+                buffer = process.stdout.read(block_bytes)
+                if not buffer:
+                    break
+                yield np.frombuffer(buffer[: len(buffer) - (len(buffer) % 2)], dtype=np.int16)
+        finally:
+            process.stdout.close()
+            if process.poll() is None:
+                process.kill()
+            returncode = process.wait()
+        if returncode != 0:
+            stderr_file.seek(0)
+            raise RuntimeError(
+                f"audio block decode failed: {stderr_file.read().decode('utf-8', errors='ignore')[-400:]}"
+            )
+
+
+def _owns(chunk, start, end):
+    midpoint = (float(start) + float(end)) / 2.0
+    return chunk["start"] <= midpoint < chunk["end"] or (
+        midpoint >= chunk["end"] and chunk.get("is_last")
+    )
+
+
+def stitch_transcription_chunks(chunk_results):
+    """Merge per-chunk Whisper results into one ``segments``/``words`` result.
+
+    ``chunk_results`` is ``[(chunk, result), ...]`` where result times are
+    relative to ``chunk["audio_start"]``.
+    """
+    ordered = sorted(chunk_results, key=lambda item: item[0]["start"])
+    if ordered:
+        ordered[-1] = ({**ordered[-1][0], "is_last": True}, ordered[-1][1])
+
+    segments = []
+    languages = []
+    for chunk, result in ordered:
+        offset = float(chunk["audio_start"])
+        if (result or {}).get("language"):
+            languages.append(result["language"])
+        for segment in (result or {}).get("segments") or []:
+            raw_words = segment.get("words") or []
+            words = [
+                {
+                    **word,
+                    "start": round(float(word.get("start", 0.0) or 0.0) + offset, 3),
+                    "end": round(float(word.get("end", 0.0) or 0.0) + offset, 3),
+                }
+                for word in raw_words
+            ]
+            if raw_words:
+                words = [word for word in words if _owns(chunk, word["start"], word["end"])]
+                if not words:
+                    continue
+                start, end = words[0]["start"], words[-1]["end"]
+                if len(words) == len(raw_words):
+                    text = str(segment.get("text") or "")
+                else:
+                    text = "".join(str(word.get("word") or "") for word in words)
+            else:
+                start = round(float(segment.get("start", 0.0) or 0.0) + offset, 3)
+                end = round(float(segment.get("end", 0.0) or 0.0) + offset, 3)
+                if not _owns(chunk, start, end):
+                    continue
+                text = str(segment.get("text") or "")
+            segments.append({**segment, "id": len(segments), "start": start, "end": end, "text": text, "words": words})
+
+    language = max(set(languages), key=languages.count) if languages else None
+    return {
+        "text": " ".join(segment["text"].strip() for segment in segments).strip(),
+        "segments": segments,
+        "language": language,
+        "duration": ordered[-1][0]["end"] if ordered else 0.0,
+    }
+
+
+def transcribe_chunks_in_parallel(input_path, chunks, transcribe_chunk, workers=1, language=None):
+    """Transcribe ``chunks`` of ``input_path`` with ``transcribe_chunk(audio, language)``.
+
+    When ``language`` is unknown the first chunk runs alone and its detected
+    language is pinned for the rest, so chunks cannot disagree.  Returns
+    ``(stitched_result, receipt)``.
+    """
+    started_at = time.perf_counter()
+    timings = {}
+
+    def run_chunk(chunk, chunk_language):
+        chunk_started_at = time.perf_counter()
+        audio = load_transcription_audio_window(
+            input_path,
+            chunk["audio_start"],
+            chunk["audio_end"] - chunk["audio_start"],
+        )
+        result = transcribe_chunk(audio, chunk_language)
+        timings[chunk["index"]] = round(time.perf_counter() - chunk_started_at, 3)
+        return chunk, result
+
+    results = []
+    remaining = list(chunks)
+    if remaining and not language:
+        first_chunk, first_result = run_chunk(remaining.pop(0), None)
+        results.append((first_chunk, first_result))
+        language = (first_result or {}).get("language") or None
+
+    safe_workers = max(1, min(int(workers or 1), len(remaining) or 1))
+    if safe_workers == 1:
+        results.extend(run_chunk(chunk, language) for chunk in remaining)
+    else:
+        with ThreadPoolExecutor(max_workers=safe_workers, thread_name_prefix="whisper-chunk") as executor:
+            results.extend(executor.map(lambda chunk: run_chunk(chunk, language), remaining))
+
+    stitched = stitch_transcription_chunks(results)
+    receipt = {
+        "mode": "chunked",
+        "chunk_count": len(chunks),
+        "worker_count": safe_workers,
+        "language": language,
+        "elapsed_seconds": round(time.perf_counter() - started_at, 3),
+        "chunks": [
+            {
+                "index": chunk["index"],
+                "start": chunk["start"],
+                "end": chunk["end"],
+                "audio_start": chunk["audio_start"],
+                "audio_end": chunk["audio_end"],
+                "forced_end": chunk["forced_end"],
+                "segment_count": len((result or {}).get("segments") or []),
+                "elapsed_seconds": timings.get(chunk["index"]),
+            }
+            for chunk, result in sorted(results, key=lambda item: item[0]["index"])
+        ],
+    }
+    return stitched, receipt
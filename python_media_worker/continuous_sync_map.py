@@ -0,0 +1,123 @@
+"""Compiled piecewise-linear timeline<->source maps for continuous sync.
+
+A camera's continuous sync map is a list of anchor dicts pairing a corrected
+master-timeline position with the camera's source position.  Every segment,
+sample and audit used to re-filter and re-sort that list and scan it for the
+bracketing pair.  ``CompiledSyncMap`` does the filtering once and keeps the
+anchors as sorted NumPy arrays, so a lookup is a ``searchsorted`` and a batch
+of thousands of timeline points maps in one vectorized pass.
+
+Evaluation matches the original scalar mapper exactly: interior points
+interpolate between the first bracketing pair, points outside the anchors
+extrapolate the first or last pair, and a zero-width pair yields no mapping.
+"""
+
+import numpy as np
+
+try:
+    from .job_cache import JobScopedCache, list_fingerprint
+except ImportError:
+    from job_cache import JobScopedCache, list_fingerprint
+
+MIN_PAIR_SPAN_SECONDS = 1e-6
+
+
+def accepted_sync_anchor(anchor):
+    return (
+        anchor.get("status") == "accepted"
+        and anchor.get("source_position_seconds") is not None
+        and anchor.get("corrected_timeline_seconds") is not None
+    )
+
+
+def _pair_indices(knots, targets):
+    """Left index of the pair each target evaluates against."""
+    last_pair = knots.size - 2
+    indices = np.searchsorted(knots, targets, side="left") - 1
+    indices = np.clip(indices, 0, last_pair)
+    # At or past the final knot always use the last pair, even when knots repeat.
+    return np.where(targets >= knots[-1], last_pair, indices)
+
+
+def _evaluate(knots, values, targets):
+    indices = _pair_indices(knots, targets)
+    left_knot = knots[indices]
+    span = knots[indices + 1] - left_knot
+    valid = np.abs(span) >= MIN_PAIR_SPAN_SECONDS
+    safe_span = np.where(valid, span, 1.0)
+    left_value = values[indices]
+    mapped = left_value + ((targets - left_knot) / safe_span) * (values[indices + 1] - left_value)
+    return np.where(valid, mapped, np.nan)
+
+
+class CompiledSyncMap:
+    __slots__ = ("timeline", "source", "_invertible")
+
+    def __init__(self, timeline, source):
+        timeline = np.asarray(timeline, dtype=np.float64)
+        source = np.asarray(source, dtype=np.float64)
+        order = np.argsort(timeline, kind="stable")
+        self.timeline = timeline[order]
+        self.source = source[order]
+        self._invertible = bool(self.source.size >= 2 and np.all(np.diff(self.source) > 0.0))
+
+    @classmethod
+    def from_anchors(cls, anchors):
+        """Compile accepted anchors; None when fewer than two remain."""
+        timeline = []
+        source = []
+        for anchor in anchors or []:
+            if not accepted_sync_anchor(anchor):
+                continue
+            timeline.append(float(anchor.get("corrected_timeline_seconds") or 0.0))
+            source.append(float(anchor.get("source_position_seconds") or 0.0))
+        if len(timeline) < 2:
+            return None
+        return cls(timeline, source)
+
+    def __len__(self):
+        return int(self.timeline.size)
+
+    @property
+    def invertible(self):
+        return self._invertible
+
+    def to_source_many(self, timeline_positions):
+        """Source positions for many timeline positions; NaN where unmappable."""
+        targets = np.asarray(timeline_positions, dtype=np.float64)
+        return _evaluate(self.timeline, self.source, targets)
+
+    def to_source(self, timeline_position):
+        mapped = float(self.to_source_many(float(timeline_position)))
+        return None if np.isnan(mapped) else mapped
+
+    def to_timeline_many(self, source_positions):
+        """Timeline positions for many source positions; all NaN unless the map is invertible."""
+        targets = np.asarray(source_positions, dtype=np.float64)
+        if not self._invertible:
+            return np.full(targets.shape, np.nan)
+        return _evaluate(self.source, self.timeline, targets)
+
+    def to_timeline(self, source_position):
+        mapped = float(self.to_timeline_many(float(source_position)))
+        return None if np.isnan(mapped) else mapped
+
+
+class CompiledSyncMapCache:
+    """Compiled maps memoized per anchor list for the current job; the list stays plain JSON on the source."""
+
+    def __init__(self, max_entries=256):
+        self._cache = JobScopedCache(max_entries=max_entries)
+
+    def get(self, sync_map):
+        anchors = (sync_map or {}).get("anchors") or []
+        if not isinstance(anchors, list):
+            return CompiledSyncMap.from_anchors(anchors)
+        if len(anchors) < 2:
+            return None
+        return self._cache.get(
+            anchors,
+            "continuous_sync_map",
+            list_fingerprint(anchors),
+            lambda: CompiledSyncMap.from_anchors(anchors),
+        )
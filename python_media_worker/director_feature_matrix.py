@@ -0,0 +1,103 @@
+"""Per-window director evidence held as one ``[windows, cameras, features]`` array.
+
+The auto director samples every camera at every decision time: trusted
+activity now and just ahead, dB levels, visual and visual-speaking scores,
+placeholder penalties and whether the footage is usable at all.  Those
+samples used to be recomputed inside the decision loop, one scalar lookup
+per camera per window, and again by every director mode that needed them.
+
+``DirectorFeatureMatrix`` stores them once per plan as a float64 array with
+one plane per name in ``FEATURES``, so the decision loop and the scoring
+helpers read array rows instead of re-walking the raw window lists.
+Boolean features are stored as ``0.0``/``1.0``.
+
+The worker memoizes one matrix per ``prepared_sources`` list and grid for the
+current job with ``job_cache.JobScopedCache``.
+"""
+
+import numpy as np
+
+
+FEATURES = (
+    "available",
+    "relative_time",
+    "current_audio_activity",
+    "upcoming_audio_activity",
+    "audio_activity",
+    "current_audio_db",
+    "upcoming_audio_db",
+    "audio_db",
+    "audio_rank",
+    "speaking",
+    "face_score",
+    "raw_visual_score",
+    "visual_score",
+    "visual_speaking_score",
+    "visual_speaking_confidence",
+    "lower_face_motion",
+    "upper_body_motion",
+    "placeholder_penalty",
+    "source_placeholder_penalty",
+)
+FEATURE_INDEX = {name: index for index, name in enumerate(FEATURES)}
+
+
+def decision_times(duration, step):
+    """Decision times the director visits: ``0, step, 2 * step, ...`` accumulated like its loop."""
+    times = []
+    current = 0.0
+    safe_duration = max(0.0, float(duration or 0.0))
+    safe_step = float(step)
+    if safe_step <= 0.0:
+        raise ValueError("Director step must be positive")
+    while current < safe_duration - 0.01:
+        times.append(current)
+        current += safe_step
+    return np.asarray(times, dtype=np.float64)
+
+
+class DirectorFeatureMatrix:
+    __slots__ = ("times", "camera_ids", "values", "_camera_index")
+
+    def __init__(self, times, camera_ids, values=None):
+        self.times = np.asarray(times, dtype=np.float64)
+        self.camera_ids = list(camera_ids)
+        shape = (self.times.size, len(self.camera_ids), len(FEATURES))
+        self.values = np.zeros(shape, dtype=np.float64) if values is None else values
+        self._camera_index = {camera_id: index for index, camera_id in enumerate(self.camera_ids)}
+
+    def __getitem__(self, name):
+        """``[windows, cameras]`` view of one feature."""
+        return self.values[:, :, FEATURE_INDEX[name]]
+
+    def __setitem__(self, name, value):
+        self.values[:, :, FEATURE_INDEX[name]] = value
+
+    def __len__(self):
+        return int(self.times.size)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def camera_index(self, camera_id):
+        return self._camera_index.get(camera_id)
+
+    def window_rows(self, index):
+        """Feature dicts for the cameras available at window ``index``, in source order."""
+        rows = self.values[index].tolist()
+        available = FEATURE_INDEX["available"]
+        return [
+            (self.camera_ids[camera], dict(zip(FEATURES, row)))
+            for camera, row in enumerate(rows)
+            if row[available]
+        ]
+
+    def rank_descending(self, name):
+        """Per-window rank of each available camera by ``name`` (0 = highest, ties in source order); -1 if unavailable."""
+        available = self["available"] > 0.0
+        keyed = np.where(available, -self[name], np.inf)
+        order = np.argsort(keyed, axis=1, kind="stable")
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(order.shape[1])[None, :], axis=1)
+        return np.where(available, ranks, -1).astype(np.float64)
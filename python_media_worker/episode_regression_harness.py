@@ -12,6 +12,11 @@ import argparse
 import json
 from pathlib import Path
 
+try:
+    from .segment_timeline import SegmentTimeline
+except ImportError:
+    from segment_timeline import SegmentTimeline
+
 
 def parse_timecode(value):
     raw = str(value).strip()
@@ -99,44 +104,53 @@ def build_dynamic_sample_times(
     return sorted(round(item, 3) for item in samples if item >= 0.0)
 
 
-def find_segment_for_sample(plans, sample_time, chunk_duration=300.0):
+def plan_chunk_start(plan, index, chunk_duration=300.0):
+    return float(plan.get("chunk_start_seconds", plan.get("window_start", index * float(chunk_duration))) or 0.0)
+
+
+def build_plan_segment_index(plans, chunk_duration=300.0):
+    """Index chunk windows and each chunk's segments once for repeated sample lookups."""
+    windows = []
+    for index, plan in enumerate(plans or []):
+        start = plan_chunk_start(plan, index, chunk_duration)
+        duration = float(plan.get("window_duration", plan.get("duration", chunk_duration)) or chunk_duration)
+        windows.append((start, start + duration, index))
+    return {
+        "chunks": SegmentTimeline.from_pairs(windows),
+        "segments": [
+            SegmentTimeline(
+                plan.get("segments") or [],
+                end_of=lambda segment: float(segment.get("timeline_end") or 0.0),
+            )
+            for plan in plans or []
+        ],
+    }
+
+
+def find_segment_for_sample(plans, sample_time, chunk_duration=300.0, index=None):
     if not plans:
         return None, None, None
-    plan = None
-    chunk_index = None
-    chunk_start = 0.0
-    for index, candidate in enumerate(plans):
-        candidate_start = float(
-            candidate.get("chunk_start_seconds", candidate.get("window_start", index * float(chunk_duration))) or 0.0
-        )
-        candidate_duration = float(
-            candidate.get("window_duration", candidate.get("duration", chunk_duration)) or chunk_duration
-        )
-        if candidate_start <= float(sample_time) < candidate_start + candidate_duration:
-            plan = candidate
-            chunk_index = index
-            chunk_start = candidate_start
-            break
-    if plan is None:
+    index = index or build_plan_segment_index(plans, chunk_duration)
+    window = index["chunks"].at(float(sample_time))
+    if window is not None:
+        chunk_index = window[2]
+        chunk_start = window[0]
+    else:
         chunk_index = min(int(float(sample_time) // float(chunk_duration)), len(plans) - 1)
-        plan = plans[chunk_index]
-        chunk_start = float(
-            plan.get("chunk_start_seconds", plan.get("window_start", chunk_index * float(chunk_duration))) or 0.0
-        )
+        chunk_start = plan_chunk_start(plans[chunk_index], chunk_index, chunk_duration)
     local_time = float(sample_time) - chunk_start
-    for segment in plan.get("segments") or []:
-        start = float(segment.get("timeline_start") or 0.0)
-        end = float(segment.get("timeline_end") or 0.0)
-        if start <= local_time < end:
-            return chunk_index, local_time, segment
-    segments = plan.get("segments") or []
+    segment = index["segments"][chunk_index].at(local_time)
+    if segment is not None:
+        return chunk_index, local_time, segment
+    segments = plans[chunk_index].get("segments") or []
     return chunk_index, local_time, segments[-1] if segments else None
 
 
 def audit_layout_samples(plans, sample_times, chunk_duration=300.0):
     checks = []
+    index = build_plan_segment_index(plans, chunk_duration) if plans else None
     for sample_time in sample_times:
-        chunk_index, local_time, segment = find_segment_for_sample(plans, sample_time, chunk_duration)
+        chunk_index, local_time, segment = find_segment_for_sample(plans, sample_time, chunk_duration, index=index)
         if not segment:
             checks.append(
                 {
@@ -0,0 +1,118 @@
+"""Memoization that lives for one render job.
+
+Director and audit lookups index the same window lists, interval lists and
+prepared source lists thousands of times per render.  ``JobScopedCache``
+memoizes a value derived from one of those objects while a
+``job_cache_scope()`` is active, and every entry is dropped when the scope
+exits, so a long-lived worker never keeps an earlier job's evidence alive.
+Outside a scope each lookup simply builds its value.
+
+The scope is bound to a context variable: concurrent jobs on the event loop
+each see their own entries, and nested scopes share the outermost one.
+
+Entries are keyed by the input object's identity and hold a reference to it,
+so its id cannot be reused while the entry lives.  Inputs are read-only once
+indexed: code that changes evidence assigns a new list instead of editing one
+in place.  The caller's ``fingerprint`` is compared on every hit and catches
+lists that grew.
+"""
+
+import contextlib
+import contextvars
+import functools
+import threading
+from collections import OrderedDict
+
+
+_active_scope = contextvars.ContextVar("job_cache_scope", default=None)
+
+
+class JobCacheScope:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._tables = {}
+
+    def table(self, cache):
+        """The entries ``cache`` holds in this scope."""
+        return self._tables.setdefault(id(cache), OrderedDict())
+
+    def entry_count(self):
+        with self.lock:
+            return sum(len(table) for table in self._tables.values())
+
+    def clear(self):
+        with self.lock:
+            self._tables.clear()
+
+
+@contextlib.contextmanager
+def job_cache_scope():
+    """Memoize ``JobScopedCache`` lookups until the block exits."""
+    scope = _active_scope.get()
+    if scope is not None:
+        yield scope
+        return
+    scope = JobCacheScope()
+    token = _active_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _active_scope.reset(token)
+        scope.clear()
+
+
+def job_cache_scoped(function):
+    """Run the coroutine ``function`` inside a ``job_cache_scope()``."""
+
+    @functools.wraps(function)
+    async def wrapper(*args, **kwargs):
+        with job_cache_scope():
+            return await function(*args, **kwargs)
+
+    return wrapper
+
+
+def job_cache_active():
+    """Whether ``JobScopedCache`` lookups are memoized right now.
+
+    Callers whose cached value only pays off over repeated lookups check this
+    and take their uncached path instead of building a throwaway index.
+    """
+    return _active_scope.get() is not None
+
+
+def list_fingerprint(points):
+    """Cheap fingerprint for a list treated as read-only: its length and end items."""
+    if not points:
+        return (0,)
+    return (len(points), id(points[0]), id(points[-1]))
+
+
+class JobScopedCache:
+    def __init__(self, max_entries=256):
+        self.max_entries = max(1, int(max_entries))
+
+    def get(self, owner, key, fingerprint, build):
+        """Return ``build()`` for ``owner`` and ``key``, memoized for the current job.
+
+        ``fingerprint`` must change whenever the evidence ``build`` reads does;
+        the entry is rebuilt when it differs from the stored one.
+        """
+        scope = _active_scope.get()
+        if scope is None:
+            return build()
+        cache_key = (id(owner), key)
+        with scope.lock:
+            table = scope.table(self)
+            entry = table.get(cache_key)
+            if entry and entry[0] is owner and entry[1] == fingerprint:
+                table.move_to_end(cache_key)
+                return entry[2]
+        value = build()
+        with scope.lock:
+            table = scope.table(self)
+            table[cache_key] = (owner, fingerprint, value)
+            table.move_to_end(cache_key)
+            while len(table) > self.max_entries:
+                table.popitem(last=False)
+        return value
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Local benchmark for the multicam director plus its pre-render audit and
+repair chain.
+
+This builds a synthetic isolated-mic conversation (no media, no ffmpeg), runs
+the production director on it, then times every audit and repair pass the
+render path runs before encoding. The default episode produces a plan of
+roughly 450 segments, the size where per-probe plan scans used to dominate.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+
+os.environ.setdefault("MULTICAM_UPLOAD_FIREBASE", "false")
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import python_media_worker.main_media_server as worker  # noqa: E402
+from python_media_worker.job_cache import job_cache_scope  # noqa: E402
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--duration", type=float, default=6300.0, help="Episode length in seconds.")
+    parser.add_argument("--cameras", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--director-mode", choices=("heuristic", "viterbi"), default="heuristic")
+    return parser.parse_args()
+
+
+def build_episode(duration, camera_count, seed):
+    rng = random.Random(seed)
+    camera_ids = [f"cam{index + 1}" for index in range(camera_count)]
+    steps = int(duration * 2)
+    activity = {camera_id: [0.05] * steps for camera_id in camera_ids}
+    step = 0
+    while step < steps:
+        owner = rng.choice(camera_ids)
+        run = rng.randint(8, 30)
+        for index in range(step, min(steps, step + run)):
+            activity[owner][index] = 0.7
+        step += run
+
+    sources = []
+    for channel_index, camera_id in enumerate(camera_ids):
+        sources.append(
+            {
+                "id": camera_id,
+                "label": camera_id,
+                "duration": duration + 5.0,
+                "offset_seconds": 0.0,
+                "sync_rate": 1.0,
+                "has_audio": True,
+                "audio_activity_source": "external_isolated_channel",
+                "audio_activity_channel_index": channel_index,
+                "window_scores": [
+                    {"face_score": 0.0, "motion_score": 0.0, "visual_speaking_score": 0.0, "visual_speaking_confidence": 0.0}
+                    for _ in range(int(duration))
+                ],
+                "timeline_audio_activity_windows": [
+                    {"time": index * 0.5, "activity": value, "db": -20.0 if value > 0.5 else -45.0}
+                    for index, value in enumerate(activity[camera_id])
+                ],
+            }
+        )
+    request = worker.RenderMultiCamRequest(
+        sources=[worker.MultiCamSource(id=camera_id, url=f"{camera_id}.mp4", label=camera_id) for camera_id in camera_ids],
+        auto_switch=True,
+        audio_based_auto_switch=True,
+        auto_switch_interval=2.0,
+        auto_switch_aggressiveness="balanced",
+        primary_audio_camera_id=camera_ids[0],
+        overlap_start=0.0,
+        overlap_duration=duration,
+        reactionOverlays=True,
+    )
+    return request, sources
+
+
+def timed(timings, name, fn):
+    started = time.perf_counter()
+    result = fn()
+    timings[name] = round(time.perf_counter() - started, 4)
+    return result
+
+
+def run_benchmark():
+    args = parse_args()
+    request, sources = build_episode(args.duration, args.cameras, args.seed)
+    request.directorMode = args.director_mode
+    timings = {}
+
+    segments = timed(
+        timings,
+        "director",
+        lambda: worker.build_multicam_segments_from_switches(request, sources, 0.0, args.duration),
+    )
+    plan_segment_count = len(segments)
+    timed(timings, "audit_switch_latency", lambda: worker.audit_multicam_director_switch_latency(segments, sources))
+    timed(timings, "audit_layout_contract", lambda: worker.audit_multicam_layout_contract(segments, sources))
+    timed(timings, "audit_director_truth", lambda: worker.audit_multicam_director_active_speaker_truth(segments, sources))
+    segments, _ = timed(
+        timings,
+        "repair_source_sync_stability",
+        lambda: worker.repair_multicam_source_sync_stability_segments(segments, sources, 0.0),
+    )
+    segments, _ = timed(
+        timings,
+        "repair_late_active_speaker",
+        lambda: worker.repair_multicam_late_active_speaker_segments(segments, sources, 0.0),
+    )
+    segments, _ = timed(
+        timings,
+        "repair_layout_contract",
+        lambda: worker.repair_multicam_layout_contract_segments(segments, sources, 0.0),
+    )
+    segments, _ = timed(
+        timings,
+        "repair_director_truth",
+        lambda: worker.repair_multicam_director_truth_segments(segments, sources, 0.0),
+    )
+    # The render path audits the final plan once more; the repair passes'
+    # final audits have usually already seen it, so this should be a cache hit.
+    timed(timings, "final_plan_audits", lambda: worker.run_multicam_plan_audits(segments, sources))
+
+    print(
+        json.dumps(
+            {
+                "duration_seconds": args.duration,
+                "cameras": args.cameras,
+                "director_mode": args.director_mode,
+                "plan_segment_count": plan_segment_count,
+                "final_segment_count": len(segments),
+                "timings_seconds": timings,
+                "total_seconds": round(sum(timings.values()), 4),
+            },
+            indent=2,
+        )
+    )
+
+
+def main():
+    # Renders memoize activity series and feature matrices per job.
+    with job_cache_scope():
+        run_benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Local benchmark for long multicam plans held as dicts versus a SegmentTable.
+
+Runs the production director on a synthetic isolated-mic episode, tiles the
+plan until it reaches --segments, then reports memory (tracemalloc) and the
+time of the copy-heavy passes: render-equivalent merging, checkpoint chunk
+partitioning as dict pieces versus table views materialized one chunk at a
+time (as the render does), and the dict <-> table round trip at the API
+boundary.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+
+os.environ.setdefault("MULTICAM_UPLOAD_FIREBASE", "false")
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import python_media_worker.main_media_server as worker  # noqa: E402
+from python_media_worker.local_director_audit_benchmark import build_episode  # noqa: E402
+from python_media_worker.multicam_chunking import (  # noqa: E402
+    materialize_multicam_chunk,
+    partition_multicam_render_segments,
+    partition_multicam_segment_table,
+)
+from python_media_worker.segment_table import SegmentTable  # noqa: E402
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--segments", type=int, default=4500, help="Plan size to tile up to.")
+    parser.add_argument("--duration", type=float, default=1800.0, help="Director episode length in seconds.")
+    parser.add_argument("--chunk-seconds", type=float, default=300.0)
+    return parser.parse_args()
+
+
+def tiled_plan(segments, target_count):
+    period = float(segments[-1]["timeline_end"])
+    plan = []
+    repeat = 0
+    while len(plan) < target_count:
+        shift = repeat * period
+        for segment in segments:
+            item = dict(segment)
+            for key in ("timeline_start", "timeline_end", "source_start", "source_end"):
+                item[key] = float(item[key]) + shift
+            item["ranked_sources"] = [dict(entry) for entry in segment.get("ranked_sources") or []]
+            plan.append(item)
+        repeat += 1
+    return plan[:target_count]
+
+
+def measured(fn):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, round(elapsed, 4), peak
+
+
+def main():
+    args = parse_args()
+    request, sources = build_episode(args.duration, 3, 11)
+    director_plan = worker.build_multicam_segments_from_switches(request, sources, 0.0, args.duration)
+
+    plan, _, dict_bytes = measured(lambda: tiled_plan(director_plan, args.segments))
+    table, from_seconds, table_bytes = measured(lambda: SegmentTable.from_segments(plan))
+    # The table shares nested values with the plan; count only what it adds.
+    shared_bytes = sum(sys.getsizeof(extra) for extra in table.extras if extra)
+    restored, to_seconds, _ = measured(table.to_segments)
+    lossless = json.dumps(restored) == json.dumps(plan)
+
+    _, merge_seconds, _ = measured(lambda: worker.merge_render_equivalent_multicam_segments(plan))
+    _, partition_seconds, partition_bytes = measured(
+        lambda: partition_multicam_render_segments(plan, args.chunk_seconds)
+    )
+    plan_end = float(plan[-1]["timeline_end"])
+    views, view_seconds, view_bytes = measured(lambda: partition_multicam_segment_table(table, args.chunk_seconds))
+
+    # The checkpoint plan JSON shares values with the table; each chunk's own
+    # segment copies live only while that chunk renders.
+    plan_json, plan_json_seconds, plan_json_bytes = measured(
+        lambda: json.dumps([materialize_multicam_chunk(view, copy_values=False) for view in views])
+    )
+    chunk_peaks = [measured(lambda view=view: materialize_multicam_chunk(view)) for view in views]
+    lazy_seconds = round(sum(seconds for _, seconds, _ in chunk_peaks), 4)
+    lazy_bytes = max(peak for _, _, peak in chunk_peaks)
+    lazy_matches = json.dumps([materialize_multicam_chunk(view) for view in views]) == json.dumps(
+        partition_multicam_render_segments(plan, args.chunk_seconds)
+    )
+
+    print(
+        json.dumps(
+            {
+                "segment_count": len(plan),
+                "timeline_seconds": round(plan_end, 3),
+                "lossless_round_trip": lossless,
+                "memory_bytes": {
+                    "dict_plan": dict_bytes,
+                    "table_rows": table.nbytes,
+                    "table_build_peak": table_bytes,
+                    "table_extras_dicts": shared_bytes,
+                    "partition_peak": partition_bytes,
+                    "table_partition_peak": view_bytes,
+                    "plan_json_peak": plan_json_bytes,
+                    "plan_json_text": len(plan_json),
+                    "largest_lazy_chunk_peak": lazy_bytes,
+                },
+                "timings_seconds": {
+                    "table_from_segments": from_seconds,
+                    "table_to_segments": to_seconds,
+                    "merge_render_equivalent": merge_seconds,
+                    "partition_chunks": partition_seconds,
+                    "table_partition": view_seconds,
+                    "plan_json": plan_json_seconds,
+                    "lazy_chunks_total": lazy_seconds,
+                },
+                "chunk_count": len(views),
+                "chunk_view_rows": sum(len(view["rows"]) for view in views),
+                "lazy_chunks_match_dict_partition": lazy_matches,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
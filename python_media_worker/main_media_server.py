@@ -19,6 +19,10 @@ import re  # Added for parsing silence output
 import hashlib
 import hmac
 import itertools
+import bisect
+import contextlib
+import functools
+import tempfile
 import urllib.request
 import urllib.parse
 import warnings
@@ -28,26 +32,29 @@ import ffmpeg  # FFmpeg (Phase 1)
 from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
 import firebase_admin
 from firebase_admin import credentials, storage, firestore
-try:
-    from scenedetect import SceneManager, open_video
-    from scenedetect.detectors import ContentDetector
-except ImportError:
-    SceneManager = None
-    open_video = None
-    ContentDetector = None
 from dotenv import load_dotenv
 
 try:
     from .multicam_chunking import (
-        build_multicam_chunk_plan,
+        diff_multicam_plans,
+        materialize_multicam_chunk,
         multicam_chunk_checkpoint_paths,
+        multicam_chunk_fingerprints,
         multicam_chunk_plan_fingerprint,
+        multicam_replan_window,
+        partition_multicam_segment_table,
+        splice_multicam_replanned_segments,
     )
 except ImportError:
     from multicam_chunking import (
-        build_multicam_chunk_plan,
+        diff_multicam_plans,
+        materialize_multicam_chunk,
         multicam_chunk_checkpoint_paths,
+        multicam_chunk_fingerprints,
         multicam_chunk_plan_fingerprint,
+        multicam_replan_window,
+        partition_multicam_segment_table,
+        splice_multicam_replanned_segments,
     )
 
 try:
@@ -78,6 +85,142 @@ try:
 except ImportError:
     from viral_creative_effects import build_creative_filter_complex, normalize_creative_plan
 
+try:
+    from .watermark_analysis import (
+        analyze_dynamic_watermark_schedule,
+        build_watermark_regions,
+        clamp_delogo_region,
+        collapse_watermark_windows,
+        read_video_frame_at_time,
+        run_watermark_analysis_pass,
+        track_manual_region_positions,
+    )
+except ImportError:
+    from watermark_analysis import (
+        analyze_dynamic_watermark_schedule,
+        build_watermark_regions,
+        clamp_delogo_region,
+        collapse_watermark_windows,
+        read_video_frame_at_time,
+        run_watermark_analysis_pass,
+        track_manual_region_positions,
+    )
+
+try:
+    from .chunked_transcription import (
+        TRANSCRIPTION_SAMPLE_RATE,
+        iter_transcription_audio_blocks,
+        load_transcription_audio_window,
+        plan_transcription_chunks,
+        transcribe_chunks_in_parallel,
+    )
+except ImportError:
+    from chunked_transcription import (
+        TRANSCRIPTION_SAMPLE_RATE,
+        iter_transcription_audio_blocks,
+        load_transcription_audio_window,
+        plan_transcription_chunks,
+        transcribe_chunks_in_parallel,
+    )
+try:
+    from .speech_gating import (
+        SPEECH_GATING_BINS_PER_SECOND,
+        SpeechEnergyScanner,
+        music_bed_mask,
+        normalize_speech_energy,
+        plan_speech_spans,
+        remap_gated_segment,
+        remap_gated_transcript,
+        write_speech_gated_wav_from_blocks,
+    )
+except ImportError:
+    from speech_gating import (
+        SPEECH_GATING_BINS_PER_SECOND,
+        SpeechEnergyScanner,
+        music_bed_mask,
+        normalize_speech_energy,
+        plan_speech_spans,
+        remap_gated_segment,
+        remap_gated_transcript,
+        write_speech_gated_wav_from_blocks,
+    )
+try:
+    from .transcript_cache import (
+        build_transcript_cache_entry,
+        build_transcript_cache_variant,
+        fingerprint_transcription_audio,
+        lookup_cached_transcript,
+        transcript_cache_key,
+    )
+except ImportError:
+    from transcript_cache import (
+        build_transcript_cache_entry,
+        build_transcript_cache_variant,
+        fingerprint_transcription_audio,
+        lookup_cached_transcript,
+        transcript_cache_key,
+    )
+try:
+    from .activity_timeseries import TimeSeries
+except ImportError:
+    from activity_timeseries import TimeSeries
+try:
+    from .continuous_sync_map import CompiledSyncMapCache
+except ImportError:
+    from continuous_sync_map import CompiledSyncMapCache
+try:
+    from .director_feature_matrix import DirectorFeatureMatrix, decision_times
+except ImportError:
+    from director_feature_matrix import DirectorFeatureMatrix, decision_times
+try:
+    from .job_cache import JobScopedCache, job_cache_active, job_cache_scoped, list_fingerprint
+except ImportError:
+    from job_cache import JobScopedCache, job_cache_active, job_cache_scoped, list_fingerprint
+try:
+    from .plan_audit_cache import PlanAuditCache, plan_audit_fingerprint
+except ImportError:
+    from plan_audit_cache import PlanAuditCache, plan_audit_fingerprint
+try:
+    from .resource_scheduler import decoder_memory_bytes, shared_scheduler
+except ImportError:
+    from resource_scheduler import decoder_memory_bytes, shared_scheduler
+try:
+    from .segment_timeline import SegmentTimeline
+except ImportError:
+    from segment_timeline import SegmentTimeline
+try:
+    from .viterbi_director import solve_camera_path
+except ImportError:
+    from viterbi_director import solve_camera_path
+try:
+    from .whisper_model_manager import WhisperModelManager, read_cgroup_memory_limit_mb
+except ImportError:
+    from whisper_model_manager import WhisperModelManager, read_cgroup_memory_limit_mb
+try:
+    from .multicam_footage_prepass import analyze_multicam_footage_prepass, merge_footage_intervals
+except ImportError:
+    from multicam_footage_prepass import analyze_multicam_footage_prepass, merge_footage_intervals
+try:
+    from .scene_detection import detect_scenes_and_motion, sample_visual_motion
+except ImportError:
+    from scene_detection import detect_scenes_and_motion, sample_visual_motion
+try:
+    from .multicam_visual_analysis import (
+        analyze_multicam_color_profile,
+        analyze_multicam_visual_window_arrays,
+        get_multicam_face_detector,
+        multicam_visual_windows_from_arrays,
+        run_multicam_camera_analyses,
+    )
+except ImportError:
+    from multicam_visual_analysis import (
+        analyze_multicam_color_profile,
+        analyze_multicam_visual_window_arrays,
+        get_multicam_face_detector,
+        multicam_visual_windows_from_arrays,
+        run_multicam_camera_analyses,
+    )
+
 # Fix asyncio event loop policy for Windows (Enable Proactor for Subprocesses)
 if sys.platform == 'win32':
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
@@ -249,6 +392,8 @@ IS_PRODUCTION_ENV = (
     str(os.getenv("NODE_ENV") or os.getenv("ENVIRONMENT") or "").strip().lower() == "production"
     or bool(os.getenv("K_SERVICE"))
 )
+# Scratch space for renders and derived-media caches.
+WORKER_TMP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../tmp"))
 LOCAL_MEDIA_OUTPUT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../tmp/worker_outputs"))
 LOCAL_MEDIA_OUTPUT_BASE_URL = str(os.getenv("LOCAL_MEDIA_OUTPUT_BASE_URL", "http://127.0.0.1:8000")).rstrip("/")
 ENABLE_LOCAL_MEDIA_OUTPUT_FALLBACK = env_flag(
@@ -265,11 +410,19 @@ MEDIA_WORKER_TASK_SECRET = os.getenv("MEDIA_WORKER_TASK_SECRET", "")
 if IS_PRODUCTION_ENV and not MEDIA_WORKER_TASK_SECRET:
     logger.warning("MEDIA_WORKER_TASK_SECRET is not set in production — task endpoints are unprotected!")
 
-# Initialize Whisper model cache (lazy load)
+# Whisper models load on first use (or at startup via WHISPER_PRELOAD_MODELS)
+# into one pool shared by both engines and capped by resident memory.
 # 'tiny' is fast but less accurate. 'base' or 'small' are better for production.
-# We will load it on first request to avoid slow startup.
-model_whisper = {}
-model_faster_whisper = {}
+def get_whisper_model_memory_limit_mb():
+    configured = os.getenv("WHISPER_MODEL_MEMORY_LIMIT_MB")
+    if configured:
+        return float(configured)
+    cgroup_limit_mb = read_cgroup_memory_limit_mb()
+    if cgroup_limit_mb:
+        return cgroup_limit_mb * clamp_float(os.getenv("WHISPER_MODEL_MEMORY_FRACTION", "0.4"), 0.05, 0.9)
+    return None
+
+
 AI_RERANK_BACKOFF_UNTIL = 0.0
 
 
@@ -292,21 +445,22 @@ def get_transcription_engine():
 
 
 def get_whisper_model(model_name=None):
-    global model_whisper
     if whisper is None:
         return None
 
     resolved_model_name = str(model_name or os.getenv("WHISPER_MODEL", "small")).strip().lower() or "small"
-    cache_key = f"{get_whisper_device()}::{resolved_model_name}"
-    cached = model_whisper.get(cache_key)
-    if cached is not None:
-        return cached
-
     device = get_whisper_device()
-    logger.info(f"Loading Whisper model ({resolved_model_name}) on {device}...")
-    loaded = whisper.load_model(resolved_model_name, device=device)
-    model_whisper[cache_key] = loaded
-    return loaded
+
+    def load_whisper_model():
+        logger.info(f"Loading Whisper model ({resolved_model_name}) on {device}...")
+        return whisper.load_model(resolved_model_name, device=device)
+
+    return whisper_model_manager.get(
+        f"openai::{device}::{resolved_model_name}",
+        load_whisper_model,
+        model_name=resolved_model_name,
+        compute_type="float32",
+    )
 
 
 def get_faster_whisper_device():
@@ -335,10 +489,10 @@ def get_faster_whisper_compute_type(device):
     return "int8"
 
 
-def get_faster_whisper_model(model_name=None):
-    global model_faster_whisper
+def get_faster_whisper_model(model_name=None, num_workers=1):
     if FasterWhisperModel is None:
         return None
+    num_workers = max(1, int(num_workers or 1))
 
     resolved_model_name = str(
         model_name
@@ -348,10 +502,11 @@ def get_faster_whisper_model(model_name=None):
     ).strip().lower() or "small"
     device = get_faster_whisper_device()
     compute_type = get_faster_whisper_compute_type(device)
-    cache_key = f"{device}::{compute_type}::{resolved_model_name}"
-    cached = model_faster_whisper.get(cache_key)
-    if cached is not None:
-        return cached
+    # A model loaded with several CTranslate2 workers serves that many
+    # concurrent transcribe() calls (chunked mode); keep it apart from the
+    # default single-worker instance.
+    worker_suffix = f"::workers={num_workers}" if num_workers > 1 else ""
+    cache_key = f"faster::{device}::{compute_type}::{resolved_model_name}{worker_suffix}"
 
     def load_faster_whisper_model(load_device, load_compute_type):
         logger.info(
@@ -363,19 +518,30 @@ def get_faster_whisper_model(model_name=None):
         model_cls = FasterWhisperModel
         if model_cls is None:
             raise RuntimeError("faster-whisper is not installed")
+        model_options = {}
+        if num_workers > 1:
+            model_options["num_workers"] = num_workers
+            if load_device == "cpu":
+                model_options["cpu_threads"] = max(1, (os.cpu_count() or 1) // num_workers)
         return model_cls(
             resolved_model_name,
             device=load_device,
             compute_type=load_compute_type,
+            **model_options,
         )
 
     try:
-        loaded = load_faster_whisper_model(device, compute_type)
+        return whisper_model_manager.get(
+            cache_key,
+            lambda: load_faster_whisper_model(device, compute_type),
+            model_name=resolved_model_name,
+            compute_type=compute_type,
+        )
     except ValueError as exc:
         fallback_device = "cpu"
         fallback_compute_type = "int8"
-        fallback_cache_key = f"{fallback_device}::{fallback_compute_type}::{resolved_model_name}"
-        fallback_cached = model_faster_whisper.get(fallback_cache_key)
+        fallback_cache_key = f"faster::{fallback_device}::{fallback_compute_type}::{resolved_model_name}{worker_suffix}"
+        fallback_cached = whisper_model_manager.peek(fallback_cache_key)
         if fallback_cached is not None:
             logger.warning(
                 "faster-whisper load failed on %s/%s (%s); using cached %s/%s model.",
@@ -396,17 +562,64 @@ def get_faster_whisper_model(model_name=None):
             fallback_device,
             fallback_compute_type,
         )
-        loaded = load_faster_whisper_model(fallback_device, fallback_compute_type)
-        model_faster_whisper[fallback_cache_key] = loaded
-        return loaded
-    model_faster_whisper[cache_key] = loaded
-    return loaded
+        return whisper_model_manager.get(
+            fallback_cache_key,
+            lambda: load_faster_whisper_model(fallback_device, fallback_compute_type),
+            model_name=resolved_model_name,
+            compute_type=fallback_compute_type,
+        )
 
 
 def get_promo_whisper_model_name():
     configured = str(os.getenv("PROMO_WHISPER_MODEL", "base")).strip().lower()
     return configured or "base"
 
+
+def get_promo_draft_whisper_model_name():
+    configured = str(os.getenv("PROMO_DRAFT_WHISPER_MODEL", "tiny")).strip().lower()
+    return configured or "tiny"
+
+
+def get_whisper_preload_model_names():
+    """Models to load at startup: ``WHISPER_PRELOAD_MODELS`` as a comma list,
+    ``auto`` (default, promo and caption models; the production default) or
+    ``none``."""
+    configured = str(os.getenv("WHISPER_PRELOAD_MODELS", "auto" if IS_PRODUCTION_ENV else "none")).strip().lower()
+    if configured in {"", "none", "off", "0", "false"}:
+        return []
+    if configured == "auto":
+        engine = get_transcription_engine()
+        names = [
+            str(os.getenv("MULTICAM_CAPTION_WHISPER_MODEL") or "").strip().lower(),
+            get_transcription_model_name(engine),
+            get_promo_whisper_model_name(),
+        ]
+        # Captions run on every multicam render; keep them first when set.
+        names = [name for name in names if name]
+    else:
+        names = [name.strip() for name in configured.split(",") if name.strip()]
+    return list(dict.fromkeys(names))
+
+
+def start_whisper_model_preload():
+    model_names = get_whisper_preload_model_names()
+    if not model_names or (FasterWhisperModel is None and whisper is None):
+        return None
+    engine = get_transcription_engine()
+    if engine == "faster":
+        compute_type = get_faster_whisper_compute_type(get_faster_whisper_device())
+        jobs = [
+            (f"faster-whisper:{name}", name, compute_type, lambda name=name: get_faster_whisper_model(model_name=name))
+            for name in model_names
+        ]
+    else:
+        jobs = [
+            (f"openai-whisper:{name}", name, "float32", lambda name=name: get_whisper_model(model_name=name))
+            for name in model_names
+        ]
+    logger.info("Preloading Whisper models in the background: %s", ", ".join(model_names))
+    return whisper_model_manager.preload_in_background(jobs)
+
 def normalize_transcription_language(language):
     value = str(language or "auto").strip().lower()
     if value in {"", "auto", "detect", "unknown"}:
@@ -420,6 +633,9 @@ def clamp_float(value, minimum, maximum):
         numeric_value = minimum
     return max(minimum, min(maximum, numeric_value))
 
+
+whisper_model_manager = WhisperModelManager(memory_limit_mb=get_whisper_model_memory_limit_mb())
+
 def _detect_gpu_encoder():
     """Check if NVIDIA NVENC can actually encode on this runtime."""
     forced_encoder = os.getenv("VIDEO_ENCODER", "").strip().lower()
@@ -475,7 +691,22 @@ GPU_CQ = "23"  # Constant quality for NVENC
 
 logger.info(f"Video encoder: {GPU_VIDEO_ENCODER} (preset={GPU_PRESET})")
 
-def build_multicam_segment_encode_args():
+# Sizes encode, proxy and analysis process pools from the task's cgroup limits.
+resource_scheduler = shared_scheduler()
+# Full-length caption and watermark passes of finished masters, across jobs.
+finishing_encode_limiter = resource_scheduler.limiter("encode")
+# Frame-sampling analysis decodes (scene detection, watermark scoring and
+# tracking) started from request handlers, across jobs.
+analysis_process_limiter = resource_scheduler.limiter("analysis")
+
+
+async def run_admitted_analysis(fn, *args, **kwargs):
+    """Run blocking analysis ``fn`` on a worker thread once the scheduler admits another analysis decode."""
+    async with analysis_process_limiter:
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
+
+def build_multicam_segment_encode_args(threads=None):
     """Encode short multicam segments quickly while keeping concat-safe output."""
     color_args = [
         "-color_primaries",
@@ -511,17 +742,18 @@ def build_multicam_segment_encode_args():
         "libx264",
         "-preset",
         "ultrafast",
-        # Two four-thread segment encodes keep an 8-vCPU Cloud Run job busy
-        # without letting each short FFmpeg process oversubscribe the machine.
+        # The scheduler splits the task's cores between the concurrent
+        # encodes (two four-thread encodes on an 8-vCPU job) so short FFmpeg
+        # processes do not oversubscribe the machine.
         "-threads",
-        os.getenv("MULTICAM_X264_THREADS", "4"),
+        str(os.getenv("MULTICAM_X264_THREADS") or threads or resource_scheduler.plan("encode")["threads"]),
         "-pix_fmt",
         "yuv420p",
         *color_args,
     ]
 
 
-def build_multicam_caption_encode_args():
+def build_multicam_caption_encode_args(threads=None):
     """Burned captions require a full video pass, so use the GPU encoder when available."""
     if GPU_VIDEO_ENCODER == "h264_nvenc" and os.getenv("MULTICAM_CAPTION_ENCODER", "nvenc").strip().lower() != "x264":
         return [
@@ -553,6 +785,9 @@ def build_multicam_caption_encode_args():
         os.getenv("MULTICAM_CAPTION_X264_MAXRATE", "8000k"),
         "-bufsize",
         os.getenv("MULTICAM_CAPTION_X264_BUFSIZE", "16000k"),
+        # Same per-encode share of the cores as the segment encodes.
+        "-threads",
+        str(os.getenv("MULTICAM_X264_THREADS") or threads or resource_scheduler.plan("encode")["threads"]),
         "-pix_fmt",
         "yuv420p",
     ]
@@ -1564,53 +1799,542 @@ def build_transcription_prompt(extra_hint=""):
     hint = str(extra_hint or "").strip()
     return f"{base} {hint}".strip()
 
-def transcribe_with_hints(file_path, *, word_timestamps=False, language=None, prompt_hint="", task=None, model_name=None):
-    normalized_language = normalize_transcription_language(language)
+def get_transcription_chunk_workers(engine):
+    # openai-whisper installs per-call decoder hooks on the shared model, so
+    # only faster-whisper chunks run concurrently.
+    if engine != "faster":
+        return 1
+    configured = os.getenv("WHISPER_CHUNK_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    return max(1, min(4, (os.cpu_count() or 1) // 2))
+
+
+def should_chunk_transcription(file_path):
+    # Chunking only pays off when chunks run concurrently; with one worker it
+    # just loses cross-chunk context.  WHISPER_CHUNKED_TRANSCRIPTION=true opts
+    # the other engines in, =false opts everything out.
+    if not isinstance(file_path, str):
+        return False
+    if str(os.getenv("WHISPER_CHUNKED_TRANSCRIPTION") or "").strip():
+        if not env_flag("WHISPER_CHUNKED_TRANSCRIPTION"):
+            return False
+    else:
+        engine = get_transcription_engine()
+        if engine != "faster" or get_transcription_chunk_workers(engine) <= 1:
+            return False
+    min_duration = float(os.getenv("WHISPER_CHUNKED_MIN_DURATION_SECONDS", "300") or 300)
+    return get_media_duration(file_path) >= min_duration
+
+
+def transcribe_with_hints_chunked(file_path, *, word_timestamps=False, language=None, prompt_hint="", task=None, model_name=None):
+    """Transcribe ``file_path`` in silence-aligned chunks across parallel model workers."""
+    duration = get_media_duration(file_path)
+    silence_intervals = detect_silence_intervals_sync(file_path, threshold="-35dB", duration=0.35)
+    chunks = plan_transcription_chunks(
+        duration,
+        silence_intervals,
+        min_seconds=float(os.getenv("WHISPER_CHUNK_MIN_SECONDS", "30") or 30),
+        target_seconds=float(os.getenv("WHISPER_CHUNK_TARGET_SECONDS", "75") or 75),
+        max_seconds=float(os.getenv("WHISPER_CHUNK_MAX_SECONDS", "120") or 120),
+        overlap_seconds=float(os.getenv("WHISPER_CHUNK_OVERLAP_SECONDS", "1.5") or 1.5),
+    )
+    engine = get_transcription_engine()
+    workers = get_transcription_chunk_workers(engine)
+    chunk_engines = set()
+
+    def transcribe_chunk(audio, chunk_language):
+        # Chunks pin the engine: a faster-whisper failure must not send
+        # parallel chunks onto the shared openai-whisper model.
+        chunk_result = transcribe_with_hints_uncached(
+            audio,
+            word_timestamps=word_timestamps,
+            language=chunk_language or language,
+            prompt_hint=prompt_hint,
+            task=task,
+            model_name=model_name,
+            chunked=False,
+            model_workers=workers,
+            engine=engine,
+        )
+        chunk_engines.add((chunk_result or {}).get("engine"))
+        return chunk_result
+
+    try:
+        result, receipt = transcribe_chunks_in_parallel(
+            file_path,
+            chunks,
+            transcribe_chunk,
+            workers=workers,
+            language=normalize_transcription_language(language),
+        )
+    except Exception as exc:
+        if engine != "faster" or env_flag("FASTER_WHISPER_STRICT", default=False) or whisper is None:
+            raise
+        logger.warning(
+            "faster-whisper chunked transcription failed; falling back to one openai-whisper pass: %s",
+            str(exc)[-500:],
+        )
+        return transcribe_with_hints_uncached(
+            file_path,
+            word_timestamps=word_timestamps,
+            language=language,
+            prompt_hint=prompt_hint,
+            task=task,
+            model_name=model_name,
+            chunked=False,
+            speech_gated=False,
+            engine="openai",
+        )
+    result["engine"] = "+".join(sorted(str(value) for value in chunk_engines if value)) or None
+    result["chunking"] = receipt
+    logger.info(
+        "Chunked transcription: %s chunks on %s workers in %.1fs for %.1fs of audio.",
+        receipt["chunk_count"],
+        receipt["worker_count"],
+        receipt["elapsed_seconds"],
+        duration,
+    )
+    return result
+
+
+def get_transcription_model_name(engine, model_name=None):
+    if engine == "faster":
+        configured = model_name or os.getenv("FASTER_WHISPER_MODEL") or os.getenv("WHISPER_MODEL")
+    else:
+        configured = model_name or os.getenv("WHISPER_MODEL")
+    return str(configured or "small").strip().lower() or "small"
+
+
+TRANSCRIPT_CACHE_FIRESTORE_COLLECTION = "transcript_cache"
+# Firestore documents cap at 1 MiB; longer word-level transcripts stay disk-only.
+TRANSCRIPT_CACHE_FIRESTORE_MAX_BYTES = 900_000
+
+
+def transcript_cache_path(cache_key):
+    cache_dir = os.getenv("TRANSCRIPT_CACHE_DIR") or os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "../tmp/transcript-cache")
+    )
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, f"{cache_key}.json")
+
+
+def read_transcript_cache_entry(cache_key):
+    cache_path = transcript_cache_path(cache_key)
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r", encoding="utf-8") as handle:
+                return json.load(handle), "disk"
+        except Exception as exc:
+            logger.debug("Could not read transcript cache %s: %s", cache_path, exc)
+    if not env_flag("TRANSCRIPT_CACHE_FIRESTORE", default=False):
+        return None, None
+    try:
+        snapshot = firestore.client().collection(TRANSCRIPT_CACHE_FIRESTORE_COLLECTION).document(cache_key).get()
+        if not snapshot.exists:
+            return None, None
+        payload = snapshot.to_dict() or {}
+        entry = {**payload, "transcript": json.loads(payload.get("transcript_json") or "null")}
+        entry.pop("transcript_json", None)
+    except Exception as exc:
+        logger.warning(f"Could not load transcript cache entry from Firestore: {exc}")
+        return None, None
+    write_transcript_cache_entry(cache_key, entry, remote=False)
+    return entry, "firestore"
+
+
+def write_transcript_cache_entry(cache_key, entry, remote=True):
+    cache_path = transcript_cache_path(cache_key)
+    try:
+        tmp_path = f"{cache_path}.part"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(entry, handle, sort_keys=True, default=str)
+        os.replace(tmp_path, cache_path)
+    except Exception as exc:
+        logger.debug("Could not write transcript cache %s: %s", cache_path, exc)
+    if not remote or not env_flag("TRANSCRIPT_CACHE_FIRESTORE", default=False):
+        return
+    try:
+        transcript_json = json.dumps(entry.get("transcript"), sort_keys=True, default=str)
+        if len(transcript_json.encode("utf-8")) > TRANSCRIPT_CACHE_FIRESTORE_MAX_BYTES:
+            return
+        payload = {key: value for key, value in entry.items() if key != "transcript"}
+        payload["transcript_json"] = transcript_json
+        firestore.client().collection(TRANSCRIPT_CACHE_FIRESTORE_COLLECTION).document(cache_key).set(payload)
+    except Exception as exc:
+        logger.warning(f"Could not store transcript cache entry in Firestore: {exc}")
+
+
+def resolve_cached_transcript(file_path, *, word_timestamps, language, prompt_hint, task, model_name):
+    """Return ``(engine, variant, audio_fingerprint, cached_result_or_None)`` for a request."""
     engine = get_transcription_engine()
+    variant = build_transcript_cache_variant(
+        engine=engine,
+        model_name=get_transcription_model_name(engine, model_name),
+        task=task,
+        language=normalize_transcription_language(language),
+        word_timestamps=word_timestamps,
+        prompt=build_transcription_prompt(prompt_hint),
+    )
+    try:
+        audio_fingerprint = fingerprint_transcription_audio(
+            file_path,
+            file_identity=multicam_file_cache_identity(file_path),
+        )
+    except Exception as exc:
+        logger.debug("Transcript cache fingerprint failed for %s: %s", file_path, exc)
+        audio_fingerprint = None
+    if not audio_fingerprint:
+        return engine, variant, None, None
+
+    cached, cache_receipt = lookup_cached_transcript(
+        audio_fingerprint,
+        variant,
+        read_transcript_cache_entry,
+        max_age_seconds=float(os.getenv("TRANSCRIPT_CACHE_MAX_AGE_SECONDS", "2592000") or 2592000),
+    )
+    if cached is not None:
+        logger.info(
+            "Transcript cache hit (%s, %s) for %s",
+            cache_receipt["source"],
+            "exact" if cache_receipt["exact"] else "reused superset",
+            os.path.basename(file_path),
+        )
+        cached["transcript_cache"] = {**cache_receipt, "audio_fingerprint": audio_fingerprint}
+    return engine, variant, audio_fingerprint, cached
+
+
+def store_cached_transcript(engine, variant, audio_fingerprint, result):
+    if not audio_fingerprint or not isinstance(result, dict) or not isinstance(result.get("segments"), list):
+        return result
+    # A faster-whisper failure falls back to openai-whisper; only cache what
+    # the variant actually describes.
+    if (result.get("engine") == "faster-whisper") != (engine == "faster"):
+        return result
+    cache_key = transcript_cache_key(audio_fingerprint, variant)
+    write_transcript_cache_entry(
+        cache_key,
+        build_transcript_cache_entry(
+            audio_fingerprint,
+            variant,
+            {key: value for key, value in result.items() if key not in {"transcript_cache", "chunking"}},
+        ),
+    )
+    result["transcript_cache"] = {"hit": False, "key": cache_key, "audio_fingerprint": audio_fingerprint}
+    return result
+
+
+def transcribe_with_transcript_cache(file_path, *, word_timestamps, language, prompt_hint, task, model_name, chunked):
+    """Serve ``transcribe_with_hints`` from the transcript cache, filling it on a miss.
+
+    Results carry ``result["transcript_cache"]`` with the audio fingerprint
+    and whether (and from which variant) the transcript was reused.
+    """
+    engine, variant, audio_fingerprint, cached = resolve_cached_transcript(
+        file_path,
+        word_timestamps=word_timestamps,
+        language=language,
+        prompt_hint=prompt_hint,
+        task=task,
+        model_name=model_name,
+    )
+    if cached is not None:
+        return cached
+    result = transcribe_with_hints_uncached(
+        file_path,
+        word_timestamps=word_timestamps,
+        language=language,
+        prompt_hint=prompt_hint,
+        task=task,
+        model_name=model_name,
+        chunked=chunked,
+    )
+    return store_cached_transcript(engine, variant, audio_fingerprint, result)
+
+
+def transcribe_with_hints(
+    file_path,
+    *,
+    word_timestamps=False,
+    language=None,
+    prompt_hint="",
+    task=None,
+    model_name=None,
+    chunked=None,
+    use_cache=None,
+):
+    """Transcribe a media path with repo-wide prompting, reusing cached transcripts.
+
+    ``use_cache=False`` (or ``TRANSCRIPT_CACHE_ENABLED=0``) always runs Whisper.
+    """
+    if use_cache is not False and isinstance(file_path, str) and env_flag("TRANSCRIPT_CACHE_ENABLED", default=True):
+        return transcribe_with_transcript_cache(
+            file_path,
+            word_timestamps=word_timestamps,
+            language=language,
+            prompt_hint=prompt_hint,
+            task=task,
+            model_name=model_name,
+            chunked=chunked,
+        )
+    return transcribe_with_hints_uncached(
+        file_path,
+        word_timestamps=word_timestamps,
+        language=language,
+        prompt_hint=prompt_hint,
+        task=task,
+        model_name=model_name,
+        chunked=chunked,
+    )
+
+
+def faster_whisper_segment_to_dict(segment, fallback_id=0):
+    words = [
+        {
+            "start": float(getattr(word, "start", 0.0) or 0.0),
+            "end": float(getattr(word, "end", 0.0) or 0.0),
+            "word": str(getattr(word, "word", "") or ""),
+            "probability": float(getattr(word, "probability", 0.0) or 0.0),
+        }
+        for word in (getattr(segment, "words", None) or [])
+    ]
+    return {
+        "id": int(getattr(segment, "id", fallback_id) or fallback_id),
+        "start": float(getattr(segment, "start", 0.0) or 0.0),
+        "end": float(getattr(segment, "end", 0.0) or 0.0),
+        "text": str(getattr(segment, "text", "") or ""),
+        "words": words,
+    }
+
+
+def start_faster_whisper_transcription(
+    file_path,
+    *,
+    word_timestamps=False,
+    language=None,
+    prompt="",
+    task=None,
+    model_name=None,
+    model_workers=1,
+):
+    """Start a faster-whisper decode; returns ``(lazy segment dict iterator, info)``.
+
+    faster-whisper decodes as the segment generator is consumed, so callers
+    that iterate see segments while later audio is still being transcribed.
+    """
+    model = get_faster_whisper_model(model_name=model_name, num_workers=model_workers)
+    if not model:
+        raise RuntimeError("faster-whisper model not allocated")
+    transcription_options = {
+        "word_timestamps": word_timestamps,
+        "temperature": 0,
+        "condition_on_previous_text": False,
+        "compression_ratio_threshold": 2.2,
+        "log_prob_threshold": -0.8,
+        "no_speech_threshold": 0.45,
+        "initial_prompt": prompt,
+        "vad_filter": env_flag("FASTER_WHISPER_VAD_FILTER", default=False),
+    }
+    if language:
+        transcription_options["language"] = language
+    if task:
+        transcription_options["task"] = task
+    faster_segments, info = model.transcribe(file_path, **transcription_options)
+    segment_iter = (
+        faster_whisper_segment_to_dict(segment, index)
+        for index, segment in enumerate(faster_segments)
+    )
+    return segment_iter, info
+
+
+# vad_envelope smooths over 1/200 of its input, so it is fed fixed-size blocks
+# to keep the smoothing near 0.3 s regardless of file length.
+SPEECH_GATING_VAD_BLOCK_SECONDS = 60.0
+
+
+def scan_speech_gating_audio(file_path, silence_threshold="-40dB", silence_duration=0.6):
+    """Return ``(rms_bins, duration, silence_intervals)`` from one streamed decode.
+
+    ``silencedetect`` runs in the same ffmpeg process as the PCM pipe, and
+    the samples are reduced to RMS bins as they arrive, so nothing
+    proportional to the file length is held in memory.
+    """
+    scanner = SpeechEnergyScanner(TRANSCRIPTION_SAMPLE_RATE, SPEECH_GATING_BINS_PER_SECOND)
+    with tempfile.TemporaryFile() as log_file:
+        for block in iter_transcription_audio_blocks(
+            file_path,
+            audio_filter=f"silencedetect=noise={silence_threshold}:d={silence_duration}",
+            log_file=log_file,
+        ):
+            scanner.feed(block)
+        log_file.seek(0)
+        silence_intervals = parse_silence_detect_output(log_file.read())
+    return scanner.finish(), scanner.sample_count / float(TRANSCRIPTION_SAMPLE_RATE), silence_intervals
+
+
+def detect_transcription_speech_spans(rms, duration, silence_intervals):
+    envelope = normalize_speech_energy(rms)
+    block_size = int(SPEECH_GATING_VAD_BLOCK_SECONDS * SPEECH_GATING_BINS_PER_SECOND)
+    activity = (
+        np.concatenate([vad_envelope(envelope[index : index + block_size]) for index in range(0, envelope.size, block_size)])
+        if envelope.size
+        else envelope
+    )
+    music_mask = music_bed_mask(rms, SPEECH_GATING_BINS_PER_SECOND) if env_flag("WHISPER_SPEECH_GATING_MUSIC", default=True) else None
+    return plan_speech_spans(
+        activity,
+        duration,
+        bins_per_second=SPEECH_GATING_BINS_PER_SECOND,
+        silence_intervals=silence_intervals,
+        music_mask=music_mask,
+    )
+
+
+def prepare_speech_gated_audio(file_path):
+    """Write a speech-only copy of ``file_path`` for Whisper, or return None.
+
+    Returns ``{"path", "span_map", "duration", "receipt"}``; the caller owns
+    ``path`` and maps timestamps back with ``remap_gated_transcript``.  Short
+    inputs and inputs that are nearly all speech are not gated, since the
+    gated copy would cost more than the Whisper time it saves; that decision
+    is made from the streamed energy scan before the copy is written.
+    """
+    if not isinstance(file_path, str) or not env_flag("WHISPER_SPEECH_GATING", default=True):
+        return None
+    min_duration = float(os.getenv("WHISPER_SPEECH_GATING_MIN_DURATION_SECONDS", "30") or 30)
+    probed_duration = get_media_duration(file_path)
+    if probed_duration < min_duration:
+        return None
+    started_at = time.perf_counter()
+    try:
+        rms, duration, silence_intervals = scan_speech_gating_audio(file_path)
+    except Exception as exc:
+        logger.warning("Speech gating skipped for %s: %s", file_path, str(exc)[-300:])
+        return None
+    spans = detect_transcription_speech_spans(rms, duration, silence_intervals)
+    speech_seconds = sum(end - start for start, end in spans)
+    min_skip_ratio = clamp_float(float(os.getenv("WHISPER_SPEECH_GATING_MIN_SKIP_RATIO", "0.15") or 0.15), 0.0, 1.0)
+    # No detected speech is more likely a quiet recording than a silent one; let Whisper decide.
+    if not spans or speech_seconds > duration * (1.0 - min_skip_ratio):
+        return None
+
+    # Only now is the audio decoded again, streaming just the speech spans
+    # into the gated WAV.
+    gate_dir = os.path.join(WORKER_TMP_DIR, "speech-gating")
+    os.makedirs(gate_dir, exist_ok=True)
+    gated_path = os.path.join(gate_dir, f"speech_gated_{uuid.uuid4().hex[:10]}.wav")
+    try:
+        span_map = write_speech_gated_wav_from_blocks(
+            gated_path,
+            iter_transcription_audio_blocks(file_path),
+            spans,
+            TRANSCRIPTION_SAMPLE_RATE,
+        )
+    except Exception as exc:
+        with contextlib.suppress(OSError):
+            os.remove(gated_path)
+        logger.warning("Speech gating skipped for %s: %s", file_path, str(exc)[-300:])
+        return None
+    receipt = {
+        "source_duration": round(duration, 3),
+        "speech_seconds": round(speech_seconds, 3),
+        "skipped_seconds": round(duration - speech_seconds, 3),
+        "speech_ratio": round(speech_seconds / duration, 3) if duration > 0 else 0.0,
+        "span_count": len(spans),
+        "elapsed_seconds": round(time.perf_counter() - started_at, 3),
+    }
+    logger.info(
+        "Speech gating: transcribing %.1fs of speech in %s spans out of %.1fs (%.1fs skipped).",
+        speech_seconds,
+        len(spans),
+        duration,
+        receipt["skipped_seconds"],
+    )
+    return {"path": gated_path, "span_map": span_map, "duration": duration, "receipt": receipt}
+
+
+def discard_speech_gated_audio(gating):
+    if gating:
+        with contextlib.suppress(OSError):
+            os.remove(gating["path"])
+
+
+def transcribe_with_hints_uncached(
+    file_path,
+    *,
+    word_timestamps=False,
+    language=None,
+    prompt_hint="",
+    task=None,
+    model_name=None,
+    chunked=None,
+    model_workers=1,
+    speech_gated=None,
+    engine=None,
+):
+    """Transcribe a media path (or a 16 kHz float32 array) with repo-wide prompting.
+
+    ``speech_gated=None`` transcribes only the detected speech spans of long
+    files (see ``prepare_speech_gated_audio``) and returns source-time
+    timestamps; ``False`` transcribes the input as is, and an already
+    prepared gating dict is used (and discarded) as is.  ``chunked=None``
+    switches long files to silence-aligned parallel chunks (see
+    ``transcribe_with_hints_chunked``); ``False`` forces one call.
+    ``engine=None`` uses the configured engine and falls back from
+    faster-whisper to openai-whisper unless ``FASTER_WHISPER_STRICT`` is
+    set; an explicit ``engine`` is used as is, with no fallback.
+    """
+    if isinstance(speech_gated, dict):
+        gating = speech_gated
+    else:
+        gating = prepare_speech_gated_audio(file_path) if speech_gated is not False else None
+    if gating:
+        try:
+            result = transcribe_with_hints_uncached(
+                gating["path"],
+                word_timestamps=word_timestamps,
+                language=language,
+                prompt_hint=prompt_hint,
+                task=task,
+                model_name=model_name,
+                chunked=chunked,
+                model_workers=model_workers,
+                speech_gated=False,
+                engine=engine,
+            )
+        finally:
+            discard_speech_gated_audio(gating)
+        result = remap_gated_transcript(result, gating["span_map"], round(gating["duration"], 3))
+        result["speech_gating"] = gating["receipt"]
+        return result
+
+    if chunked is not False and isinstance(file_path, str) and (chunked or should_chunk_transcription(file_path)):
+        return transcribe_with_hints_chunked(
+            file_path,
+            word_timestamps=word_timestamps,
+            language=language,
+            prompt_hint=prompt_hint,
+            task=task,
+            model_name=model_name,
+        )
+
+    normalized_language = normalize_transcription_language(language)
+    fallback_allowed = engine is None
+    engine = engine or get_transcription_engine()
     prompt = build_transcription_prompt(prompt_hint)
 
     if engine == "faster":
         try:
-            model = get_faster_whisper_model(model_name=model_name)
-            if not model:
-                raise RuntimeError("faster-whisper model not allocated")
-            transcription_options = {
-                "word_timestamps": word_timestamps,
-                "temperature": 0,
-                "condition_on_previous_text": False,
-                "compression_ratio_threshold": 2.2,
-                "log_prob_threshold": -0.8,
-                "no_speech_threshold": 0.45,
-                "initial_prompt": prompt,
-                "vad_filter": env_flag("FASTER_WHISPER_VAD_FILTER", default=False),
-            }
-            if normalized_language:
-                transcription_options["language"] = normalized_language
-            if task:
-                transcription_options["task"] = task
-
-            faster_segments, info = model.transcribe(file_path, **transcription_options)
-            segments = []
-            for segment in faster_segments:
-                words = []
-                for word in (getattr(segment, "words", None) or []):
-                    words.append(
-                        {
-                            "start": float(getattr(word, "start", 0.0) or 0.0),
-                            "end": float(getattr(word, "end", 0.0) or 0.0),
-                            "word": str(getattr(word, "word", "") or ""),
-                            "probability": float(getattr(word, "probability", 0.0) or 0.0),
-                        }
-                    )
-                segments.append(
-                    {
-                        "id": int(getattr(segment, "id", len(segments)) or len(segments)),
-                        "start": float(getattr(segment, "start", 0.0) or 0.0),
-                        "end": float(getattr(segment, "end", 0.0) or 0.0),
-                        "text": str(getattr(segment, "text", "") or ""),
-                        "words": words,
-                    }
-                )
+            segment_iter, info = start_faster_whisper_transcription(
+                file_path,
+                word_timestamps=word_timestamps,
+                language=normalized_language,
+                prompt=prompt,
+                task=task,
+                model_name=model_name,
+                model_workers=model_workers,
+            )
+            segments = list(segment_iter)
             return {
                 "text": " ".join(segment.get("text", "").strip() for segment in segments).strip(),
                 "segments": segments,
@@ -1619,7 +2343,7 @@ def transcribe_with_hints(file_path, *, word_timestamps=False, language=None, pr
                 "engine": "faster-whisper",
             }
         except Exception as exc:
-            if env_flag("FASTER_WHISPER_STRICT", default=False):
+            if not fallback_allowed or env_flag("FASTER_WHISPER_STRICT", default=False):
                 raise
             if whisper is None:
                 raise RuntimeError(f"faster-whisper transcription failed: {exc}") from exc
@@ -1653,17 +2377,198 @@ def transcribe_with_hints(file_path, *, word_timestamps=False, language=None, pr
     return result
 
 
-LOW_SIGNAL_TRANSCRIPT_TOKENS = {
-    "yeah", "oh", "ah", "uh", "um", "la", "na", "hey", "woo", "ooh", "mmm",
-}
-
-
-def normalize_transcript_text(value):
-    return re.sub(r"\s+", " ", str(value or "").strip())
+def build_transcription_progress_publisher(job_id, progress_start, progress_end, detail="Transcribing audio", min_interval_seconds=5.0):
+    """Return ``publish(fraction)`` that maps decode progress onto the job document.
 
+    Updates are throttled to one per ``min_interval_seconds`` (plus the
+    final 100%) so a fast decode does not hammer Firestore.
+    """
+    state = {"last_at": 0.0, "last_progress": None}
 
-def estimate_transcript_segment_confidence(segment):
-    text = normalize_transcript_text(segment.get("text"))
+    def publish(fraction):
+        if not job_id:
+            return
+        safe_fraction = clamp_float(fraction, 0.0, 1.0)
+        progress = int(round(progress_start + (progress_end - progress_start) * safe_fraction))
+        now = time.monotonic()
+        if progress == state["last_progress"]:
+            return
+        if safe_fraction < 1.0 and now - state["last_at"] < min_interval_seconds:
+            return
+        state["last_at"] = now
+        state["last_progress"] = progress
+        update_firestore_job(
+            job_id,
+            {
+                "progress": progress,
+                "detail": f"{detail} ({int(round(safe_fraction * 100))}%)",
+                "transcriptionProgress": round(safe_fraction, 3),
+            },
+        )
+
+    return publish
+
+
+def iter_transcribe_with_hints(
+    file_path,
+    *,
+    word_timestamps=False,
+    language=None,
+    prompt_hint="",
+    task=None,
+    model_name=None,
+    on_progress=None,
+    summary=None,
+):
+    """Yield transcript segments as Whisper decodes them.
+
+    Only the single-pass faster-whisper path truly streams (over the
+    speech-gated copy when gating applies, remapped to source time); cache hits,
+    chunked long files and openai-whisper yield the finished result.
+    ``on_progress(fraction)`` follows decoded audio time and ``summary``
+    (a dict) receives ``language``/``duration``/``engine``/``transcript_cache``.
+    A fully consumed stream is written to the transcript cache; a consumer
+    that stops early leaves the cache untouched.
+    """
+    summary = summary if summary is not None else {}
+    options = {
+        "word_timestamps": word_timestamps,
+        "language": language,
+        "prompt_hint": prompt_hint,
+        "task": task,
+        "model_name": model_name,
+    }
+
+    def yield_finished(result):
+        summary.update({key: value for key, value in (result or {}).items() if key not in {"segments", "text"}})
+        duration = float(summary.get("duration") or 0.0)
+        for segment in (result or {}).get("segments") or []:
+            if on_progress and duration > 0.0:
+                on_progress(float(segment.get("end", 0.0) or 0.0) / duration)
+            yield segment
+        if on_progress:
+            on_progress(1.0)
+
+    if get_transcription_engine() != "faster" or should_chunk_transcription(file_path):
+        yield from yield_finished(transcribe_with_hints(file_path, **options))
+        return
+
+    use_cache = env_flag("TRANSCRIPT_CACHE_ENABLED", default=True)
+    engine, variant, audio_fingerprint, cached = (
+        resolve_cached_transcript(file_path, **options) if use_cache else ("faster", None, None, None)
+    )
+    if cached is not None:
+        yield from yield_finished(cached)
+        return
+
+    gating = prepare_speech_gated_audio(file_path)
+    try:
+        segment_iter, info = start_faster_whisper_transcription(
+            gating["path"] if gating else file_path,
+            word_timestamps=word_timestamps,
+            language=normalize_transcription_language(language),
+            prompt=build_transcription_prompt(prompt_hint),
+            task=task,
+            model_name=model_name,
+        )
+    except Exception as exc:
+        if env_flag("FASTER_WHISPER_STRICT", default=False) or whisper is None:
+            discard_speech_gated_audio(gating)
+            raise
+        logger.warning("faster-whisper stream unavailable; transcribing in one pass: %s", str(exc)[-500:])
+        # Reuse the gated copy and cache lookup already paid for above.
+        result = transcribe_with_hints_uncached(file_path, **options, chunked=False, speech_gated=gating or False)
+        yield from yield_finished(store_cached_transcript(engine, variant, audio_fingerprint, result))
+        return
+
+    duration = round(gating["duration"], 3) if gating else float(getattr(info, "duration", 0.0) or 0.0)
+    summary.update({"language": getattr(info, "language", None), "duration": duration, "engine": "faster-whisper"})
+    if gating:
+        summary["speech_gating"] = gating["receipt"]
+    segments = []
+    try:
+        for segment in segment_iter:
+            if gating:
+                segment = remap_gated_segment(segment, gating["span_map"])
+            segments.append(segment)
+            if on_progress and duration > 0.0:
+                on_progress(segment["end"] / duration)
+            yield segment
+    finally:
+        discard_speech_gated_audio(gating)
+    if on_progress:
+        on_progress(1.0)
+    result = store_cached_transcript(
+        engine,
+        variant,
+        audio_fingerprint,
+        {
+            "text": " ".join(segment.get("text", "").strip() for segment in segments).strip(),
+            "segments": segments,
+            **summary,
+        },
+    )
+    summary["transcript_cache"] = result.get("transcript_cache")
+
+
+async def stream_transcribe_with_hints(file_path, *, job_id=None, progress_range=None, progress_detail="Transcribing audio", summary=None, **options):
+    """Async iterator over ``iter_transcribe_with_hints`` running on a worker thread.
+
+    With ``job_id`` and ``progress_range=(start, end)`` decode progress is
+    published to the job document. Closing the iterator early stops the
+    decode after the segment in flight.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    finished = object()
+    stop_requested = threading.Event()
+    on_progress = None
+    if job_id and progress_range:
+        on_progress = build_transcription_progress_publisher(job_id, progress_range[0], progress_range[1], progress_detail)
+
+    def deliver(item):
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            stop_requested.set()
+
+    def produce():
+        try:
+            for segment in iter_transcribe_with_hints(file_path, on_progress=on_progress, summary=summary, **options):
+                if stop_requested.is_set():
+                    break
+                deliver(("segment", segment))
+        except Exception as exc:
+            deliver(("error", exc))
+        finally:
+            deliver(("done", finished))
+
+    producer = loop.run_in_executor(None, produce)
+    try:
+        while True:
+            kind, item = await queue.get()
+            if kind == "done":
+                break
+            if kind == "error":
+                raise item
+            yield item
+    finally:
+        stop_requested.set()
+        if producer.done():
+            producer.result()
+
+
+LOW_SIGNAL_TRANSCRIPT_TOKENS = {
+    "yeah", "oh", "ah", "uh", "um", "la", "na", "hey", "woo", "ooh", "mmm",
+}
+
+
+def normalize_transcript_text(value):
+    return re.sub(r"\s+", " ", str(value or "").strip())
+
+
+def estimate_transcript_segment_confidence(segment):
+    text = normalize_transcript_text(segment.get("text"))
     if not text:
         return 0.0
 
@@ -1814,19 +2719,14 @@ def score_text_for_virality(text, keyword_weights):
 
     return boost, found
 
-def build_transcript_windows(
-    transcription_segments,
-    keyword_weights,
-    *,
-    min_segment_confidence=0.42,
-    min_window_confidence=0.52,
-):
-    if not transcription_segments:
-        return []
+def iter_transcript_window_groups(transcription_segments, min_segment_confidence=0.42):
+    """Group confident segments into speech windows, yielding each as soon as it closes.
 
-    windows = []
+    Works on a live segment stream: a window is emitted once a later segment
+    starts more than 1.2 s after it or would push it past 36 s.
+    """
     current = None
-    for segment in transcription_segments:
+    for segment in transcription_segments or []:
         start = float(segment.get("start", 0) or 0)
         end = float(segment.get("end", 0) or 0)
         text = str(segment.get("text", "") or "").strip()
@@ -1834,68 +2734,89 @@ def build_transcript_windows(
         if end <= start or not text or confidence < min_segment_confidence:
             continue
 
-        if not current:
-            current = {
-                "start": start,
-                "end": end,
-                "texts": [text],
-                "segments": [segment],
-                "confidenceSamples": [confidence],
-            }
-            continue
-
-        gap = start - current["end"]
-        proposed_duration = end - current["start"]
-        if gap <= 1.2 and proposed_duration <= 36:
-            current["end"] = end
-            current["texts"].append(text)
-            current["segments"].append(segment)
-            current["confidenceSamples"].append(confidence)
-        else:
-            windows.append(current)
-            current = {
-                "start": start,
-                "end": end,
-                "texts": [text],
-                "segments": [segment],
-                "confidenceSamples": [confidence],
-            }
+        if current:
+            gap = start - current["end"]
+            proposed_duration = end - current["start"]
+            if gap <= 1.2 and proposed_duration <= 36:
+                current["end"] = end
+                current["texts"].append(text)
+                current["segments"].append(segment)
+                current["confidenceSamples"].append(confidence)
+                continue
+            yield current
+        current = {
+            "start": start,
+            "end": end,
+            "texts": [text],
+            "segments": [segment],
+            "confidenceSamples": [confidence],
+        }
 
     if current:
-        windows.append(current)
+        yield current
 
-    ranked = []
-    for index, window in enumerate(windows):
-        duration = window["end"] - window["start"]
-        if duration < 6:
-            continue
-        window_confidence = sum(window["confidenceSamples"]) / max(1, len(window["confidenceSamples"]))
-        if window_confidence < min_window_confidence:
-            continue
-        text = " ".join(window["texts"]).strip()
-        keyword_boost, found_keywords = score_text_for_virality(text, keyword_weights)
-        word_count = len(text.split())
-        density_boost = min(12, max(0, word_count // 6))
-        duration_penalty = 0 if duration <= 28 else min(12, int(duration - 28))
-        score = min(99, 64 + keyword_boost + density_boost - duration_penalty)
-        ranked.append({
-            "id": f"speech_{index}",
-            "start": window["start"],
-            "end": window["end"],
-            "duration": duration,
-            "viralScore": score,
-            "reason": " + ".join(
-                [part for part in [
-                    "Dense spoken segment",
-                    f"Keywords: {', '.join(found_keywords)}" if found_keywords else "",
-                    "Strong question/command phrasing" if keyword_boost >= 10 else "",
-                ] if part]
-            ),
-            "text": text[:220] + ("..." if len(text) > 220 else ""),
-            "source": "speech_window",
-            "transcriptConfidence": round(window_confidence, 3),
-        })
-    return ranked
+
+def rank_transcript_window(index, window, keyword_weights, min_window_confidence=0.52):
+    duration = window["end"] - window["start"]
+    if duration < 6:
+        return None
+    window_confidence = sum(window["confidenceSamples"]) / max(1, len(window["confidenceSamples"]))
+    if window_confidence < min_window_confidence:
+        return None
+    text = " ".join(window["texts"]).strip()
+    keyword_boost, found_keywords = score_text_for_virality(text, keyword_weights)
+    word_count = len(text.split())
+    density_boost = min(12, max(0, word_count // 6))
+    duration_penalty = 0 if duration <= 28 else min(12, int(duration - 28))
+    score = min(99, 64 + keyword_boost + density_boost - duration_penalty)
+    return {
+        "id": f"speech_{index}",
+        "start": window["start"],
+        "end": window["end"],
+        "duration": duration,
+        "viralScore": score,
+        "reason": " + ".join(
+            [part for part in [
+                "Dense spoken segment",
+                f"Keywords: {', '.join(found_keywords)}" if found_keywords else "",
+                "Strong question/command phrasing" if keyword_boost >= 10 else "",
+            ] if part]
+        ),
+        "text": text[:220] + ("..." if len(text) > 220 else ""),
+        "source": "speech_window",
+        "transcriptConfidence": round(window_confidence, 3),
+    }
+
+
+def iter_transcript_windows(
+    transcription_segments,
+    keyword_weights,
+    *,
+    min_segment_confidence=0.42,
+    min_window_confidence=0.52,
+):
+    """Yield ranked speech windows while ``transcription_segments`` is still streaming."""
+    for index, window in enumerate(iter_transcript_window_groups(transcription_segments, min_segment_confidence)):
+        ranked = rank_transcript_window(index, window, keyword_weights, min_window_confidence)
+        if ranked:
+            yield ranked
+
+
+def build_transcript_windows(
+    transcription_segments,
+    keyword_weights,
+    *,
+    min_segment_confidence=0.42,
+    min_window_confidence=0.52,
+):
+    return list(
+        iter_transcript_windows(
+            transcription_segments,
+            keyword_weights,
+            min_segment_confidence=min_segment_confidence,
+            min_window_confidence=min_window_confidence,
+        )
+    )
 
 
 def build_podcast_candidate_pool(
@@ -2058,6 +2979,44 @@ def build_podcast_candidate_pool(
     )
     return deduped, transcript_quality
 
+def refine_draft_transcript_windows(input_path, candidates, *, model_name=None, max_windows=4, padding_seconds=0.6):
+    """Re-transcribe the top ``max_windows`` draft-ranked candidates with ``model_name``.
+
+    Ranking runs on a cheap draft transcript of the whole source; only the
+    windows that will actually be rendered are decoded again at full quality.
+    Returns ``(candidates, receipt)`` with refined ``text`` on those windows.
+    """
+    refined = [dict(candidate) for candidate in candidates or []]
+    started_at = time.perf_counter()
+    refined_ids = []
+    for candidate in refined[: max(0, int(max_windows))]:
+        start = max(0.0, float(candidate.get("start", 0.0) or 0.0) - padding_seconds)
+        end = float(candidate.get("end", 0.0) or 0.0) + padding_seconds
+        if end - start < 1.0:
+            continue
+        try:
+            audio = load_transcription_audio_window(input_path, start, end - start)
+            result = transcribe_with_hints_uncached(audio, model_name=model_name, chunked=False)
+        except Exception as exc:
+            logger.warning("Draft refinement failed for %s: %s", candidate.get("id"), str(exc)[-300:])
+            continue
+        text = normalize_transcript_text(
+            " ".join(str(segment.get("text") or "").strip() for segment in (result or {}).get("segments") or [])
+        )
+        if not text:
+            continue
+        candidate["text"] = text[:280] + ("..." if len(text) > 280 else "")
+        candidate["transcriptTier"] = "refined"
+        refined_ids.append(candidate.get("id"))
+    receipt = {
+        "refinedWindows": len(refined_ids),
+        "refinedIds": refined_ids,
+        "modelName": model_name,
+        "elapsedSeconds": round(time.perf_counter() - started_at, 3),
+    }
+    return refined, receipt
+
+
 def align_clip_to_scenes(candidate, scene_list):
     if not scene_list:
         return candidate
@@ -3583,56 +4542,6 @@ def build_promo_virtual_multiphone_filter(segments, src_width, src_height, targe
 
 
 
-def build_watermark_regions(width, height):
-    width = max(int(width or 1080), 320)
-    height = max(int(height or 1920), 320)
-
-    margin_x = max(18, int(width * 0.018))
-    top_margin = max(18, int(height * 0.018))
-    bottom_margin = max(68, int(height * 0.052))
-    logo_w = max(88, int(width * 0.16))
-    logo_h = max(54, int(height * 0.06))
-    username_w = max(124, int(width * 0.22))
-    username_h = max(44, int(height * 0.046))
-    username_gap = max(8, int(width * 0.012))
-    bottom_y = max(top_margin, height - username_h - bottom_margin)
-    bottom_right_x = max(margin_x, width - username_w - margin_x)
-    icon_bottom_y = max(top_margin, bottom_y - max(10, int(height * 0.01)))
-    icon_right_x = max(margin_x, width - logo_w - margin_x)
-
-    return {
-        "top_left": [
-            (margin_x, top_margin, logo_w, logo_h),
-        ],
-        "top_right": [
-            (max(margin_x, width - logo_w - margin_x), top_margin, logo_w, logo_h),
-        ],
-        "bottom_left": [
-            (margin_x, icon_bottom_y, logo_w, logo_h),
-            (margin_x + logo_w - max(4, int(width * 0.006)), bottom_y, username_w, username_h),
-        ],
-        "bottom_right": [
-            (icon_right_x, icon_bottom_y, logo_w, logo_h),
-            (bottom_right_x - logo_w - username_gap + max(4, int(width * 0.006)), bottom_y, username_w, username_h),
-        ],
-    }
-
-def score_watermark_region(frame, region):
-    x, y, region_w, region_h = region
-    roi = frame[y:y + region_h, x:x + region_w]
-    if roi is None or roi.size == 0:
-        return 0.0
-
-    gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
-    blurred = cv2.GaussianBlur(gray, (3, 3), 0)
-    edges = cv2.Canny(blurred, 80, 160)
-    _, bright_mask = cv2.threshold(gray, 208, 255, cv2.THRESH_BINARY)
-
-    edge_density = cv2.countNonZero(edges) / float(edges.size or 1)
-    bright_density = cv2.countNonZero(bright_mask) / float(bright_mask.size or 1)
-    contrast_score = float(gray.std()) / 255.0
-    return (edge_density * 0.55) + (bright_density * 0.30) + (contrast_score * 0.15)
-
 def build_alternating_watermark_schedule(duration, window_seconds=3.5):
     schedule = []
     position_pairs = [
@@ -3653,463 +4562,87 @@ def build_alternating_watermark_schedule(duration, window_seconds=3.5):
         schedule.append((0.0, max(window_seconds, safe_duration), position_pairs[0]))
     return schedule
 
-def get_default_watermark_keys(sample_index):
-    return ("top_left", "bottom_right") if sample_index % 2 == 0 else ("top_right", "bottom_left")
-
-def build_window_sample_times(start_time, end_time, samples_per_window):
-    sample_count = max(1, int(samples_per_window or 1))
-    duration = max(0.05, float(end_time) - float(start_time))
-    if sample_count == 1:
-        return [start_time + (duration / 2.0)]
-
-    step = duration / float(sample_count + 1)
-    return [start_time + (step * (index + 1)) for index in range(sample_count)]
-
-def choose_watermark_keys(scores, sample_index, previous_keys=None):
-    default_keys = get_default_watermark_keys(sample_index)
-    top_left_score = scores.get("top_left", 0.0)
-    top_right_score = scores.get("top_right", 0.0)
-    bottom_left_score = scores.get("bottom_left", 0.0)
-    bottom_right_score = scores.get("bottom_right", 0.0)
-
-    top_choice = "top_left" if top_left_score >= top_right_score else "top_right"
-    bottom_choice = "bottom_left" if bottom_left_score >= bottom_right_score else "bottom_right"
-
-    selected_keys = []
-    top_gap = abs(top_left_score - top_right_score)
-    bottom_gap = abs(bottom_left_score - bottom_right_score)
-    top_gate = max(0.022, ((top_left_score + top_right_score) / 2.0) + 0.008)
-    bottom_gate = max(0.022, ((bottom_left_score + bottom_right_score) / 2.0) + 0.008)
-
-    if top_gap < 0.012 and previous_keys:
-        previous_top = next((key for key in previous_keys if key.startswith("top_")), None)
-        if previous_top:
-            top_choice = previous_top
-    if bottom_gap < 0.012 and previous_keys:
-        previous_bottom = next((key for key in previous_keys if key.startswith("bottom_")), None)
-        if previous_bottom:
-            bottom_choice = previous_bottom
-
-    if scores.get(top_choice, 0.0) >= top_gate:
-        selected_keys.append(top_choice)
-    if scores.get(bottom_choice, 0.0) >= bottom_gate:
-        selected_keys.append(bottom_choice)
-
-    if not selected_keys:
-        selected_keys = list(default_keys)
-
-    return tuple(dict.fromkeys(selected_keys))
-
-def collapse_watermark_windows(windows):
-    collapsed = []
-    for window in windows:
-        if collapsed and collapsed[-1]["keys"] == window["keys"]:
-            previous = collapsed[-1]
-            collapsed[-1] = {
-                **window,
-                "start": previous["start"],
-                "sample_times": previous.get("sample_times", []) + window.get("sample_times", []),
-            }
-        else:
-            collapsed.append(window)
-    return collapsed
-
-def analyze_dynamic_watermark_schedule(video_path, width, height, duration, mode, window_seconds=2.4, samples_per_window=3):
-    safe_duration = max(0.0, float(duration or 0.0))
-    if safe_duration <= 0:
-        return []
-
-    regions = build_watermark_regions(width, height)
-    capture = cv2.VideoCapture(video_path)
-    if not capture.isOpened():
-        return []
-
-    windows = []
-    current_start = 0.0
-    sample_index = 0
-    previous_keys = None
-    clamped_window = clamp_float(window_seconds, 1.2, 5.0)
-    clamped_samples = max(1, min(5, int(samples_per_window or 3)))
-
-    try:
-        while current_start < safe_duration:
-            current_end = min(safe_duration, current_start + clamped_window)
-            sample_times = build_window_sample_times(current_start, current_end, clamped_samples)
-            aggregated_scores = {key: 0.0 for key in regions.keys()}
-            captured_samples = 0
-
-            for sample_time in sample_times:
-                capture.set(cv2.CAP_PROP_POS_MSEC, sample_time * 1000.0)
-                success, frame = capture.read()
-                if not success or frame is None:
-                    continue
-                captured_samples += 1
-                for key, rects in regions.items():
-                    if rects:
-                        aggregated_scores[key] += score_watermark_region(frame, rects[0])
-
-            if captured_samples > 0:
-                averaged_scores = {
-                    key: aggregated_scores[key] / float(captured_samples)
-                    for key in aggregated_scores.keys()
-                }
-                selected_keys = choose_watermark_keys(averaged_scores, sample_index, previous_keys)
-            else:
-                averaged_scores = {key: 0.0 for key in regions.keys()}
-                selected_keys = get_default_watermark_keys(sample_index)
-
-            sorted_scores = sorted(averaged_scores.values(), reverse=True)
-            confidence = round((sorted_scores[0] - sorted_scores[2]) if len(sorted_scores) >= 3 else sorted_scores[0], 4)
-            windows.append(
-                {
-                    "start": round(current_start, 3),
-                    "end": round(current_end, 3),
-                    "keys": tuple(selected_keys),
-                    "scores": {key: round(value, 4) for key, value in averaged_scores.items()},
-                    "sample_times": [round(value, 3) for value in sample_times],
-                    "captured_samples": captured_samples,
-                    "confidence": confidence,
-                }
-            )
-            previous_keys = tuple(selected_keys)
-            current_start = current_end
-            sample_index += 1
-    finally:
-        capture.release()
-
-    return windows
-
-def detect_dynamic_watermark_schedule(video_path, width, height, duration, mode, window_seconds=3.5):
-    analyzed = analyze_dynamic_watermark_schedule(video_path, width, height, duration, mode, window_seconds=window_seconds)
+def detect_dynamic_watermark_schedule(video_path, width, height, duration, mode, window_seconds=3.5, analyzed_windows=None):
+    analyzed = (
+        analyzed_windows
+        if analyzed_windows is not None
+        else analyze_dynamic_watermark_schedule(video_path, width, height, duration, mode, window_seconds=window_seconds)
+    )
     if not analyzed:
         safe_duration = max(0.0, float(duration or 0.0))
         return build_alternating_watermark_schedule(safe_duration or window_seconds, window_seconds)
     analyzed = collapse_watermark_windows(analyzed)
     return [(window["start"], window["end"], window["keys"]) for window in analyzed]
 
-def create_watermark_preview_sheet(video_path, width, height, analyzed_windows, max_preview_frames=6):
-    if not analyzed_windows:
-        return None
-
-    capture = cv2.VideoCapture(video_path)
-    if not capture.isOpened():
-        return None
-
-    regions = build_watermark_regions(width, height)
-    preview_tiles = []
-    target_count = max(1, min(int(max_preview_frames or 6), len(analyzed_windows)))
-    if len(analyzed_windows) <= target_count:
-        target_windows = analyzed_windows
-    else:
-        step = max(1, len(analyzed_windows) // target_count)
-        target_windows = [analyzed_windows[index] for index in range(0, len(analyzed_windows), step)][:target_count]
+def build_tracked_manual_filters(width, height, duration, video_path, manual_regions, target_time=None, tracked_positions_by_region=None):
+    filters = []
+    safe_duration = max(0.0, float(duration or 0.0))
+    if tracked_positions_by_region is None and video_path:
+        # One decode tracks every manual region instead of reopening the
+        # video once per region.
+        tracked_positions_by_region = run_watermark_analysis_pass(
+            video_path,
+            width,
+            height,
+            safe_duration,
+            manual_regions=manual_regions,
+            target_time=target_time,
+            include_schedule=False,
+        )["manual_positions"]
 
-    try:
-        for index, window in enumerate(target_windows):
-            sample_time = window.get("sample_times", [window["start"]])[0]
-            capture.set(cv2.CAP_PROP_POS_MSEC, float(sample_time) * 1000.0)
-            success, frame = capture.read()
-            if not success or frame is None:
-                continue
+    for region_index, region in enumerate(manual_regions):
+        tracking_enabled = bool(region.get("track", True))
+        if not tracking_enabled or not video_path:
+            left = max(0.0, min(100.0, float(region.get("left", 0.0))))
+            top = max(0.0, min(100.0, float(region.get("top", 0.0))))
+            region_w_pct = max(1.0, min(100.0, float(region.get("width", 0.0))))
+            region_h_pct = max(1.0, min(100.0, float(region.get("height", 0.0))))
+            region_x = int((left / 100.0) * width)
+            region_y = int((top / 100.0) * height)
+            region_w = max(32, int((region_w_pct / 100.0) * width))
+            region_h = max(24, int((region_h_pct / 100.0) * height))
+            region_x, region_y, region_w, region_h = clamp_delogo_region(width, height, region_x, region_y, region_w, region_h)
+            filters.append(f"delogo=x={region_x}:y={region_y}:w={region_w}:h={region_h}:show=0")
+            continue
 
-            annotated = frame.copy()
-            for key, rects in regions.items():
-                color = (64, 64, 64)
-                thickness = 1
-                if key in window["keys"]:
-                    color = (0, 220, 255) if key.startswith("top_") else (0, 255, 120)
-                    thickness = 3
-                for x, y, region_w, region_h in rects:
-                    cv2.rectangle(annotated, (x, y), (x + region_w, y + region_h), color, thickness)
-
-            cv2.putText(
-                annotated,
-                f"{window['start']:.1f}s-{window['end']:.1f}s | {', '.join(window['keys'])}",
-                (24, 36),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.82,
-                (255, 255, 255),
-                2,
-                cv2.LINE_AA,
-            )
-            cv2.putText(
-                annotated,
-                f"confidence={window.get('confidence', 0):.3f}",
-                (24, 68),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.68,
-                (240, 240, 240),
-                2,
-                cv2.LINE_AA,
+        tracked_positions = (tracked_positions_by_region or [None] * len(manual_regions))[region_index]
+        if not tracked_positions:
+            tracked_positions = track_manual_region_positions(
+                video_path,
+                width,
+                height,
+                safe_duration,
+                region,
+                target_time=target_time,
+                sample_interval=0.9,
             )
+        if target_time is not None:
+            target_key = sorted(tracked_positions.keys(), key=lambda value: abs(value - float(target_time)))[0]
+            region_x, region_y, region_w, region_h = tracked_positions[target_key]
+            filters.append(f"delogo=x={region_x}:y={region_y}:w={region_w}:h={region_h}:show=0")
+            continue
 
-            preview_tiles.append(cv2.resize(annotated, (480, 270)))
-    finally:
-        capture.release()
-
-    if not preview_tiles:
-        return None
+        ordered_times = sorted(tracked_positions.keys())
+        if not ordered_times:
+            continue
 
-    while len(preview_tiles) % 2 != 0:
-        preview_tiles.append(np.zeros_like(preview_tiles[0]))
+        merged_windows = []
+        for index, start_time in enumerate(ordered_times):
+            end_time = safe_duration if index == len(ordered_times) - 1 else ordered_times[index + 1]
+            box = tracked_positions[start_time]
+            if merged_windows and merged_windows[-1]["box"] == box:
+                merged_windows[-1]["end"] = end_time
+            else:
+                merged_windows.append({"start": start_time, "end": end_time, "box": box})
 
-    rows = []
-    for index in range(0, len(preview_tiles), 2):
-        rows.append(cv2.hconcat(preview_tiles[index:index + 2]))
+        for window in merged_windows:
+            region_x, region_y, region_w, region_h = window["box"]
+            enable_expr = f"between(t\\,{window['start']:.3f}\\,{window['end']:.3f})"
+            filters.append(
+                f"delogo=x={region_x}:y={region_y}:w={region_w}:h={region_h}:show=0:enable='{enable_expr}'"
+            )
 
-    return cv2.vconcat(rows) if len(rows) > 1 else rows[0]
-
-def clamp_delogo_region(width, height, x, y, region_w, region_h):
-    safe_width = max(int(width or 1080), 32)
-    safe_height = max(int(height or 1920), 32)
-
-    x = int(x)
-    y = int(y)
-    region_w = int(region_w)
-    region_h = int(region_h)
-
-    x = max(1, min(safe_width - 2, x))
-    y = max(1, min(safe_height - 2, y))
-    region_w = max(1, min(safe_width - x - 1, region_w))
-    region_h = max(1, min(safe_height - y - 1, region_h))
-    return x, y, region_w, region_h
-
-def read_video_frame_at_time(capture, time_seconds):
-    capture.set(cv2.CAP_PROP_POS_MSEC, max(0.0, float(time_seconds or 0.0)) * 1000.0)
-    success, frame = capture.read()
-    if not success or frame is None:
-        return None
-    return frame
-
-def build_tracking_candidate_windows(width, height, region_w, region_h, previous_box=None, seed_box=None):
-    windows = []
-
-    def add_window(x, y, window_w, window_h):
-        x = max(0, min(width - 2, int(x)))
-        y = max(0, min(height - 2, int(y)))
-        window_w = max(region_w + 2, min(width - x, int(window_w)))
-        window_h = max(region_h + 2, min(height - y, int(window_h)))
-        key = (x, y, window_w, window_h)
-        if window_w > region_w and window_h > region_h and key not in windows:
-            windows.append(key)
-
-    def add_local_windows(box, padding_scale_x=2.6, padding_scale_y=2.4):
-        if not box:
-            return
-        box_x, box_y, box_w, box_h = box
-        pad_x = max(40, int(box_w * padding_scale_x), int(width * 0.08))
-        pad_y = max(32, int(box_h * padding_scale_y), int(height * 0.07))
-        add_window(box_x - pad_x, box_y - pad_y, box_w + (pad_x * 2), box_h + (pad_y * 2))
-
-        mirrored_x = max(0, width - box_x - box_w)
-        add_window(mirrored_x - pad_x, box_y - pad_y, box_w + (pad_x * 2), box_h + (pad_y * 2))
-
-    add_local_windows(previous_box)
-    add_local_windows(seed_box, padding_scale_x=3.0, padding_scale_y=2.8)
-
-    corner_w = max(region_w + max(72, int(width * 0.18)), int(width * 0.34))
-    corner_h = max(region_h + max(60, int(height * 0.12)), int(height * 0.24))
-    add_window(0, 0, corner_w, corner_h)
-    add_window(width - corner_w, 0, corner_w, corner_h)
-    add_window(0, height - corner_h, corner_w, corner_h)
-    add_window(width - corner_w, height - corner_h, corner_w, corner_h)
-    add_window(0, max(0, int(height * 0.42)), max(region_w + 80, int(width * 0.42)), max(region_h + 80, int(height * 0.24)))
-    add_window(max(0, int(width * 0.58)), max(0, int(height * 0.42)), max(region_w + 80, int(width * 0.42)), max(region_h + 80, int(height * 0.24)))
-    return windows
-
-def locate_template_in_frame(frame, template_gray, width, height, region_w, region_h, previous_box=None, seed_box=None):
-    if frame is None or template_gray is None or template_gray.size == 0:
-        return None
-
-    frame_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    candidate_windows = build_tracking_candidate_windows(width, height, region_w, region_h, previous_box, seed_box)
-    best_match = None
-
-    for window_x, window_y, window_w, window_h in candidate_windows:
-        roi = frame_gray[window_y:window_y + window_h, window_x:window_x + window_w]
-        if roi is None or roi.size == 0:
-            continue
-        if roi.shape[0] <= template_gray.shape[0] or roi.shape[1] <= template_gray.shape[1]:
-            continue
-
-        result = cv2.matchTemplate(roi, template_gray, cv2.TM_CCOEFF_NORMED)
-        _, score, _, max_loc = cv2.minMaxLoc(result)
-        candidate = (
-            window_x + int(max_loc[0]),
-            window_y + int(max_loc[1]),
-            region_w,
-            region_h,
-            float(score),
-        )
-        if best_match is None or candidate[4] > best_match[4]:
-            best_match = candidate
-
-    return best_match
-
-def build_manual_tracking_times(seed_time, duration, sample_interval, target_time=None):
-    safe_duration = max(0.0, float(duration or 0.0))
-    safe_seed = clamp_float(seed_time, 0.0, safe_duration if safe_duration > 0 else 0.0)
-    safe_interval = clamp_float(sample_interval, 0.35, 2.0)
-
-    if target_time is not None:
-        safe_target = clamp_float(target_time, 0.0, safe_duration if safe_duration > 0 else 0.0)
-        times = {round(safe_seed, 3), round(safe_target, 3)}
-        if safe_target >= safe_seed:
-            current_time = safe_seed
-            while current_time < safe_target:
-                times.add(round(current_time, 3))
-                current_time += safe_interval
-        else:
-            current_time = safe_seed
-            while current_time > safe_target:
-                times.add(round(current_time, 3))
-                current_time -= safe_interval
-        return sorted(times)
-
-    times = {0.0, round(safe_seed, 3), round(safe_duration, 3)}
-    current_time = 0.0
-    while current_time < safe_duration:
-        times.add(round(current_time, 3))
-        current_time += safe_interval
-    times.add(round(safe_duration, 3))
-    return sorted(times)
-
-def track_manual_region_positions(video_path, width, height, duration, region, target_time=None, sample_interval=0.9):
-    safe_duration = max(0.0, float(duration or 0.0))
-    seed_time = clamp_float(region.get("seed_time", 0.0), 0.0, safe_duration if safe_duration > 0 else 0.0)
-
-    left = max(0.0, min(100.0, float(region.get("left", 0.0))))
-    top = max(0.0, min(100.0, float(region.get("top", 0.0))))
-    region_w_pct = max(1.0, min(100.0, float(region.get("width", 0.0))))
-    region_h_pct = max(1.0, min(100.0, float(region.get("height", 0.0))))
-    seed_x = int((left / 100.0) * width)
-    seed_y = int((top / 100.0) * height)
-    seed_w = max(32, int((region_w_pct / 100.0) * width))
-    seed_h = max(24, int((region_h_pct / 100.0) * height))
-    seed_box = clamp_delogo_region(width, height, seed_x, seed_y, seed_w, seed_h)
-
-    times = build_manual_tracking_times(seed_time, safe_duration, sample_interval, target_time)
-    if len(times) <= 1 or not video_path:
-        return {times[0] if times else round(seed_time, 3): seed_box}
-
-    capture = cv2.VideoCapture(video_path)
-    if not capture.isOpened():
-        return {time_value: seed_box for time_value in times}
-
-    positions = {round(seed_time, 3): seed_box}
-
-    try:
-        seed_frame = read_video_frame_at_time(capture, seed_time)
-        if seed_frame is None:
-            return {time_value: seed_box for time_value in times}
-
-        box_x, box_y, box_w, box_h = seed_box
-        template = seed_frame[box_y:box_y + box_h, box_x:box_x + box_w]
-        if template is None or template.size == 0:
-            return {time_value: seed_box for time_value in times}
-
-        template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
-        times_sorted = sorted(times)
-        seed_key = round(seed_time, 3)
-        if seed_key not in times_sorted:
-            times_sorted.append(seed_key)
-            times_sorted.sort()
-
-        seed_index = times_sorted.index(seed_key)
-
-        previous_box = seed_box
-        for time_value in times_sorted[seed_index + 1:]:
-            frame = read_video_frame_at_time(capture, time_value)
-            best_match = locate_template_in_frame(
-                frame,
-                template_gray,
-                width,
-                height,
-                box_w,
-                box_h,
-                previous_box=previous_box,
-                seed_box=seed_box,
-            )
-            if best_match and best_match[4] >= 0.18:
-                previous_box = clamp_delogo_region(width, height, best_match[0], best_match[1], box_w, box_h)
-            positions[time_value] = previous_box
-
-        previous_box = seed_box
-        for time_value in reversed(times_sorted[:seed_index]):
-            frame = read_video_frame_at_time(capture, time_value)
-            best_match = locate_template_in_frame(
-                frame,
-                template_gray,
-                width,
-                height,
-                box_w,
-                box_h,
-                previous_box=previous_box,
-                seed_box=seed_box,
-            )
-            if best_match and best_match[4] >= 0.18:
-                previous_box = clamp_delogo_region(width, height, best_match[0], best_match[1], box_w, box_h)
-            positions[time_value] = previous_box
-    finally:
-        capture.release()
-
-    return positions
-
-def build_tracked_manual_filters(width, height, duration, video_path, manual_regions, target_time=None):
-    filters = []
-    safe_duration = max(0.0, float(duration or 0.0))
-
-    for region in manual_regions:
-        tracking_enabled = bool(region.get("track", True))
-        if not tracking_enabled or not video_path:
-            left = max(0.0, min(100.0, float(region.get("left", 0.0))))
-            top = max(0.0, min(100.0, float(region.get("top", 0.0))))
-            region_w_pct = max(1.0, min(100.0, float(region.get("width", 0.0))))
-            region_h_pct = max(1.0, min(100.0, float(region.get("height", 0.0))))
-            region_x = int((left / 100.0) * width)
-            region_y = int((top / 100.0) * height)
-            region_w = max(32, int((region_w_pct / 100.0) * width))
-            region_h = max(24, int((region_h_pct / 100.0) * height))
-            region_x, region_y, region_w, region_h = clamp_delogo_region(width, height, region_x, region_y, region_w, region_h)
-            filters.append(f"delogo=x={region_x}:y={region_y}:w={region_w}:h={region_h}:show=0")
-            continue
-
-        tracked_positions = track_manual_region_positions(
-            video_path,
-            width,
-            height,
-            safe_duration,
-            region,
-            target_time=target_time,
-            sample_interval=0.9,
-        )
-        if target_time is not None:
-            target_key = sorted(tracked_positions.keys(), key=lambda value: abs(value - float(target_time)))[0]
-            region_x, region_y, region_w, region_h = tracked_positions[target_key]
-            filters.append(f"delogo=x={region_x}:y={region_y}:w={region_w}:h={region_h}:show=0")
-            continue
-
-        ordered_times = sorted(tracked_positions.keys())
-        if not ordered_times:
-            continue
-
-        merged_windows = []
-        for index, start_time in enumerate(ordered_times):
-            end_time = safe_duration if index == len(ordered_times) - 1 else ordered_times[index + 1]
-            box = tracked_positions[start_time]
-            if merged_windows and merged_windows[-1]["box"] == box:
-                merged_windows[-1]["end"] = end_time
-            else:
-                merged_windows.append({"start": start_time, "end": end_time, "box": box})
-
-        for window in merged_windows:
-            region_x, region_y, region_w, region_h = window["box"]
-            enable_expr = f"between(t\\,{window['start']:.3f}\\,{window['end']:.3f})"
-            filters.append(
-                f"delogo=x={region_x}:y={region_y}:w={region_w}:h={region_h}:show=0:enable='{enable_expr}'"
-            )
-
-    return filters
+    return filters
 
 def resolve_schedule_keys_at_time(schedule, target_time):
     if not schedule:
@@ -4126,7 +4659,16 @@ def resolve_schedule_keys_at_time(schedule, target_time):
     )
     return tuple(nearest_window[2])
 
-def build_delogo_filters(width, height, mode, duration=None, video_path=None, manual_regions=None, target_time=None):
+def build_delogo_filters(
+    width,
+    height,
+    mode,
+    duration=None,
+    video_path=None,
+    manual_regions=None,
+    target_time=None,
+    analyzed_windows=None,
+):
     width = max(int(width or 1080), 320)
     height = max(int(height or 1920), 320)
     mode = str(mode or "adaptive").strip().lower()
@@ -4141,7 +4683,14 @@ def build_delogo_filters(width, height, mode, duration=None, video_path=None, ma
         if target_time is not None:
             filters = []
             active_keys = resolve_schedule_keys_at_time(
-                detect_dynamic_watermark_schedule(video_path, width, height, duration, mode),
+                detect_dynamic_watermark_schedule(
+                    video_path,
+                    width,
+                    height,
+                    duration,
+                    mode,
+                    analyzed_windows=analyzed_windows,
+                ),
                 target_time,
             )
             for key in active_keys:
@@ -4151,7 +4700,14 @@ def build_delogo_filters(width, height, mode, duration=None, video_path=None, ma
             return filters
 
         filters = []
-        for start_time, end_time, keys in detect_dynamic_watermark_schedule(video_path, width, height, duration, mode):
+        for start_time, end_time, keys in detect_dynamic_watermark_schedule(
+            video_path,
+            width,
+            height,
+            duration,
+            mode,
+            analyzed_windows=analyzed_windows,
+        ):
             enable_expr = f"between(t\\,{start_time:.3f}\\,{end_time:.3f})"
             for key in keys:
                 for x, y, region_w, region_h in regions.get(key, []):
@@ -4259,27 +4815,16 @@ CAPTION_STYLES = {
 }
 
 
-def generate_ass_captions(
-    whisper_result,
-    style_name="bold_pop",
-    video_width=1080,
-    video_height=1920,
-    caption_position="lower",
-    caption_scale=1.0,
-):
-    """
-    Generate ASS (Advanced SubStation Alpha) subtitle file content
-    with word-level animated captions from Whisper's word_timestamps output.
-    """
-    style = resolve_caption_layout(
+def resolve_ass_caption_style(style_name="bold_pop", caption_position="lower", caption_scale=1.0):
+    return resolve_caption_layout(
         caption_position,
         caption_scale,
         CAPTION_STYLES.get(style_name, CAPTION_STYLES["bold_pop"]),
     )
-    segments = whisper_result.get("segments", [])
 
-    # ASS header
-    ass_lines = [
+
+def build_ass_caption_header(style, video_width=1080, video_height=1920):
+    return [
         "[Script Info]",
         "ScriptType: v4.00+",
         f"PlayResX: {video_width}",
@@ -4304,124 +4849,152 @@ def generate_ass_captions(
         "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
     ]
 
-    hallucinations = {"thank you.", "thanks.", "bye.", "music.", "watching.", "mbc", "lbc", "you", "silence"}
 
-    for segment in segments:
-        words = segment.get("words", [])
-        seg_text = str(segment.get("text", "")).strip()
+ASS_CAPTION_HALLUCINATIONS = {"thank you.", "thanks.", "bye.", "music.", "watching.", "mbc", "lbc", "you", "silence"}
 
-        # Filter hallucinations
-        if seg_text.lower().strip(". ") in hallucinations:
-            continue
-        if segment.get("no_speech_prob", 0) > 0.8:
-            continue
 
-        if not words:
-            # Fallback: show full segment text without word-level animation
-            start_ass = _seconds_to_ass_time(segment["start"])
-            end_ass = _seconds_to_ass_time(segment["end"])
-            clean = re.sub(r"\[.*?\]|\(.*?\)", "", seg_text).strip()
-            if clean and len(clean) >= 2:
-                ass_lines.append(f"Dialogue: 0,{start_ass},{end_ass},Default,,0,0,0,,{_escape_ass(clean)}")
-            continue
+def build_ass_caption_segment_events(segment, style):
+    """``Dialogue`` lines for one transcript segment.
+
+    Events never span segments, so captions can be built segment by segment
+    while the transcript is still streaming.
+    """
+    events = []
+    words = segment.get("words", [])
+    seg_text = str(segment.get("text", "")).strip()
 
-        # Build word groups (3-5 words per line for readability)
-        groups = _chunk_words(words, max_words=5)
+    # Filter hallucinations
+    if seg_text.lower().strip(". ") in ASS_CAPTION_HALLUCINATIONS:
+        return events
+    if segment.get("no_speech_prob", 0) > 0.8:
+        return events
 
-        for group in groups:
-            if not group:
-                continue
-            group_start = group[0]["start"]
-            group_end = group[-1]["end"]
-            start_ass = _seconds_to_ass_time(group_start)
-            end_ass = _seconds_to_ass_time(group_end)
-
-            # Build the animated text line
-            if style["animation"] == "karaoke_fill":
-                # Karaoke: words fill with color as they're spoken
-                text_parts = []
-                for word in group:
-                    w_dur_cs = max(1, int((word["end"] - word["start"]) * 100))
-                    word_text = _escape_ass(word.get("word", "").strip())
-                    if word_text:
-                        spacer = "" if not text_parts else " "
-                        text_parts.append(f"{spacer}{{\\kf{w_dur_cs}}}{word_text}")
-                if text_parts:
-                    line = "".join(text_parts)
-                    ass_lines.append(f"Dialogue: 0,{start_ass},{end_ass},Default,,0,0,0,,{line}")
-
-            elif style["animation"] == "scale_pop":
-                # Bold Pop: active word scales up briefly
-                for i, word in enumerate(group):
-                    w_start = _seconds_to_ass_time(word["start"])
-                    w_end = _seconds_to_ass_time(word["end"])
-                    word_text = _escape_ass(word.get("word", "").strip())
-                    if not word_text:
+    if not words:
+        # Fallback: show full segment text without word-level animation
+        start_ass = _seconds_to_ass_time(segment["start"])
+        end_ass = _seconds_to_ass_time(segment["end"])
+        clean = re.sub(r"\[.*?\]|\(.*?\)", "", seg_text).strip()
+        if clean and len(clean) >= 2:
+            events.append(f"Dialogue: 0,{start_ass},{end_ass},Default,,0,0,0,,{_escape_ass(clean)}")
+        return events
+
+    # Build word groups (3-5 words per line for readability)
+    groups = _chunk_words(words, max_words=5)
+
+    for group in groups:
+        if not group:
+            continue
+        group_start = group[0]["start"]
+        group_end = group[-1]["end"]
+        start_ass = _seconds_to_ass_time(group_start)
+        end_ass = _seconds_to_ass_time(group_end)
+
+        # Build the animated text line
+        if style["animation"] == "karaoke_fill":
+            # Karaoke: words fill with color as they're spoken
+            text_parts = []
+            for word in group:
+                w_dur_cs = max(1, int((word["end"] - word["start"]) * 100))
+                word_text = _escape_ass(word.get("word", "").strip())
+                if word_text:
+                    spacer = "" if not text_parts else " "
+                    text_parts.append(f"{spacer}{{\\kf{w_dur_cs}}}{word_text}")
+            if text_parts:
+                line = "".join(text_parts)
+                events.append(f"Dialogue: 0,{start_ass},{end_ass},Default,,0,0,0,,{line}")
+
+        elif style["animation"] == "scale_pop":
+            # Bold Pop: active word scales up briefly
+            for i, word in enumerate(group):
+                w_start = _seconds_to_ass_time(word["start"])
+                w_end = _seconds_to_ass_time(word["end"])
+                word_text = _escape_ass(word.get("word", "").strip())
+                if not word_text:
+                    continue
+                # Build line: all words shown, active word is highlighted + scaled
+                parts = []
+                for j, w in enumerate(group):
+                    wt = _escape_ass(w.get("word", "").strip())
+                    if not wt:
                         continue
-                    # Build line: all words shown, active word is highlighted + scaled
-                    parts = []
-                    for j, w in enumerate(group):
-                        wt = _escape_ass(w.get("word", "").strip())
-                        if not wt:
-                            continue
-                        if j == i:
-                            parts.append(f"{{\\fscx115\\fscy115\\c{style['highlight_color']}\\b1}}{wt}{{\\fscx100\\fscy100\\c{style['primary_color']}\\b1}}")
-                        else:
-                            parts.append(wt)
-                    line = " ".join(parts)
-                    ass_lines.append(f"Dialogue: 0,{w_start},{w_end},Default,,0,0,0,,{line}")
-
-            elif style["animation"] == "bounce_word":
-                # Bounce: active word moves up slightly
-                for i, word in enumerate(group):
-                    w_start = _seconds_to_ass_time(word["start"])
-                    w_end = _seconds_to_ass_time(word["end"])
-                    word_text = _escape_ass(word.get("word", "").strip())
-                    if not word_text:
+                    if j == i:
+                        parts.append(f"{{\\fscx115\\fscy115\\c{style['highlight_color']}\\b1}}{wt}{{\\fscx100\\fscy100\\c{style['primary_color']}\\b1}}")
+                    else:
+                        parts.append(wt)
+                line = " ".join(parts)
+                events.append(f"Dialogue: 0,{w_start},{w_end},Default,,0,0,0,,{line}")
+
+        elif style["animation"] == "bounce_word":
+            # Bounce: active word moves up slightly
+            for i, word in enumerate(group):
+                w_start = _seconds_to_ass_time(word["start"])
+                w_end = _seconds_to_ass_time(word["end"])
+                word_text = _escape_ass(word.get("word", "").strip())
+                if not word_text:
+                    continue
+                parts = []
+                for j, w in enumerate(group):
+                    wt = _escape_ass(w.get("word", "").strip())
+                    if not wt:
                         continue
-                    parts = []
-                    for j, w in enumerate(group):
-                        wt = _escape_ass(w.get("word", "").strip())
-                        if not wt:
-                            continue
-                        if j == i:
-                            parts.append(f"{{\\move(0,0,0,-12)\\c{style['highlight_color']}\\b1}}{wt}{{\\c{style['primary_color']}\\b0}}")
-                        else:
-                            parts.append(wt)
-                    line = " ".join(parts)
-                    ass_lines.append(f"Dialogue: 0,{w_start},{w_end},Default,,0,0,0,,{line}")
-
-            elif style["animation"] == "glow_pulse":
-                # Glow: active word gets extra outline glow
-                for i, word in enumerate(group):
-                    w_start = _seconds_to_ass_time(word["start"])
-                    w_end = _seconds_to_ass_time(word["end"])
-                    word_text = _escape_ass(word.get("word", "").strip())
-                    if not word_text:
+                    if j == i:
+                        parts.append(f"{{\\move(0,0,0,-12)\\c{style['highlight_color']}\\b1}}{wt}{{\\c{style['primary_color']}\\b0}}")
+                    else:
+                        parts.append(wt)
+                line = " ".join(parts)
+                events.append(f"Dialogue: 0,{w_start},{w_end},Default,,0,0,0,,{line}")
+
+        elif style["animation"] == "glow_pulse":
+            # Glow: active word gets extra outline glow
+            for i, word in enumerate(group):
+                w_start = _seconds_to_ass_time(word["start"])
+                w_end = _seconds_to_ass_time(word["end"])
+                word_text = _escape_ass(word.get("word", "").strip())
+                if not word_text:
+                    continue
+                parts = []
+                for j, w in enumerate(group):
+                    wt = _escape_ass(w.get("word", "").strip())
+                    if not wt:
                         continue
-                    parts = []
-                    for j, w in enumerate(group):
-                        wt = _escape_ass(w.get("word", "").strip())
-                        if not wt:
-                            continue
-                        if j == i:
-                            parts.append(f"{{\\bord{style['outline'] + 3}\\3c{style['highlight_color']}\\c{style['highlight_color']}}}{wt}{{\\bord{style['outline']}\\3c{style['outline_color']}\\c{style['primary_color']}}}")
-                        else:
-                            parts.append(wt)
-                    line = " ".join(parts)
-                    ass_lines.append(f"Dialogue: 0,{w_start},{w_end},Default,,0,0,0,,{line}")
+                    if j == i:
+                        parts.append(f"{{\\bord{style['outline'] + 3}\\3c{style['highlight_color']}\\c{style['highlight_color']}}}{wt}{{\\bord{style['outline']}\\3c{style['outline_color']}\\c{style['primary_color']}}}")
+                    else:
+                        parts.append(wt)
+                line = " ".join(parts)
+                events.append(f"Dialogue: 0,{w_start},{w_end},Default,,0,0,0,,{line}")
+
+        else:
+            # fade_word (minimal): simple fade per word group
+            clean_text = " ".join(_escape_ass(w.get("word", "").strip()) for w in group if w.get("word", "").strip())
+            if clean_text:
+                fade_in_ms = 100
+                fade_out_ms = 150
+                events.append(
+                    f"Dialogue: 0,{start_ass},{end_ass},Default,,0,0,0,,"
+                    f"{{\\fad({fade_in_ms},{fade_out_ms})}}{clean_text}"
+                )
+
+
+    return events
 
-            else:
-                # fade_word (minimal): simple fade per word group
-                clean_text = " ".join(_escape_ass(w.get("word", "").strip()) for w in group if w.get("word", "").strip())
-                if clean_text:
-                    fade_in_ms = 100
-                    fade_out_ms = 150
-                    ass_lines.append(
-                        f"Dialogue: 0,{start_ass},{end_ass},Default,,0,0,0,,"
-                        f"{{\\fad({fade_in_ms},{fade_out_ms})}}{clean_text}"
-                    )
 
+def generate_ass_captions(
+    whisper_result,
+    style_name="bold_pop",
+    video_width=1080,
+    video_height=1920,
+    caption_position="lower",
+    caption_scale=1.0,
+):
+    """
+    Generate ASS (Advanced SubStation Alpha) subtitle file content
+    with word-level animated captions from Whisper's word_timestamps output.
+    """
+    style = resolve_ass_caption_style(style_name, caption_position, caption_scale)
+    ass_lines = build_ass_caption_header(style, video_width, video_height)
+    for segment in whisper_result.get("segments", []):
+        ass_lines.extend(build_ass_caption_segment_events(segment, style))
     return "\n".join(ass_lines)
 
 
@@ -4510,11 +5083,14 @@ def build_multicam_caption_layout_context(segments, video_width=1920, video_heig
     return context
 
 
+def index_multicam_caption_layout_context(layout_context):
+    if isinstance(layout_context, SegmentTimeline):
+        return layout_context
+    return SegmentTimeline.from_keys(layout_context, "start", "end")
+
+
 def find_multicam_caption_segment(layout_context, seconds):
-    for item in layout_context or []:
-        if float(item.get("start", 0.0)) <= seconds < float(item.get("end", 0.0)) + 0.05:
-            return item
-    return None
+    return index_multicam_caption_layout_context(layout_context).at(seconds, end_tolerance=0.05)
 
 
 def extract_caption_channel_samples(audio_path, sample_rate=8000):
@@ -5012,7 +5588,108 @@ def apply_external_director_channel_activity(
     }
 
 
-def build_caption_word_speaker_assignments(audio_path, whisper_result, segments, job_id=None):
+def mean_activity_over_intervals(times, values, starts, ends, interpolate=False):
+    """Duration-weighted mean of windowed ``values`` over each ``[start, end)``.
+
+    ``times`` are sorted window starts; every window lasts until the next one
+    (the last one for the median step). Intervals outside the covered range
+    come back as NaN. By default each window is constant; ``interpolate``
+    instead treats each value as the level at its window centre and
+    integrates the straight line between neighbouring centres, so an
+    interval inside a window still leans toward the neighbour it sits next to.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    if times.size == 0:
+        return np.full(starts.shape, np.nan)
+    step = float(np.median(np.diff(times))) if times.size > 1 else 0.5
+    edges = np.append(times, times[-1] + max(step, 1e-3))
+    if interpolate:
+        # Knots at each window centre, held flat out to the covered edges.
+        knots = np.concatenate([[edges[0]], (edges[:-1] + edges[1:]) / 2.0, [edges[-1]]])
+        levels = np.concatenate([[values[0]], values, [values[-1]]])
+        spans = np.diff(knots)
+        slopes = np.divide(np.diff(levels), spans, out=np.zeros(spans.size), where=spans > 0.0)
+        cumulative = np.concatenate([[0.0], np.cumsum((levels[:-1] + levels[1:]) / 2.0 * spans)])
+
+        def integral(points):
+            clipped = np.clip(points, knots[0], knots[-1])
+            index = np.clip(np.searchsorted(knots, clipped, side="right") - 1, 0, spans.size - 1)
+            offset = clipped - knots[index]
+            return cumulative[index] + levels[index] * offset + 0.5 * slopes[index] * offset ** 2
+    else:
+        cumulative = np.concatenate([[0.0], np.cumsum(values * np.diff(edges))])
+
+        def integral(points):
+            clipped = np.clip(points, edges[0], edges[-1])
+            index = np.clip(np.searchsorted(edges, clipped, side="right") - 1, 0, values.size - 1)
+            return cumulative[index] + values[index] * (clipped - edges[index])
+
+    covered = np.clip(ends, edges[0], edges[-1]) - np.clip(starts, edges[0], edges[-1])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = (integral(ends) - integral(starts)) / covered
+    return np.where(covered > 1e-6, means, np.nan)
+
+
+def caption_camera_activity_over_words(source, word_starts, word_ends, render_segments, overlap_start=0.0):
+    """Return ``(values, mode)`` for one camera over caption word intervals, from cached director activity.
+
+    Master-timeline channel windows are read directly (``mode="db"``,
+    comparable across cameras). Source-time scratch windows are reached by
+    mapping each word through the render segment it falls in (``mode="activity"``).
+
+    The windows are ~0.5 s, coarser than the per-word RMS of the decode
+    path, so levels are interpolated between window centres and averaged
+    over each word's own bounds.  A word a few tenths of a second from a
+    speaker change that falls mid-window still resolves to its side of the
+    change; a word straddling the change itself comes back as a tie.
+    """
+    timeline_windows = source.get("timeline_audio_activity_windows") or []
+    if timeline_windows:
+        times = np.array([float(item.get("time", 0.0) or 0.0) for item in timeline_windows])
+        power = np.power(10.0, np.array([float(item.get("db", -80.0)) for item in timeline_windows]) / 10.0)
+        mean_power = mean_activity_over_intervals(times, power, word_starts, word_ends, interpolate=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return 10.0 * np.log10(np.maximum(mean_power, 1e-8)), "db"
+
+    source_windows = source.get("audio_activity_windows") or []
+    if not source_windows or not render_segments:
+        return None, None
+    segment_starts = np.array([float(item.get("timeline_start", 0.0) or 0.0) for item in render_segments])
+    segment_source_starts = get_source_starts_for_timeline(source, overlap_start, segment_starts)
+    sync_rate = float(source.get("sync_rate") or 1.0)
+    segment_index = np.clip(np.searchsorted(segment_starts, word_starts, side="right") - 1, 0, segment_starts.size - 1)
+    base = segment_source_starts[segment_index] - segment_starts[segment_index] * sync_rate
+    times = np.array([float(item.get("time", 0.0) or 0.0) for item in source_windows])
+    activity = np.array([float(item.get("activity", 0.0) or 0.0) for item in source_windows])
+    return (
+        mean_activity_over_intervals(
+            times,
+            activity,
+            base + word_starts * sync_rate,
+            base + word_ends * sync_rate,
+            interpolate=True,
+        ),
+        "activity",
+    )
+
+
+def build_caption_word_speaker_assignments(
+    audio_path,
+    whisper_result,
+    segments,
+    job_id=None,
+    activity_sources=None,
+    overlap_start=0.0,
+):
+    """Tag caption words with the speaking camera.
+
+    Uses the per-camera activity the director already computed
+    (``activity_sources`` are the prepared sources) and only decodes the
+    master's stereo channels when no camera has cached activity.
+    """
     camera_ids = []
     for segment in segments or []:
         for camera_id in (segment.get("camera_id"), segment.get("secondary_camera_id")):
@@ -5036,6 +5713,53 @@ def build_caption_word_speaker_assignments(audio_path, whisper_result, segments,
                 camera_ids = mapped[:2]
                 break
 
+    words = []
+    word_starts = []
+    word_ends = []
+    for segment in (whisper_result or {}).get("segments", []) or []:
+        for word in segment.get("words", []) or []:
+            start = max(0.0, float(word.get("start", segment.get("start", 0.0)) or 0.0) - 0.035)
+            words.append(word)
+            word_starts.append(start)
+            word_ends.append(max(start + 0.08, float(word.get("end", start + 0.18) or start + 0.18) + 0.035))
+    word_starts = np.array(word_starts, dtype=np.float64)
+    word_ends = np.array(word_ends, dtype=np.float64)
+
+    source_by_id = {source.get("id"): source for source in activity_sources or []}
+    ordered_segments = sorted(segments or [], key=lambda item: float(item.get("timeline_start", 0.0) or 0.0))
+    cached = [
+        caption_camera_activity_over_words(source_by_id[camera_id], word_starts, word_ends, ordered_segments, overlap_start)
+        if camera_id in source_by_id
+        else (None, None)
+        for camera_id in camera_ids[:2]
+    ]
+    if all(values is not None for values, _mode in cached) and cached[0][1] == cached[1][1]:
+        mode = cached[0][1]
+        first, second = cached[0][0], cached[1][0]
+        with np.errstate(invalid="ignore"):
+            if mode == "db":
+                # Same rule as per-word RMS: the louder channel must lead by 1.18x.
+                ratio = np.power(10.0, np.abs(first - second) / 20.0)
+                decided = ratio >= 1.18
+                confidence = np.clip((ratio - 1.0) / 1.25, 0.0, 0.95)
+            else:
+                gap = np.abs(first - second)
+                decided = gap >= 0.12
+                confidence = np.clip(gap / 0.5, 0.0, 0.95)
+        decided &= ~(np.isnan(first) | np.isnan(second))
+        for index in np.flatnonzero(decided):
+            word = words[index]
+            word["caption_speaker_camera_id"] = camera_ids[0] if first[index] >= second[index] else camera_ids[1]
+            word["caption_speaker_confidence"] = round(float(confidence[index]), 3)
+        assigned = int(np.count_nonzero(decided))
+        return {
+            "status": "active",
+            "method": "cached_timeline_channel_activity_per_word" if mode == "db" else "cached_source_activity_per_word",
+            "channel_camera_ids": camera_ids[:2],
+            "assigned_word_count": assigned,
+            "ambiguous_word_count": len(words) - assigned,
+        }
+
     try:
         samples, sample_rate = extract_caption_channel_samples(audio_path, sample_rate=8000)
     except Exception as exc:
@@ -5044,27 +5768,24 @@ def build_caption_word_speaker_assignments(audio_path, whisper_result, segments,
 
     assigned = 0
     ambiguous = 0
-    for segment in (whisper_result or {}).get("segments", []) or []:
-        for word in segment.get("words", []) or []:
-            start = max(0.0, float(word.get("start", segment.get("start", 0.0)) or 0.0) - 0.035)
-            end = max(start + 0.08, float(word.get("end", start + 0.18) or start + 0.18) + 0.035)
-            lo = max(0, int(start * sample_rate))
-            hi = min(samples.shape[0], max(lo + 1, int(end * sample_rate)))
-            window = samples[lo:hi]
-            if window.size <= 0:
-                continue
-            rms = np.sqrt(np.mean(window ** 2, axis=0))
-            ch0 = float(rms[0])
-            ch1 = float(rms[1])
-            loud = max(ch0, ch1, 1e-6)
-            quiet = max(min(ch0, ch1), 1e-6)
-            ratio = loud / quiet
-            if ratio < 1.18:
-                ambiguous += 1
-                continue
-            word["caption_speaker_camera_id"] = camera_ids[0] if ch0 >= ch1 else camera_ids[1]
-            word["caption_speaker_confidence"] = round(clamp_float((ratio - 1.0) / 1.25, 0.0, 0.95), 3)
-            assigned += 1
+    for word, start, end in zip(words, word_starts, word_ends):
+        lo = max(0, int(start * sample_rate))
+        hi = min(samples.shape[0], max(lo + 1, int(end * sample_rate)))
+        window = samples[lo:hi]
+        if window.size <= 0:
+            continue
+        rms = np.sqrt(np.mean(window ** 2, axis=0))
+        ch0 = float(rms[0])
+        ch1 = float(rms[1])
+        loud = max(ch0, ch1, 1e-6)
+        quiet = max(min(ch0, ch1), 1e-6)
+        ratio = loud / quiet
+        if ratio < 1.18:
+            ambiguous += 1
+            continue
+        word["caption_speaker_camera_id"] = camera_ids[0] if ch0 >= ch1 else camera_ids[1]
+        word["caption_speaker_confidence"] = round(clamp_float((ratio - 1.0) / 1.25, 0.0, 0.95), 3)
+        assigned += 1
     return {
         "status": "active",
         "method": "stereo_channel_rms_per_word",
@@ -5125,6 +5846,7 @@ def generate_multicam_word_highlight_ass(
     font_size = int(clamp_float((video_width if not is_vertical else video_height) * 0.034, 34, 52))
     margin_v = int(clamp_float(video_height * (0.07 if not is_vertical else 0.105), 64, 150))
     max_words = 3 if is_vertical else 4
+    layout_context = index_multicam_caption_layout_context(layout_context)
     primary_color = "&H0042F5F5"  # warm yellow highlight
     secondary_color = "&H00FFFFFF"  # unread words stay white
     outline_color = "&H00111111"
@@ -5337,26 +6059,27 @@ async def apply_multicam_brand_watermark(output_path, job_id, output_width, outp
     }
     branded_output_path = os.path.join(os.path.dirname(output_path), f"{job_id}_multicam_branded.mp4")
     try:
-        await run_subprocess_async(
-            [
-                "ffmpeg",
-                "-nostdin",
-                "-i",
-                output_path,
-                "-vf",
-                build_multicam_brand_watermark_filter(output_width, output_height, text),
-                *build_multicam_caption_encode_args(),
-                "-c:a",
-                "copy",
-                "-movflags",
-                "+faststart",
-                "-y",
-                branded_output_path,
-            ],
-            check=True,
-            job_context=job_id,
-            timeout_seconds=MEDIA_WORKER_SUBPROCESS_TIMEOUT_SECONDS,
-        )
+        async with finishing_encode_limiter:
+            await run_subprocess_async(
+                [
+                    "ffmpeg",
+                    "-nostdin",
+                    "-i",
+                    output_path,
+                    "-vf",
+                    build_multicam_brand_watermark_filter(output_width, output_height, text),
+                    *build_multicam_caption_encode_args(),
+                    "-c:a",
+                    "copy",
+                    "-movflags",
+                    "+faststart",
+                    "-y",
+                    branded_output_path,
+                ],
+                check=True,
+                job_context=job_id,
+                timeout_seconds=MEDIA_WORKER_SUBPROCESS_TIMEOUT_SECONDS,
+            )
         os.replace(branded_output_path, output_path)
         receipt["status"] = "burned_in"
         receipt["video_encoder"] = "h264_nvenc" if GPU_VIDEO_ENCODER == "h264_nvenc" else "libx264"
@@ -5580,40 +6303,205 @@ async def generate_multicam_thumbnail_asset(output_path, job_id, duration, segme
     return receipt
 
 
-async def burn_multicam_word_captions(
-    output_path,
-    job_id,
-    output_width,
-    output_height,
-    style_name="podcast_clean",
-    render_segments=None,
-    extra_video_filter=None,
-):
-    receipt = {
-        "enabled": True,
-        "status": "pending",
-        "style": style_name,
-        "output_width": int(output_width),
-        "output_height": int(output_height),
-    }
-    if not has_audio_stream(output_path):
-        raise HTTPException(status_code=500, detail={"message": "Captions are mandatory but final render has no audio stream"})
-    if whisper is None:
-        raise HTTPException(status_code=500, detail={"message": "Captions are mandatory but Whisper is not available"})
+MULTICAM_CAPTION_PROMPT_HINT = "Podcast conversation. Preserve natural spoken wording for burned word-by-word captions."
 
-    loop = asyncio.get_event_loop()
-    try:
-        whisper_result = await loop.run_in_executor(
-            None,
+
+def shift_multicam_caption_transcript(transcript, time_shift, duration):
+    """Move transcript times onto the output timeline and clip to ``[0, duration]``.
+
+    The multicam audio bed is one continuous trim of a single audio source, so
+    its sync map onto the output timeline is a constant shift.
+    """
+    safe_duration = max(0.0, float(duration or 0.0))
+    shift = float(time_shift or 0.0)
+
+    def clip(value):
+        return round(max(0.0, min(safe_duration, float(value or 0.0) + shift)), 3)
+
+    mapped_segments = []
+    for segment in (transcript or {}).get("segments") or []:
+        words = []
+        for word in segment.get("words") or []:
+            start = float(word.get("start", 0.0) or 0.0) + shift
+            end = float(word.get("end", 0.0) or 0.0) + shift
+            if end <= 0.0 or start >= safe_duration:
+                continue
+            words.append({**word, "start": clip(word.get("start")), "end": clip(word.get("end"))})
+        segment_start = float(segment.get("start", 0.0) or 0.0) + shift
+        segment_end = float(segment.get("end", 0.0) or 0.0) + shift
+        if segment_end <= 0.0 or segment_start >= safe_duration:
+            continue
+        if segment.get("words") and not words:
+            continue
+        mapped_segments.append(
+            {
+                **segment,
+                "id": len(mapped_segments),
+                "start": clip(segment.get("start")),
+                "end": clip(segment.get("end")),
+                "words": words,
+            }
+        )
+    mapped = dict(transcript or {})
+    mapped["segments"] = mapped_segments
+    mapped["text"] = " ".join(str(segment.get("text") or "").strip() for segment in mapped_segments).strip()
+    mapped["duration"] = round(safe_duration, 3)
+    return mapped
+
+
+def resolve_multicam_camera_audio_bed_source(source_map, prepared_sources, primary_audio_camera_id, segments, overlap_start):
+    """Pick the camera whose scratch audio becomes the master bed and its trim anchor."""
+    audio_source = source_map.get(primary_audio_camera_id or "")
+    if not audio_source or not audio_source.get("has_audio"):
+        audio_source = next((source for source in prepared_sources if source.get("has_audio")), None)
+    if not audio_source or not audio_source.get("has_audio"):
+        return None, None
+
+    audio_anchor = overlap_start - float(audio_source["offset_seconds"])
+    primary_segments = [segment for segment in segments if segment["camera_id"] == audio_source["id"]]
+    if primary_segments:
+        inferred_anchor = float(primary_segments[0]["source_start"]) - float(primary_segments[0]["timeline_start"])
+        if inferred_anchor >= -0.01:
+            audio_anchor = inferred_anchor
+    return audio_source, audio_anchor
+
+
+async def prepare_multicam_caption_transcript(audio_path, audio_anchor, duration, job_id, audio_source_label=None):
+    """Transcribe the master audio source once, before/while video renders.
+
+    The window the audio bed will use (``audio_anchor`` for ``duration``) is
+    decoded to 16 kHz mono PCM and transcribed with word timestamps through
+    the shared transcript cache, so re-renders of the same episode (new
+    layout, new captions style) skip Whisper entirely. Never raises: a
+    failed receipt makes ``burn_multicam_word_captions`` fall back to
+    transcribing the finished master.
+    """
+    started_at = time.perf_counter()
+    safe_duration = max(0.01, float(duration or 0.0))
+    anchor = float(audio_anchor or 0.0)
+    window_start = max(0.0, anchor)
+    window_duration = max(0.01, safe_duration - max(0.0, -anchor))
+    model_name = os.getenv("MULTICAM_CAPTION_WHISPER_MODEL") or None
+    receipt = {
+        "status": "pending",
+        "audio_source": audio_source_label,
+        "audio_anchor_seconds": round(anchor, 6),
+        "window_start_seconds": round(window_start, 6),
+        "window_duration_seconds": round(window_duration, 6),
+        "model_name": model_name or "default",
+        "cache_hit": False,
+    }
+    wav_path = os.path.join(
+        os.path.abspath(os.path.join(os.path.dirname(__file__), "../tmp")),
+        f"{job_id}_caption_audio.wav",
+    )
+    try:
+        if whisper is None:
+            raise RuntimeError("Whisper is not available")
+        os.makedirs(os.path.dirname(wav_path), exist_ok=True)
+        await run_subprocess_async(
+            [
+                "ffmpeg",
+                "-nostdin",
+                "-ss",
+                f"{window_start:.6f}",
+                "-t",
+                f"{window_duration:.6f}",
+                "-i",
+                audio_path,
+                "-vn",
+                "-ac",
+                "1",
+                "-ar",
+                "16000",
+                "-c:a",
+                "pcm_s16le",
+                "-y",
+                wav_path,
+            ],
+            check=True,
+            job_context=job_id,
+        )
+        loop = asyncio.get_running_loop()
+        raw_transcript = await loop.run_in_executor(
+            None,
             lambda: transcribe_with_hints(
-                output_path,
+                wav_path,
                 word_timestamps=True,
-                prompt_hint="Podcast conversation. Preserve natural spoken wording for burned word-by-word captions.",
-                model_name=os.getenv("MULTICAM_CAPTION_WHISPER_MODEL") or None,
+                prompt_hint=MULTICAM_CAPTION_PROMPT_HINT,
+                model_name=model_name,
             ),
         )
+        transcript_cache_receipt = (raw_transcript or {}).get("transcript_cache") or {}
+        receipt["audio_sha256"] = transcript_cache_receipt.get("audio_fingerprint")
+        receipt["cache_hit"] = bool(transcript_cache_receipt.get("hit"))
+        receipt["transcript"] = shift_multicam_caption_transcript(
+            raw_transcript,
+            window_start - anchor,
+            safe_duration,
+        )
+        receipt["status"] = "ready"
     except Exception as exc:
-        raise HTTPException(status_code=500, detail={"message": "Mandatory caption transcription failed", "error": str(exc)})
+        receipt["status"] = "failed"
+        receipt["error"] = str(exc)[-500:]
+        logger.warning("MULTICAM CAPTION TRANSCRIPT %s failed; captions will transcribe the master: %s", job_id, exc)
+    finally:
+        try:
+            if os.path.exists(wav_path):
+                os.remove(wav_path)
+        except OSError:
+            pass
+    receipt["elapsed_seconds"] = round(time.perf_counter() - started_at, 3)
+    return receipt
+
+
+async def burn_multicam_word_captions(
+    output_path,
+    job_id,
+    output_width,
+    output_height,
+    style_name="podcast_clean",
+    render_segments=None,
+    extra_video_filter=None,
+    transcript_receipt=None,
+    activity_sources=None,
+    overlap_start=0.0,
+):
+    receipt = {
+        "enabled": True,
+        "status": "pending",
+        "style": style_name,
+        "output_width": int(output_width),
+        "output_height": int(output_height),
+    }
+    if not has_audio_stream(output_path):
+        raise HTTPException(status_code=500, detail={"message": "Captions are mandatory but final render has no audio stream"})
+
+    reused_transcript = (transcript_receipt or {}).get("transcript") if (transcript_receipt or {}).get("status") == "ready" else None
+    if reused_transcript and sum(len(segment.get("words") or []) for segment in reused_transcript.get("segments") or []) > 0:
+        whisper_result = reused_transcript
+        receipt["transcript_source"] = "clean_audio_prepass"
+    else:
+        if whisper is None:
+            raise HTTPException(status_code=500, detail={"message": "Captions are mandatory but Whisper is not available"})
+        loop = asyncio.get_event_loop()
+        try:
+            whisper_result = await loop.run_in_executor(
+                None,
+                lambda: transcribe_with_hints(
+                    output_path,
+                    word_timestamps=True,
+                    prompt_hint=MULTICAM_CAPTION_PROMPT_HINT,
+                    model_name=os.getenv("MULTICAM_CAPTION_WHISPER_MODEL") or None,
+                ),
+            )
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail={"message": "Mandatory caption transcription failed", "error": str(exc)})
+        receipt["transcript_source"] = "final_master"
+    if transcript_receipt:
+        receipt["transcript_prepass"] = {
+            key: value for key, value in transcript_receipt.items() if key != "transcript"
+        }
 
     transcript_segments = (whisper_result or {}).get("segments") or []
     word_count = sum(len(segment.get("words") or []) for segment in transcript_segments)
@@ -5628,6 +6516,8 @@ async def burn_multicam_word_captions(
         whisper_result,
         render_segments or [],
         job_id=job_id,
+        activity_sources=activity_sources,
+        overlap_start=overlap_start,
     )
     layout_context = build_multicam_caption_layout_context(
         render_segments or [],
@@ -5649,33 +6539,34 @@ async def burn_multicam_word_captions(
         )
 
     try:
-        await run_subprocess_async(
-            [
-                "ffmpeg",
-                "-nostdin",
-                "-i",
-                output_path,
-                "-vf",
-                ",".join(
-                    item
-                    for item in [
-                        f"ass='{escape_ffmpeg_filter_path(ass_path)}'",
-                        extra_video_filter,
-                    ]
-                    if item
-                ),
-                *build_multicam_caption_encode_args(),
-                "-c:a",
-                "copy",
-                "-movflags",
-                "+faststart",
-                "-y",
-                captioned_output_path,
-            ],
-            check=True,
-            job_context=job_id,
-            timeout_seconds=MEDIA_WORKER_SUBPROCESS_TIMEOUT_SECONDS,
-        )
+        async with finishing_encode_limiter:
+            await run_subprocess_async(
+                [
+                    "ffmpeg",
+                    "-nostdin",
+                    "-i",
+                    output_path,
+                    "-vf",
+                    ",".join(
+                        item
+                        for item in [
+                            f"ass='{escape_ffmpeg_filter_path(ass_path)}'",
+                            extra_video_filter,
+                        ]
+                        if item
+                    ),
+                    *build_multicam_caption_encode_args(),
+                    "-c:a",
+                    "copy",
+                    "-movflags",
+                    "+faststart",
+                    "-y",
+                    captioned_output_path,
+                ],
+                check=True,
+                job_context=job_id,
+                timeout_seconds=MEDIA_WORKER_SUBPROCESS_TIMEOUT_SECONDS,
+            )
         os.replace(captioned_output_path, output_path)
     except HTTPException:
         raise
@@ -5703,6 +6594,132 @@ async def burn_multicam_word_captions(
     return receipt
 
 
+def prepare_multicam_fused_finishing(brand_watermark_filter):
+    """
+    Finishing to burn into the segment encodes, or None.
+
+    Only the brand watermark is fused: it saves the full-length watermark
+    re-encode of the master.  Captions always burn in the post-mux pass, where
+    the caption transcript has had the whole render to finish and speaker tags
+    can be read from the master's channels.
+    """
+    if not MULTICAM_FUSED_FINISHING or not brand_watermark_filter:
+        return None
+    return {"watermark_filter": brand_watermark_filter}
+
+
+def multicam_finishing_filter(finishing):
+    """Filter chain burning the fused watermark into a part of the master."""
+    if not finishing:
+        return ""
+    return str(finishing.get("watermark_filter") or "")
+
+
+def append_multicam_finishing_filter(filter_graph, finishing, output_label="v"):
+    """``filter_graph`` with the finishing chain applied to ``[output_label]``, and the label to map."""
+    chain = multicam_finishing_filter(finishing)
+    if not chain:
+        return filter_graph, f"[{output_label}]"
+    return f"{filter_graph};[{output_label}]{chain}[finished]", "[finished]"
+
+
+def multicam_finishing_fingerprint(finishing):
+    """Digest of the fused finishing; None when nothing is fused."""
+    if not finishing:
+        return None
+    return hashlib.sha256(multicam_finishing_filter(finishing).encode("utf-8")).hexdigest()
+
+
+async def finish_multicam_master(
+    output_path,
+    job_id,
+    output_width,
+    output_height,
+    *,
+    fused_finishing,
+    burn_captions,
+    caption_style,
+    caption_transcript_task,
+    brand_watermark_enabled,
+    brand_watermark_text,
+    brand_watermark_filter,
+    render_segments,
+    activity_sources,
+    overlap_start,
+    async_mode=False,
+):
+    """
+    Burn captions and the watermark into the muxed master; ``(caption_receipt, brand_watermark_receipt)``.
+
+    A watermark fused into the segment encodes is only recorded here.  Captions
+    wait for ``caption_transcript_task``, which has been transcribing the audio
+    bed while video rendered.
+    """
+    caption_receipt = None
+    brand_watermark_receipt = None
+    watermark_fused = bool((fused_finishing or {}).get("watermark_filter"))
+    if brand_watermark_enabled and watermark_fused:
+        # The watermark was burned into the segment encodes.
+        brand_watermark_receipt = {
+            "enabled": True,
+            "status": "burned_in",
+            "text": brand_watermark_text,
+            "placement": "top_right",
+            "style": "subtle_glass_pill",
+            "video_encoder": "h264_nvenc" if GPU_VIDEO_ENCODER == "h264_nvenc" else "libx264",
+            "fused_into_render": True,
+        }
+    if burn_captions:
+        if async_mode:
+            update_firestore_job(job_id, {"progress": 91, "detail": "Burning word-level captions"})
+        caption_transcript_receipt = await caption_transcript_task if caption_transcript_task else None
+        caption_receipt = await burn_multicam_word_captions(
+            output_path,
+            job_id,
+            output_width,
+            output_height,
+            style_name=caption_style,
+            render_segments=render_segments,
+            extra_video_filter=None if watermark_fused else brand_watermark_filter,
+            transcript_receipt=caption_transcript_receipt,
+            activity_sources=activity_sources,
+            overlap_start=overlap_start,
+        )
+        if brand_watermark_enabled and not watermark_fused:
+            brand_watermark_receipt = {
+                "enabled": True,
+                "status": "burned_in_with_captions",
+                "text": brand_watermark_text,
+                "placement": "top_right",
+                "style": "subtle_glass_pill",
+                "video_encoder": caption_receipt.get("video_encoder"),
+            }
+    else:
+        caption_receipt = {
+            "enabled": False,
+            "status": "disabled_by_request",
+            "message": "Captions are normally mandatory for multicam podcast renders.",
+        }
+
+    if brand_watermark_enabled and not brand_watermark_receipt:
+        if async_mode:
+            update_firestore_job(job_id, {"progress": 92, "detail": "Adding AutoPromote branding"})
+        brand_watermark_receipt = await apply_multicam_brand_watermark(
+            output_path,
+            job_id,
+            output_width,
+            output_height,
+            text=brand_watermark_text,
+        )
+    elif not brand_watermark_enabled:
+        brand_watermark_receipt = {
+            "enabled": False,
+            "status": "disabled_by_request",
+            "message": "AutoPromote watermark disabled for this render.",
+        }
+    return caption_receipt, brand_watermark_receipt
+
+
 def _seconds_to_ass_time(seconds):
     """Convert seconds to ASS time format: H:MM:SS.CC"""
     s = max(0.0, float(seconds))
@@ -6560,60 +7577,74 @@ def normalize_audio_energy_windows(audio_windows):
         )
     return normalized
 
+# Director and audit lookups hit the same window lists thousands of times per
+# render; index each list once per job as a sorted series.
+activity_series_cache = JobScopedCache()
+# Silence and dead-footage interval lists are probed per camera per director step.
+interval_timeline_cache = JobScopedCache()
+
+
+def cached_activity_series(points, kind, build):
+    """``build(points)`` memoized for the current job by list identity and ``kind``."""
+    return activity_series_cache.get(points, kind, list_fingerprint(points), lambda: build(points))
+
+
+def _audio_window_time(item):
+    return item[0] if isinstance(item, (list, tuple)) else item.get("time", 0.0)
+
+
+def _audio_window_activity(item):
+    if isinstance(item, dict) and "activity" in item:
+        return clamp_float(float(item.get("activity", 0.0)), 0.0, 1.0)
+    db_value = item[1] if isinstance(item, (list, tuple)) and len(item) > 1 else item.get("db", -80.0)
+    return audio_db_to_activity_score(db_value)
+
+
+def _audio_window_db(item):
+    try:
+        return float(item[1] if isinstance(item, (list, tuple)) and len(item) > 1 else item.get("db", -80.0))
+    except Exception:
+        return float("nan")
+
+
+def audio_window_series(audio_windows, kind="activity"):
+    """Cached ``TimeSeries`` of activity scores (or raw dB with ``kind="db"``)."""
+    value_of = _audio_window_db if kind == "db" else _audio_window_activity
+    return cached_activity_series(
+        audio_windows,
+        kind,
+        lambda points: TimeSeries.from_points(points, _audio_window_time, value_of),
+    )
+
+
 def get_audio_activity_score_at_source_time(audio_windows, source_time):
     if not audio_windows:
         return 0.0
     safe_time = max(0.0, float(source_time or 0.0))
-    nearest = min(
-        audio_windows,
-        key=lambda item: abs(float(item[0] if isinstance(item, (list, tuple)) else item.get("time", 0.0)) - safe_time),
-    )
-    if isinstance(nearest, dict) and "activity" in nearest:
-        return clamp_float(float(nearest.get("activity", 0.0)), 0.0, 1.0)
-    db_value = nearest[1] if isinstance(nearest, (list, tuple)) and len(nearest) > 1 else nearest.get("db", -80.0)
-    return audio_db_to_activity_score(db_value)
+    nearest = audio_window_series(audio_windows).nearest(safe_time)
+    return 0.0 if nearest is None else nearest
 
 def get_audio_activity_score_near_source_time(audio_windows, source_time, window_seconds=0.8):
     if not audio_windows:
         return 0.0
     safe_time = max(0.0, float(source_time or 0.0))
     half_window = max(0.05, float(window_seconds or 0.8) / 2.0)
-    values = []
-    for item in audio_windows:
-        timestamp = float(item[0] if isinstance(item, (list, tuple)) else item.get("time", 0.0))
-        if abs(timestamp - safe_time) <= half_window:
-            if isinstance(item, dict) and "activity" in item:
-                values.append(clamp_float(float(item.get("activity", 0.0)), 0.0, 1.0))
-            else:
-                db_value = item[1] if isinstance(item, (list, tuple)) and len(item) > 1 else item.get("db", -80.0)
-                values.append(audio_db_to_activity_score(db_value))
-    if not values:
+    median = audio_window_series(audio_windows).median_within(safe_time, half_window)
+    if median is None:
         return get_audio_activity_score_at_source_time(audio_windows, source_time)
-    return clamp_float(float(np.median(values)), 0.0, 1.0)
+    return clamp_float(median, 0.0, 1.0)
 
 def get_audio_db_near_source_time(audio_windows, source_time, window_seconds=0.8):
     if not audio_windows:
         return -80.0
     safe_time = max(0.0, float(source_time or 0.0))
     half_window = max(0.05, float(window_seconds or 0.8) / 2.0)
-    values = []
-    for item in audio_windows:
-        timestamp = float(item[0] if isinstance(item, (list, tuple)) else item.get("time", 0.0))
-        if abs(timestamp - safe_time) <= half_window:
-            try:
-                values.append(float(item[1] if isinstance(item, (list, tuple)) and len(item) > 1 else item.get("db", -80.0)))
-            except Exception:
-                continue
-    if values:
-        return float(np.median(values))
-    nearest = min(
-        audio_windows,
-        key=lambda item: abs(float(item[0] if isinstance(item, (list, tuple)) else item.get("time", 0.0)) - safe_time),
-    )
-    try:
-        return float(nearest[1] if isinstance(nearest, (list, tuple)) and len(nearest) > 1 else nearest.get("db", -80.0))
-    except Exception:
-        return -80.0
+    series = audio_window_series(audio_windows, "db")
+    median = series.median_within(safe_time, half_window)
+    if median is not None:
+        return median
+    nearest = series.nearest(safe_time)
+    return -80.0 if nearest is None or math.isnan(nearest) else nearest
 
 def get_conversation_audio_score(activity, loudest_activity, second_activity):
     safe_activity = clamp_float(float(activity or 0.0), 0.0, 1.0)
@@ -6651,13 +7682,16 @@ def estimate_multicam_isolated_handoff_start(
     safe_decision = max(0.0, float(decision_time or 0.0))
     safe_interval = clamp_float(float(decision_interval or 5.0), 1.0, 10.0)
     lookback_start = max(float(minimum_start_time or 0.0), safe_decision - min(4.0, safe_interval))
-    candidate_times = sorted(
-        {
-            float(item.get("time", 0.0) if isinstance(item, dict) else item[0])
-            for item in leader_windows
-            if lookback_start - 0.001 <= float(item.get("time", 0.0) if isinstance(item, dict) else item[0]) <= safe_decision + 0.001
-        }
-    )
+    leader_times = audio_window_series(leader_windows, "db").times
+    candidate_times = [
+        float(timestamp)
+        for timestamp in np.unique(
+            leader_times[
+                np.searchsorted(leader_times, lookback_start - 0.001, side="left"):
+                np.searchsorted(leader_times, safe_decision + 0.001, side="right")
+            ]
+        )
+    ]
     if not candidate_times:
         return round(max(float(minimum_start_time or 0.0), safe_decision), 3)
 
@@ -6695,42 +7729,6 @@ def estimate_multicam_isolated_handoff_start(
     return round(clamp_float(best_start, float(minimum_start_time or 0.0), safe_decision), 3)
 
 
-def analyze_visual_motion(video_path, sample_interval=1.0):
-    """
-    Analyze visual motion intensity using frame differencing.
-    Higher values = more action/movement.
-    """
-    cap = cv2.VideoCapture(video_path)
-    if not cap.isOpened():
-        return []
-
-    fps = cap.get(cv2.CAP_PROP_FPS) or 30
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
-    duration = total_frames / fps if fps > 0 else 0
-    motion_scores = []
-    prev_gray = None
-
-    for t in _frange(0, duration, sample_interval):
-        frame_no = int(t * fps)
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_no)
-        ret, frame = cap.read()
-        if not ret:
-            continue
-
-        # Downscale for speed
-        small = cv2.resize(frame, (160, 90), interpolation=cv2.INTER_AREA)
-        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
-
-        if prev_gray is not None:
-            diff = cv2.absdiff(gray, prev_gray)
-            motion = float(np.mean(diff)) / 255.0  # Normalize 0-1
-            motion_scores.append((t, motion))
-        prev_gray = gray
-
-    cap.release()
-    return motion_scores
-
-
 PROMO_ROLE_RECIPES = {
     "hook_slap": {"placements": ["start", "center", "end", "center"], "pace": "fast"},
     "proof_snap": {"placements": ["center", "start", "end", "center"], "pace": "steady"},
@@ -7454,25 +8452,22 @@ def build_story_confidence_summary(
     }
 
 
+def _timeline_metric_time(point):
+    if not isinstance(point, (list, tuple)) or len(point) < 2:
+        raise ValueError("timeline metric points are (time, value) pairs")
+    return point[0] or 0.0
+
+
 def _sample_timeline_metric(samples, timestamp, default=0.0):
     if not samples:
         return float(default or 0.0)
-    target = float(timestamp or 0.0)
-    best_value = None
-    best_delta = None
-    for point in samples:
-        if not isinstance(point, (list, tuple)) or len(point) < 2:
-            continue
-        try:
-            point_time = float(point[0] or 0.0)
-            point_value = float(point[1] or 0.0)
-        except Exception:
-            continue
-        delta = abs(point_time - target)
-        if best_delta is None or delta < best_delta:
-            best_delta = delta
-            best_value = point_value
-    return float(best_value if best_value is not None else default or 0.0)
+    series = cached_activity_series(
+        samples,
+        "timeline_metric",
+        lambda points: TimeSeries.from_points(points, _timeline_metric_time, lambda point: point[1] or 0.0),
+    )
+    value = series.nearest(float(timestamp or 0.0))
+    return float(value if value is not None else default or 0.0)
 
 
 def _nearest_tracked_position(positions, timestamp):
@@ -7497,65 +8492,40 @@ def _nearest_tracked_position(positions, timestamp):
     return best
 
 
+def _subject_sample_series(subject_samples):
+    """Series of subject sample times whose values index back into ``subject_samples``."""
+
+    def build(samples):
+        indexed = [(index, sample) for index, sample in enumerate(samples) if isinstance(sample, dict)]
+        return TimeSeries.from_points(indexed, lambda item: item[1].get("time", 0.0) or 0.0, lambda item: item[0])
+
+    return cached_activity_series(subject_samples, "subject_samples", build)
+
+
+def _subject_sample_at(subject_samples, series, index):
+    return None if index is None else subject_samples[int(series.values[index])]
+
+
 def _nearest_subject_sample(subject_samples, timestamp):
     if not subject_samples:
         return None
-    target = float(timestamp or 0.0)
-    best = None
-    best_delta = None
-    for sample in subject_samples:
-        if not isinstance(sample, dict):
-            continue
-        try:
-            point_time = float(sample.get("time", 0.0) or 0.0)
-        except Exception:
-            continue
-        delta = abs(point_time - target)
-        if best_delta is None or delta < best_delta:
-            best_delta = delta
-            best = sample
-    return best
+    series = _subject_sample_series(subject_samples)
+    return _subject_sample_at(subject_samples, series, series.nearest_index(float(timestamp or 0.0)))
 
 
 def _subject_sample_at_or_before(subject_samples, timestamp):
     if not subject_samples:
         return None
-    target = float(timestamp or 0.0)
-    best = None
-    best_time = None
-    for sample in subject_samples:
-        if not isinstance(sample, dict):
-            continue
-        try:
-            point_time = float(sample.get("time", 0.0) or 0.0)
-        except Exception:
-            continue
-        if point_time > target:
-            continue
-        if best_time is None or point_time > best_time:
-            best = sample
-            best_time = point_time
+    series = _subject_sample_series(subject_samples)
+    best = _subject_sample_at(subject_samples, series, series.index_at_or_before(float(timestamp or 0.0)))
     return best or _nearest_subject_sample(subject_samples, timestamp)
 
 
 def _subject_sample_at_or_after(subject_samples, timestamp):
     if not subject_samples:
         return None
-    target = float(timestamp or 0.0)
-    best = None
-    best_time = None
-    for sample in subject_samples:
-        if not isinstance(sample, dict):
-            continue
-        try:
-            point_time = float(sample.get("time", 0.0) or 0.0)
-        except Exception:
-            continue
-        if point_time < target:
-            continue
-        if best_time is None or point_time < best_time:
-            best = sample
-            best_time = point_time
+    series = _subject_sample_series(subject_samples)
+    best = _subject_sample_at(subject_samples, series, series.index_at_or_after(float(timestamp or 0.0)))
     return best or _nearest_subject_sample(subject_samples, timestamp)
 
 
@@ -9475,7 +10445,15 @@ def resolve_music_input(music_file, output_path, *, is_search=False, safe_search
 
     return download_youtube_audio(raw_value, output_path, safe_search=safe_search)
 
-app = FastAPI(title="AutoPromote Media Worker (Python)")
+@contextlib.asynccontextmanager
+async def media_worker_lifespan(_app):
+    # Background preload: the server accepts requests (and /health reports
+    # model readiness) while models are still loading.
+    start_whisper_model_preload()
+    yield
+
+
+app = FastAPI(title="AutoPromote Media Worker (Python)", lifespan=media_worker_lifespan)
 
 # Allow local frontend to call worker directly for ingest
 app.add_middleware(
@@ -9707,6 +10685,7 @@ def health_check():
         "maxFileMb": MEDIA_WORKER_MAX_FILE_MB,
         "tmpDir": os.path.abspath(os.path.join(os.path.dirname(__file__), "../tmp")),
         "whisperReady": FasterWhisperModel is not None or whisper is not None,
+        "whisperModels": whisper_model_manager.snapshot(),
     }
 
 
@@ -9807,10 +10786,7 @@ def authorize_worker_task(request: Request):
     if provided_secret != MEDIA_WORKER_TASK_SECRET:
         raise HTTPException(status_code=401, detail="Invalid worker task secret")
 
-async def detect_silence_intervals(input_path, threshold="-30dB", duration=0.5, start_time=0.0, analysis_duration=None):
-    """
-    Returns list of (start, end) tuples for SILENCE.
-    """
+def build_silence_detect_command(input_path, threshold="-30dB", duration=0.5, start_time=0.0, analysis_duration=None):
     cmd = ["ffmpeg"]
     safe_start = max(0.0, float(start_time or 0.0))
     safe_duration = float(analysis_duration or 0.0)
@@ -9823,12 +10799,32 @@ async def detect_silence_intervals(input_path, threshold="-30dB", duration=0.5,
         "-af", f"silencedetect=noise={threshold}:d={duration}",
         "-f", "null", "-",
     ])
+    return cmd
+
+
+async def detect_silence_intervals(input_path, threshold="-30dB", duration=0.5, start_time=0.0, analysis_duration=None):
+    """
+    Returns list of (start, end) tuples for SILENCE.
+    """
+    cmd = build_silence_detect_command(input_path, threshold, duration, start_time, analysis_duration)
     
     # We need to capture stderr
     result = await run_subprocess_async(cmd, check=False, stderr=subprocess.PIPE, text=True)
-    output = result.stderr
+    return parse_silence_detect_output(result.stderr, start_time)
+
+
+def detect_silence_intervals_sync(input_path, threshold="-30dB", duration=0.5, start_time=0.0, analysis_duration=None):
+    """Blocking ``detect_silence_intervals`` for code already running in a worker thread."""
+    cmd = build_silence_detect_command(input_path, threshold, duration, start_time, analysis_duration)
+    result = subprocess.run(cmd, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, errors="replace")
+    return parse_silence_detect_output(result.stderr, start_time)
+
+
+def parse_silence_detect_output(output, start_time=0.0):
+    safe_start = max(0.0, float(start_time or 0.0))
     if isinstance(output, bytes):
         output = output.decode('utf-8', errors='replace')
+    output = output or ""
     
     silence_starts = []
     silence_ends = []
@@ -10014,21 +11010,19 @@ async def preview_watermark_regions(request: WatermarkPreviewRequest):
         await materialize_video_input(request.video_url, local_input_path)
         width_val, height_val = get_video_dimensions(local_input_path)
         video_duration = get_media_duration(local_input_path)
-        analyzed_windows = analyze_dynamic_watermark_schedule(
+        # Schedule scoring, the preview sheet, and the delogo filters below all
+        # come from this one decode of the input.
+        watermark_pass = await run_admitted_analysis(
+            run_watermark_analysis_pass,
             local_input_path,
             width_val,
             height_val,
             video_duration,
-            request.watermark_mode,
             window_seconds=request.window_seconds,
-        )
-        preview_sheet = create_watermark_preview_sheet(
-            local_input_path,
-            width_val,
-            height_val,
-            analyzed_windows,
             max_preview_frames=request.max_preview_frames,
         )
+        analyzed_windows = watermark_pass["windows"]
+        preview_sheet = watermark_pass["preview_sheet"]
 
         preview_url = None
         if preview_sheet is not None:
@@ -10047,6 +11041,7 @@ async def preview_watermark_regions(request: WatermarkPreviewRequest):
                 request.watermark_mode,
                 duration=video_duration,
                 video_path=local_input_path,
+                analyzed_windows=analyzed_windows,
             ),
             "preview_image_path": preview_image_path if os.path.exists(preview_image_path) else None,
             "preview_image_url": preview_url,
@@ -10079,7 +11074,8 @@ async def preview_watermark_cleanup(request: WatermarkPreviewRequest):
             max(0.0, video_duration - 0.05) if video_duration > 0 else 0.0,
         )
 
-        filters = build_delogo_filters(
+        filters = await run_admitted_analysis(
+            build_delogo_filters,
             width_val,
             height_val,
             request.watermark_mode,
@@ -10549,7 +11545,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
         # A0. Remove Watermark (TikTok/Reels) - Prioritize this before scaling
         if request.remove_watermark:
-             filters = build_delogo_filters(
+             filters = await run_admitted_analysis(
+                 build_delogo_filters,
                  width_val,
                  height_val,
                  request.watermark_mode,
@@ -11254,22 +12251,9 @@ async def analyze_clips(request: Dict[str, Any]):
 
         def run_scenedetect():
             logger.info("Task [SceneDetect]: Starting...")
-            from scenedetect import SceneManager, open_video
-            from scenedetect.detectors import ContentDetector
-            
-            # Extreme Downscale for Speed (ContentDetector is robust)
-            # 8 is good, 10-12 is faster for HD content
-            video = open_video(input_path)
-            try:
-                video.set_downscale_factor(8)
-            except Exception:
-                pass
-
-            sm = SceneManager()
-            sm.add_detector(ContentDetector(threshold=27.0)) # Slightly lower threshold for speed
-
-            sm.detect_scenes(video=video)
-            return sm.get_scene_list()
+            # Scene cuts and the motion curve share one low-res decode.
+            detected_scenes, detected_motion, _scene_receipt = detect_scenes_and_motion(input_path, motion_interval=1.0)
+            return detected_scenes, detected_motion
 
         # Execute in ThreadPool to allow GIL release (Whisper releases GIL in C++ parts)
         # We use run_in_executor to run these blocking functions in threads
@@ -11277,7 +12261,7 @@ async def analyze_clips(request: Dict[str, Any]):
         # 3. Proper Exception Handling for Parallel Tasks
         try:
             future_whisper = loop.run_in_executor(None, run_whisper)
-            future_scenes = loop.run_in_executor(None, run_scenedetect)
+            future_scenes = run_admitted_analysis(run_scenedetect)
             
             # Wait for both and catch any exceptions
             results = await asyncio.gather(future_whisper, future_scenes, return_exceptions=True)
@@ -11285,6 +12269,7 @@ async def analyze_clips(request: Dict[str, Any]):
             # Check for exceptions
             transcription_segments = []
             scene_list = []
+            motion_scores = []
             
             if isinstance(results[0], Exception):
                 logger.error(f"Whisper Transcription Failed: {results[0]}")
@@ -11297,7 +12282,7 @@ async def analyze_clips(request: Dict[str, Any]):
                 logger.error(f"Scene Detection Failed: {results[1]}")
                 scene_list = []
             else:
-                scene_list = results[1]
+                scene_list, motion_scores = results[1]
                 
         except Exception as e:
             import traceback
@@ -11307,18 +12292,11 @@ async def analyze_clips(request: Dict[str, Any]):
 
         logger.info(f"Parallel Analysis Complete. Scenes: {len(scene_list)}, Segments: {len(transcription_segments)}")
 
-        # 4.5. Enhanced scoring: audio energy + visual motion analysis (parallel)
+        # 4.5. Enhanced scoring: audio energy (motion came from the scene pass)
         audio_energy = []
-        motion_scores = []
         try:
-            logger.info("Running enhanced scoring analysis (audio energy + motion)...")
-            future_audio = loop.run_in_executor(None, analyze_audio_energy, input_path, 1.0)
-            future_motion = loop.run_in_executor(None, analyze_visual_motion, input_path, 1.0)
-            scoring_results = await asyncio.gather(future_audio, future_motion, return_exceptions=True)
-            if not isinstance(scoring_results[0], Exception):
-                audio_energy = scoring_results[0]
-            if not isinstance(scoring_results[1], Exception):
-                motion_scores = scoring_results[1]
+            logger.info("Running enhanced scoring analysis (audio energy)...")
+            audio_energy = await loop.run_in_executor(None, analyze_audio_energy, input_path, 1.0)
             logger.info(f"Enhanced scoring data: {len(audio_energy)} audio samples, {len(motion_scores)} motion samples")
         except Exception as scoring_err:
             logger.warning(f"Enhanced scoring failed (non-fatal): {scoring_err}")
@@ -11948,6 +12926,8 @@ class RenderMultiCamRequest(BaseModel):
     audio_based_auto_switch: bool = True
     auto_switch_interval: float = 2.0
     auto_switch_aggressiveness: str = "balanced"
+    director_mode: Optional[str] = None
+    directorMode: Optional[str] = None
     primary_audio_camera_id: Optional[str] = None
     primaryAudioCameraId: Optional[str] = None
     director_channel_camera_ids: Optional[List[str]] = None
@@ -12011,11 +12991,15 @@ class RenderMultiCamRequest(BaseModel):
     qaProofReceiptId: Optional[str] = None
     qa_proof_receipt: Optional[Dict[str, Any]] = None
     qaProofReceipt: Optional[Dict[str, Any]] = None
+    previous_plan: Optional[Dict[str, Any]] = None
+    previousPlan: Optional[Dict[str, Any]] = None
+    replan_range: Optional[List[float]] = None
+    replanRange: Optional[List[float]] = None
 
 MULTICAM_ENFORCE_PROD_LIMITS = env_flag("MULTICAM_ENFORCE_PROD_LIMITS", default=IS_PRODUCTION_ENV)
 MULTICAM_BETA_MAX_CAMERAS = max(2, int(os.getenv("MULTICAM_BETA_MAX_CAMERAS", "3") or 3))
 MULTICAM_BETA_MAX_SECONDS = max(60, int(os.getenv("MULTICAM_BETA_MAX_SECONDS", "10800") or 10800))
-MULTICAM_BETA_MAX_SEGMENTS = max(20, int(os.getenv("MULTICAM_BETA_MAX_SEGMENTS", "450") or 450))
+MULTICAM_BETA_MAX_SEGMENTS = max(20, int(os.getenv("MULTICAM_BETA_MAX_SEGMENTS", "4500") or 4500))
 MULTICAM_RENDER_CHECKPOINTS_ENABLED = env_flag(
     "MULTICAM_RENDER_CHECKPOINTS_ENABLED",
     default=IS_PRODUCTION_ENV,
@@ -12045,6 +13029,119 @@ def resolve_multicam_checkpoint_seconds(request=None):
         60.0,
         min(1200.0, float(requested or MULTICAM_RENDER_CHECKPOINT_SECONDS)),
     )
+
+
+MULTICAM_REPLAN_MARGIN_SECONDS = max(0.0, float(os.getenv("MULTICAM_REPLAN_MARGIN_SECONDS", "5") or 5))
+# A finished render keeps its checkpoint chunks so a later re-plan of the
+# same job can reuse the chunks it did not change.  The temp lifecycle rule
+# on temp/multicam-checkpoints/ (lifecycle.json, age 1 day) bounds the
+# storage; =false deletes them as soon as the master is committed.
+MULTICAM_RETAIN_CHECKPOINTS_FOR_REPLAN = env_flag("MULTICAM_RETAIN_CHECKPOINTS_FOR_REPLAN", default=True)
+MULTICAM_CHECKPOINT_RETENTION_HOURS = 24
+
+
+def finish_multicam_checkpoint_storage(job_id, storage_prefix, checkpoint_receipts):
+    """Retain a finished render's checkpoints for re-planning, or delete them."""
+    if not MULTICAM_RETAIN_CHECKPOINTS_FOR_REPLAN:
+        return delete_multicam_checkpoint_prefix(job_id)
+    return {
+        "deleted": 0,
+        "status": "retained_for_replan",
+        "prefix": storage_prefix,
+        "retained_bytes": sum(int(receipt.get("size_bytes") or 0) for receipt in checkpoint_receipts or []),
+        "retention_hours": MULTICAM_CHECKPOINT_RETENTION_HOURS,
+    }
+# Consecutive single-camera cuts inside a checkpoint chunk are encoded by one
+# ffmpeg process, up to this many segment inputs per process.  Each input is
+# its own demuxer and decoder, so the scheduler lowers the cap further when
+# the inputs' decoders would not fit the encode memory share.
+MULTICAM_CHUNK_CUT_RENDER = env_flag("MULTICAM_CHUNK_CUT_RENDER", default=True)
+# Burn captions and the watermark into the segment encodes instead of two
+# full-length re-encodes of the finished master.
+MULTICAM_FUSED_FINISHING = env_flag("MULTICAM_FUSED_FINISHING", default=True)
+MULTICAM_CHUNK_CUT_RENDER_MAX_INPUTS = max(2, int(os.getenv("MULTICAM_CHUNK_CUT_RENDER_MAX_INPUTS", "6") or 6))
+# "auto" pre-frames one track per camera for simple-tier renders only; cut
+# segments are then cut out of those tracks by stream copy.
+MULTICAM_CAMERA_TRACK_RENDER = str(os.getenv("MULTICAM_CAMERA_TRACK_RENDER", "auto") or "auto").strip().lower()
+# A track encodes its camera for the whole span it appears in; skip cameras
+# that are on screen for less than this share of their span.
+MULTICAM_CAMERA_TRACK_MIN_COVERAGE = clamp_float(
+    float(os.getenv("MULTICAM_CAMERA_TRACK_MIN_COVERAGE", "0.2") or 0.2),
+    0.0,
+    1.0,
+)
+
+
+def multicam_checkpoint_storage_prefix(job_id, plan_fingerprint):
+    safe_job_id = re.sub(r"[^A-Za-z0-9_-]+", "-", str(job_id)).strip("-")
+    return f"temp/multicam-checkpoints/{safe_job_id}/{plan_fingerprint}"
+
+
+def resolve_multicam_previous_plan(request):
+    """The earlier director plan (and its checkpoint fingerprints) a re-plan starts from."""
+    previous = request.previous_plan if request.previous_plan is not None else request.previousPlan
+    if not isinstance(previous, dict):
+        return None
+    segments = [dict(segment) for segment in previous.get("segments") or [] if isinstance(segment, dict)]
+    if not segments:
+        return None
+    checkpoint = previous.get("render_checkpoint") or previous.get("renderCheckpoint") or {}
+    plan_fingerprint = (
+        previous.get("plan_fingerprint")
+        or checkpoint.get("plan_fingerprint")
+        or checkpoint.get("planFingerprint")
+    )
+    chunk_fingerprints = (
+        previous.get("chunk_fingerprints")
+        or checkpoint.get("chunk_fingerprints")
+        or checkpoint.get("chunkFingerprints")
+        or []
+    )
+    return {
+        "job_id": str(previous.get("job_id") or previous.get("jobId") or "").strip() or None,
+        "segments": segments,
+        "plan_fingerprint": str(plan_fingerprint or "").strip().lower() or None,
+        "chunk_fingerprints": [str(item or "").strip().lower() for item in chunk_fingerprints],
+    }
+
+
+def resolve_multicam_replan_window(request, previous_plan, segments, chunk_seconds):
+    """Chunk-aligned window a partial re-plan recomputes; everything outside it is pinned."""
+    receipt = {"status": "not_requested", "window": None}
+    if previous_plan is None:
+        return receipt
+    requested = request.replan_range if request.replan_range is not None else request.replanRange
+    receipt["previous_job_id"] = previous_plan.get("job_id")
+    if not requested or len(requested) != 2:
+        receipt["status"] = "full_replan_no_range"
+        return receipt
+    receipt["requested_range"] = [round(float(value), 3) for value in requested]
+    plan_start = float(segments[0]["timeline_start"])
+    plan_end = float(segments[-1]["timeline_end"])
+    try:
+        window = multicam_replan_window(
+            plan_start,
+            plan_end,
+            requested[0],
+            requested[1],
+            chunk_seconds,
+            margin_seconds=MULTICAM_REPLAN_MARGIN_SECONDS,
+        )
+        # Dry run so an unusable previous plan falls back before any
+        # repair pass is narrowed to the window.
+        splice_multicam_replanned_segments(previous_plan["segments"], segments, window["start"], window["end"])
+    except ValueError as error:
+        receipt.update({"status": "full_replan_incompatible_previous_plan", "error": str(error)[:500]})
+        return receipt
+    receipt.update(
+        {
+            "status": "partial",
+            "window": {"start": window["start"], "end": window["end"]},
+            "chunk_indexes": window["chunk_indexes"],
+            "margin_seconds": MULTICAM_REPLAN_MARGIN_SECONDS,
+        }
+    )
+    return receipt
 MULTICAM_REQUIRE_QA_PROOF_FOR_LONG_RENDER = env_flag(
     "MULTICAM_REQUIRE_QA_PROOF_FOR_LONG_RENDER",
     default=IS_PRODUCTION_ENV,
@@ -12197,22 +13294,6 @@ MULTICAM_SEGMENT_DURATION_TOLERANCE_SECONDS = max(
     float(os.getenv("MULTICAM_SEGMENT_DURATION_TOLERANCE_SECONDS", "0.25") or 0.25),
 )
 
-multicam_face_detector = None
-
-def get_multicam_face_detector():
-    global multicam_face_detector
-    if multicam_face_detector is not None:
-        return multicam_face_detector
-
-    cascade_path = os.path.join(cv2.data.haarcascades, "haarcascade_frontalface_default.xml")
-    if not os.path.exists(cascade_path):
-        multicam_face_detector = None
-        return None
-
-    detector = cv2.CascadeClassifier(cascade_path)
-    multicam_face_detector = detector if not detector.empty() else None
-    return multicam_face_detector
-
 def normalize_multicam_aggressiveness(value):
     normalized = str(value or "balanced").strip().lower()
     if normalized == "low":
@@ -12394,194 +13475,6 @@ def is_multicam_reaction_hero_accent_earned(
     return False
 
 
-def estimate_multicam_placeholder_penalty(frame):
-    if frame is None or getattr(frame, "size", 0) == 0:
-        return 0.0
-
-    try:
-        preview = cv2.resize(frame, (96, 54), interpolation=cv2.INTER_AREA)
-        preview_float = preview.astype(np.float32)
-        hsv = cv2.cvtColor(preview, cv2.COLOR_BGR2HSV)
-
-        column_texture = np.mean(np.std(preview_float, axis=0))
-        column_means = np.mean(preview_float, axis=0)
-        column_deltas = np.linalg.norm(np.diff(column_means, axis=0), axis=1)
-        adjacent_delta = float(np.percentile(column_deltas, 88)) if column_deltas.size else 0.0
-        low_texture_ratio = float(np.mean(np.std(preview_float, axis=0) < 14.0))
-        saturation_mean = float(np.mean(hsv[:, :, 1]))
-        gray = cv2.cvtColor(preview, cv2.COLOR_BGR2GRAY)
-        vertical_edges = float(np.mean(np.abs(cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=3))))
-        horizontal_edges = float(np.mean(np.abs(cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=3))))
-        vertical_dominance = vertical_edges / max(1.0, horizontal_edges)
-
-        saturated_pixels = hsv[:, :, 1] > 92
-        hue_bins = 0
-        if np.any(saturated_pixels):
-            hue_bins = len(np.unique((hsv[:, :, 0][saturated_pixels] / 15).astype(np.int32)))
-
-        if saturation_mean > 140.0 and vertical_dominance > 1.8 and adjacent_delta > 20.0:
-            return round(clamp_float(0.46 + ((vertical_dominance - 1.8) * 0.08), 0.0, 0.72), 4)
-
-        if saturation_mean < 65.0 or low_texture_ratio < 0.58 or hue_bins < 4:
-            return 0.0
-
-        stripe_score = clamp_float(((16.0 - column_texture) / 16.0), 0.0, 1.0)
-        band_transition_score = clamp_float((adjacent_delta - 18.0) / 44.0, 0.0, 1.0)
-        palette_score = 1.0 if 5 <= hue_bins <= 10 else 0.35
-        vertical_pattern_score = clamp_float((vertical_dominance - 1.4) / 1.3, 0.0, 1.0)
-
-        return round(
-            clamp_float(
-                (stripe_score * 0.28)
-                + (band_transition_score * 0.16)
-                + (low_texture_ratio * 0.14)
-                + (palette_score * 0.12)
-                + (vertical_pattern_score * 0.3),
-                0.0,
-                0.72,
-            ),
-            4,
-        )
-    except Exception:
-        return 0.0
-
-def analyze_multicam_visual_windows(video_path, source_offset, overlap_start, overlap_duration, interval_seconds):
-    safe_duration = max(0.0, float(overlap_duration or 0.0))
-    if safe_duration <= 0.0:
-        return []
-
-    capture = cv2.VideoCapture(video_path)
-    if not capture.isOpened():
-        return []
-
-    detector = get_multicam_face_detector()
-    windows = []
-    previous_gray = None
-    current_start = 0.0
-    step = clamp_float(interval_seconds, 0.75, 10.0)
-
-    try:
-        def _roi_motion(gray_frame, prev_gray_frame, roi):
-            if prev_gray_frame is None or prev_gray_frame.shape != gray_frame.shape:
-                return 0.0
-            x1, y1, x2, y2 = roi
-            h, w = gray_frame.shape[:2]
-            x1 = int(clamp_float(x1, 0, max(0, w - 1)))
-            x2 = int(clamp_float(x2, x1 + 1, w))
-            y1 = int(clamp_float(y1, 0, max(0, h - 1)))
-            y2 = int(clamp_float(y2, y1 + 1, h))
-            if x2 <= x1 or y2 <= y1:
-                return 0.0
-            current_crop = gray_frame[y1:y2, x1:x2]
-            previous_crop = prev_gray_frame[y1:y2, x1:x2]
-            if current_crop.size == 0 or previous_crop.size == 0:
-                return 0.0
-            return clamp_float(float(np.mean(cv2.absdiff(current_crop, previous_crop))) / 28.0, 0.0, 1.0)
-
-        while current_start < safe_duration - 0.001:
-            current_end = min(safe_duration, current_start + step)
-            midpoint = current_start + ((current_end - current_start) / 2.0)
-            relative_time = float(overlap_start or 0.0) + midpoint - float(source_offset or 0.0)
-            capture.set(cv2.CAP_PROP_POS_MSEC, max(0.0, relative_time) * 1000.0)
-            success, frame = capture.read()
-
-            face_score = 0.0
-            motion_score = 0.0
-            face_count = 0
-            placeholder_penalty = 0.0
-            lower_face_motion = 0.0
-            upper_body_motion = 0.0
-            visual_speaking_score = 0.0
-            visual_speaking_confidence = 0.0
-            face_area_ratio = 0.0
-            face_center_x = None
-            if success and frame is not None:
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                placeholder_penalty = estimate_multicam_placeholder_penalty(frame)
-                primary_face = None
-                if detector is not None:
-                    min_face = max(24, min(gray.shape[0], gray.shape[1]) // 7)
-                    faces = detector.detectMultiScale(
-                        gray,
-                        scaleFactor=1.1,
-                        minNeighbors=4,
-                        minSize=(min_face, min_face),
-                    )
-                    face_count = len(faces)
-                    if face_count:
-                        frame_area = float(gray.shape[0] * gray.shape[1]) or 1.0
-                        face_area = sum(w * h for (_, _, w, h) in faces)
-                        face_area_ratio = clamp_float(face_area / frame_area, 0.0, 1.0)
-                        face_score = min(1.0, (face_count * 0.22) + ((face_area / frame_area) * 8.0))
-                        primary_face = max(faces, key=lambda item: item[2] * item[3])
-                        px, _py, pw, _ph = [float(v) for v in primary_face]
-                        face_center_x = clamp_float((px + (pw / 2.0)) / max(1.0, float(gray.shape[1])), 0.0, 1.0)
-
-                if previous_gray is not None and previous_gray.shape == gray.shape:
-                    motion_delta = cv2.absdiff(gray, previous_gray)
-                    motion_score = min(1.0, float(np.mean(motion_delta)) / 28.0)
-                    height, width = gray.shape[:2]
-                    if primary_face is not None:
-                        x, y, w, h = [int(v) for v in primary_face]
-                        lower_face_motion = _roi_motion(
-                            gray,
-                            previous_gray,
-                            (x + (w * 0.12), y + (h * 0.48), x + (w * 0.88), y + (h * 1.05)),
-                        )
-                        upper_body_motion = _roi_motion(
-                            gray,
-                            previous_gray,
-                            (x - (w * 0.35), y + (h * 0.45), x + (w * 1.35), y + (h * 2.35)),
-                        )
-                        visual_speaking_confidence = clamp_float(0.45 + (face_score * 0.45), 0.0, 1.0)
-                    else:
-                        # If the face detector misses a turned/partial face, use the speaker-safe center band
-                        # as a fallback instead of blindly trusting noisy camera audio.
-                        lower_face_motion = _roi_motion(
-                            gray,
-                            previous_gray,
-                            (width * 0.28, height * 0.18, width * 0.72, height * 0.68),
-                        )
-                        upper_body_motion = _roi_motion(
-                            gray,
-                            previous_gray,
-                            (width * 0.18, height * 0.30, width * 0.82, height * 0.90),
-                        )
-                        visual_speaking_confidence = 0.28 if upper_body_motion > 0.04 else 0.12
-
-                    visual_speaking_score = clamp_float(
-                        (lower_face_motion * 0.62)
-                        + (upper_body_motion * 0.26)
-                        + (motion_score * 0.12),
-                        0.0,
-                        1.0,
-                    )
-                previous_gray = gray
-
-            windows.append(
-                {
-                    "start_time": round(current_start, 3),
-                    "end_time": round(current_end, 3),
-                    "sample_time": round(midpoint, 3),
-                    "face_score": round(face_score, 4),
-                    "motion_score": round(motion_score, 4),
-                    "lower_face_motion": round(lower_face_motion, 4),
-                    "upper_body_motion": round(upper_body_motion, 4),
-                    "visual_speaking_score": round(visual_speaking_score, 4),
-                    "visual_speaking_confidence": round(visual_speaking_confidence, 4),
-                    "face_area_ratio": round(face_area_ratio, 4),
-                    "face_center_x": round(face_center_x, 4) if face_center_x is not None else None,
-                    "placeholder_penalty": placeholder_penalty,
-                    "face_count": face_count,
-                }
-            )
-            current_start = current_end
-    finally:
-        capture.release()
-
-    return windows
-
-
 def estimate_multicam_layout_focus_x(video_path, source_offset, overlap_start, overlap_duration, sample_count=18):
     """
     Cheap placement-only pass for the audio-first director path.
@@ -13061,11 +13954,37 @@ def reclaim_multicam_active_speaker_primary(item, valid_source_ids):
 
 def is_time_in_silence(target_time, intervals):
     safe_time = float(target_time or 0.0)
+    # Outside a job scope the sorted timeline would be rebuilt for every
+    # lookup, which costs more than the scan it replaces.
+    if isinstance(intervals, list) and job_cache_active():
+        timeline = interval_timeline_cache.get(
+            intervals,
+            "intervals",
+            list_fingerprint(intervals),
+            lambda: SegmentTimeline.from_pairs(intervals),
+        )
+        return timeline.contains(safe_time)
     for start_time, end_time in intervals or []:
         if safe_time >= float(start_time) and safe_time < float(end_time):
             return True
     return False
 
+def times_in_intervals(times, intervals):
+    """``is_time_in_silence`` for an array of ``times``, with one ``searchsorted``.
+
+    Intervals are sorted by start and each keeps the furthest end reached so
+    far, so overlapping and unsorted ``(start, end)`` pairs answer the same.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    pairs = np.array([(float(start), float(end)) for start, end in intervals or []], dtype=np.float64).reshape(-1, 2)
+    if not pairs.size:
+        return np.zeros(times.shape, dtype=bool)
+    order = np.argsort(pairs[:, 0], kind="stable")
+    starts = pairs[order, 0]
+    reach = np.maximum.accumulate(pairs[order, 1])
+    index = np.searchsorted(starts, times, side="right") - 1
+    return (index >= 0) & (reach[np.maximum(index, 0)] > times)
+
 def get_multicam_timeline_activity_average(prepared_sources, camera_id, start_time, duration):
     source = next(
         (
@@ -13079,14 +13998,16 @@ def get_multicam_timeline_activity_average(prepared_sources, camera_id, start_ti
         return None
     safe_start = float(start_time or 0.0)
     safe_end = safe_start + max(0.0, float(duration or 0.0))
-    values = [
-        float(item.get("activity", 0.0) or 0.0)
-        for item in windows
-        if safe_start <= float(item.get("time", 0.0) or 0.0) < safe_end
-    ]
-    if not values:
-        return None
-    return float(sum(values) / len(values))
+    series = cached_activity_series(
+        windows,
+        "timeline_activity",
+        lambda points: TimeSeries.from_points(
+            points,
+            lambda item: item.get("time", 0.0) or 0.0,
+            lambda item: item.get("activity", 0.0) or 0.0,
+        ),
+    )
+    return series.mean_between(safe_start, safe_end)
 
 def choose_multicam_attention_layout(primary_camera_id, ranked_sources, source_count=0):
     """
@@ -13667,6 +14588,336 @@ def build_clean_channel_authority_switches(request, prepared_sources, overlap_du
     )
     return deduped
 
+MULTICAM_DIRECTOR_MODE = os.getenv("MULTICAM_DIRECTOR_MODE", "heuristic")
+MULTICAM_VITERBI_STEP_SECONDS = clamp_float(os.getenv("MULTICAM_VITERBI_STEP_SECONDS", "0.5") or 0.5, 0.1, 2.0)
+
+
+def resolve_multicam_director_mode(request):
+    requested = getattr(request, "director_mode", None)
+    if requested is None:
+        requested = getattr(request, "directorMode", None)
+    mode = str(requested or MULTICAM_DIRECTOR_MODE or "heuristic").strip().lower()
+    return mode if mode in {"heuristic", "viterbi"} else "heuristic"
+
+
+def format_multicam_director_switches(items):
+    return [
+        {
+            "camera_id": item["camera_id"],
+            "start_time": round(float(item["start_time"]), 3),
+            "layout_mode": normalize_multicam_layout_mode(item.get("layout_mode", "cut") or "cut"),
+            "layout_reason": item.get("layout_reason", ""),
+            "secondary_camera_id": item.get("secondary_camera_id"),
+            "layout_confidence": item.get("layout_confidence", 0.0),
+            "score": item.get("score", 0.0),
+            "audio_leader_camera_id": item.get("audio_leader_camera_id"),
+            "raw_audio_leader_camera_id": item.get("raw_audio_leader_camera_id"),
+            "audio_leader_activity": item.get("audio_leader_activity"),
+            "audio_second_activity": item.get("audio_second_activity"),
+            "audio_leader_gap": item.get("audio_leader_gap"),
+            "audio_decision_reliable": item.get("audio_decision_reliable"),
+            "audio_decision_reason": item.get("audio_decision_reason"),
+            "editorial_decision_score": item.get("editorial_decision_score"),
+            "editorial_decision_reason": item.get("editorial_decision_reason"),
+            "editorial_decision_threshold": item.get("editorial_decision_threshold"),
+            "editorial_switch_allowed": item.get("editorial_switch_allowed"),
+            "editorial_active_speaker_value": item.get("editorial_active_speaker_value"),
+            "editorial_reaction_story_value": item.get("editorial_reaction_story_value"),
+            "ranked_sources": item.get("ranked_sources"),
+        }
+        for item in items
+    ]
+
+
+# One feature matrix per prepared sources list and decision grid, per job.
+director_feature_cache = JobScopedCache(max_entries=8)
+
+_DIRECTOR_EVIDENCE_KEYS = (
+    "timeline_audio_activity_windows",
+    "audio_activity_windows",
+    "window_scores",
+    "dead_footage_intervals",
+    "silence_intervals",
+    "continuous_sync_map",
+)
+
+
+def multicam_director_feature_fingerprint(prepared_sources):
+    """Identity of the evidence a feature matrix was built from; changes when any source's lists are replaced or grow."""
+    fingerprint = []
+    for source in prepared_sources:
+        evidence = []
+        for key in _DIRECTOR_EVIDENCE_KEYS:
+            value = source.get(key)
+            evidence.append((id(value), len(value) if isinstance(value, (list, tuple)) else None))
+        fingerprint.append(
+            (
+                id(source),
+                source.get("id"),
+                source.get("duration"),
+                source.get("offset_seconds"),
+                source.get("sync_rate"),
+                source.get("has_audio"),
+                source.get("placeholder_score"),
+                tuple(evidence),
+            )
+        )
+    return tuple(fingerprint)
+
+
+def sample_audio_windows_near(audio_windows, source_times, window_seconds, kind="activity"):
+    """
+    ``get_audio_activity_score_near_source_time`` (or ``get_audio_db_near_source_time``
+    with ``kind="db"``) for an array of times.
+    """
+    fallback = -80.0 if kind == "db" else 0.0
+    safe_times = np.maximum(np.asarray(source_times, dtype=np.float64), 0.0)
+    if not audio_windows:
+        return np.full(safe_times.shape, fallback)
+    series = audio_window_series(audio_windows, kind)
+    samples = series.rolling_median(safe_times, max(0.05, float(window_seconds) / 2.0))
+    if kind != "db":
+        samples = np.clip(samples, 0.0, 1.0)
+    for index in np.flatnonzero(np.isnan(samples)):
+        nearest = series.nearest(float(safe_times[index]))
+        if nearest is None or (kind == "db" and math.isnan(nearest)):
+            nearest = fallback
+        samples[index] = nearest
+    return samples
+
+
+def build_multicam_director_feature_matrix(prepared_sources, overlap_start, overlap_duration, step_seconds, interval_seconds, tuning):
+    """
+    Director evidence for every camera at every decision time, built once per plan.
+
+    Sampling matches what the decision loop used to do per camera per tick, so
+    the loop, the Viterbi mode and the scoring helpers all read the same rows.
+    Cameras outside their source range, or on dead footage while another camera
+    is live, are marked unavailable.
+    """
+    key = (
+        float(overlap_start or 0.0),
+        float(overlap_duration or 0.0),
+        float(step_seconds),
+        float(interval_seconds),
+        float(tuning["placeholder_penalty_weight"]),
+        float(tuning["placeholder_source_penalty_weight"]),
+    )
+    return director_feature_cache.get(
+        prepared_sources,
+        key,
+        multicam_director_feature_fingerprint(prepared_sources),
+        lambda: _build_multicam_director_feature_matrix(prepared_sources, *key),
+    )
+
+
+def _build_multicam_director_feature_matrix(
+    prepared_sources,
+    overlap_start,
+    overlap_duration,
+    step_seconds,
+    interval_seconds,
+    placeholder_penalty_weight,
+    placeholder_source_penalty_weight,
+):
+    times = decision_times(overlap_duration, step_seconds)
+    matrix = DirectorFeatureMatrix(times, [source["id"] for source in prepared_sources])
+    in_range = np.zeros((times.size, len(prepared_sources)), dtype=bool)
+    dead = np.zeros_like(in_range)
+    slot_positions = np.maximum(0, (times / interval_seconds).astype(np.int64))
+
+    for column, source in enumerate(prepared_sources):
+        relative_times = get_source_starts_for_timeline(source, overlap_start, times)
+        matrix["relative_time"][:, column] = relative_times
+        in_range[:, column] = (relative_times >= 0) & (relative_times < source["duration"])
+        dead_intervals = source.get("dead_footage_intervals")
+        if dead_intervals:
+            dead[:, column] = times_in_intervals(relative_times, dead_intervals)
+
+        window_scores = source.get("window_scores") or []
+        slot_values = {}
+        for name in (
+            "face_score",
+            "motion_score",
+            "visual_speaking_score",
+            "visual_speaking_confidence",
+            "placeholder_penalty",
+            "lower_face_motion",
+            "upper_body_motion",
+        ):
+            per_slot = np.array([float(slot.get(name, 0.0)) for slot in window_scores] or [0.0])
+            slot_values[name] = per_slot[np.minimum(slot_positions, per_slot.size - 1)]
+        source_placeholder_penalty = float(source.get("placeholder_score", 0.0))
+        raw_visual_score = (slot_values["face_score"] * 0.65) + (slot_values["motion_score"] * 0.35)
+        placeholder_penalty = slot_values["placeholder_penalty"]
+        matrix["face_score"][:, column] = slot_values["face_score"]
+        matrix["raw_visual_score"][:, column] = raw_visual_score
+        matrix["visual_score"][:, column] = np.maximum(
+            0.0,
+            raw_visual_score
+            - (placeholder_penalty * placeholder_penalty_weight)
+            - (source_placeholder_penalty * placeholder_source_penalty_weight),
+        )
+        matrix["visual_speaking_score"][:, column] = np.maximum(
+            0.0, slot_values["visual_speaking_score"] - (placeholder_penalty * 0.18)
+        )
+        matrix["visual_speaking_confidence"][:, column] = slot_values["visual_speaking_confidence"]
+        matrix["lower_face_motion"][:, column] = slot_values["lower_face_motion"]
+        matrix["upper_body_motion"][:, column] = slot_values["upper_body_motion"]
+        matrix["placeholder_penalty"][:, column] = placeholder_penalty
+        matrix["source_placeholder_penalty"][:, column] = source_placeholder_penalty
+
+        timeline_audio_windows = source.get("timeline_audio_activity_windows") or []
+        if timeline_audio_windows:
+            audio_windows, sample_times = timeline_audio_windows, times
+        else:
+            audio_windows, sample_times = source.get("audio_activity_windows") or [], relative_times
+        current_activity = sample_audio_windows_near(audio_windows, sample_times, 1.1)
+        upcoming_activity = sample_audio_windows_near(audio_windows, sample_times + 0.45, 0.8)
+        current_db = sample_audio_windows_near(audio_windows, sample_times, 1.1, "db")
+        upcoming_db = sample_audio_windows_near(audio_windows, sample_times + 0.45, 0.8, "db")
+        audio_activity = np.maximum(current_activity, upcoming_activity * 0.92)
+        matrix["current_audio_activity"][:, column] = current_activity
+        matrix["upcoming_audio_activity"][:, column] = upcoming_activity
+        matrix["audio_activity"][:, column] = audio_activity
+        matrix["current_audio_db"][:, column] = current_db
+        matrix["upcoming_audio_db"][:, column] = upcoming_db
+        matrix["audio_db"][:, column] = np.maximum(current_db, upcoming_db)
+        if timeline_audio_windows:
+            matrix["speaking"][:, column] = audio_activity >= 0.12
+        elif source["has_audio"]:
+            matrix["speaking"][:, column] = ~times_in_intervals(relative_times, source.get("silence_intervals"))
+
+    # Dead footage is excluded unless every camera is dead at that moment.
+    dead &= ~dead.all(axis=1, keepdims=True)
+    matrix["available"] = in_range & ~dead
+    matrix["audio_rank"] = matrix.rank_descending("audio_activity")
+    return matrix
+
+
+def build_multicam_viterbi_switches(request, prepared_sources, overlap_duration, interval_seconds, tuning, default_camera_id=None):
+    """
+    Director mode that picks the camera for every window in one global pass.
+
+    Emission costs reward trusted activity (now and just ahead), visual and
+    visual-speaking evidence; unusable footage is forbidden. Cuts cost a
+    switch penalty plus a young-shot penalty below the aggressiveness's
+    minimum hold. Every dominant speaker run the switch-latency audit will
+    check is pinned to its owner at the audit's own checkpoint, so the plan
+    meets the latency gate by construction.
+    """
+    if len(prepared_sources) < 2:
+        return []
+    features = build_multicam_director_feature_matrix(
+        prepared_sources,
+        float(request.overlap_start or 0.0),
+        overlap_duration,
+        MULTICAM_VITERBI_STEP_SECONDS,
+        interval_seconds,
+        tuning,
+    )
+    times = features.times
+    step = MULTICAM_VITERBI_STEP_SECONDS
+    camera_ids = features.camera_ids
+    if not times.size:
+        return []
+
+    score = (
+        features["current_audio_activity"]
+        + (features["upcoming_audio_activity"] * 0.35)
+        + (features["visual_score"] * 0.25)
+        + (features["visual_speaking_score"] * features["visual_speaking_confidence"] * 0.35)
+    )
+    if default_camera_id in camera_ids and tuning.get("primary_bonus"):
+        score[:, camera_ids.index(default_camera_id)] += float(tuning["primary_bonus"])
+    available = features["available"] > 0.0
+    available |= ~available.any(axis=1, keepdims=True)
+    emission = np.where(available, -score * step, np.inf)
+
+    max_latency, min_run_duration, min_activity, min_gap = multicam_switch_latency_thresholds()
+    owners = np.full(times.size, -1, dtype=np.int64)
+    pinned_count = 0
+    for run in multicam_dominant_speaker_runs(prepared_sources, min_activity, min_gap) or []:
+        if run["owner_id"] not in camera_ids:
+            continue
+        owner = camera_ids.index(run["owner_id"])
+        run_start = float(run["start"])
+        run_end = min(float(run["end"]), float(overlap_duration))
+        first = max(0, int(math.floor(run_start / step)))
+        last = min(times.size, int(math.ceil(run_end / step)))
+        owners[first:last] = owner
+        if run_end - run_start < min_run_duration:
+            continue
+        checkpoint = min(run_start + max_latency, max(run_start, run_end - 0.001))
+        window = min(times.size - 1, int(math.floor(checkpoint / step)))
+        if np.isfinite(emission[window, owner]):
+            pinned = np.full(len(camera_ids), np.inf)
+            pinned[owner] = emission[window, owner]
+            emission[window] = pinned
+            pinned_count += 1
+
+    min_hold_seconds = min(
+        max(clamp_float(interval_seconds, 1.0, 10.0) * tuning["min_hold_factor"], tuning["min_hold_floor"]),
+        tuning["min_hold_cap"],
+    )
+    switch_cost = (float(tuning["switch_threshold"]) + float(tuning["continuity_bonus"])) * min_hold_seconds * 0.5
+    path, total_cost = solve_camera_path(
+        emission,
+        switch_cost,
+        min_shot_windows=max(1, int(round(min_hold_seconds / step))),
+        young_shot_cost=switch_cost,
+    )
+
+    cut_windows = [0] + [int(index) for index in np.flatnonzero(np.diff(path)) + 1]
+    bounds = cut_windows[1:] + [times.size]
+    switches = []
+    for start, end in zip(cut_windows, bounds):
+        camera = int(path[start])
+        window_activity = features["current_audio_activity"][start:end]
+        ranked_activity = np.sort(window_activity, axis=1)[:, ::-1]
+        segment_owners = owners[start:end]
+        owned = segment_owners[segment_owners >= 0]
+        majority_owner = int(np.bincount(owned).argmax()) if owned.size else -1
+        reliable = bool(owned.size and (owned == majority_owner).sum() * 2 >= (end - start))
+        leader = majority_owner if majority_owner >= 0 else int(window_activity.mean(axis=0).argmax())
+        mean_scores = score[start:end].mean(axis=0)
+        switches.append(
+            {
+                "camera_id": camera_ids[camera],
+                "start_time": float(times[start]),
+                "layout_mode": "cut",
+                "layout_reason": "viterbi_active_speaker" if reliable and leader == camera else "viterbi_hold",
+                "secondary_camera_id": None,
+                "layout_confidence": round(float(mean_scores[camera]), 4),
+                "score": round(float(mean_scores[camera]), 4),
+                "audio_leader_camera_id": camera_ids[leader],
+                "raw_audio_leader_camera_id": camera_ids[leader],
+                "audio_leader_activity": round(float(ranked_activity[:, 0].mean()), 4),
+                "audio_second_activity": round(float(ranked_activity[:, 1].mean()), 4),
+                "audio_leader_gap": round(float((ranked_activity[:, 0] - ranked_activity[:, 1]).mean()), 4),
+                "audio_decision_reliable": reliable,
+                "audio_decision_reason": "viterbi_dominant_owner" if reliable else "viterbi_no_dominant_owner",
+                "ranked_sources": [
+                    {
+                        "camera_id": camera_ids[index],
+                        "score": round(float(mean_scores[index]), 4),
+                        "audio_activity": round(float(window_activity[:, index].mean()), 4),
+                    }
+                    for index in np.argsort(-mean_scores, kind="stable")
+                ],
+            }
+        )
+    logger.info(
+        "VITERBI_DIRECTOR windows=%d cameras=%d switches=%d pinned_runs=%d cost=%.3f",
+        times.size,
+        len(camera_ids),
+        len(switches),
+        pinned_count,
+        total_cost,
+    )
+    return switches
+
+
 def normalize_multicam_switches(request, prepared_sources, overlap_duration):
     safe_duration = max(0.0, float(overlap_duration or 0.0))
     source_ids = [source["id"] for source in prepared_sources]
@@ -13690,32 +14941,18 @@ def normalize_multicam_switches(request, prepared_sources, overlap_duration):
     if request.auto_switch:
         clean_channel_switches = build_clean_channel_authority_switches(request, prepared_sources, safe_duration)
         if clean_channel_switches:
-            return [
-                {
-                    "camera_id": item["camera_id"],
-                    "start_time": round(float(item["start_time"]), 3),
-                    "layout_mode": normalize_multicam_layout_mode(item.get("layout_mode", "cut") or "cut"),
-                    "layout_reason": item.get("layout_reason", ""),
-                    "secondary_camera_id": item.get("secondary_camera_id"),
-                    "layout_confidence": item.get("layout_confidence", 0.0),
-                    "score": item.get("score", 0.0),
-                    "audio_leader_camera_id": item.get("audio_leader_camera_id"),
-                    "raw_audio_leader_camera_id": item.get("raw_audio_leader_camera_id"),
-                    "audio_leader_activity": item.get("audio_leader_activity"),
-                    "audio_second_activity": item.get("audio_second_activity"),
-                    "audio_leader_gap": item.get("audio_leader_gap"),
-                    "audio_decision_reliable": item.get("audio_decision_reliable"),
-                    "audio_decision_reason": item.get("audio_decision_reason"),
-                    "editorial_decision_score": item.get("editorial_decision_score"),
-                    "editorial_decision_reason": item.get("editorial_decision_reason"),
-                    "editorial_decision_threshold": item.get("editorial_decision_threshold"),
-                    "editorial_switch_allowed": item.get("editorial_switch_allowed"),
-                    "editorial_active_speaker_value": item.get("editorial_active_speaker_value"),
-                    "editorial_reaction_story_value": item.get("editorial_reaction_story_value"),
-                    "ranked_sources": item.get("ranked_sources"),
-                }
-                for item in clean_channel_switches
-            ]
+            return format_multicam_director_switches(clean_channel_switches)
+        if resolve_multicam_director_mode(request) == "viterbi":
+            viterbi_switches = build_multicam_viterbi_switches(
+                request,
+                prepared_sources,
+                safe_duration,
+                interval,
+                tuning,
+                default_camera_id,
+            )
+            if viterbi_switches:
+                return format_multicam_director_switches(viterbi_switches)
         current_time = 0.0
         current_camera_id = None
         # Do not treat source order as editorial truth. Only an explicit primary
@@ -13736,7 +14973,21 @@ def normalize_multicam_switches(request, prepared_sources, overlap_duration):
             ) or tuning.get("opening_primary_hold_seconds", 18.0)),
         )
 
+        director_features = (
+            build_multicam_director_feature_matrix(
+                prepared_sources,
+                float(request.overlap_start or 0.0),
+                safe_duration,
+                interval,
+                interval,
+                tuning,
+            )
+            if any(source.get("window_scores") for source in prepared_sources)
+            else None
+        )
+        window_index = -1
         while current_time < safe_duration - 0.01:
+            window_index += 1
             decision_context = {}
             audio_leader = None
             audio_decision_reliable = False
@@ -13753,111 +15004,31 @@ def normalize_multicam_switches(request, prepared_sources, overlap_duration):
                 visual_leader_gap = 0.0
                 has_isolated_director_audio = False
                 audio_decision_reason = "no_audio_scores"
-                for source in prepared_sources:
-                    relative_time = get_source_start_for_timeline(
-                        source,
-                        float(request.overlap_start or 0.0),
-                        current_time,
-                    )
-                    if relative_time < 0 or relative_time >= source["duration"]:
-                        continue
-
-                    window_scores = source.get("window_scores") or []
-                    slot_index = min(
-                        max(0, int(current_time / interval)),
-                        max(0, len(window_scores) - 1),
-                    )
-                    slot = window_scores[slot_index] if window_scores else {}
-                    raw_visual_score = (float(slot.get("face_score", 0.0)) * 0.65) + (
-                        float(slot.get("motion_score", 0.0)) * 0.35
-                    )
-                    raw_visual_speaking_score = float(slot.get("visual_speaking_score", 0.0))
-                    visual_speaking_confidence = float(slot.get("visual_speaking_confidence", 0.0))
-                    placeholder_penalty = float(slot.get("placeholder_penalty", 0.0))
-                    source_placeholder_penalty = float(source.get("placeholder_score", 0.0))
-                    visual_score = max(
-                        0.0,
-                        raw_visual_score
-                        - (placeholder_penalty * tuning["placeholder_penalty_weight"])
-                        - (source_placeholder_penalty * tuning["placeholder_source_penalty_weight"]),
-                    )
-                    timeline_audio_windows = source.get("timeline_audio_activity_windows") or []
-                    if timeline_audio_windows:
-                        current_audio_activity = get_audio_activity_score_near_source_time(
-                            timeline_audio_windows,
-                            current_time,
-                            window_seconds=1.1,
-                        )
-                        upcoming_audio_activity = get_audio_activity_score_near_source_time(
-                            timeline_audio_windows,
-                            current_time + 0.45,
-                            window_seconds=0.8,
-                        )
-                        current_audio_db = get_audio_db_near_source_time(
-                            timeline_audio_windows,
-                            current_time,
-                            window_seconds=1.1,
-                        )
-                        upcoming_audio_db = get_audio_db_near_source_time(
-                            timeline_audio_windows,
-                            current_time + 0.45,
-                            window_seconds=0.8,
-                        )
-                    else:
-                        current_audio_activity = get_audio_activity_score_near_source_time(
-                            source.get("audio_activity_windows") or [],
-                            relative_time,
-                            window_seconds=1.1,
-                        )
-                        upcoming_audio_activity = get_audio_activity_score_near_source_time(
-                            source.get("audio_activity_windows") or [],
-                            relative_time + 0.45,
-                            window_seconds=0.8,
-                        )
-                        current_audio_db = get_audio_db_near_source_time(
-                            source.get("audio_activity_windows") or [],
-                            relative_time,
-                            window_seconds=1.1,
-                        )
-                        upcoming_audio_db = get_audio_db_near_source_time(
-                            source.get("audio_activity_windows") or [],
-                            relative_time + 0.45,
-                            window_seconds=0.8,
-                        )
-                    audio_activity = max(current_audio_activity, upcoming_audio_activity * 0.92)
-                    audio_db = max(current_audio_db, upcoming_audio_db)
-                    speaking = (
-                        audio_activity >= 0.12
-                        if timeline_audio_windows
-                        else source["has_audio"] and not is_time_in_silence(
-                            relative_time, source.get("silence_intervals")
-                        )
-                    )
-                    continuity_bonus = tuning["continuity_bonus"] if source["id"] == current_camera_id else 0.0
-                    primary_bonus = tuning["primary_bonus"] if source["id"] == request.primary_audio_camera_id else 0.0
-
+                # Black, frozen and placeholder ranges found by the footage
+                # prepass are already marked unavailable, unless every camera is dead.
+                for camera_id, features in director_features.window_rows(window_index):
                     ranked_sources.append(
                         {
-                            "camera_id": source["id"],
+                            "camera_id": camera_id,
                             "score": 0.0,
-                            "visual_score": visual_score,
-                            "raw_visual_score": raw_visual_score,
-                            "visual_speaking_score": max(0.0, raw_visual_speaking_score - (placeholder_penalty * 0.18)),
-                            "visual_speaking_confidence": visual_speaking_confidence,
-                            "lower_face_motion": float(slot.get("lower_face_motion", 0.0)),
-                            "upper_body_motion": float(slot.get("upper_body_motion", 0.0)),
-                            "placeholder_penalty": placeholder_penalty,
-                            "source_placeholder_penalty": source_placeholder_penalty,
-                            "speaking": speaking,
-                            "audio_activity": audio_activity,
-                            "audio_db": audio_db,
-                            "current_audio_db": current_audio_db,
-                            "upcoming_audio_db": upcoming_audio_db,
-                            "current_audio_activity": current_audio_activity,
-                            "upcoming_audio_activity": upcoming_audio_activity,
-                            "onset_lift": max(0.0, upcoming_audio_activity - current_audio_activity),
-                            "continuity_bonus": continuity_bonus,
-                            "primary_bonus": primary_bonus,
+                            "visual_score": features["visual_score"],
+                            "raw_visual_score": features["raw_visual_score"],
+                            "visual_speaking_score": features["visual_speaking_score"],
+                            "visual_speaking_confidence": features["visual_speaking_confidence"],
+                            "lower_face_motion": features["lower_face_motion"],
+                            "upper_body_motion": features["upper_body_motion"],
+                            "placeholder_penalty": features["placeholder_penalty"],
+                            "source_placeholder_penalty": features["source_placeholder_penalty"],
+                            "speaking": bool(features["speaking"]),
+                            "audio_activity": features["audio_activity"],
+                            "audio_db": features["audio_db"],
+                            "current_audio_db": features["current_audio_db"],
+                            "upcoming_audio_db": features["upcoming_audio_db"],
+                            "current_audio_activity": features["current_audio_activity"],
+                            "upcoming_audio_activity": features["upcoming_audio_activity"],
+                            "onset_lift": max(0.0, features["upcoming_audio_activity"] - features["current_audio_activity"]),
+                            "continuity_bonus": tuning["continuity_bonus"] if camera_id == current_camera_id else 0.0,
+                            "primary_bonus": tuning["primary_bonus"] if camera_id == request.primary_audio_camera_id else 0.0,
                         }
                     )
 
@@ -14674,32 +15845,7 @@ def normalize_multicam_switches(request, prepared_sources, overlap_duration):
         deduped = reconcile_multicam_speaker_owner_switches(deduped, source_ids)
         deduped = backfill_uncertain_opening_to_first_reliable_owner(deduped, source_ids)
 
-    return [
-        {
-            "camera_id": item["camera_id"],
-            "start_time": round(float(item["start_time"]), 3),
-            "layout_mode": normalize_multicam_layout_mode(item.get("layout_mode", "cut") or "cut"),
-            "layout_reason": item.get("layout_reason", ""),
-            "secondary_camera_id": item.get("secondary_camera_id"),
-            "layout_confidence": item.get("layout_confidence", 0.0),
-            "score": item.get("score", 0.0),
-            "audio_leader_camera_id": item.get("audio_leader_camera_id"),
-            "raw_audio_leader_camera_id": item.get("raw_audio_leader_camera_id"),
-            "audio_leader_activity": item.get("audio_leader_activity"),
-            "audio_second_activity": item.get("audio_second_activity"),
-            "audio_leader_gap": item.get("audio_leader_gap"),
-            "audio_decision_reliable": item.get("audio_decision_reliable"),
-            "audio_decision_reason": item.get("audio_decision_reason"),
-            "editorial_decision_score": item.get("editorial_decision_score"),
-            "editorial_decision_reason": item.get("editorial_decision_reason"),
-            "editorial_decision_threshold": item.get("editorial_decision_threshold"),
-            "editorial_switch_allowed": item.get("editorial_switch_allowed"),
-            "editorial_active_speaker_value": item.get("editorial_active_speaker_value"),
-            "editorial_reaction_story_value": item.get("editorial_reaction_story_value"),
-            "ranked_sources": item.get("ranked_sources"),
-        }
-        for item in deduped
-    ]
+    return format_multicam_director_switches(deduped)
 
 def build_multicam_segments_from_switches(request, prepared_sources, overlap_start, overlap_duration):
     switches = normalize_multicam_switches(request, prepared_sources, overlap_duration)
@@ -15937,7 +17083,140 @@ def enforce_reaction_overlay_on_multicam_segments(segments, prepared_sources, en
             needed_reaction_count -= 1
     return enforced
 
-def audit_multicam_layout_contract(segments, prepared_sources, output_width=None, output_height=None):
+def multicam_switch_latency_thresholds():
+    """(max latency, min dominant run, min activity, min gap) for the switch-latency gate."""
+    return (
+        float(os.getenv("MULTICAM_DIRECTOR_MAX_SWITCH_LATENCY_SECONDS", "1.0") or 1.0),
+        float(os.getenv("MULTICAM_DIRECTOR_MIN_DOMINANT_RUN_SECONDS", "0.75") or 0.75),
+        float(os.getenv("MULTICAM_DIRECTOR_SWITCH_LATENCY_MIN_ACTIVITY", "0.34") or 0.34),
+        float(os.getenv("MULTICAM_DIRECTOR_SWITCH_LATENCY_MIN_GAP", "0.14") or 0.14),
+    )
+
+
+# Dominant-speaker runs per prepared sources list and thresholds, per job.
+dominant_speaker_runs_cache = JobScopedCache(max_entries=8)
+
+
+def multicam_dominant_speaker_runs(prepared_sources, min_activity, min_gap):
+    """
+    Runs of one clearly dominant trusted-activity speaker, sampled at every
+    activity window time. None when fewer than two sources carry activity.
+
+    Memoized per sources list and thresholds; treat the result as read-only.
+    """
+    sources = prepared_sources or []
+    fingerprint = tuple(
+        (
+            id(source),
+            source.get("id"),
+            id(source.get("timeline_audio_activity_windows")),
+            len(source.get("timeline_audio_activity_windows") or []),
+        )
+        for source in sources
+    )
+    return dominant_speaker_runs_cache.get(
+        sources,
+        (float(min_activity), float(min_gap)),
+        fingerprint,
+        lambda: _multicam_dominant_speaker_runs(sources, min_activity, min_gap),
+    )
+
+
+def _multicam_dominant_speaker_runs(prepared_sources, min_activity, min_gap):
+    source_ids = [
+        str(source.get("id") or "")
+        for source in (prepared_sources or [])
+        if source.get("id")
+    ]
+    source_windows = {}
+    all_times = set()
+    for source in prepared_sources or []:
+        source_id = str(source.get("id") or "")
+        if not source_id:
+            continue
+        windows = sorted(
+            [
+                {
+                    "time": float(item.get("time", 0.0) or 0.0),
+                    "activity": float(item.get("activity", 0.0) or 0.0),
+                }
+                for item in (source.get("timeline_audio_activity_windows") or [])
+                if item is not None
+            ],
+            key=lambda item: item["time"],
+        )
+        if not windows:
+            continue
+        source_windows[source_id] = windows
+        all_times.update(item["time"] for item in windows)
+
+    if len(source_windows) < 2 or not all_times:
+        return None
+
+    window_times = {source_id: [item["time"] for item in windows] for source_id, windows in source_windows.items()}
+
+    def activity_at(source_id, target_time):
+        index = bisect.bisect_right(window_times.get(source_id) or [], target_time + 1e-6) - 1
+        return source_windows[source_id][index]["activity"] if index >= 0 else 0.0
+
+    leaders = []
+    for target_time in sorted(all_times):
+        ranked = sorted(
+            [
+                {"camera_id": source_id, "activity": activity_at(source_id, target_time)}
+                for source_id in source_ids
+            ],
+            key=lambda item: item["activity"],
+            reverse=True,
+        )
+        if len(ranked) < 2:
+            continue
+        leader = ranked[0]
+        gap = leader["activity"] - ranked[1]["activity"]
+        owner_id = leader["camera_id"] if leader["activity"] >= min_activity and gap >= min_gap else None
+        leaders.append(
+            {
+                "time": target_time,
+                "owner_id": owner_id,
+                "activity": leader["activity"],
+                "second_activity": ranked[1]["activity"],
+                "gap": gap,
+            }
+        )
+
+    runs = []
+    current = None
+    for item in leaders:
+        owner_id = item.get("owner_id")
+        if not owner_id:
+            if current:
+                current["end"] = item["time"]
+                runs.append(current)
+                current = None
+            continue
+        if current and current["owner_id"] == owner_id:
+            current["end"] = item["time"]
+            current["activity"] = max(current["activity"], item["activity"])
+            current["gap"] = max(current["gap"], item["gap"])
+            continue
+        if current:
+            current["end"] = item["time"]
+            runs.append(current)
+        current = {
+            "owner_id": owner_id,
+            "start": item["time"],
+            "end": item["time"],
+            "activity": item["activity"],
+            "second_activity": item["second_activity"],
+            "gap": item["gap"],
+        }
+    if current:
+        runs.append(current)
+    return runs
+
+
+def multicam_layout_contract_audit_visitor(prepared_sources, output_width=None, output_height=None):
+    """Visitor form of ``audit_multicam_layout_contract`` for ``run_multicam_plan_audits``."""
     source_map = {
         str(source.get("id") or ""): source
         for source in (prepared_sources or [])
@@ -15946,8 +17225,11 @@ def audit_multicam_layout_contract(segments, prepared_sources, output_width=None
     valid_source_ids = set(source_map.keys())
     issues = []
     pip_geometry_samples = []
+    checked = 0
 
-    for index, segment in enumerate(segments or []):
+    def visit(index, segment):
+        nonlocal checked
+        checked += 1
         camera_id = str((segment or {}).get("camera_id") or "")
         secondary_camera_id = str((segment or {}).get("secondary_camera_id") or "")
         layout_mode = normalize_multicam_layout_mode((segment or {}).get("layout_mode", "cut") or "cut")
@@ -16062,23 +17344,20 @@ def audit_multicam_layout_contract(segments, prepared_sources, output_width=None
                         }
                     )
 
-    return {
-        "status": "failed" if issues else "passed",
-        "checked_segments": len(segments or []),
-        "issue_count": len(issues),
-        "issues": issues[:50],
-        "pip_geometry_samples": pip_geometry_samples,
-    }
+    def finish(_timeline):
+        return {
+            "status": "failed" if issues else "passed",
+            "checked_segments": checked,
+            "issue_count": len(issues),
+            "issues": issues[:50],
+            "pip_geometry_samples": pip_geometry_samples,
+        }
 
+    return visit, finish
 
-def audit_multicam_director_active_speaker_truth(segments, prepared_sources):
-    """
-    Pre-render director truth gate.
 
-    Layout contract checks the final segment owner. This audit checks the raw
-    trusted director channel too, so a hold/reaction decision cannot hide the
-    active speaker in the small reaction window and still report "passed".
-    """
+def multicam_director_truth_audit_visitor(prepared_sources):
+    """Visitor form of ``audit_multicam_director_active_speaker_truth`` for ``run_multicam_plan_audits``."""
     valid_source_ids = {
         str(source.get("id") or "")
         for source in (prepared_sources or [])
@@ -16097,7 +17376,8 @@ def audit_multicam_director_active_speaker_truth(segments, prepared_sources):
         "visual_speaker_owner",
     }
 
-    for index, segment in enumerate(segments or []):
+    def visit(index, segment):
+        nonlocal checked
         item = segment or {}
         layout_mode = normalize_multicam_layout_mode(item.get("layout_mode", "cut") or "cut")
         reason = str(item.get("layout_reason") or "")
@@ -16129,7 +17409,7 @@ def audit_multicam_director_active_speaker_truth(segments, prepared_sources):
                 or abs(leader_gap) >= 0.14
             )
         ):
-            continue
+            return
 
         checked += 1
         shared_moment = (
@@ -16147,9 +17427,9 @@ def audit_multicam_director_active_speaker_truth(segments, prepared_sources):
         )
 
         if shared_moment and raw_leader_id in {camera_id, secondary_camera_id}:
-            continue
+            return
         if sync_safety_fallback and not clean_channel_authority and camera_id != raw_leader_id:
-            continue
+            return
 
         if camera_id != raw_leader_id:
             issues.append(
@@ -16188,78 +17468,28 @@ def audit_multicam_director_active_speaker_truth(segments, prepared_sources):
                 }
             )
 
-    return {
-        "status": "failed" if issues else "passed",
-        "checked_segments": checked,
-        "issue_count": len(issues),
-        "issues": issues[:50],
-    }
+    def finish(_timeline):
+        return {
+            "status": "failed" if issues else "passed",
+            "checked_segments": checked,
+            "issue_count": len(issues),
+            "issues": issues[:50],
+        }
 
+    return visit, finish
 
-def audit_multicam_director_switch_latency(segments, prepared_sources):
-    """
-    Pre-render timing gate for active-speaker changes.
 
-    The director can be technically correct on final segments while still
-    joining a speaker late. This audit reads the raw trusted source activity
-    timeline and verifies that a dominant speaker run gets hero/shared coverage
-    within a short latency budget.
-    """
+def multicam_switch_latency_audit_visitor(prepared_sources):
+    """Visitor form of ``audit_multicam_director_switch_latency`` for ``run_multicam_plan_audits``."""
     source_ids = [
         str(source.get("id") or "")
         for source in (prepared_sources or [])
         if source.get("id")
     ]
-    if len(source_ids) < 2:
-        return {"status": "passed", "checked_runs": 0, "issue_count": 0, "issues": []}
-
-    max_latency = float(os.getenv("MULTICAM_DIRECTOR_MAX_SWITCH_LATENCY_SECONDS", "1.0") or 1.0)
-    min_run_duration = float(os.getenv("MULTICAM_DIRECTOR_MIN_DOMINANT_RUN_SECONDS", "0.75") or 0.75)
-    min_activity = float(os.getenv("MULTICAM_DIRECTOR_SWITCH_LATENCY_MIN_ACTIVITY", "0.34") or 0.34)
-    min_gap = float(os.getenv("MULTICAM_DIRECTOR_SWITCH_LATENCY_MIN_GAP", "0.14") or 0.14)
+    max_latency, min_run_duration, min_activity, min_gap = multicam_switch_latency_thresholds()
     shared_layouts = {"split", "split-vertical", "scene-grid", "grid"}
-
-    source_windows = {}
-    all_times = set()
-    for source in prepared_sources or []:
-        source_id = str(source.get("id") or "")
-        if not source_id:
-            continue
-        windows = sorted(
-            [
-                {
-                    "time": float(item.get("time", 0.0) or 0.0),
-                    "activity": float(item.get("activity", 0.0) or 0.0),
-                }
-                for item in (source.get("timeline_audio_activity_windows") or [])
-                if item is not None
-            ],
-            key=lambda item: item["time"],
-        )
-        if not windows:
-            continue
-        source_windows[source_id] = windows
-        all_times.update(item["time"] for item in windows)
-
-    if len(source_windows) < 2 or not all_times:
-        return {"status": "passed", "checked_runs": 0, "issue_count": 0, "issues": []}
-
-    def activity_at(source_id, target_time):
-        windows = source_windows.get(source_id) or []
-        value = 0.0
-        for item in windows:
-            if item["time"] > target_time + 1e-6:
-                break
-            value = item["activity"]
-        return value
-
-    def segment_at(target_time):
-        for segment in segments or []:
-            start = float((segment or {}).get("timeline_start", 0.0) or 0.0)
-            end = float((segment or {}).get("timeline_end", start) or start)
-            if start <= target_time < end:
-                return segment or {}
-        return {}
+    runs = multicam_dominant_speaker_runs(prepared_sources, min_activity, min_gap) if len(source_ids) >= 2 else None
+    max_segment_end = None
 
     def segment_covers_owner(segment, owner_id):
         camera_id = str((segment or {}).get("camera_id") or "")
@@ -16281,133 +17511,199 @@ def audit_multicam_director_switch_latency(segments, prepared_sources):
             return True
         return bool(shared and owner_id in {camera_id, secondary_id})
 
-    leaders = []
-    for target_time in sorted(all_times):
-        ranked = sorted(
-            [
-                {"camera_id": source_id, "activity": activity_at(source_id, target_time)}
-                for source_id in source_ids
-            ],
-            key=lambda item: item["activity"],
-            reverse=True,
-        )
-        if len(ranked) < 2:
-            continue
-        leader = ranked[0]
-        gap = leader["activity"] - ranked[1]["activity"]
-        owner_id = leader["camera_id"] if leader["activity"] >= min_activity and gap >= min_gap else None
-        leaders.append(
-            {
-                "time": target_time,
-                "owner_id": owner_id,
-                "activity": leader["activity"],
-                "second_activity": ranked[1]["activity"],
-                "gap": gap,
-            }
-        )
+    def visit(_index, segment):
+        nonlocal max_segment_end
+        segment_end = float((segment or {}).get("timeline_end", 0.0) or 0.0)
+        max_segment_end = segment_end if max_segment_end is None else max(max_segment_end, segment_end)
 
-    runs = []
-    current = None
-    for item in leaders:
-        owner_id = item.get("owner_id")
-        if not owner_id:
-            if current:
-                current["end"] = item["time"]
-                runs.append(current)
-                current = None
-            continue
-        if current and current["owner_id"] == owner_id:
-            current["end"] = item["time"]
-            current["activity"] = max(current["activity"], item["activity"])
-            current["gap"] = max(current["gap"], item["gap"])
-            continue
-        if current:
-            current["end"] = item["time"]
-            runs.append(current)
-        current = {
-            "owner_id": owner_id,
-            "start": item["time"],
-            "end": item["time"],
-            "activity": item["activity"],
-            "second_activity": item["second_activity"],
-            "gap": item["gap"],
-        }
-    if current:
-        runs.append(current)
+    def finish(segment_timeline):
+        if runs is None:
+            return {"status": "passed", "checked_runs": 0, "issue_count": 0, "issues": []}
 
-    issues = []
-    checked = 0
-    ordered_segments = sorted(segments or [], key=lambda item: float((item or {}).get("timeline_start", 0.0) or 0.0))
-    max_segment_end = max(
-        [
-            float((segment or {}).get("timeline_end", 0.0) or 0.0)
-            for segment in ordered_segments
-        ]
-        or [0.0]
-    )
-    for run in runs:
-        run_start = float(run["start"])
-        run_end = min(float(run["end"]), max_segment_end)
-        if run_end <= run_start:
-            continue
-        if (run_end - run_start) < min_run_duration:
-            continue
-        checked += 1
-        owner_id = run["owner_id"]
-        deadline = run_start + max_latency
-        checkpoint_time = min(deadline, max(run_start, run_end - 0.001))
-        deadline_segment = segment_at(checkpoint_time)
-        if segment_covers_owner(deadline_segment, owner_id):
-            continue
+        def segment_at(target_time):
+            return segment_timeline.at(target_time, default={})
 
-        first_compliant_time = None
-        for segment in ordered_segments:
-            seg_start = float((segment or {}).get("timeline_start", 0.0) or 0.0)
-            seg_end = float((segment or {}).get("timeline_end", seg_start) or seg_start)
-            if seg_end <= run_start:
+        issues = []
+        checked = 0
+        for run in runs:
+            run_start = float(run["start"])
+            run_end = min(float(run["end"]), 0.0 if max_segment_end is None else max_segment_end)
+            if run_end <= run_start:
+                continue
+            if (run_end - run_start) < min_run_duration:
+                continue
+            checked += 1
+            owner_id = run["owner_id"]
+            deadline = run_start + max_latency
+            checkpoint_time = min(deadline, max(run_start, run_end - 0.001))
+            deadline_segment = segment_at(checkpoint_time)
+            if segment_covers_owner(deadline_segment, owner_id):
                 continue
-            if seg_start >= run_end:
-                break
-            if segment_covers_owner(segment, owner_id):
-                first_compliant_time = max(seg_start, run_start)
-                break
 
-        issues.append(
-            {
-                "type": "late_active_speaker_switch",
-                "owner_camera_id": owner_id,
-                "run_start": round(run_start, 3),
-                "run_end": round(run_end, 3),
-                "deadline": round(deadline, 3),
-                "checkpoint_time": round(checkpoint_time, 3),
-                "first_compliant_time": round(first_compliant_time, 3) if first_compliant_time is not None else None,
-                "observed_latency_seconds": round((first_compliant_time - run_start), 3)
-                if first_compliant_time is not None else None,
-                "max_allowed_latency_seconds": round(max_latency, 3),
-                "deadline_segment_camera_id": str((deadline_segment or {}).get("camera_id") or ""),
-                "deadline_segment_secondary_camera_id": str((deadline_segment or {}).get("secondary_camera_id") or ""),
-                "deadline_segment_layout": normalize_multicam_layout_mode((deadline_segment or {}).get("layout_mode", "cut") or "cut"),
-                "activity": round(float(run.get("activity", 0.0) or 0.0), 4),
-                "gap": round(float(run.get("gap", 0.0) or 0.0), 4),
-            }
-        )
+            first_compliant_time = None
+            for segment in segment_timeline.overlapping(run_start, run_end):
+                if segment_covers_owner(segment, owner_id):
+                    first_compliant_time = max(float(segment.get("timeline_start", 0.0) or 0.0), run_start)
+                    break
 
-    issue_report_limit = int(os.getenv("MULTICAM_DIRECTOR_AUDIT_ISSUE_REPORT_LIMIT", "50") or 50)
-    return {
-        "status": "failed" if issues else "passed",
-        "checked_runs": checked,
-        "issue_count": len(issues),
-        "issues": issues[:issue_report_limit],
-        "all_issues": issues,
-        "issues_truncated": len(issues) > issue_report_limit,
-        "issue_report_limit": issue_report_limit,
-        "thresholds": {
-            "max_latency_seconds": round(max_latency, 3),
-            "min_run_duration_seconds": round(min_run_duration, 3),
-            "min_activity": round(min_activity, 3),
-            "min_gap": round(min_gap, 3),
-        },
-    }
+            issues.append(
+                {
+                    "type": "late_active_speaker_switch",
+                    "owner_camera_id": owner_id,
+                    "run_start": round(run_start, 3),
+                    "run_end": round(run_end, 3),
+                    "deadline": round(deadline, 3),
+                    "checkpoint_time": round(checkpoint_time, 3),
+                    "first_compliant_time": round(first_compliant_time, 3) if first_compliant_time is not None else None,
+                    "observed_latency_seconds": round((first_compliant_time - run_start), 3)
+                    if first_compliant_time is not None else None,
+                    "max_allowed_latency_seconds": round(max_latency, 3),
+                    "deadline_segment_camera_id": str((deadline_segment or {}).get("camera_id") or ""),
+                    "deadline_segment_secondary_camera_id": str((deadline_segment or {}).get("secondary_camera_id") or ""),
+                    "deadline_segment_layout": normalize_multicam_layout_mode((deadline_segment or {}).get("layout_mode", "cut") or "cut"),
+                    "activity": round(float(run.get("activity", 0.0) or 0.0), 4),
+                    "gap": round(float(run.get("gap", 0.0) or 0.0), 4),
+                }
+            )
+
+        issue_report_limit = int(os.getenv("MULTICAM_DIRECTOR_AUDIT_ISSUE_REPORT_LIMIT", "50") or 50)
+        return {
+            "status": "failed" if issues else "passed",
+            "checked_runs": checked,
+            "issue_count": len(issues),
+            "issues": issues[:issue_report_limit],
+            "all_issues": issues,
+            "issues_truncated": len(issues) > issue_report_limit,
+            "issue_report_limit": issue_report_limit,
+            "thresholds": {
+                "max_latency_seconds": round(max_latency, 3),
+                "min_run_duration_seconds": round(min_run_duration, 3),
+                "min_activity": round(min_activity, 3),
+                "min_gap": round(min_gap, 3),
+            },
+        }
+
+    return visit, finish
+
+
+MULTICAM_PLAN_AUDITS = ("layout_contract", "director_truth", "switch_latency")
+# Every segment field any plan audit reads; the memo key digests these in plan order.
+_PLAN_AUDIT_SEGMENT_FIELDS = (
+    "timeline_start",
+    "timeline_end",
+    "camera_id",
+    "secondary_camera_id",
+    "layout_mode",
+    "layout_reason",
+    "audio_leader_camera_id",
+    "raw_audio_leader_camera_id",
+    "audio_decision_reliable",
+    "audio_decision_reason",
+    "audio_leader_activity",
+    "audio_second_activity",
+    "audio_leader_gap",
+)
+plan_audit_cache = PlanAuditCache()
+
+
+def run_multicam_plan_audits(segments, prepared_sources, output_width=None, output_height=None, audits=MULTICAM_PLAN_AUDITS):
+    """
+    Run the pre-render plan audits in one sweep over the plan, memoized.
+
+    Each audit is a ``(visit, finish)`` visitor: ``visit`` sees every segment
+    once, in plan order, and ``finish`` receives the one SegmentTimeline they
+    share. Results are cached under a digest of the segment fields the audits
+    read plus each audit's other inputs, so re-auditing an unchanged plan (the
+    repair passes' final audits, the pre-render audits, the quality gate) is a
+    cache lookup.
+    """
+    plan_key = plan_audit_fingerprint(segments, _PLAN_AUDIT_SEGMENT_FIELDS)
+    source_ids = tuple(str(source.get("id") or "") for source in (prepared_sources or []))
+    results = {}
+    pending = []
+    for name in audits:
+        if name == "layout_contract":
+            context = (
+                source_ids,
+                tuple(
+                    (source.get("focus_x"), source.get("reaction_side"), source.get("reactionSide"))
+                    for source in (prepared_sources or [])
+                ),
+                output_width,
+                output_height,
+            )
+            visitor_factory = multicam_layout_contract_audit_visitor
+            visitor_args = (prepared_sources, output_width, output_height)
+        elif name == "director_truth":
+            context = source_ids
+            visitor_factory = multicam_director_truth_audit_visitor
+            visitor_args = (prepared_sources,)
+        elif name == "switch_latency":
+            thresholds = multicam_switch_latency_thresholds()
+            runs = (
+                multicam_dominant_speaker_runs(prepared_sources, thresholds[2], thresholds[3])
+                if len([source_id for source_id in source_ids if source_id]) >= 2
+                else None
+            )
+            context = (
+                thresholds,
+                os.getenv("MULTICAM_DIRECTOR_AUDIT_ISSUE_REPORT_LIMIT", "50"),
+                hashlib.sha256(repr(runs).encode("utf-8")).hexdigest(),
+            )
+            visitor_factory = multicam_switch_latency_audit_visitor
+            visitor_args = (prepared_sources,)
+        else:
+            raise ValueError(f"Unknown multicam plan audit: {name}")
+        key = (name, plan_key, context)
+        cached = plan_audit_cache.get(key)
+        if cached is not None:
+            results[name] = cached
+        else:
+            pending.append((name, key, visitor_factory(*visitor_args)))
+
+    if pending:
+        for index, segment in enumerate(segments or []):
+            for _name, _key, (visit, _finish) in pending:
+                visit(index, segment)
+        segment_timeline = SegmentTimeline(segments)
+        for name, key, (_visit, finish) in pending:
+            result = finish(segment_timeline)
+            plan_audit_cache.put(key, result)
+            results[name] = result
+    return results
+
+
+def audit_multicam_layout_contract(segments, prepared_sources, output_width=None, output_height=None):
+    return run_multicam_plan_audits(
+        segments,
+        prepared_sources,
+        output_width=output_width,
+        output_height=output_height,
+        audits=("layout_contract",),
+    )["layout_contract"]
+
+
+def audit_multicam_director_active_speaker_truth(segments, prepared_sources):
+    """
+    Pre-render director truth gate.
+
+    Layout contract checks the final segment owner. This audit checks the raw
+    trusted director channel too, so a hold/reaction decision cannot hide the
+    active speaker in the small reaction window and still report "passed".
+    """
+    return run_multicam_plan_audits(segments, prepared_sources, audits=("director_truth",))["director_truth"]
+
+
+def audit_multicam_director_switch_latency(segments, prepared_sources):
+    """
+    Pre-render timing gate for active-speaker changes.
+
+    The director can be technically correct on final segments while still
+    joining a speaker late. This audit reads the raw trusted source activity
+    timeline and verifies that a dominant speaker run gets hero/shared coverage
+    within a short latency budget.
+    """
+    return run_multicam_plan_audits(segments, prepared_sources, audits=("switch_latency",))["switch_latency"]
 
 
 def merge_adjacent_multicam_segments(segments):
@@ -16630,14 +17926,17 @@ def repair_multicam_late_active_speaker_segments(segments, prepared_sources, ove
             key=lambda item: item["time"],
         )
 
+    window_times = {source_id: [item["time"] for item in windows] for source_id, windows in source_windows.items()}
+
     def activity_at_repair_time(source_id, target_time):
-        windows = source_windows.get(source_id) or []
-        value = 0.0
-        for item in windows:
-            if item["time"] > target_time + 1e-6:
-                break
-            value = item["activity"]
-        return value
+        index = bisect.bisect_right(window_times.get(source_id) or [], target_time + 1e-6) - 1
+        return source_windows[source_id][index]["activity"] if index >= 0 else 0.0
+
+    segment_timeline = SegmentTimeline(
+        ordered_segments,
+        end_of=lambda item: float(item.get("timeline_end", 0.0) or 0.0),
+    )
+    repair_timeline = SegmentTimeline.from_keys(repairs, "start", "end")
 
     repaired_segments = []
     for index in range(len(timeline_points) - 1):
@@ -16646,20 +17945,10 @@ def repair_multicam_late_active_speaker_segments(segments, prepared_sources, ove
         if end - start <= 0.02:
             continue
         midpoint = start + ((end - start) / 2.0)
-        base_segment = next(
-            (
-                segment for segment in ordered_segments
-                if float((segment or {}).get("timeline_start", 0.0) or 0.0) <= midpoint
-                and midpoint < float((segment or {}).get("timeline_end", 0.0) or 0.0)
-            ),
-            None,
-        )
+        base_segment = segment_timeline.at(midpoint)
         if not base_segment:
             continue
-        covering_repairs = [
-            repair for repair in repairs
-            if repair["start"] <= midpoint < repair["end"]
-        ]
+        covering_repairs = repair_timeline.covering(midpoint)
         active_repair = max(
             covering_repairs,
             key=lambda repair: (
@@ -17949,13 +19238,15 @@ def multicam_timeline_frame_count(timeline_start, timeline_end, fps=30):
     up to a second of video lag inside a checkpoint. Using absolute frame
     boundaries makes adjacent allocations telescope to the master frame count.
     """
-    safe_fps = max(1, int(fps or 30))
     start = float(timeline_start or 0.0)
     end = max(start, float(timeline_end or start))
-    epsilon = 1e-7
-    start_frame = int(math.ceil((start * safe_fps) - epsilon))
-    end_frame = int(math.ceil((end * safe_fps) - epsilon))
-    return max(1, end_frame - start_frame)
+    return max(1, multicam_timeline_frame_index(end, fps) - multicam_timeline_frame_index(start, fps))
+
+
+def multicam_timeline_frame_index(timeline_time, fps=30):
+    """First master-timeline CFR frame at or after ``timeline_time``."""
+    safe_fps = max(1, int(fps or 30))
+    return int(math.ceil((float(timeline_time or 0.0) * safe_fps) - 1e-7))
 
 
 def validate_multicam_checkpoint_media(
@@ -18363,6 +19654,9 @@ def multicam_source_has_auditable_audio(source):
 
 def pick_multicam_post_render_sync_samples(segments, source_map, overlap_start, max_samples=None):
     candidates = []
+    # Samples without an explicit source range are mapped per camera in one batch.
+    pending_by_source = {}
+    samples_by_source = {}
     max_count = max_samples or MULTICAM_POST_RENDER_SYNC_MAX_SAMPLES
     for index, segment in enumerate(segments or []):
         timeline_start = float(segment.get("timeline_start", 0.0) or 0.0)
@@ -18408,7 +19702,7 @@ def pick_multicam_post_render_sync_samples(segments, source_map, overlap_start,
                         + (float(sample_offset) * source_seconds_per_timeline_second)
                     )
                 else:
-                    source_start_seconds = get_source_start_for_timeline(source, overlap_start, output_start)
+                    source_start_seconds = None
                 candidates.append({
                     "segment_index": index,
                     "role": role,
@@ -18425,6 +19719,9 @@ def pick_multicam_post_render_sync_samples(segments, source_map, overlap_start,
                     "source_start_seconds": source_start_seconds,
                     "duration_seconds": remaining_duration,
                 })
+                samples_by_source.setdefault(id(source), (source, []))[1].append(candidates[-1])
+                if source_start_seconds is None:
+                    pending_by_source.setdefault(id(source), (source, []))[1].append(candidates[-1])
 
         primary = source_map.get(segment.get("camera_id"))
         append_samples(primary, "primary")
@@ -18433,6 +19730,29 @@ def pick_multicam_post_render_sync_samples(segments, source_map, overlap_start,
         secondary = source_map.get(secondary_id)
         append_samples(secondary, "secondary")
 
+    for source, pending in pending_by_source.values():
+        source_starts = get_source_starts_for_timeline(
+            source,
+            overlap_start,
+            [candidate["output_start_seconds"] for candidate in pending],
+        )
+        for candidate, source_start_seconds in zip(pending, source_starts):
+            candidate["source_start_seconds"] = float(source_start_seconds)
+
+    # Explicit source ranges can go stale when the sync map is re-solved after
+    # planning; record how far the current map would move each sampled frame.
+    for source, samples in samples_by_source.values():
+        compiled = compiled_continuous_sync_map(source)
+        if not source_has_active_continuous_sync_map(source) or compiled is None or not compiled.invertible:
+            continue
+        mapped_timelines = compiled.to_timeline_many([sample["source_start_seconds"] for sample in samples])
+        for sample, mapped_timeline in zip(samples, mapped_timelines):
+            if not np.isnan(mapped_timeline):
+                sample["sync_map_output_drift_seconds"] = round(
+                    float(mapped_timeline) - float(overlap_start) - sample["output_start_seconds"],
+                    3,
+                )
+
     if len(candidates) <= max_count:
         return candidates
 
@@ -19077,7 +20397,7 @@ def multicam_rounded_mask_path(width, height, radius):
     safe_width = max(2, int(width))
     safe_height = max(2, int(height))
     safe_radius = max(1, int(radius))
-    cache_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../tmp/multicam-mask-cache"))
+    cache_dir = os.path.join(WORKER_TMP_DIR, "multicam-mask-cache")
     os.makedirs(cache_dir, exist_ok=True)
     mask_path = os.path.join(cache_dir, f"rounded_{safe_width}x{safe_height}_r{safe_radius}.png")
     if not os.path.exists(mask_path):
@@ -19263,47 +20583,34 @@ def source_has_active_continuous_sync_map(source):
     return bool(sync_map.get("active") and len(sync_map.get("anchors") or []) >= 2)
 
 
+# Anchors are compiled once per map and job; the map itself stays JSON on the source.
+compiled_sync_map_cache = CompiledSyncMapCache()
+
+
+def compiled_continuous_sync_map(source):
+    return compiled_sync_map_cache.get((source or {}).get("continuous_sync_map"))
+
+
 def map_timeline_to_source_with_continuous_sync(source, absolute_timeline):
-    sync_map = (source or {}).get("continuous_sync_map") or {}
-    anchors = sorted(
-        [
-            anchor
-            for anchor in (sync_map.get("anchors") or [])
-            if anchor.get("status") == "accepted"
-            and anchor.get("source_position_seconds") is not None
-            and anchor.get("corrected_timeline_seconds") is not None
-        ],
-        key=lambda item: float(item.get("corrected_timeline_seconds") or 0.0),
-    )
-    if len(anchors) < 2:
+    compiled = compiled_continuous_sync_map(source)
+    if compiled is None:
         return None
+    return compiled.to_source(absolute_timeline)
 
-    timeline_value = float(absolute_timeline)
 
-    def point(anchor):
-        return (
-            float(anchor.get("corrected_timeline_seconds") or 0.0),
-            float(anchor.get("source_position_seconds") or 0.0),
-        )
+def map_timelines_to_source_with_continuous_sync(source, absolute_timelines):
+    """Batch form of ``map_timeline_to_source_with_continuous_sync``; NaN where unmapped."""
+    compiled = compiled_continuous_sync_map(source)
+    if compiled is None:
+        return np.full(np.shape(absolute_timelines), np.nan)
+    return compiled.to_source_many(absolute_timelines)
 
-    if timeline_value <= float(anchors[0]["corrected_timeline_seconds"]):
-        left, right = point(anchors[0]), point(anchors[1])
-    elif timeline_value >= float(anchors[-1]["corrected_timeline_seconds"]):
-        left, right = point(anchors[-2]), point(anchors[-1])
-    else:
-        left, right = point(anchors[0]), point(anchors[-1])
-        for index in range(len(anchors) - 1):
-            candidate_left = point(anchors[index])
-            candidate_right = point(anchors[index + 1])
-            if candidate_left[0] <= timeline_value <= candidate_right[0]:
-                left, right = candidate_left, candidate_right
-                break
 
-    timeline_delta = right[0] - left[0]
-    if abs(timeline_delta) < 1e-6:
+def map_source_to_timeline_with_continuous_sync(source, source_position):
+    compiled = compiled_continuous_sync_map(source)
+    if compiled is None:
         return None
-    ratio = (timeline_value - left[0]) / timeline_delta
-    return left[1] + (ratio * (right[1] - left[1]))
+    return compiled.to_timeline(source_position)
 
 
 def get_source_start_for_timeline(source, overlap_start, timeline_start):
@@ -19315,6 +20622,27 @@ def get_source_start_for_timeline(source, overlap_start, timeline_start):
     return (absolute_timeline - float(source["offset_seconds"])) * sync_rate
 
 
+def get_source_starts_for_timeline(source, overlap_start, timeline_starts):
+    """``get_source_start_for_timeline`` for an array of timeline positions."""
+    absolute_timelines = float(overlap_start) + np.asarray(timeline_starts, dtype=np.float64)
+    mapped = map_timelines_to_source_with_continuous_sync(source, absolute_timelines)
+    unmapped = np.isnan(mapped)
+    if unmapped.any():
+        sync_rate = float(source.get("sync_rate") or 1.0)
+        linear = (absolute_timelines - float(source["offset_seconds"])) * sync_rate
+        mapped = np.where(unmapped, linear, mapped)
+    return mapped
+
+
+def get_timeline_for_source_position(source, overlap_start, source_position):
+    """Inverse of ``get_source_start_for_timeline``: the output time showing ``source_position``."""
+    absolute_timeline = map_source_to_timeline_with_continuous_sync(source, source_position)
+    if absolute_timeline is None:
+        sync_rate = max(0.001, float(source.get("sync_rate") or 1.0))
+        absolute_timeline = (float(source_position) / sync_rate) + float(source["offset_seconds"])
+    return absolute_timeline - float(overlap_start)
+
+
 def get_source_range_for_timeline(source, overlap_start, timeline_start, duration):
     source_start = get_source_start_for_timeline(source, overlap_start, timeline_start)
     source_end = get_source_start_for_timeline(
@@ -19400,6 +20728,7 @@ async def render_multicam_layout_segment(
     primary_source_end=None,
     layout_source_ranges=None,
     segment_index=None,
+    finishing=None,
 ):
     layout_mode = normalize_multicam_layout_mode(layout_mode)
     if len(layout_sources) < 2 or layout_mode not in {"scene-grid", "split-vertical", "pip"}:
@@ -19681,11 +21010,12 @@ async def render_multicam_layout_segment(
         timeline_start,
         float(timeline_start) + float(duration),
     )
+    filter_graph, output_label = append_multicam_finishing_filter(";".join(filters), finishing)
     cmd.extend([
         "-filter_complex",
-        ";".join(filters),
+        filter_graph,
         "-map",
-        "[v]",
+        output_label,
         "-frames:v",
         str(target_frame_count),
         *build_multicam_segment_encode_args(),
@@ -21791,6 +23121,7 @@ def activate_continuous_sync_map(source, anchors):
         "anchors": monotonic if active else accepted,
         "rejected_anchor_count": len([anchor for anchor in anchors if anchor.get("status") != "accepted"]),
     }
+    compiled_continuous_sync_map(source)
     return source["continuous_sync_map"]
 
 
@@ -21933,9 +23264,17 @@ async def build_continuous_sync_anchor_maps(
         )
         camera_receipt["max_shift_seconds"] = round(float(source_max_shift_seconds), 3)
         anchors = []
+        mapped_source_positions = map_timelines_to_source_with_continuous_sync(
+            source,
+            [float(overlap_start) + float(relative_timeline) for relative_timeline in checkpoints],
+        )
         for anchor_index, relative_timeline in enumerate(checkpoints):
             absolute_timeline = float(overlap_start) + float(relative_timeline)
-            mapped_source_pos = map_timeline_to_source_with_continuous_sync(source, absolute_timeline)
+            mapped_source_pos = (
+                None
+                if np.isnan(mapped_source_positions[anchor_index])
+                else float(mapped_source_positions[anchor_index])
+            )
             source_pos = mapped_source_pos if mapped_source_pos is not None else (absolute_timeline - offset) * sync_rate
             audit_shift = float(source.get("audio_audit_time_shift_seconds") or 0.0)
             audit_source_pos = float(source_pos or 0.0) - audit_shift
@@ -22066,236 +23405,6 @@ async def build_continuous_sync_anchor_maps(
     return receipt
 
 
-def analyze_multicam_color_profile(video_path, sample_start=0.0, sample_duration=90.0, pre_filter=""):
-    # Twelve 480x270 frames are still cheap, while retaining enough facial
-    # structure for profile/angled podcast guests. Production previously used
-    # one 320x180 frontal cascade; a zero-detection result silently reduced the
-    # promised face-aware grade to a whole-frame average.
-    width = 480
-    height = 270
-    frame_bytes = width * height * 3
-    safe_start = max(0.0, float(sample_start or 0.0))
-    safe_duration = max(1.0, float(sample_duration or 1.0))
-    analysis_filter = combine_multicam_filter_chains(
-        pre_filter,
-        f"fps=1/5,scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height},format=rgb24",
-    )
-    cmd = [
-        "ffmpeg",
-        "-nostdin",
-        "-hide_banner",
-        "-loglevel",
-        "error",
-        "-ss",
-        f"{safe_start:.3f}",
-        "-t",
-        f"{safe_duration:.3f}",
-        "-i",
-        video_path,
-        "-vf",
-        analysis_filter,
-        "-f",
-        "rawvideo",
-        "-",
-    ]
-    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
-    if result.returncode != 0:
-        raise RuntimeError((result.stderr or b"").decode("utf-8", errors="ignore")[-500:] or "ffmpeg color analysis failed")
-    usable_bytes = len(result.stdout) - (len(result.stdout) % frame_bytes)
-    if usable_bytes <= 0:
-        raise RuntimeError("ffmpeg color analysis returned no video frames")
-
-    frames = np.frombuffer(result.stdout[:usable_bytes], dtype=np.uint8).reshape(
-        (-1, height, width, 3)
-    )
-    pixels = frames.reshape((-1, 3)).astype(np.float32)
-    red = pixels[:, 0]
-    green = pixels[:, 1]
-    blue = pixels[:, 2]
-    luma = (0.2126 * red) + (0.7152 * green) + (0.0722 * blue)
-    chroma = np.sqrt(((red - luma) ** 2) + ((blue - luma) ** 2))
-    max_channel = np.max(pixels, axis=1)
-    min_channel = np.min(pixels, axis=1)
-    saturation = (max_channel - min_channel) / np.maximum(max_channel, 1.0)
-    neutral_luma_floor = max(96.0, float(np.percentile(luma, 55.0)))
-    neutral_mask = (
-        (luma >= neutral_luma_floor)
-        & (luma <= 245.0)
-        & (saturation <= 0.28)
-        & (max_channel < 252.0)
-    )
-    if float(np.mean(neutral_mask)) < 0.015:
-        neutral_mask = (
-            (luma >= max(88.0, float(np.percentile(luma, 60.0))))
-            & (luma <= 248.0)
-            & (saturation <= 0.38)
-        )
-    neutral_pixels = pixels[neutral_mask]
-
-    haar_face_luma_samples = []
-    subject_midtone_luma_samples = []
-    face_detection_count = 0
-    subject_midtone_sample_count = 0
-    face_detection_methods = set()
-    try:
-        detector_specs = [
-            ("frontal_default", "haarcascade_frontalface_default.xml", False),
-            ("frontal_alt2", "haarcascade_frontalface_alt2.xml", False),
-            ("profile", "haarcascade_profileface.xml", False),
-            ("profile_mirrored", "haarcascade_profileface.xml", True),
-        ]
-        face_detectors = []
-        for method, filename, mirrored in detector_specs:
-            detector_path = os.path.join(cv2.data.haarcascades, filename)
-            detector = cv2.CascadeClassifier(detector_path)
-            if not detector.empty():
-                face_detectors.append((method, detector, mirrored))
-
-        for frame in frames:
-            frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-            gray = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY)
-            equalized_gray = cv2.equalizeHist(gray)
-            detection_candidates = []
-            for method, detector, mirrored in face_detectors:
-                detector_input = cv2.flip(equalized_gray, 1) if mirrored else equalized_gray
-                detections = detector.detectMultiScale(
-                    detector_input,
-                    scaleFactor=1.07,
-                    minNeighbors=3,
-                    minSize=(24, 24),
-                    maxSize=(int(width * 0.48), int(height * 0.86)),
-                )
-                for x, y, face_width, face_height in detections:
-                    mapped_x = width - int(x) - int(face_width) if mirrored else int(x)
-                    detection_candidates.append(
-                        (
-                            int(face_width) * int(face_height),
-                            mapped_x,
-                            int(y),
-                            int(face_width),
-                            int(face_height),
-                            method,
-                        )
-                    )
-
-            if detection_candidates:
-                _area, x, y, face_width, face_height, method = max(detection_candidates)
-                inset_x = max(1, int(face_width * 0.10))
-                inset_y = max(1, int(face_height * 0.10))
-                face_rgb = frame[
-                    y + inset_y : y + face_height - inset_y,
-                    x + inset_x : x + face_width - inset_x,
-                ].reshape((-1, 3)).astype(np.float32)
-                if face_rgb.size > 0:
-                    haar_face_luma_samples.append(
-                        (0.2126 * face_rgb[:, 0])
-                        + (0.7152 * face_rgb[:, 1])
-                        + (0.0722 * face_rgb[:, 2])
-                    )
-                    face_detection_count += 1
-                    face_detection_methods.add(method)
-                    continue
-
-            # Cascades can still miss dark skin, side profiles, hats, or a
-            # container image whose Haar data is incomplete. Use a bounded
-            # upper-frame skin-region estimate for exposure only; record it as
-            # a subject fallback instead of pretending it was a face detection.
-            ycrcb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2YCrCb)
-            skin_mask = cv2.inRange(
-                ycrcb,
-                np.array([20, 122, 68], dtype=np.uint8),
-                np.array([245, 188, 142], dtype=np.uint8),
-            )
-            skin_mask[int(height * 0.84) :, :] = 0
-            kernel = np.ones((3, 3), np.uint8)
-            skin_mask = cv2.morphologyEx(skin_mask, cv2.MORPH_OPEN, kernel)
-            skin_mask = cv2.morphologyEx(skin_mask, cv2.MORPH_CLOSE, kernel, iterations=2)
-            component_count, _labels, stats, centroids = cv2.connectedComponentsWithStats(
-                skin_mask,
-                connectivity=8,
-            )
-            fallback_candidates = []
-            frame_area = float(width * height)
-            for component_index in range(1, component_count):
-                x, y, region_width, region_height, region_area = [
-                    int(value) for value in stats[component_index]
-                ]
-                if region_area < frame_area * 0.0015 or region_area > frame_area * 0.09:
-                    continue
-                if region_width < 12 or region_height < 14:
-                    continue
-                aspect = float(region_width) / max(1.0, float(region_height))
-                center_x, center_y = centroids[component_index]
-                if aspect < 0.38 or aspect > 1.85 or center_y > height * 0.72:
-                    continue
-                edge_penalty = 0.65 if center_x < width * 0.04 or center_x > width * 0.96 else 1.0
-                upper_weight = 1.25 - min(0.65, float(center_y) / max(1.0, height))
-                fallback_candidates.append(
-                    (region_area * edge_penalty * upper_weight, x, y, region_width, region_height)
-                )
-            if fallback_candidates:
-                _score, x, y, region_width, region_height = max(fallback_candidates)
-                # Tall skin components often include neck/arms. Keep the upper,
-                # face-sized portion so clothing and furniture cannot set skin exposure.
-                sampled_height = min(region_height, max(18, int(region_width * 1.30)))
-                pad_x = max(2, int(region_width * 0.10))
-                pad_y = max(2, int(sampled_height * 0.08))
-                x0 = max(0, x - pad_x)
-                x1 = min(width, x + region_width + pad_x)
-                y0 = max(0, y - pad_y)
-                y1 = min(height, y + sampled_height + pad_y)
-                subject_rgb = frame[y0:y1, x0:x1].reshape((-1, 3)).astype(np.float32)
-                if subject_rgb.size > 0:
-                    subject_midtone_luma_samples.append(
-                        (0.2126 * subject_rgb[:, 0])
-                        + (0.7152 * subject_rgb[:, 1])
-                        + (0.0722 * subject_rgb[:, 2])
-                    )
-                    subject_midtone_sample_count += 1
-    except Exception as face_error:
-        logger.warning("Multicam face exposure analysis skipped: %s", face_error)
-
-    profile = {
-        "sample_start_seconds": round(safe_start, 3),
-        "sample_duration_seconds": round(safe_duration, 3),
-        "sample_frame_count": int(usable_bytes / frame_bytes),
-        "mean_r": round(float(np.mean(red)), 3),
-        "mean_g": round(float(np.mean(green)), 3),
-        "mean_b": round(float(np.mean(blue)), 3),
-        "mean_luma": round(float(np.mean(luma)), 3),
-        "contrast_luma": round(float(np.std(luma)), 3),
-        "mean_chroma": round(float(np.mean(chroma)), 3),
-        "warmth": round(float((np.mean(red) - np.mean(blue)) / 255.0), 5),
-        "green_bias": round(float((np.mean(green) - ((np.mean(red) + np.mean(blue)) / 2.0)) / 255.0), 5),
-    }
-    if neutral_pixels.size > 0:
-        neutral_median = np.median(neutral_pixels, axis=0)
-        profile.update({
-            "neutral_sample_ratio": round(float(np.mean(neutral_mask)), 5),
-            "neutral_median_r": round(float(neutral_median[0]), 3),
-            "neutral_median_g": round(float(neutral_median[1]), 3),
-            "neutral_median_b": round(float(neutral_median[2]), 3),
-        })
-    exposure_samples = haar_face_luma_samples or subject_midtone_luma_samples
-    if exposure_samples:
-        combined_face_luma = np.concatenate(exposure_samples)
-        profile.update({
-            "face_detection_count": face_detection_count,
-            "face_detection_methods": sorted(face_detection_methods),
-            "subject_midtone_sample_count": subject_midtone_sample_count,
-            "face_exposure_source": "haar_face" if haar_face_luma_samples else "skin_subject_fallback",
-            "face_luma_mean": round(float(np.mean(combined_face_luma)), 3),
-            "face_luma_median": round(float(np.median(combined_face_luma)), 3),
-            "face_luma_p90": round(float(np.percentile(combined_face_luma, 90.0)), 3),
-        })
-    else:
-        profile["face_detection_count"] = 0
-        profile["face_detection_methods"] = []
-        profile["subject_midtone_sample_count"] = 0
-        profile["face_exposure_source"] = "global_frame_fallback"
-    return profile
-
-
 def build_multicam_color_match_filter(reference_profile, source_profile):
     ref_luma = float(reference_profile.get("mean_luma") or 0.0)
     src_luma = float(source_profile.get("mean_luma") or ref_luma or 1.0)
@@ -22718,7 +23827,7 @@ def combine_multicam_filter_chains(*chains):
 
 
 def multicam_receipt_cache_path(namespace, payload):
-    cache_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../tmp/multicam-receipt-cache"))
+    cache_dir = os.path.join(WORKER_TMP_DIR, "multicam-receipt-cache")
     os.makedirs(cache_dir, exist_ok=True)
     safe_namespace = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(namespace or "receipt")).strip("._") or "receipt"
     key = json.dumps(payload or {}, sort_keys=True, default=str)
@@ -22892,14 +24001,15 @@ async def prepare_multicam_visual_proxy_sources(prepared_sources, overlap_start,
 
     max_long_edge = int(os.getenv("MULTICAM_VISUAL_PROXY_MAX_LONG_EDGE", "1280") or 1280)
     safe_sources = list(prepared_sources or [])
+    proxy_plan = resource_scheduler.plan("proxy", len(safe_sources) or 1)
     proxy_concurrency = max(
         1,
         min(
             len(safe_sources) or 1,
-            int(os.getenv("MULTICAM_VISUAL_PROXY_CONCURRENCY", "2") or 2),
+            int(os.getenv("MULTICAM_VISUAL_PROXY_CONCURRENCY") or proxy_plan["concurrency"]),
         ),
     )
-    proxy_semaphore = asyncio.Semaphore(proxy_concurrency)
+    proxy_semaphore = resource_scheduler.limiter("proxy", proxy_concurrency)
 
     async def prepare_source_proxy(source):
         async with proxy_semaphore:
@@ -22943,7 +24053,7 @@ async def prepare_multicam_visual_proxy_sources(prepared_sources, overlap_start,
                         "0:a?",
                         "-vf",
                         render_filter,
-                        *build_multicam_segment_encode_args(),
+                        *build_multicam_segment_encode_args(threads=proxy_plan["threads"]),
                         "-c:a",
                         "aac",
                         "-b:a",
@@ -23089,6 +24199,9 @@ async def apply_multicam_color_matching(prepared_sources, overlap_start, overlap
         return receipt
 
     sample_duration = max(1.0, min(120.0, float(overlap_duration or 1.0)))
+    profile_jobs = []
+    profile_job_indexes = {}
+    profile_errors = {}
     for index, source in enumerate(prepared_sources):
         color_metadata = source.get("color_metadata") or probe_video_color_metadata(source["path"])
         base_color_filter = build_multicam_base_color_filter(color_metadata)
@@ -23103,12 +24216,37 @@ async def apply_multicam_color_matching(prepared_sources, overlap_start, overlap
         try:
             sample_start = get_source_start_for_timeline(source, overlap_start, 0.0)
             max_duration = max(1.0, float(source.get("duration") or 0.0) - max(0.0, sample_start))
-            profile = analyze_multicam_color_profile(
-                source["path"],
-                sample_start=max(0.0, sample_start),
-                sample_duration=min(sample_duration, max_duration),
-                pre_filter=base_color_filter,
+        except Exception as sample_error:
+            profile_errors[index] = sample_error
+            continue
+        profile_job_indexes[index] = len(profile_jobs)
+        profile_jobs.append(
+            (
+                (source["path"],),
+                {
+                    "sample_start": max(0.0, sample_start),
+                    "sample_duration": min(sample_duration, max_duration),
+                    "pre_filter": base_color_filter,
+                },
             )
+        )
+
+    profile_results, profile_analysis_receipt = await run_multicam_camera_analyses(
+        analyze_multicam_color_profile,
+        profile_jobs,
+        job_context=job_id,
+    )
+    receipt["profile_analysis"] = profile_analysis_receipt
+
+    for index, source in enumerate(prepared_sources):
+        color_metadata = source.get("color_metadata")
+        base_color_filter = source.get("base_color_filter")
+        try:
+            if index in profile_errors:
+                raise profile_errors[index]
+            profile = profile_results[profile_job_indexes[index]]
+            if isinstance(profile, BaseException):
+                raise profile
             source["color_profile"] = profile
             neutral_white_balance_filter = build_multicam_neutral_white_balance_filter(profile)
             source["neutral_white_balance_filter"] = neutral_white_balance_filter
@@ -23201,11 +24339,431 @@ async def apply_multicam_color_matching(prepared_sources, overlap_start, overlap
                 item["source_visual_filter"] = source.get("source_visual_filter") or ""
                 break
 
-    receipt["matched_source_count"] = applied_count
-    receipt["status"] = "active" if applied_count else "skipped_no_matchable_sources"
-    write_multicam_receipt_cache(cache_path, receipt)
-    logger.info("MULTICAM COLOR MATCH %s: %s", job_id, json.dumps(receipt, default=str))
-    return receipt
+    receipt["matched_source_count"] = applied_count
+    receipt["status"] = "active" if applied_count else "skipped_no_matchable_sources"
+    write_multicam_receipt_cache(cache_path, receipt)
+    logger.info("MULTICAM COLOR MATCH %s: %s", job_id, json.dumps(receipt, default=str))
+    return receipt
+
+
+def multicam_dead_footage_intervals_for_director(prepass_receipt):
+    """Intervals the director should refuse to cut to for one camera."""
+    prepass_receipt = prepass_receipt or {}
+    interval_lists = [
+        prepass_receipt.get("black_intervals") or [],
+        prepass_receipt.get("placeholder_intervals") or [],
+    ]
+    # Screen-capture cameras can legitimately hold a still slide, so frozen
+    # footage exclusion can be switched off without losing black/placeholder.
+    if env_flag("MULTICAM_EXCLUDE_FROZEN_FOOTAGE", default=True):
+        interval_lists.append(prepass_receipt.get("frozen_intervals") or [])
+    return merge_footage_intervals(*interval_lists)
+
+
+async def apply_multicam_footage_prepass(prepared_sources, overlap_start, overlap_duration, job_id):
+    """Run the dead-footage prepass per camera and store intervals on each source."""
+    receipt = {
+        "status": "skipped",
+        "enabled": env_flag("MULTICAM_FOOTAGE_PREPASS", default=True),
+        "cache_hit_count": 0,
+        "sources": [],
+    }
+    if not receipt["enabled"] or not prepared_sources:
+        return receipt
+
+    cache_max_age = float(os.getenv("MULTICAM_FOOTAGE_PREPASS_CACHE_MAX_AGE_SECONDS", "1209600") or 1209600)
+    prepass_jobs = []
+    pending = []
+    for index, source in enumerate(prepared_sources):
+        analysis_path = source.get("render_path") or source["path"]
+        window_start, _window_end, window_duration = get_source_range_for_timeline(
+            source,
+            overlap_start,
+            0.0,
+            overlap_duration,
+        )
+        window_duration = max(0.5, float(window_duration) + min(0.0, float(window_start)))
+        window_start = max(0.0, float(window_start))
+        cache_path = multicam_receipt_cache_path(
+            "footage_prepass",
+            {
+                "version": 1,
+                "camera_identity": multicam_file_cache_identity(analysis_path),
+                "window_start": round(window_start, 3),
+                "window_duration": round(window_duration, 3),
+            },
+        )
+        cached = read_multicam_receipt_cache(cache_path, max_age_seconds=cache_max_age)
+        if cached and cached.get("status") == "active":
+            source["footage_prepass"] = cached
+            receipt["cache_hit_count"] += 1
+            continue
+        pending.append((index, cache_path))
+        prepass_jobs.append(((analysis_path,), {"start_time": window_start, "duration": window_duration}))
+
+    prepass_results, receipt["analysis"] = await run_multicam_camera_analyses(
+        analyze_multicam_footage_prepass,
+        prepass_jobs,
+        job_context=job_id,
+    )
+    for (index, cache_path), result in zip(pending, prepass_results):
+        source = prepared_sources[index]
+        if isinstance(result, BaseException):
+            logger.warning("Footage prepass failed for %s in %s: %s", source.get("id"), job_id, result)
+            source["footage_prepass"] = {"status": "failed", "error": str(result)}
+            continue
+        source["footage_prepass"] = result
+        write_multicam_receipt_cache(cache_path, result)
+
+    for source in prepared_sources:
+        prepass_receipt = source.get("footage_prepass") or {}
+        source["dead_footage_intervals"] = multicam_dead_footage_intervals_for_director(prepass_receipt)
+        receipt["sources"].append(
+            {
+                "id": source.get("id"),
+                "status": prepass_receipt.get("status"),
+                "black_interval_count": len(prepass_receipt.get("black_intervals") or []),
+                "frozen_interval_count": len(prepass_receipt.get("frozen_intervals") or []),
+                "placeholder_interval_count": len(prepass_receipt.get("placeholder_intervals") or []),
+                "excluded_seconds": round(
+                    sum(float(end) - float(start) for start, end in source["dead_footage_intervals"]),
+                    3,
+                ),
+            }
+        )
+    receipt["status"] = "active"
+    logger.info("MULTICAM FOOTAGE PREPASS %s: %s", job_id, json.dumps(receipt, default=str))
+    return receipt
+
+
+def build_multicam_single_cut_plan(segment, source, render_tier_profile):
+    """
+    Input seek, trim and timing for rendering ``segment`` as a single-camera cut.
+
+    Shared by the per-segment renderer and the chunk cut renderer so both
+    produce the same frames for the same segment.
+    """
+    segment_start = float(segment["timeline_start"])
+    segment_end = float(segment["timeline_end"])
+    segment_duration = max(0.0, segment_end - segment_start)
+    trim_start = float(segment["source_start"])
+    raw_duration = max(0.02, float(segment["source_end"]) - trim_start)
+    render_shift = max(0.0, float(source.get("render_time_shift_seconds", 0.0) or 0.0))
+    return {
+        "camera_id": source.get("id"),
+        "input_path": source.get("render_path") or source["path"],
+        "input_seek": max(0.0, trim_start - render_shift),
+        "render_time_shift": render_shift,
+        "raw_duration": raw_duration,
+        "setpts_factor": clamp_float(segment_duration / raw_duration, 0.25, 4.0),
+        "rotation": source.get("render_rotation_degrees", source.get("rotation_degrees", 0)),
+        "visual_filter": str(
+            source.get("render_visual_filter", source.get("source_visual_filter") or "") or ""
+        ).strip().strip(","),
+        "focus_x": multicam_source_focus_x(source),
+        "rounded_frame": bool(render_tier_profile.get("rounded_active_speaker")),
+        "timeline_start": segment_start,
+        "timeline_end": segment_end,
+        "duration": segment_duration,
+        "frame_count": multicam_timeline_frame_count(segment_start, segment_end),
+    }
+
+
+def multicam_single_cut_filter_chain(cut_plan, input_index, output_label, output_width, output_height):
+    """Filter graph entries turning input ``input_index`` into the cut frame at ``[output_label]``."""
+    visual_filter = cut_plan["visual_filter"]
+    source_label = f"cutsrc{input_index}" if input_index else "cutsrc"
+    prefix = (
+        f"{multicam_rotation_filter(cut_plan['rotation'])}"
+        f"trim=start=0:duration={cut_plan['raw_duration']:.6f},"
+        f"setpts=PTS-STARTPTS,setpts={cut_plan['setpts_factor']:.9f}*PTS,fps=30,"
+        f"{visual_filter + ',' if visual_filter else ''}"
+    )
+    return [
+        f"[{input_index}:v]{prefix}setsar=1[{source_label}]",
+        multicam_single_cut_filter(
+            source_label,
+            output_width,
+            output_height,
+            output_label,
+            is_vertical_output=output_height > output_width,
+            focus_x=cut_plan["focus_x"],
+            rounded_frame=cut_plan["rounded_frame"],
+        ),
+    ]
+
+
+def multicam_chunk_cut_plan(segment, source_map, prepared_sources, render_tier_profile):
+    """
+    Single-cut plan for a chunk segment that can join a cut run, else None.
+
+    Composite layouts and anything the per-segment renderer would reject
+    (empty duration, out-of-bounds trims) stay on the per-segment path.
+    """
+    layout_mode = normalize_multicam_layout_mode(segment.get("layout_mode", "cut") or "cut")
+    if layout_mode in {"scene-grid", "split-vertical", "pip"}:
+        return None
+    source = source_map.get(segment.get("camera_id")) or prepared_sources[0]
+    trim_start = float(segment["source_start"])
+    trim_end = float(segment["source_end"])
+    if trim_start < 0 or trim_end > float(source["duration"]) + 0.01:
+        return None
+    if float(segment["timeline_end"]) - float(segment["timeline_start"]) <= 0.02:
+        return None
+    return build_multicam_single_cut_plan(segment, source, render_tier_profile)
+
+
+def plan_multicam_chunk_render_units(segments, cut_plans, max_inputs=None, skip_offsets=()):
+    """
+    Group a chunk's segments into render units.
+
+    Runs of consecutive single-camera cuts (``cut_plans[i]`` not None) become
+    one unit of up to ``max_inputs`` segments; composites stay one unit each.
+    Offsets in ``skip_offsets`` are already rendered and break runs.
+    Returns ``[(first_offset, [segment, ...], [cut_plan or None, ...]), ...]``.
+    """
+    limit = max(1, int(max_inputs or MULTICAM_CHUNK_CUT_RENDER_MAX_INPUTS))
+    skipped = set(skip_offsets or ())
+    units = []
+    for offset, (segment, cut_plan) in enumerate(zip(segments, cut_plans)):
+        if offset in skipped:
+            continue
+        previous = units[-1] if units else None
+        if (
+            cut_plan is not None
+            and previous is not None
+            and previous[2][-1] is not None
+            and previous[0] + len(previous[1]) == offset
+            and len(previous[1]) < limit
+        ):
+            previous[1].append(segment)
+            previous[2].append(cut_plan)
+            continue
+        units.append((offset, [segment], [cut_plan]))
+    return units
+
+
+def multicam_cut_run_max_inputs(prepared_sources, concurrency):
+    """
+    Segment inputs one cut-run process may open while ``concurrency`` encodes run.
+
+    ``MULTICAM_CHUNK_CUT_RENDER_MAX_INPUTS`` lowered until that many decoders
+    of the largest render input fit each encode's share of the memory limit.
+    """
+    input_dimensions = [
+        get_video_dimensions(source.get("render_path") or source.get("path"))
+        for source in (prepared_sources or [])
+    ]
+    width, height = max(input_dimensions or [(1920, 1080)], key=lambda dimensions: dimensions[0] * dimensions[1])
+    return resource_scheduler.inputs_per_process(
+        "encode",
+        decoder_memory_bytes(width, height),
+        MULTICAM_CHUNK_CUT_RENDER_MAX_INPUTS,
+        concurrency,
+    )
+
+
+async def render_multicam_cut_run(
+    cut_plans,
+    output_path,
+    first_segment_index,
+    *,
+    output_width,
+    output_height,
+    job_id,
+    keyframe_frames=(),
+    finishing=None,
+):
+    """
+    Encode consecutive single-camera cut segments with one ffmpeg process.
+
+    Every segment keeps its own accurately seeked input and the same filter
+    chain as the per-segment renderer; each branch is padded or trimmed to its
+    absolute-timeline frame allocation before ``concat``, so the output has
+    exactly the frames the segments would have had rendered one by one.
+    ``keyframe_frames`` forces keyframes at those output frame indices and
+    ``finishing`` burns the fused watermark into the run.
+    """
+    cmd = ["ffmpeg", "-y", "-nostdin"]
+    filters = []
+    for input_index, cut_plan in enumerate(cut_plans):
+        cmd.extend([
+            "-fflags", "+genpts",
+            "-ss", str(cut_plan["input_seek"]),
+            "-t", f"{cut_plan['raw_duration'] + 0.5:.6f}",
+            "-i", cut_plan["input_path"],
+        ])
+        frame_count = cut_plan["frame_count"]
+        filters.extend(
+            multicam_single_cut_filter_chain(cut_plan, input_index, f"cut{input_index}", output_width, output_height)
+        )
+        filters.append(
+            f"[cut{input_index}]tpad=stop_mode=clone:stop={frame_count},"
+            f"trim=end_frame={frame_count},setpts=PTS-STARTPTS,format=yuv420p[seg{input_index}]"
+        )
+    concat_inputs = "".join(f"[seg{input_index}]" for input_index in range(len(cut_plans)))
+    filters.append(f"{concat_inputs}concat=n={len(cut_plans)}:v=1:a=0[v]")
+    target_frame_count = sum(cut_plan["frame_count"] for cut_plan in cut_plans)
+    filter_graph, output_label = append_multicam_finishing_filter(";".join(filters), finishing)
+    cmd.extend([
+        "-filter_complex",
+        filter_graph,
+        "-map",
+        output_label,
+        "-frames:v",
+        str(target_frame_count),
+        *build_multicam_segment_encode_args(),
+    ])
+    if keyframe_frames:
+        # Half a frame early so float rounding cannot push the key frame late.
+        cmd.extend([
+            "-force_key_frames",
+            ",".join(f"{(frame - 0.5) / 30.0:.6f}" for frame in sorted(set(keyframe_frames)) if frame > 0),
+        ])
+    cmd.extend([
+        "-an",
+        "-movflags",
+        "+faststart",
+        "-vsync",
+        "cfr",
+        output_path,
+    ])
+    logger.info(
+        "MULTICAM_CUT_RUN segments=%d first_segment=%d frames=%d timeline=%.3f-%.3f",
+        len(cut_plans),
+        first_segment_index,
+        target_frame_count,
+        cut_plans[0]["timeline_start"],
+        cut_plans[-1]["timeline_end"],
+    )
+    await run_subprocess_async(cmd, check=True, job_context=job_id)
+    receipt = validate_multicam_segment_duration(
+        output_path,
+        target_frame_count / 30.0,
+        first_segment_index,
+        strict=True,
+    )
+    receipt["segment_count"] = len(cut_plans)
+    receipt["frame_count"] = target_frame_count
+    return receipt
+
+
+def multicam_camera_track_render_enabled(render_tier_profile):
+    if MULTICAM_CAMERA_TRACK_RENDER == "auto":
+        return (render_tier_profile or {}).get("tier") == "simple"
+    return MULTICAM_CAMERA_TRACK_RENDER in {"1", "true", "yes", "on"}
+
+
+def plan_multicam_camera_tracks(cut_plans, segments, min_coverage=None):
+    """
+    Pre-framed camera tracks for a chunk's single-camera cuts.
+
+    A camera qualifies when it has at least two cut segments and all of them
+    play its source at 1x with the same source-minus-timeline offset (within
+    half a frame), so one continuous encode of the source shows the same
+    frames each segment would.  The track spans the camera's first to last cut
+    on master-timeline frames and is split at every one of its segment
+    boundaries; ``pieces`` maps each split piece to a segment offset, or None
+    for pieces where another camera is on screen.
+    """
+    coverage_floor = MULTICAM_CAMERA_TRACK_MIN_COVERAGE if min_coverage is None else float(min_coverage)
+    by_camera = {}
+    for offset, cut_plan in enumerate(cut_plans):
+        if cut_plan is not None:
+            by_camera.setdefault(cut_plan["camera_id"], []).append(offset)
+
+    tracks = []
+    for camera_id, offsets in by_camera.items():
+        if len(offsets) < 2:
+            continue
+        plans = [cut_plans[offset] for offset in offsets]
+        source_offsets = [
+            float(segments[offset]["source_start"]) - float(segments[offset]["timeline_start"])
+            for offset in offsets
+        ]
+        if any(abs(plan["setpts_factor"] - 1.0) > 0.002 for plan in plans):
+            continue
+        if max(source_offsets) - min(source_offsets) > 0.5 / 30.0:
+            continue
+        frame_ranges = [
+            (
+                multicam_timeline_frame_index(plan["timeline_start"]),
+                multicam_timeline_frame_index(plan["timeline_end"]),
+            )
+            for plan in plans
+        ]
+        if any(end_frame <= start_frame for start_frame, end_frame in frame_ranges):
+            continue
+        first_frame = frame_ranges[0][0]
+        frame_count = frame_ranges[-1][1] - first_frame
+        on_screen_frames = sum(end_frame - start_frame for start_frame, end_frame in frame_ranges)
+        if on_screen_frames < coverage_floor * frame_count:
+            continue
+
+        split_frames = sorted(
+            {frame - first_frame for frame_range in frame_ranges for frame in frame_range} - {0, frame_count}
+        )
+        owner_by_start = {start_frame - first_frame: offset for offset, (start_frame, _) in zip(offsets, frame_ranges)}
+        pieces = [owner_by_start.get(piece_start) for piece_start in [0, *split_frames]]
+        source_offset = source_offsets[0]
+        track_plan = {
+            **plans[0],
+            "input_seek": max(
+                0.0,
+                (first_frame / 30.0) + source_offset - plans[0]["render_time_shift"],
+            ),
+            "raw_duration": frame_count / 30.0,
+            "setpts_factor": 1.0,
+            "timeline_start": first_frame / 30.0,
+            "timeline_end": (first_frame + frame_count) / 30.0,
+            "duration": frame_count / 30.0,
+            "frame_count": frame_count,
+        }
+        tracks.append(
+            {
+                "camera_id": camera_id,
+                "cut_plan": track_plan,
+                "offsets": offsets,
+                "split_frames": split_frames,
+                "pieces": pieces,
+                "piece_frame_counts": [
+                    end - start for start, end in zip([0, *split_frames], [*split_frames, frame_count])
+                ],
+            }
+        )
+    return tracks
+
+
+async def split_multicam_camera_track(track_path, split_frames, output_pattern, job_id):
+    """Stream-copy ``track_path`` into pieces at ``split_frames`` (which must be keyframes)."""
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-nostdin",
+        "-i",
+        track_path,
+        "-map",
+        "0:v",
+        "-c",
+        "copy",
+        "-f",
+        "segment",
+        "-segment_frames",
+        ",".join(str(frame) for frame in split_frames),
+        "-reset_timestamps",
+        "1",
+        "-segment_format",
+        "mp4",
+        "-segment_format_options",
+        "movflags=+faststart",
+        output_pattern,
+    ]
+    await run_subprocess_async(cmd, check=True, job_context=job_id)
+    piece_paths = [output_pattern % piece_index for piece_index in range(len(split_frames) + 1)]
+    missing = [path for path in piece_paths if not os.path.exists(path)]
+    if missing:
+        raise RuntimeError(f"Camera track split produced {len(piece_paths) - len(missing)} of {len(piece_paths)} pieces")
+    return piece_paths
 
 
 async def render_multicam_video_segment(
@@ -23220,18 +24778,17 @@ async def render_multicam_video_segment(
     output_height,
     render_tier_profile,
     job_id,
+    finishing=None,
 ):
     segment_start = float(segment["timeline_start"])
     segment_end = float(segment["timeline_end"])
     segment_duration = max(0.0, segment_end - segment_start)
     if segment_duration <= 0.02:
         raise HTTPException(status_code=400, detail="Multicam segment duration is empty")
-    target_frame_count = multicam_timeline_frame_count(segment_start, segment_end)
 
     source = source_map.get(segment["camera_id"]) or prepared_sources[0]
     trim_start = float(segment["source_start"])
     trim_end = float(segment["source_end"])
-    raw_segment_duration = max(0.02, trim_end - trim_start)
     layout_mode = normalize_multicam_layout_mode(segment.get("layout_mode", "cut") or "cut")
 
     if trim_start < 0 or trim_end > source["duration"] + 0.01:
@@ -23281,6 +24838,7 @@ async def render_multicam_video_segment(
             if camera_id is not None and start is not None and end is not None
         },
         segment_index=segment_index,
+        finishing=finishing,
     )
     if not rendered_composite:
         logger.info(
@@ -23288,39 +24846,10 @@ async def render_multicam_video_segment(
             f"layout_sources={len(layout_sources)} "
             f"reason={'not_enough_sources' if len(layout_sources) < 2 else 'layout_mode_not_applicable'}"
         )
-        single_setpts = clamp_float(segment_duration / raw_segment_duration, 0.25, 4.0)
-        single_render_path = source.get("render_path") or source["path"]
-        single_render_shift = max(
-            0.0,
-            float(source.get("render_time_shift_seconds", 0.0) or 0.0),
-        )
-        single_render_trim_start = max(0.0, trim_start - single_render_shift)
-        single_rotation = source.get(
-            "render_rotation_degrees",
-            source.get("rotation_degrees", 0),
-        )
-        single_visual_filter = str(
-            source.get("render_visual_filter", source.get("source_visual_filter") or "") or ""
-        ).strip().strip(",")
-        single_prefix = (
-            f"{multicam_rotation_filter(single_rotation)}"
-            f"trim=start=0:duration={raw_segment_duration:.6f},"
-            f"setpts=PTS-STARTPTS,setpts={single_setpts:.9f}*PTS,fps=30,"
-            f"{single_visual_filter + ',' if single_visual_filter else ''}"
-        )
-        single_filter = ";".join(
-            [
-                f"[0:v]{single_prefix}setsar=1[cutsrc]",
-                multicam_single_cut_filter(
-                    "cutsrc",
-                    output_width,
-                    output_height,
-                    "v",
-                    is_vertical_output=output_height > output_width,
-                    focus_x=multicam_source_focus_x(source),
-                    rounded_frame=bool(render_tier_profile.get("rounded_active_speaker")),
-                ),
-            ]
+        cut_plan = build_multicam_single_cut_plan(segment, source, render_tier_profile)
+        single_filter, single_output_label = append_multicam_finishing_filter(
+            ";".join(multicam_single_cut_filter_chain(cut_plan, 0, "v", output_width, output_height)),
+            finishing,
         )
         await run_subprocess_async(
             [
@@ -23328,17 +24857,17 @@ async def render_multicam_video_segment(
                 "-fflags",
                 "+genpts",
                 "-ss",
-                str(single_render_trim_start),
+                str(cut_plan["input_seek"]),
                 "-i",
-                single_render_path,
+                cut_plan["input_path"],
                 "-t",
-                str(raw_segment_duration),
+                str(cut_plan["raw_duration"]),
                 "-filter_complex",
                 single_filter,
                 "-map",
-                "[v]",
+                single_output_label,
                 "-frames:v",
-                str(target_frame_count),
+                str(cut_plan["frame_count"]),
                 *build_multicam_segment_encode_args(),
                 "-an",
                 "-movflags",
@@ -23417,6 +24946,7 @@ async def concat_multicam_video_parts(part_paths, output_path, concat_list_path,
             os.remove(concat_list_path)
 
 
+@job_cache_scoped
 async def render_multicam_impl(
     request: RenderMultiCamRequest,
     provided_job_id: str = None,
@@ -23543,6 +25073,7 @@ async def render_multicam_impl(
     primary_audio_output_path = os.path.join(shared_tmp_dir, f"{job_id}_multicam_audio.m4a")
     external_audio_input_path = os.path.join(shared_tmp_dir, f"{job_id}_external_audio_input")
     external_audio_materialized_path = external_audio_input_path
+    caption_transcript_task = None
     prepared_sources = []
     segment_paths = []
     transient_segment_paths = []
@@ -24289,7 +25820,33 @@ async def render_multicam_impl(
                     for source in prepared_sources
                 )
             )
-            for source in prepared_sources:
+            footage_prepass_receipt = await apply_multicam_footage_prepass(
+                prepared_sources,
+                overlap_start,
+                overlap_duration,
+                job_id,
+            )
+            visual_window_results = []
+            visual_analysis_receipt = None
+            if not audio_first_director_scoring:
+                visual_window_results, visual_analysis_receipt = await run_multicam_camera_analyses(
+                    analyze_multicam_visual_window_arrays,
+                    [
+                        (
+                            (
+                                source.get("render_path") or source["path"],
+                                source["offset_seconds"],
+                                overlap_start,
+                                overlap_duration,
+                                request.auto_switch_interval,
+                            ),
+                            {},
+                        )
+                        for source in prepared_sources
+                    ],
+                    job_context=job_id,
+                )
+            for source_index, source in enumerate(prepared_sources):
                 if audio_first_director_scoring:
                     score_count = max(
                         1,
@@ -24308,13 +25865,10 @@ async def render_multicam_impl(
                         for _ in range(score_count)
                     ]
                 else:
-                    source["window_scores"] = analyze_multicam_visual_windows(
-                        source.get("render_path") or source["path"],
-                        source["offset_seconds"],
-                        overlap_start,
-                        overlap_duration,
-                        request.auto_switch_interval,
-                    )
+                    visual_window_result = visual_window_results[source_index]
+                    if isinstance(visual_window_result, BaseException):
+                        raise visual_window_result
+                    source["window_scores"] = multicam_visual_windows_from_arrays(*visual_window_result)
                 face_center_values = [
                     float(slot.get("face_center_x"))
                     for slot in source["window_scores"]
@@ -24421,6 +25975,8 @@ async def render_multicam_impl(
                 stage_started_at,
                 source_count=len(prepared_sources),
                 mode="audio_first_external_channels" if audio_first_director_scoring else "audio_visual",
+                visual_analysis=visual_analysis_receipt,
+                footage_prepass=footage_prepass_receipt,
                 director_audio_status=(director_audio_receipt or {}).get("status") if director_audio_receipt else None,
                 source_activity_cache_hits=sum(1 for source in prepared_sources if source.get("source_activity_cache_hit")),
                 source_activity_cache_misses=sum(1 for source in prepared_sources if source.get("has_audio") and not source.get("source_activity_cache_hit")),
@@ -24475,6 +26031,14 @@ async def render_multicam_impl(
         segments = normalize_multicam_segments(render_request, prepared_sources, overlap_start, overlap_duration)
         if not segments:
             raise HTTPException(status_code=400, detail="No valid multicam segment plan could be generated")
+        previous_multicam_plan = resolve_multicam_previous_plan(request)
+        replan_receipt = resolve_multicam_replan_window(
+            request,
+            previous_multicam_plan,
+            segments,
+            render_checkpoint_seconds,
+        )
+        replan_window = replan_receipt.get("window")
         output_width, output_height = get_multicam_output_dimensions(output_aspect_ratio)
         director_latency_repair_receipt = None
         director_latency_repair_receipts = []
@@ -24570,14 +26134,29 @@ async def render_multicam_impl(
                 job_id,
                 json.dumps(dense_sync_segment_proof, default=str),
             )
-            segments, pre_render_segment_sync_repair_receipt = await repair_multicam_segment_sync_before_render(
-                segments,
+            # Segments outside a partial re-plan window were sync-proved by the
+            # previous render and are pinned below, so only probe the window.
+            sync_repair_indexes = [
+                index
+                for index, segment in enumerate(segments)
+                if not replan_window
+                or (
+                    float(segment.get("timeline_end") or 0.0) > replan_window["start"]
+                    and float(segment.get("timeline_start") or 0.0) < replan_window["end"]
+                )
+            ]
+            sync_repaired_segments, pre_render_segment_sync_repair_receipt = await repair_multicam_segment_sync_before_render(
+                [segments[index] for index in sync_repair_indexes],
                 prepared_sources,
                 ext_local,
                 effective_external_audio_offset_seconds,
                 overlap_start,
                 job_id,
             )
+            segments = list(segments)
+            for index, segment in zip(sync_repair_indexes, sync_repaired_segments):
+                segments[index] = segment
+            pre_render_segment_sync_repair_receipt["checked_segment_count"] = len(sync_repair_indexes)
             pre_render_segment_sync_repair_receipt["episode_sync_proof"] = dense_sync_segment_proof
         if (pre_render_segment_sync_repair_receipt or {}).get("status") == "failed":
             raise HTTPException(
@@ -24595,6 +26174,23 @@ async def render_multicam_impl(
             prepared_sources,
             enabled=multicam_reaction_overlays_enabled(request),
         )
+        if replan_window:
+            segments = splice_multicam_replanned_segments(
+                previous_multicam_plan["segments"],
+                segments,
+                replan_window["start"],
+                replan_window["end"],
+            )
+        if previous_multicam_plan is not None:
+            try:
+                replan_receipt["diff"] = diff_multicam_plans(
+                    previous_multicam_plan["segments"],
+                    segments,
+                    render_checkpoint_seconds,
+                )
+            except ValueError as error:
+                replan_receipt["diff"] = {"status": "unavailable", "error": str(error)[:500]}
+            logger.info("MULTICAM REPLAN %s: %s", job_id, json.dumps(replan_receipt, default=str))
         production_limits = enforce_multicam_production_limits(
             request,
             overlap_duration,
@@ -24602,20 +26198,15 @@ async def render_multicam_impl(
             qa_overlap_duration=requested_overlap_duration,
             allow_pending_embedded_proof=allow_embedded_server_proof,
         )
-        layout_contract_audit = audit_multicam_layout_contract(
+        plan_audits = run_multicam_plan_audits(
             segments,
             prepared_sources,
             output_width=output_width,
             output_height=output_height,
         )
-        director_truth_audit = audit_multicam_director_active_speaker_truth(
-            segments,
-            prepared_sources,
-        )
-        director_latency_audit = audit_multicam_director_switch_latency(
-            segments,
-            prepared_sources,
-        )
+        layout_contract_audit = plan_audits["layout_contract"]
+        director_truth_audit = plan_audits["director_truth"]
+        director_latency_audit = plan_audits["switch_latency"]
         if layout_contract_audit.get("status") != "passed":
             logger.error(
                 "MULTICAM_LAYOUT_CONTRACT_FAILED %s: %s",
@@ -24794,6 +26385,7 @@ async def render_multicam_impl(
                 "source_sync_stability_repair": source_sync_stability_repair_receipt,
                 "pre_render_segment_sync_repair": pre_render_segment_sync_repair_receipt,
                 "render_segment_merge": render_segment_merge_receipt,
+                "replan": replan_receipt,
                 "has_flow_segments": bool(render_request.segments),
                 "flow_segment_count": len(render_request.segments or []),
             }, df, indent=2)
@@ -24851,6 +26443,7 @@ async def render_multicam_impl(
                 "director_truth_repair": director_truth_repair_receipt,
                 "source_sync_stability_repair": source_sync_stability_repair_receipt,
                 "render_segment_merge": render_segment_merge_receipt,
+                "replan": replan_receipt,
                 "color_match": color_match_receipt,
                 "visual_proxy": visual_proxy_receipt,
                 "visual_source_auditability": visual_source_auditability_receipt,
@@ -24873,6 +26466,7 @@ async def render_multicam_impl(
                     "director_layout_repair": director_layout_repair_receipt,
                     "director_truth_repair": director_truth_repair_receipt,
                     "source_sync_stability_repair": source_sync_stability_repair_receipt,
+                    "replan": replan_receipt,
                 },
             }
         switches = build_multicam_switches_from_segments(segments)
@@ -24888,6 +26482,60 @@ async def render_multicam_impl(
 
         stage_started_at = time.perf_counter()
         source_map = {source["id"]: source for source in prepared_sources}
+        if external_audio_url:
+            if pre_sync_result and pre_sync_result.get("status") == "aligned":
+                external_audio_materialized_path = effective_external_audio_url
+            else:
+                external_audio_materialized_path = await materialize_cached_media_input(
+                    effective_external_audio_url,
+                    external_audio_input_path,
+                    external_audio_cache_key or effective_external_audio_url,
+                    keep_audio=True,
+                )
+        burn_captions_requested, _requested_caption_style = resolve_multicam_caption_request(request)
+        if (
+            burn_captions_requested
+            and render_tier_profile.get("burn_captions")
+            and env_flag("MULTICAM_CAPTION_TRANSCRIPT_PREPASS", default=True)
+        ):
+            # The master audio bed is the clean/camera audio trimmed at a known
+            # anchor, so captions can be transcribed from it while video renders
+            # instead of re-transcribing the finished master afterwards.
+            if external_audio_url:
+                caption_audio_path = external_audio_materialized_path
+                caption_audio_anchor = overlap_start - float(effective_external_audio_offset_seconds or 0.0)
+                caption_audio_label = "external_clean_audio"
+            else:
+                caption_audio_source, caption_audio_anchor = resolve_multicam_camera_audio_bed_source(
+                    source_map,
+                    prepared_sources,
+                    primary_audio_camera_id,
+                    segments,
+                    overlap_start,
+                )
+                caption_audio_path = (caption_audio_source or {}).get("path")
+                caption_audio_label = f"camera_audio:{(caption_audio_source or {}).get('id')}"
+            if caption_audio_path:
+                caption_transcript_task = asyncio.create_task(
+                    prepare_multicam_caption_transcript(
+                        caption_audio_path,
+                        caption_audio_anchor,
+                        master_duration,
+                        job_id,
+                        audio_source_label=caption_audio_label,
+                    )
+                )
+        brand_watermark_enabled, brand_watermark_text = resolve_multicam_branding_request(request)
+        brand_watermark_enabled = bool(brand_watermark_enabled and render_tier_profile.get("brand_watermark"))
+        brand_watermark_filter = (
+            build_multicam_brand_watermark_filter(output_width, output_height, brand_watermark_text)
+            if brand_watermark_enabled
+            else None
+        )
+        burn_captions, caption_style = resolve_multicam_caption_request(request)
+        burn_captions = bool(burn_captions and render_tier_profile.get("burn_captions"))
+        fused_finishing = prepare_multicam_fused_finishing(brand_watermark_filter)
+
         checkpointing_enabled = bool(
             request.async_mode
             and MULTICAM_RENDER_CHECKPOINTS_ENABLED
@@ -24895,10 +26543,20 @@ async def render_multicam_impl(
         )
 
         if checkpointing_enabled:
-            checkpoint_plan = build_multicam_chunk_plan(
-                render_segments,
-                render_checkpoint_seconds,
-            )
+            # Chunks hold views of one SegmentTable; segment dicts are built
+            # for the plan JSON here and for each chunk as it renders.
+            render_chunks = partition_multicam_segment_table(render_segments, render_checkpoint_seconds)
+            checkpoint_plan_chunks = [
+                materialize_multicam_chunk(chunk, copy_values=False)
+                for chunk in render_chunks
+            ]
+            checkpoint_plan = {
+                "target_chunk_duration": float(render_checkpoint_seconds),
+                "start": render_chunks[0]["start"],
+                "end": render_chunks[-1]["end"],
+                "duration": render_chunks[-1]["end"] - render_chunks[0]["start"],
+                "chunks": checkpoint_plan_chunks,
+            }
             checkpoint_context = {
                 "version": 2,
                 "renderer_contract": "cam-combiner-checkpoint-v2",
@@ -24946,6 +26604,7 @@ async def render_multicam_impl(
                         "start": round(float(chunk["start"]), 6),
                         "end": round(float(chunk["end"]), 6),
                         "duration": round(float(chunk["duration"]), 6),
+                        "finishing": multicam_finishing_fingerprint(fused_finishing),
                         "segments": [
                             {
                                 key: (
@@ -24977,22 +26636,34 @@ async def render_multicam_impl(
                             for segment in chunk["segments"]
                         ],
                     }
-                    for chunk in checkpoint_plan["chunks"]
+                    for chunk in checkpoint_plan_chunks
                 ],
             }
             checkpoint_plan["fingerprint"] = multicam_chunk_plan_fingerprint(
                 [checkpoint_canonical_plan]
             )
+            # Per-chunk fingerprints survive a partial re-plan for every
+            # chunk outside the re-planned window.
+            checkpoint_plan["chunk_fingerprints"] = multicam_chunk_fingerprints(
+                checkpoint_canonical_plan["chunks"],
+                checkpoint_context,
+            )
             checkpoint_plan["context"] = checkpoint_context
-            safe_checkpoint_job_id = re.sub(
-                r"[^A-Za-z0-9_-]+",
-                "-",
-                str(job_id),
-            ).strip("-")
-            checkpoint_storage_prefix = (
-                f"temp/multicam-checkpoints/{safe_checkpoint_job_id}/"
-                f"{checkpoint_plan['fingerprint']}"
+            checkpoint_storage_prefix = multicam_checkpoint_storage_prefix(
+                job_id,
+                checkpoint_plan["fingerprint"],
             )
+            previous_checkpoint_prefix = None
+            if (
+                previous_multicam_plan
+                and previous_multicam_plan.get("job_id")
+                and previous_multicam_plan.get("plan_fingerprint")
+                and previous_multicam_plan.get("chunk_fingerprints")
+            ):
+                previous_checkpoint_prefix = multicam_checkpoint_storage_prefix(
+                    previous_multicam_plan["job_id"],
+                    previous_multicam_plan["plan_fingerprint"],
+                )
             checkpoint_plan_temp_path = os.path.join(
                 shared_tmp_dir,
                 f"{job_id}_multicam_checkpoint_plan.json",
@@ -25008,11 +26679,12 @@ async def render_multicam_impl(
                     "planFingerprint": checkpoint_plan["fingerprint"],
                 },
             )
-            render_chunks = checkpoint_plan["chunks"]
+            # The uploaded plan is the only consumer of the full dict plan.
+            del checkpoint_plan["chunks"], checkpoint_plan_chunks
             overloaded_chunks = [
                 chunk
                 for chunk in render_chunks
-                if len(chunk.get("segments") or []) > MULTICAM_BETA_MAX_SEGMENTS
+                if len(chunk["rows"]) > MULTICAM_BETA_MAX_SEGMENTS
             ]
             if overloaded_chunks:
                 raise HTTPException(
@@ -25023,11 +26695,6 @@ async def render_multicam_impl(
                         "checkpoint_indexes": [chunk["index"] for chunk in overloaded_chunks[:10]],
                     },
                 )
-            checkpoint_render_segments = [
-                segment
-                for chunk in render_chunks
-                for segment in chunk.get("segments") or []
-            ]
             if request.async_mode:
                 update_firestore_job(
                     job_id,
@@ -25067,12 +26734,43 @@ async def render_multicam_impl(
             1,
             min(
                 len(render_segments) or 1,
-                # Conservative outside the dedicated 8-vCPU render jobs; both
-                # production job deploy scripts opt into two-way rendering.
-                int(os.getenv("MULTICAM_SEGMENT_RENDER_CONCURRENCY", "1") or 1),
+                # The environment still wins so deploys can pin a shape.
+                int(
+                    os.getenv("MULTICAM_SEGMENT_RENDER_CONCURRENCY")
+                    or resource_scheduler.plan("encode")["concurrency"]
+                ),
             ),
         )
+        cut_run_max_inputs = (
+            multicam_cut_run_max_inputs(prepared_sources, segment_render_concurrency)
+            if MULTICAM_CHUNK_CUT_RENDER
+            else 1
+        )
+        def validate_restored_checkpoint(receipt, local_path, chunk_duration, chunk_index):
+            duration_receipt = validate_multicam_checkpoint_media(
+                local_path,
+                chunk_duration,
+                chunk_index,
+                expected_width=output_width,
+                expected_height=output_height,
+            )
+            expected_profile_fingerprint = str(
+                (receipt.get("metadata") or {}).get("profileFingerprint") or ""
+            )
+            if not expected_profile_fingerprint or not hmac.compare_digest(
+                expected_profile_fingerprint,
+                duration_receipt["profile_fingerprint"],
+            ):
+                raise HTTPException(
+                    status_code=500,
+                    detail="Multicam checkpoint stream profile changed",
+                )
+            return duration_receipt
+
         for chunk in render_chunks:
+            if "rows" in chunk:
+                chunk = materialize_multicam_chunk(chunk)
+                checkpoint_render_segments.extend(chunk["segments"])
             chunk_index = int(chunk["index"])
             chunk_duration = float(chunk["duration"])
             chunk_part_paths = []
@@ -25080,10 +26778,11 @@ async def render_multicam_impl(
             checkpoint_receipt = None
 
             if checkpointing_enabled:
+                chunk_fingerprint = checkpoint_plan["chunk_fingerprints"][chunk_index]
                 checkpoint_paths = multicam_chunk_checkpoint_paths(
                     shared_tmp_dir,
                     job_id,
-                    checkpoint_plan["fingerprint"],
+                    chunk_fingerprint,
                     chunk_index,
                 )
                 os.makedirs(checkpoint_paths["directory"], exist_ok=True)
@@ -25104,24 +26803,12 @@ async def render_multicam_impl(
                 )
                 if checkpoint_receipt:
                     try:
-                        duration_receipt = validate_multicam_checkpoint_media(
+                        duration_receipt = validate_restored_checkpoint(
+                            checkpoint_receipt,
                             chunk_output_path,
                             chunk_duration,
                             chunk_index,
-                            expected_width=output_width,
-                            expected_height=output_height,
-                        )
-                        expected_profile_fingerprint = str(
-                            (checkpoint_receipt.get("metadata") or {}).get("profileFingerprint") or ""
                         )
-                        if not expected_profile_fingerprint or not hmac.compare_digest(
-                            expected_profile_fingerprint,
-                            duration_receipt["profile_fingerprint"],
-                        ):
-                            raise HTTPException(
-                                status_code=500,
-                                detail="Multicam checkpoint stream profile changed",
-                            )
                         segment_duration_receipts.append(duration_receipt)
                         checkpoint_receipt.update(
                             {
@@ -25146,10 +26833,76 @@ async def render_multicam_impl(
                             os.remove(chunk_output_path)
                         checkpoint_receipt = None
 
+                previous_chunk_fingerprints = (previous_multicam_plan or {}).get("chunk_fingerprints") or []
+                if (
+                    not checkpoint_receipt
+                    and previous_checkpoint_prefix
+                    and chunk_index < len(previous_chunk_fingerprints)
+                    and previous_chunk_fingerprints[chunk_index] == chunk_fingerprint
+                ):
+                    previous_checkpoint_path = f"{previous_checkpoint_prefix}/chunk_{chunk_index:04d}.mp4"
+                    previous_receipt = restore_multicam_checkpoint_object(
+                        previous_checkpoint_path,
+                        chunk_output_path,
+                        {
+                            "autopromoteJobId": previous_multicam_plan["job_id"],
+                            "planFingerprint": previous_multicam_plan["plan_fingerprint"],
+                            "chunkIndex": chunk_index,
+                            "chunkFingerprint": chunk_fingerprint,
+                            "expectedDuration": f"{chunk_duration:.6f}",
+                        },
+                    )
+                    if previous_receipt:
+                        try:
+                            duration_receipt = validate_restored_checkpoint(
+                                previous_receipt,
+                                chunk_output_path,
+                                chunk_duration,
+                                chunk_index,
+                            )
+                            # Re-publish under this plan so resume and
+                            # recovery see a complete checkpoint prefix.
+                            checkpoint_receipt = upload_multicam_checkpoint_object(
+                                chunk_output_path,
+                                checkpoint_storage_path,
+                                {
+                                    **expected_metadata,
+                                    "autopromotePurpose": "multicam_render_checkpoint",
+                                    "timelineStart": f"{float(chunk['start']):.6f}",
+                                    "timelineEnd": f"{float(chunk['end']):.6f}",
+                                    "profileFingerprint": duration_receipt["profile_fingerprint"],
+                                    "chunkFingerprint": chunk_fingerprint,
+                                    "reusedFrom": previous_checkpoint_path,
+                                },
+                            )
+                            segment_duration_receipts.append(duration_receipt)
+                            checkpoint_receipt.update(
+                                {
+                                    "index": chunk_index,
+                                    "status": "reused_from_previous_plan",
+                                    "reusedFrom": previous_checkpoint_path,
+                                    "timelineStart": round(float(chunk["start"]), 3),
+                                    "timelineEnd": round(float(chunk["end"]), 3),
+                                    "expectedDuration": round(chunk_duration, 3),
+                                    "actualDuration": duration_receipt["actual_duration_seconds"],
+                                    "segmentCount": len(chunk["segments"]),
+                                    "profileFingerprint": duration_receipt["profile_fingerprint"],
+                                }
+                            )
+                        except Exception as checkpoint_reuse_error:
+                            logger.warning(
+                                "Not reusing previous multicam checkpoint %s: %s",
+                                previous_checkpoint_path,
+                                checkpoint_reuse_error,
+                            )
+                            if os.path.exists(chunk_output_path):
+                                os.remove(chunk_output_path)
+                            checkpoint_receipt = None
+
             if not checkpoint_receipt:
                 chunk_segments = list(chunk["segments"])
                 chunk_segment_start_index = rendered_segment_count
-                segment_render_semaphore = asyncio.Semaphore(segment_render_concurrency)
+                segment_render_semaphore = resource_scheduler.limiter("encode", segment_render_concurrency)
 
                 async def render_chunk_segment(segment_offset, segment):
                     segment_index = chunk_segment_start_index + segment_offset
@@ -25170,19 +26923,148 @@ async def render_multicam_impl(
                             output_height=output_height,
                             render_tier_profile=render_tier_profile,
                             job_id=job_id,
+                            finishing=fused_finishing,
+                        )
+                    return [(segment_output_path, duration_receipt)]
+
+                async def render_chunk_unit(segment_offset, unit_segments, unit_cut_plans):
+                    if len(unit_segments) < 2:
+                        return await render_chunk_segment(segment_offset, unit_segments[0])
+                    segment_index = chunk_segment_start_index + segment_offset
+                    run_output_path = os.path.join(
+                        shared_tmp_dir,
+                        f"{job_id}_multicam_cut_run_{segment_index}.mp4",
+                    )
+                    transient_segment_paths.append(run_output_path)
+                    try:
+                        async with segment_render_semaphore:
+                            duration_receipt = await render_multicam_cut_run(
+                                unit_cut_plans,
+                                run_output_path,
+                                segment_index,
+                                output_width=output_width,
+                                output_height=output_height,
+                                job_id=job_id,
+                                finishing=fused_finishing,
+                            )
+                        return [(run_output_path, duration_receipt)]
+                    except Exception as cut_run_error:
+                        logger.warning(
+                            "Multicam cut run at segment %d (%d segments) failed, rendering per segment: %s",
+                            segment_index,
+                            len(unit_segments),
+                            cut_run_error,
+                        )
+                        if os.path.exists(run_output_path):
+                            os.remove(run_output_path)
+                    results = await asyncio.gather(
+                        *[
+                            render_chunk_segment(segment_offset + run_offset, segment)
+                            for run_offset, segment in enumerate(unit_segments)
+                        ]
+                    )
+                    return [item for result in results for item in result]
+
+                async def render_chunk_camera_track(track):
+                    track_index = chunk_segment_start_index + track["offsets"][0]
+                    track_output_path = os.path.join(
+                        shared_tmp_dir,
+                        f"{job_id}_multicam_camera_track_{track_index}.mp4",
+                    )
+                    piece_pattern = os.path.join(
+                        shared_tmp_dir,
+                        f"{job_id}_multicam_camera_track_{track_index}_%04d.mp4",
+                    )
+                    transient_segment_paths.append(track_output_path)
+                    transient_segment_paths.extend(
+                        piece_pattern % piece_index for piece_index in range(len(track["pieces"]))
+                    )
+                    try:
+                        async with segment_render_semaphore:
+                            await render_multicam_cut_run(
+                                [track["cut_plan"]],
+                                track_output_path,
+                                track_index,
+                                output_width=output_width,
+                                output_height=output_height,
+                                job_id=job_id,
+                                keyframe_frames=track["split_frames"],
+                                finishing=fused_finishing,
+                            )
+                        piece_paths = await split_multicam_camera_track(
+                            track_output_path,
+                            track["split_frames"],
+                            piece_pattern,
+                            job_id,
+                        )
+                        rendered = {}
+                        for piece_path, segment_offset, piece_frame_count in zip(
+                            piece_paths,
+                            track["pieces"],
+                            track["piece_frame_counts"],
+                        ):
+                            if segment_offset is None:
+                                continue
+                            duration_receipt = validate_multicam_segment_duration(
+                                piece_path,
+                                piece_frame_count / 30.0,
+                                chunk_segment_start_index + segment_offset,
+                                strict=True,
+                            )
+                            duration_receipt["camera_track"] = track["camera_id"]
+                            rendered[segment_offset] = [(piece_path, duration_receipt)]
+                        return rendered
+                    except Exception as camera_track_error:
+                        logger.warning(
+                            "Multicam camera track %s at segment %d failed, rendering its cuts directly: %s",
+                            track["camera_id"],
+                            track_index,
+                            camera_track_error,
                         )
-                    return segment_output_path, duration_receipt
+                        return {}
 
-                chunk_render_results = await asyncio.gather(
+                if MULTICAM_CHUNK_CUT_RENDER or multicam_camera_track_render_enabled(render_tier_profile):
+                    chunk_cut_plans = [
+                        multicam_chunk_cut_plan(segment, source_map, prepared_sources, render_tier_profile)
+                        for segment in chunk_segments
+                    ]
+                else:
+                    chunk_cut_plans = [None] * len(chunk_segments)
+                chunk_rendered_offsets = {}
+                if multicam_camera_track_render_enabled(render_tier_profile):
+                    for track_results in await asyncio.gather(
+                        *[
+                            render_chunk_camera_track(track)
+                            for track in plan_multicam_camera_tracks(chunk_cut_plans, chunk_segments)
+                        ]
+                    ):
+                        chunk_rendered_offsets.update(track_results)
+                if not MULTICAM_CHUNK_CUT_RENDER:
+                    chunk_cut_plans = [None] * len(chunk_segments)
+                chunk_render_units = plan_multicam_chunk_render_units(
+                    chunk_segments,
+                    chunk_cut_plans,
+                    max_inputs=cut_run_max_inputs,
+                    skip_offsets=chunk_rendered_offsets,
+                )
+                chunk_unit_results = await asyncio.gather(
                     *[
-                        render_chunk_segment(segment_offset, segment)
-                        for segment_offset, segment in enumerate(chunk_segments)
+                        render_chunk_unit(segment_offset, unit_segments, unit_cut_plans)
+                        for segment_offset, unit_segments, unit_cut_plans in chunk_render_units
                     ]
                 )
-                for segment_output_path, duration_receipt in chunk_render_results:
-                    segment_duration_receipts.append(duration_receipt)
-                    chunk_part_paths.append(segment_output_path)
-                rendered_segment_count += len(chunk_render_results)
+                chunk_rendered_offsets.update(
+                    (unit[0], unit_results) for unit, unit_results in zip(chunk_render_units, chunk_unit_results)
+                )
+                chunk_render_results = [
+                    chunk_rendered_offsets[segment_offset]
+                    for segment_offset in sorted(chunk_rendered_offsets)
+                ]
+                for unit_results in chunk_render_results:
+                    for segment_output_path, duration_receipt in unit_results:
+                        segment_duration_receipts.append(duration_receipt)
+                        chunk_part_paths.append(segment_output_path)
+                rendered_segment_count += len(chunk_segments)
 
                 if checkpointing_enabled:
                     chunk_concat_list_path = os.path.join(
@@ -25221,6 +27103,7 @@ async def render_multicam_impl(
                             "timelineStart": f"{float(chunk['start']):.6f}",
                             "timelineEnd": f"{float(chunk['end']):.6f}",
                             "profileFingerprint": duration_receipt["profile_fingerprint"],
+                            "chunkFingerprint": chunk_fingerprint,
                         },
                     )
                     checkpoint_receipt.update(
@@ -25294,6 +27177,8 @@ async def render_multicam_impl(
             render_segment_merge=render_segment_merge_receipt,
             fast_composite=multicam_fast_composite_enabled(),
             segment_render_concurrency=segment_render_concurrency,
+            cut_run_max_inputs=cut_run_max_inputs,
+            resource_scheduler=resource_scheduler.snapshot(),
             layout_summary=layout_summary,
         )
 
@@ -25344,15 +27229,6 @@ async def render_multicam_impl(
         if external_audio_url:
             if request.async_mode:
                 update_firestore_job(job_id, {"progress": 88, "detail": "Preparing external clean audio"})
-            if pre_sync_result and pre_sync_result.get("status") == "aligned":
-                external_audio_materialized_path = effective_external_audio_url
-            else:
-                external_audio_materialized_path = await materialize_cached_media_input(
-                    effective_external_audio_url,
-                    external_audio_input_path,
-                    external_audio_cache_key or effective_external_audio_url,
-                    keep_audio=True,
-                )
             external_audio_anchor = overlap_start - float(effective_external_audio_offset_seconds or 0.0)
             audio_bed_receipt = await render_multicam_audio_bed(
                 external_audio_materialized_path,
@@ -25398,17 +27274,15 @@ async def render_multicam_impl(
                 job_context=job_id,
             )
         else:
-            audio_source = source_map.get(primary_audio_camera_id or "")
-            if not audio_source or not audio_source.get("has_audio"):
-                audio_source = next((source for source in prepared_sources if source.get("has_audio")), None)
+            audio_source, audio_anchor = resolve_multicam_camera_audio_bed_source(
+                source_map,
+                prepared_sources,
+                primary_audio_camera_id,
+                segments,
+                overlap_start,
+            )
 
             if audio_source and audio_source.get("has_audio"):
-                audio_anchor = overlap_start - float(audio_source["offset_seconds"])
-                primary_segments = [segment for segment in segments if segment["camera_id"] == audio_source["id"]]
-                if primary_segments:
-                    inferred_anchor = float(primary_segments[0]["source_start"]) - float(primary_segments[0]["timeline_start"])
-                    if inferred_anchor >= -0.01:
-                        audio_anchor = inferred_anchor
                 audio_bed_receipt = await render_multicam_audio_bed(
                     audio_source["path"],
                     primary_audio_output_path,
@@ -25479,61 +27353,24 @@ async def render_multicam_impl(
                 max_abs_residual_seconds=(pre_caption_sync_audit or {}).get("max_abs_residual_seconds"),
             )
 
-        brand_watermark_enabled, brand_watermark_text = resolve_multicam_branding_request(request)
-        brand_watermark_enabled = bool(brand_watermark_enabled and render_tier_profile.get("brand_watermark"))
-        brand_watermark_filter = (
-            build_multicam_brand_watermark_filter(output_width, output_height, brand_watermark_text)
-            if brand_watermark_enabled
-            else None
-        )
-
-        burn_captions, caption_style = resolve_multicam_caption_request(request)
-        burn_captions = bool(burn_captions and render_tier_profile.get("burn_captions"))
         stage_started_at = time.perf_counter()
-        if burn_captions:
-            if request.async_mode:
-                update_firestore_job(job_id, {"progress": 91, "detail": "Burning word-level captions"})
-            caption_receipt = await burn_multicam_word_captions(
-                output_path,
-                job_id,
-                output_width,
-                output_height,
-                style_name=caption_style,
-                render_segments=segments,
-                extra_video_filter=brand_watermark_filter,
-            )
-            if brand_watermark_enabled:
-                brand_watermark_receipt = {
-                    "enabled": True,
-                    "status": "burned_in_with_captions",
-                    "text": brand_watermark_text,
-                    "placement": "top_right",
-                    "style": "subtle_glass_pill",
-                    "video_encoder": caption_receipt.get("video_encoder"),
-                }
-        else:
-            caption_receipt = {
-                "enabled": False,
-                "status": "disabled_by_request",
-                "message": "Captions are normally mandatory for multicam podcast renders.",
-            }
-
-        if brand_watermark_enabled and not brand_watermark_receipt:
-            if request.async_mode:
-                update_firestore_job(job_id, {"progress": 92, "detail": "Adding AutoPromote branding"})
-            brand_watermark_receipt = await apply_multicam_brand_watermark(
-                output_path,
-                job_id,
-                output_width,
-                output_height,
-                text=brand_watermark_text,
-            )
-        elif not brand_watermark_enabled:
-            brand_watermark_receipt = {
-                "enabled": False,
-                "status": "disabled_by_request",
-                "message": "AutoPromote watermark disabled for this render.",
-            }
+        caption_receipt, brand_watermark_receipt = await finish_multicam_master(
+            output_path,
+            job_id,
+            output_width,
+            output_height,
+            fused_finishing=fused_finishing,
+            burn_captions=burn_captions,
+            caption_style=caption_style,
+            caption_transcript_task=caption_transcript_task,
+            brand_watermark_enabled=brand_watermark_enabled,
+            brand_watermark_text=brand_watermark_text,
+            brand_watermark_filter=brand_watermark_filter,
+            render_segments=segments,
+            activity_sources=prepared_sources,
+            overlap_start=overlap_start,
+            async_mode=request.async_mode,
+        )
         record_performance_stage(
             "captions_branding",
             stage_started_at,
@@ -25710,13 +27547,18 @@ async def render_multicam_impl(
             "status": "stitched" if checkpointing_enabled else "not_required",
             "checkpoint_seconds": round(render_checkpoint_seconds, 3),
             "plan_fingerprint": (checkpoint_plan or {}).get("fingerprint"),
+            "chunk_fingerprints": (checkpoint_plan or {}).get("chunk_fingerprints") or [],
             "plan_storage_path": (checkpoint_plan_receipt or {}).get("storage_path"),
             "canonical_plan": checkpoint_canonical_plan,
             "total_chunks": len(checkpoint_receipts),
             "completed_chunks": len(checkpoint_receipts),
             "stitch": stitch_receipt,
             "cleanup_policy": (
-                "delete_after_master_manifest_commit; temp lifecycle fallback"
+                (
+                    f"retain_for_replan; temp lifecycle cleanup after {MULTICAM_CHECKPOINT_RETENTION_HOURS}h"
+                    if MULTICAM_RETAIN_CHECKPOINTS_FOR_REPLAN
+                    else "delete_after_master_manifest_commit; temp lifecycle fallback"
+                )
                 if checkpointing_enabled
                 else "not_applicable"
             ),
@@ -25746,6 +27588,9 @@ async def render_multicam_impl(
                 "restored_count": sum(
                     1 for receipt in checkpoint_receipts if receipt.get("status") == "restored"
                 ),
+                "reused_count": sum(
+                    1 for receipt in checkpoint_receipts if receipt.get("status") == "reused_from_previous_plan"
+                ),
             },
             "stages": performance_stages,
         }
@@ -25788,6 +27633,7 @@ async def render_multicam_impl(
             "director_layout_repair": director_layout_repair_receipt,
             "director_truth_repair": director_truth_repair_receipt,
             "render_segment_merge": render_segment_merge_receipt,
+            "replan": replan_receipt,
             "captions": caption_receipt,
             "brand_watermark": brand_watermark_receipt,
             "thumbnail": thumbnail_receipt,
@@ -25803,6 +27649,7 @@ async def render_multicam_impl(
                 "performance_timing": performance_timing,
                 "render_segment_merge": render_segment_merge_receipt,
                 "render_checkpoint": checkpoint_manifest,
+                "replan": replan_receipt,
                 "trusted_sync_contract": trusted_sync_contract_receipt,
                 "trusted_director_channel_map": trusted_director_channel_map_receipt,
                 "final_quality_gate": final_quality_gate,
@@ -25914,7 +27761,11 @@ async def render_multicam_impl(
             }, critical=True, max_attempts=5)
 
             if checkpointing_enabled:
-                checkpoint_cleanup_receipt = delete_multicam_checkpoint_prefix(job_id)
+                checkpoint_cleanup_receipt = finish_multicam_checkpoint_storage(
+                    job_id,
+                    checkpoint_storage_prefix,
+                    checkpoint_receipts,
+                )
                 result_data["render_checkpoint"]["cleanup"] = checkpoint_cleanup_receipt
                 update_firestore_job(
                     job_id,
@@ -25967,6 +27818,8 @@ async def render_multicam_impl(
         except Exception as rescue_error:
             logger.warning("Could not preserve multicam master before cleanup: %s", rescue_error)
 
+        if caption_transcript_task and not caption_transcript_task.done():
+            caption_transcript_task.cancel()
         for source in prepared_sources:
             if os.path.exists(source["path"]):
                 os.remove(source["path"])
@@ -26624,6 +28477,7 @@ async def auto_generate_clips(request: Dict[str, Any], background_tasks: Backgro
     return {"status": "processing", "job_id": job_id, "mode": "async"}
 
 
+@job_cache_scoped
 async def _auto_generate_clips_impl(
     video_url,
     job_id,
@@ -26802,6 +28656,16 @@ async def _auto_generate_clips_impl(
             podcast_workflow = workflow_type == SMART_PROMO_PODCAST_WORKFLOW_TYPE
             transcription_limit = 300.0 if output_mode in {"story_edit", "visual_edit"} else 120.0
             allow_full_transcription = audio_present and analysis_duration > 0 and analysis_duration <= transcription_limit
+            # Past the full-quality limit, rank on a tiny-model draft of the whole
+            # source and refine only the windows that get rendered.
+            draft_transcription = (
+                audio_present
+                and not allow_full_transcription
+                and analysis_duration > 0
+                and not visual_workflow
+                and env_flag("PROMO_DRAFT_TRANSCRIPTION", default=True)
+            )
+            allow_full_transcription = allow_full_transcription or draft_transcription
             analysis_transcription_timeout = min(
                 210,
                 max(
@@ -26811,6 +28675,14 @@ async def _auto_generate_clips_impl(
             )
 
             promo_whisper_model_name = get_promo_whisper_model_name()
+            analysis_whisper_model_name = (
+                get_promo_draft_whisper_model_name() if draft_transcription else promo_whisper_model_name
+            )
+
+            # Segments land here as they decode, so a transcription timeout
+            # still leaves the analysis with everything heard so far.
+            streamed_transcription_segments = []
+            transcription_stop = threading.Event()
 
             def run_whisper_local():
                 if not audio_present:
@@ -26818,25 +28690,37 @@ async def _auto_generate_clips_impl(
                     return []
                 if not allow_full_transcription:
                     return []
-                return transcribe_with_hints(
+                publish_progress = build_transcription_progress_publisher(
+                    job_id,
+                    20,
+                    38,
+                    "Transcribing speech",
+                )
+                for segment in iter_transcribe_with_hints(
                     analysis_path,
                     word_timestamps=False,
-                    model_name=promo_whisper_model_name,
-                ).get("segments", [])
+                    model_name=analysis_whisper_model_name,
+                    on_progress=publish_progress,
+                ):
+                    streamed_transcription_segments.append(segment)
+                    if transcription_stop.is_set():
+                        break
+                return list(streamed_transcription_segments)
 
             def run_scenedetect_local():
-                video = open_video(analysis_path)
-                try:
-                    video.set_downscale_factor(8)
-                except Exception:
-                    pass
-                sm = SceneManager()
-                sm.add_detector(ContentDetector(threshold=27.0))
-                sm.detect_scenes(video=video)
-                return sm.get_scene_list()
+                detected_scenes, detected_motion, _scene_receipt = detect_scenes_and_motion(
+                    analysis_path,
+                    motion_interval=1.0,
+                    duration=analysis_duration,
+                )
+                return detected_scenes, detected_motion
 
-            async def run_analysis_task(label, fn, *args, timeout_seconds=45, fallback_value=None):
+            async def run_analysis_task(label, fn, *args, timeout_seconds=45, fallback_value=None, admitted=False):
                 try:
+                    if admitted:
+                        # Decode-bound passes queue for the scheduler before their timeout starts.
+                        async with analysis_process_limiter:
+                            return await asyncio.wait_for(loop.run_in_executor(None, fn, *args), timeout=timeout_seconds)
                     return await asyncio.wait_for(
                         loop.run_in_executor(None, fn, *args),
                         timeout=timeout_seconds,
@@ -26853,6 +28737,11 @@ async def _auto_generate_clips_impl(
                 logger.info(
                     f"Promo job {job_id} is using fast highlight mode (duration {analysis_duration:.1f}s); skipping full transcription."
                 )
+            elif draft_transcription:
+                logger.info(
+                    f"Promo job {job_id} is ranking on a '{analysis_whisper_model_name}' draft transcript "
+                    f"(duration {analysis_duration:.1f}s); top windows are refined with '{promo_whisper_model_name}'."
+                )
             else:
                 logger.info(
                     f"Promo job {job_id} is using Whisper model '{promo_whisper_model_name}' for promo analysis."
@@ -26900,7 +28789,7 @@ async def _auto_generate_clips_impl(
                 })
                 audio_energy, motion_scores_data, subject_tracking_samples = await asyncio.gather(
                     run_analysis_task("audio_energy", analyze_audio_energy, analysis_path, 1.0, timeout_seconds=20, fallback_value=[]),
-                    run_analysis_task("visual_motion", analyze_visual_motion, analysis_path, 1.0, timeout_seconds=20, fallback_value=[]),
+                    run_analysis_task("visual_motion", sample_visual_motion, analysis_path, 1.0, timeout_seconds=20, fallback_value=[]),
                     run_analysis_task("speaker_tracking", detect_speaker_positions, analysis_path, 1.5, True, timeout_seconds=35, fallback_value=[]),
                 )
                 face_positions = [
@@ -26909,17 +28798,27 @@ async def _auto_generate_clips_impl(
                     if isinstance(sample, dict)
                 ]
             else:
-                transcription_segments, scene_list, audio_energy, motion_scores_data = await asyncio.gather(
+                # One sequential decode yields both scene cuts and motion, so
+                # the budget scales with duration instead of a fixed 20s that
+                # dropped scenes entirely on long inputs.
+                scene_pass_timeout = int(min(900, max(20, analysis_duration * 0.2)))
+                transcription_segments, scene_and_motion, audio_energy = await asyncio.gather(
                     run_analysis_task(
                         "transcription",
                         run_whisper_local,
                         timeout_seconds=analysis_transcription_timeout if allow_full_transcription else 1,
                         fallback_value=[],
                     ),
-                    run_analysis_task("scene_detect", run_scenedetect_local, timeout_seconds=20, fallback_value=[]),
+                    run_analysis_task(
+                        "scene_detect",
+                        run_scenedetect_local,
+                        timeout_seconds=scene_pass_timeout,
+                        fallback_value=([], []),
+                        admitted=True,
+                    ),
                     run_analysis_task("audio_energy", analyze_audio_energy, analysis_path, 1.0, timeout_seconds=20, fallback_value=[]),
-                    run_analysis_task("visual_motion", analyze_visual_motion, analysis_path, 1.0, timeout_seconds=20, fallback_value=[]),
                 )
+                scene_list, motion_scores_data = scene_and_motion
 
                 visual_notes = await run_analysis_task(
                     "visual_frame_understanding",
@@ -26931,6 +28830,12 @@ async def _auto_generate_clips_impl(
                     fallback_value=[],
                 )
                 face_positions = []
+            transcription_stop.set()
+            if not transcription_segments and streamed_transcription_segments:
+                logger.info(
+                    f"Promo job {job_id}: using {len(streamed_transcription_segments)} partial transcript segments decoded before the timeout."
+                )
+                transcription_segments = list(streamed_transcription_segments)
             transcription_segments = annotate_transcription_segments(transcription_segments)
 
             update_firestore_job(job_id, {
@@ -27065,6 +28970,33 @@ async def _auto_generate_clips_impl(
                     max_candidates=12 if campaign_roles else 10,
                 )
 
+            transcript_refinement = None
+            if draft_transcription and ranked:
+                refine_window_count = int(os.getenv("PROMO_DRAFT_REFINE_WINDOWS", "0") or 0) or min(
+                    12,
+                    max(1, int(max_clips or 1)) * (4 if campaign_roles or output_mode == "story_edit" else 1),
+                )
+                update_firestore_job(job_id, {
+                    "status": "analyzing",
+                    "progress": 42,
+                    "detail": "Refining transcripts for the top moments",
+                })
+                ranked, transcript_refinement = await run_analysis_task(
+                    "transcript_refinement",
+                    lambda candidates=ranked: refine_draft_transcript_windows(
+                        analysis_path,
+                        candidates,
+                        model_name=promo_whisper_model_name,
+                        max_windows=refine_window_count,
+                    ),
+                    timeout_seconds=min(300, 30 + 20 * refine_window_count),
+                    fallback_value=(ranked, None),
+                )
+                transcript_refinement = {
+                    "draftModel": analysis_whisper_model_name,
+                    **(transcript_refinement or {"refinedWindows": 0}),
+                }
+
             artifact_id = store_analysis_artifact(
                 analysis_cache_key,
                 {
@@ -27076,6 +29008,7 @@ async def _auto_generate_clips_impl(
                         "candidateCount": len(ranked),
                         "visualNoteCount": len(visual_notes or []),
                         "transcriptQuality": transcript_quality,
+                        "transcriptRefinement": transcript_refinement,
                     },
                 },
                 workflow_type=workflow_type,
@@ -28008,11 +29941,12 @@ async def render_viral_clip(request: RenderViralRequest):
 
     return await render_viral_clip_impl(request)
 
+@job_cache_scoped
 async def render_viral_clip_impl(request: RenderViralRequest, provided_job_id: str = None):
     logger.info(f"Rendering viral clip for {request.video_url} with {len(request.overlays)} overlays (SmartCrop={request.smart_crop}, AutoCaptions={request.auto_captions})")
 
     job_id = provided_job_id or str(uuid.uuid4())
-    SHARED_TMP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../tmp"))
+    SHARED_TMP_DIR = WORKER_TMP_DIR
     if not os.path.exists(SHARED_TMP_DIR): os.makedirs(SHARED_TMP_DIR)
 
     input_path = os.path.join(SHARED_TMP_DIR, f"{job_id}_input.mp4")
@@ -28259,7 +30193,7 @@ async def render_viral_clip_impl(request: RenderViralRequest, provided_job_id: s
 
                 motion_scores = []
                 try:
-                    motion_scores = await loop.run_in_executor(None, analyze_visual_motion, visual_source_path, 0.5)
+                    motion_scores = await loop.run_in_executor(None, sample_visual_motion, visual_source_path, 0.5)
                 except Exception:
                     pass
 
@@ -28489,7 +30423,12 @@ async def render_viral_clip_impl(request: RenderViralRequest, provided_job_id: s
             use_animated = caption_style_name in CAPTION_STYLES
             try:
                 logger.info(f"Generating auto-captions (style={caption_style_name or 'legacy'}, animated={use_animated})...")
-                loop = asyncio.get_running_loop()
+                caption_layout = resolve_ass_caption_style(
+                    caption_style_name,
+                    request.caption_position,
+                    request.caption_scale,
+                )
+                caption_events = None
                 if request.caption_text_override:
                     whisper_result = build_caption_override_transcript(
                         request.caption_text_override,
@@ -28497,13 +30436,23 @@ async def render_viral_clip_impl(request: RenderViralRequest, provided_job_id: s
                     )
                     logger.info("Using creator-supplied caption copy instead of transcription")
                 elif FasterWhisperModel is not None or whisper is not None:
-                    whisper_result = await loop.run_in_executor(
-                        None,
-                        lambda: transcribe_with_hints(
-                            working_path,
-                            word_timestamps=use_animated,
-                        ),
-                    )
+                    # ASS events are built per segment as the transcript
+                    # streams in, so only the header is left once it ends.
+                    caption_summary = {}
+                    caption_segments = []
+                    caption_events = []
+                    async for segment in stream_transcribe_with_hints(
+                        working_path,
+                        job_id=job_id if request.async_mode else None,
+                        progress_range=(40, 60),
+                        progress_detail="Transcribing captions",
+                        summary=caption_summary,
+                        word_timestamps=use_animated,
+                    ):
+                        caption_segments.append(segment)
+                        if use_animated:
+                            caption_events.extend(build_ass_caption_segment_events(segment, caption_layout))
+                    whisper_result = {**caption_summary, "segments": caption_segments}
                 else:
                     whisper_result = {"segments": []}
 
@@ -28514,14 +30463,13 @@ async def render_viral_clip_impl(request: RenderViralRequest, provided_job_id: s
                     if use_animated and segments:
                         # Generate ASS subtitle file with animated word-level captions
                         w, h = get_video_dimensions(working_path)
-                        ass_content = generate_ass_captions(
-                            whisper_result,
-                            caption_style_name,
-                            w,
-                            h,
-                            caption_position=request.caption_position,
-                            caption_scale=request.caption_scale,
-                        )
+                        if caption_events is None:
+                            caption_events = [
+                                event
+                                for segment in segments
+                                for event in build_ass_caption_segment_events(segment, caption_layout)
+                            ]
+                        ass_content = "\n".join(build_ass_caption_header(caption_layout, w, h) + caption_events)
                         ass_subtitle_path = os.path.join(SHARED_TMP_DIR, f"{job_id}_captions.ass")
                         with open(ass_subtitle_path, "w", encoding="utf-8") as f:
                             f.write(ass_content)
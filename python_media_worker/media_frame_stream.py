@@ -0,0 +1,167 @@
+"""Shared low-resolution frame stream for frame-sampling analyzers.
+
+Several analyzers (watermark scoring, manual-region tracking, preview sheets,
+scene-cut detection) only need small frames at a few frames per second, yet
+each used to open its own ``cv2.VideoCapture`` and seek per sample.  This
+module decodes a file once through an ffmpeg rawvideo pipe at the highest
+sample rate any registered consumer asks for, downscaled to a bounded long
+edge, and hands every frame to every consumer in timeline order.  Frames are
+not retained by the stream, so memory is one frame regardless of duration.
+
+Consumers implement a tiny protocol:
+
+``sample_fps``
+    Minimum frames per second the consumer needs (``None``/0 = no opinion).
+``consume(frame_time, frame)``
+    Called for each decoded BGR ``uint8`` frame in order.
+``finish()``
+    Called once after the last frame; its return value is collected.
+
+Like ``multicam_visual_analysis`` this module only imports OpenCV/NumPy so it
+is safe to load inside process-pool workers.
+"""
+
+import logging
+import math
+import os
+import subprocess
+import tempfile
+
+import numpy as np
+
+
+logger = logging.getLogger("MediaWorker")
+
+FRAME_STREAM_DEFAULT_MAX_LONG_EDGE = 640
+FRAME_STREAM_MAX_FPS = 12.0
+
+
+def even_stream_dimension(value):
+    return max(2, int(round(float(value) / 2.0)) * 2)
+
+
+def frame_stream_dimensions(source_width, source_height, max_long_edge=None):
+    """Return even ``(width, height)`` that fit ``max_long_edge`` without upscaling."""
+    safe_width = max(2, int(source_width or 2))
+    safe_height = max(2, int(source_height or 2))
+    configured_edge = max_long_edge or int(
+        os.getenv("FRAME_STREAM_MAX_LONG_EDGE", str(FRAME_STREAM_DEFAULT_MAX_LONG_EDGE))
+        or FRAME_STREAM_DEFAULT_MAX_LONG_EDGE
+    )
+    scale = min(1.0, float(configured_edge) / float(max(safe_width, safe_height)))
+    return even_stream_dimension(safe_width * scale), even_stream_dimension(safe_height * scale)
+
+
+def resolve_frame_stream_fps(consumers, default_fps=1.0):
+    requested = [
+        float(getattr(consumer, "sample_fps", 0.0) or 0.0)
+        for consumer in consumers or []
+    ]
+    requested = [value for value in requested if value > 0.0 and math.isfinite(value)]
+    fps = max(requested) if requested else float(default_fps)
+    return max(0.05, min(FRAME_STREAM_MAX_FPS, fps))
+
+
+def iter_low_res_frames(video_path, fps, width, height, start_time=0.0, duration=None):
+    """Yield ``(frame_time, bgr_frame)`` from one sequential ffmpeg decode.
+
+    ``frame_time`` is seconds on the source timeline. The ``fps`` filter emits
+    output frame ``i`` at ``start_time + i / fps``.
+    """
+    safe_fps = max(0.05, float(fps or 1.0))
+    safe_start = max(0.0, float(start_time or 0.0))
+    frame_bytes = int(width) * int(height) * 3
+    cmd = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error"]
+    if safe_start > 0.0:
+        cmd.extend(["-ss", f"{safe_start:.3f}"])
+    if duration is not None and float(duration) > 0.0:
+        cmd.extend(["-t", f"{float(duration):.3f}"])
+    cmd.extend(
+        [
+            "-i",
+            video_path,
+            "-map",
+            "0:v:0",
+            "-an",
+            "-vf",
+            f"fps={safe_fps:.6f},scale={int(width)}:{int(height)}:flags=area,format=bgr24",
+            "-f",
+            "rawvideo",
+            "-",
+        ]
+    )
+
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+        frame_index = 0
+        try:
+            while True:
+                buffer = process.stdout.read(frame_bytes)
+                if not buffer or len(buffer) < frame_bytes:
+                    break
+                frame = np.frombuffer(buffer, dtype=np.uint8).reshape((int(height), int(width), 3))
+                yield safe_start + (frame_index / safe_fps), frame
+                frame_index += 1
+        finally:
+            process.stdout.close()
+            if process.poll() is None:
+                process.kill()
+            returncode = process.wait()
+        if returncode not in (0, -9) and frame_index == 0:
+            stderr_file.seek(0)
+            logger.warning(
+                "Frame stream decode failed for %s: %s",
+                video_path,
+                stderr_file.read().decode("utf-8", errors="ignore")[-500:],
+            )
+
+
+def run_shared_frame_pass(
+    video_path,
+    consumers,
+    source_width,
+    source_height,
+    duration=None,
+    start_time=0.0,
+    max_long_edge=None,
+):
+    """Decode ``video_path`` once and feed every frame to every consumer.
+
+    Returns ``(results, receipt)`` where ``results`` holds each consumer's
+    ``finish()`` value in registration order.
+    """
+    safe_consumers = [consumer for consumer in consumers or [] if consumer is not None]
+    if not safe_consumers:
+        return [], {"status": "skipped_no_consumers"}
+
+    stream_width, stream_height = frame_stream_dimensions(source_width, source_height, max_long_edge)
+    fps = resolve_frame_stream_fps(safe_consumers)
+    for consumer in safe_consumers:
+        bind = getattr(consumer, "bind_stream", None)
+        if callable(bind):
+            bind(stream_width, stream_height, fps)
+
+    frame_count = 0
+    if video_path:
+        for frame_time, frame in iter_low_res_frames(
+            video_path,
+            fps,
+            stream_width,
+            stream_height,
+            start_time=start_time,
+            duration=duration,
+        ):
+            frame_count += 1
+            for consumer in safe_consumers:
+                consumer.consume(frame_time, frame)
+
+    results = [consumer.finish() for consumer in safe_consumers]
+    receipt = {
+        "status": "active" if frame_count else "no_frames",
+        "width": stream_width,
+        "height": stream_height,
+        "fps": round(fps, 4),
+        "frame_count": frame_count,
+        "consumers": [type(consumer).__name__ for consumer in safe_consumers],
+    }
+    return results, receipt
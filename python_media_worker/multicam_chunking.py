@@ -5,6 +5,10 @@ splits an already-final director/render plan at deterministic timeline
 boundaries.  Production callers can supply a continuous-sync-aware source
 range resolver; tests and other pure callers can rely on proportional slicing
 of source ranges already present on each segment.
+
+Long plans are partitioned over a ``SegmentTable``: each chunk holds a view of
+the table's rows, and segment dicts are only built for a chunk when it is
+rendered or written out as JSON (:func:`materialize_multicam_chunk`).
 """
 
 from __future__ import annotations
@@ -18,6 +22,13 @@ import re
 from pathlib import Path
 from typing import Any, Callable, Mapping, Optional, Sequence, Tuple, Union
 
+import numpy as np
+
+try:
+    from .segment_table import SegmentTable
+except ImportError:
+    from segment_table import SegmentTable
+
 
 SourceRange = Union[Sequence[float], Mapping[str, float]]
 SourceRangeResolver = Callable[[str, float, float], SourceRange]
@@ -115,13 +126,13 @@ def _apply_source_range(
         piece[source_start_key], piece[source_end_key] = source_range
 
 
-def _split_segment(
+def _clip_piece(
+    piece: dict,
     segment: Mapping[str, Any],
     piece_start: float,
     piece_end: float,
     source_range_resolver: Optional[SourceRangeResolver],
 ) -> dict:
-    piece = copy.deepcopy(dict(segment))
     piece["timeline_start"] = piece_start
     piece["timeline_end"] = piece_end
     if "duration" in piece:
@@ -152,6 +163,15 @@ def _split_segment(
     return piece
 
 
+def _split_segment(
+    segment: Mapping[str, Any],
+    piece_start: float,
+    piece_end: float,
+    source_range_resolver: Optional[SourceRangeResolver],
+) -> dict:
+    return _clip_piece(copy.deepcopy(dict(segment)), segment, piece_start, piece_end, source_range_resolver)
+
+
 def _validated_segments(segments: Sequence[Mapping[str, Any]]) -> list:
     validated = []
     previous_end = None
@@ -169,7 +189,11 @@ def _validated_segments(segments: Sequence[Mapping[str, Any]]) -> list:
                 raise ValueError(f"Segments must be contiguous; {issue} before segment {index}")
             timeline_start = previous_end
 
-        normalized = copy.deepcopy(dict(segment))
+        # Shallow and internal: nested values still belong to the caller's
+        # plan, so every segment handed back is deep-copied on the way out
+        # (materialize_multicam_chunk, _clipped_pieces) and this list is never
+        # returned.
+        normalized = dict(segment)
         normalized["timeline_start"] = timeline_start
         normalized["timeline_end"] = timeline_end
         validated.append(normalized)
@@ -177,92 +201,77 @@ def _validated_segments(segments: Sequence[Mapping[str, Any]]) -> list:
     return validated
 
 
-def partition_multicam_render_segments(
-    segments: Sequence[Mapping[str, Any]],
+def _chunk_grid(plan_start: float, plan_end: float, chunk_duration: float) -> int:
+    return max(1, int(math.ceil(max(0.0, plan_end - plan_start - 1e-9) / chunk_duration)))
+
+
+def _validated_table(segments: Union[SegmentTable, Sequence[Mapping[str, Any]]]) -> SegmentTable:
+    if not isinstance(segments, SegmentTable):
+        return SegmentTable.from_segments(_validated_segments(segments))
+    rows = segments.rows.copy()
+    if not len(rows):
+        return SegmentTable(rows, segments.extras, segments.strings, segments.orders)
+    starts = rows["timeline_start"]
+    ends = rows["timeline_end"]
+    invalid = np.flatnonzero(~(np.isfinite(starts) & np.isfinite(ends)))
+    if invalid.size:
+        raise ValueError(f"Segment {int(invalid[0])} timeline_start and timeline_end must be finite numbers")
+    empty = np.flatnonzero(ends <= starts)
+    if empty.size:
+        raise ValueError(f"Segment {int(empty[0])} must have positive timeline duration")
+    deltas = starts[1:] - ends[:-1]
+    broken = np.flatnonzero(np.abs(deltas) > _CONTIGUITY_TOLERANCE_SECONDS)
+    if broken.size:
+        issue = "gap" if deltas[broken[0]] > 0.0 else "overlap"
+        raise ValueError(f"Segments must be contiguous; {issue} before segment {int(broken[0]) + 1}")
+    starts[1:] = ends[:-1]
+    return SegmentTable(rows, segments.extras, segments.strings, segments.orders)
+
+
+def partition_multicam_segment_table(
+    segments: Union[SegmentTable, Sequence[Mapping[str, Any]]],
     target_chunk_duration: float = 300.0,
-    *,
-    source_range_resolver: Optional[SourceRangeResolver] = None,
 ) -> list:
-    """Split contiguous render segments into deterministic timeline chunks.
+    """Split a contiguous plan into chunks that hold views of one ``SegmentTable``.
 
-    Segment timeline values and chunk start/end values remain on the caller's
-    original timeline.  A segment crossing a chunk boundary is copied and
-    clipped on both sides of that boundary.  All unrelated director/layout
-    metadata is deep-copied unchanged.
-
-    ``source_range_resolver`` is called as ``(camera_id, timeline_start,
-    duration)`` for both the primary and secondary camera on every emitted
-    segment piece.  Without it, existing primary and secondary source ranges
-    are sliced proportionally; this fallback is intended for pure planning and
-    tests rather than production continuous-sync mapping.
+    Each chunk's ``rows`` is a view of the table rows overlapping the chunk,
+    with no per-segment copies; the first and last rows may extend past the
+    chunk and are clipped by :func:`materialize_multicam_chunk`.  The chunk
+    grid matches :func:`partition_multicam_render_segments`.
     """
 
     chunk_duration = _finite_float(target_chunk_duration, "target_chunk_duration")
     if chunk_duration <= 0.0:
         raise ValueError("target_chunk_duration must be greater than zero")
 
-    normalized_segments = _validated_segments(segments)
-    if not normalized_segments:
+    table = _validated_table(segments)
+    if not len(table):
         return []
 
-    plan_start = normalized_segments[0]["timeline_start"]
-    plan_end = normalized_segments[-1]["timeline_end"]
-    plan_duration = plan_end - plan_start
+    starts = table.rows["timeline_start"]
+    ends = table.rows["timeline_end"]
+    plan_start = float(starts[0])
+    plan_end = float(ends[-1])
     # Use only a floating-point epsilon here. The wider segment-contiguity
     # tolerance must never shorten the declared render timeline.
-    chunk_count = max(
-        1,
-        int(
-            math.ceil(
-                max(0.0, plan_duration - 1e-9)
-                / chunk_duration
-            )
-        ),
-    )
+    chunk_count = _chunk_grid(plan_start, plan_end, chunk_duration)
     chunks = []
-    segment_cursor = 0
-
     for chunk_index in range(chunk_count):
         chunk_start = plan_start + (chunk_index * chunk_duration)
         chunk_end = min(plan_end, plan_start + ((chunk_index + 1) * chunk_duration))
-        chunk_segments = []
-
-        while (
-            segment_cursor < len(normalized_segments)
-            and normalized_segments[segment_cursor]["timeline_end"]
-            <= chunk_start + _BOUNDARY_EPSILON_SECONDS
-        ):
-            segment_cursor += 1
-
-        scan_index = segment_cursor
-        while scan_index < len(normalized_segments):
-            segment = normalized_segments[scan_index]
-            segment_start = segment["timeline_start"]
-            segment_end = segment["timeline_end"]
-            if segment_start >= chunk_end - _BOUNDARY_EPSILON_SECONDS:
-                break
-
-            piece_start = max(chunk_start, segment_start)
-            piece_end = min(chunk_end, segment_end)
-            if piece_end - piece_start > _BOUNDARY_EPSILON_SECONDS:
-                chunk_segments.append(
-                    _split_segment(
-                        segment,
-                        piece_start,
-                        piece_end,
-                        source_range_resolver,
-                    )
-                )
-            if segment_end <= chunk_end + _BOUNDARY_EPSILON_SECONDS:
-                scan_index += 1
-            else:
-                break
-
-        if not chunk_segments:
+        first = int(np.searchsorted(ends, chunk_start + _BOUNDARY_EPSILON_SECONDS, side="right"))
+        last = int(np.searchsorted(starts, chunk_end - _BOUNDARY_EPSILON_SECONDS, side="left"))
+        # Rows that only graze the chunk by a rounding error are not pieces.
+        while first < last and min(chunk_end, ends[first]) - max(chunk_start, starts[first]) <= _BOUNDARY_EPSILON_SECONDS:
+            first += 1
+        while last > first and min(chunk_end, ends[last - 1]) - max(chunk_start, starts[last - 1]) <= _BOUNDARY_EPSILON_SECONDS:
+            last -= 1
+
+        if last <= first:
             raise ValueError(f"Chunk {chunk_index} has no render segments")
-        if abs(chunk_segments[0]["timeline_start"] - chunk_start) > _BOUNDARY_EPSILON_SECONDS:
+        if abs(max(chunk_start, float(starts[first])) - chunk_start) > _BOUNDARY_EPSILON_SECONDS:
             raise ValueError(f"Chunk {chunk_index} does not start at its declared boundary")
-        if abs(chunk_segments[-1]["timeline_end"] - chunk_end) > _BOUNDARY_EPSILON_SECONDS:
+        if abs(min(chunk_end, float(ends[last - 1])) - chunk_end) > _BOUNDARY_EPSILON_SECONDS:
             raise ValueError(f"Chunk {chunk_index} does not end at its declared boundary")
 
         chunks.append(
@@ -271,13 +280,73 @@ def partition_multicam_render_segments(
                 "start": chunk_start,
                 "end": chunk_end,
                 "duration": chunk_end - chunk_start,
-                "segments": chunk_segments,
+                "rows": table[first:last],
             }
         )
 
     return chunks
 
 
+def materialize_multicam_chunk(
+    chunk: Mapping[str, Any],
+    *,
+    source_range_resolver: Optional[SourceRangeResolver] = None,
+    copy_values: bool = True,
+) -> dict:
+    """Return ``chunk`` with its table rows rebuilt as clipped segment dicts.
+
+    This is the JSON boundary of the table plan: the dicts carry every key of
+    the original segments unchanged apart from the clipped timeline and source
+    ranges.  With ``copy_values`` the pieces are deep-copied so they share
+    nothing with the caller's plan; without it nested values are shared, which
+    suits read-only uses such as fingerprints and plan JSON.
+    """
+
+    chunk_start = chunk["start"]
+    chunk_end = chunk["end"]
+    pieces = []
+    for segment in chunk["rows"].to_segments():
+        piece = copy.deepcopy(segment) if copy_values else dict(segment)
+        pieces.append(
+            _clip_piece(
+                piece,
+                segment,
+                max(chunk_start, segment["timeline_start"]),
+                min(chunk_end, segment["timeline_end"]),
+                source_range_resolver,
+            )
+        )
+    record = {key: value for key, value in chunk.items() if key != "rows"}
+    record["segments"] = pieces
+    return record
+
+
+def partition_multicam_render_segments(
+    segments: Sequence[Mapping[str, Any]],
+    target_chunk_duration: float = 300.0,
+    *,
+    source_range_resolver: Optional[SourceRangeResolver] = None,
+) -> list:
+    """Split contiguous render segments into deterministic timeline chunks.
+
+    Segment timeline values and chunk start/end values remain on the caller's
+    original timeline.  A segment crossing a chunk boundary is copied and
+    clipped on both sides of that boundary.  All unrelated director/layout
+    metadata is deep-copied unchanged.
+
+    ``source_range_resolver`` is called as ``(camera_id, timeline_start,
+    duration)`` for both the primary and secondary camera on every emitted
+    segment piece.  Without it, existing primary and secondary source ranges
+    are sliced proportionally; this fallback is intended for pure planning and
+    tests rather than production continuous-sync mapping.
+    """
+
+    return [
+        materialize_multicam_chunk(chunk, source_range_resolver=source_range_resolver)
+        for chunk in partition_multicam_segment_table(segments, target_chunk_duration)
+    ]
+
+
 def _canonical_fingerprint_value(value: Any) -> Any:
     if isinstance(value, Mapping):
         return {
@@ -338,6 +407,207 @@ def build_multicam_chunk_plan(
     }
 
 
+def multicam_chunk_fingerprints(
+    chunks: Sequence[Mapping[str, Any]],
+    context: Optional[Mapping[str, Any]] = None,
+) -> list:
+    """Return one stable fingerprint per chunk.
+
+    Unlike the whole-plan fingerprint, a chunk's fingerprint only changes when
+    that chunk's own segments (or the shared render ``context``) change, so a
+    partial re-plan leaves the fingerprints of untouched chunks intact.
+    """
+
+    shared_context = dict(context or {})
+    return [
+        multicam_chunk_plan_fingerprint([{"context": shared_context, "chunk": chunk}])
+        for chunk in chunks or []
+    ]
+
+
+def multicam_replan_window(
+    plan_start: float,
+    plan_end: float,
+    changed_start: float,
+    changed_end: float,
+    target_chunk_duration: float = 300.0,
+    *,
+    margin_seconds: float = 0.0,
+) -> dict:
+    """Snap a changed timeline range outward to whole chunk boundaries.
+
+    The grid matches :func:`partition_multicam_render_segments`, so every
+    chunk outside the returned window keeps exactly its previous segments.
+    ``margin_seconds`` widens the changed range first to leave the director
+    room to settle holds and handoffs around the edit.
+    """
+
+    chunk_duration = _finite_float(target_chunk_duration, "target_chunk_duration")
+    if chunk_duration <= 0.0:
+        raise ValueError("target_chunk_duration must be greater than zero")
+    plan_start = _finite_float(plan_start, "plan_start")
+    plan_end = _finite_float(plan_end, "plan_end")
+    if plan_end <= plan_start:
+        raise ValueError("plan_end must be after plan_start")
+    margin = max(0.0, _finite_float(margin_seconds, "margin_seconds"))
+    low = _finite_float(changed_start, "changed_start")
+    high = _finite_float(changed_end, "changed_end")
+    if high < low:
+        low, high = high, low
+    low = min(plan_end, max(plan_start, low - margin))
+    high = min(plan_end, max(plan_start, high + margin))
+
+    chunk_count = _chunk_grid(plan_start, plan_end, chunk_duration)
+    first = min(chunk_count - 1, int(math.floor((low - plan_start) / chunk_duration)))
+    last = min(
+        chunk_count - 1,
+        max(first, int(math.ceil((high - plan_start) / chunk_duration - _BOUNDARY_EPSILON_SECONDS)) - 1),
+    )
+    return {
+        "start": plan_start + (first * chunk_duration),
+        "end": min(plan_end, plan_start + ((last + 1) * chunk_duration)),
+        "chunk_indexes": list(range(first, last + 1)),
+    }
+
+
+def _clipped_pieces(segments: Sequence[dict], start: float, end: float) -> list:
+    pieces = []
+    for segment in segments:
+        segment_start = segment["timeline_start"]
+        segment_end = segment["timeline_end"]
+        piece_start = max(start, segment_start)
+        piece_end = min(end, segment_end)
+        if piece_end - piece_start <= _BOUNDARY_EPSILON_SECONDS:
+            continue
+        if piece_start == segment_start and piece_end == segment_end:
+            pieces.append(copy.deepcopy(segment))
+        else:
+            pieces.append(_split_segment(segment, piece_start, piece_end, None))
+    return pieces
+
+
+def splice_multicam_replanned_segments(
+    previous_segments: Sequence[Mapping[str, Any]],
+    replanned_segments: Sequence[Mapping[str, Any]],
+    window_start: float,
+    window_end: float,
+) -> list:
+    """Keep the previous plan outside ``[window_start, window_end)``.
+
+    Segments crossing a window edge are clipped on that edge with their source
+    ranges sliced proportionally.  Both plans must be contiguous and cover the
+    same timeline.
+    """
+
+    previous = _validated_segments(previous_segments)
+    replanned = _validated_segments(replanned_segments)
+    if not previous or not replanned:
+        raise ValueError("Both plans need at least one segment to splice")
+    if (
+        abs(previous[0]["timeline_start"] - replanned[0]["timeline_start"]) > _CONTIGUITY_TOLERANCE_SECONDS
+        or abs(previous[-1]["timeline_end"] - replanned[-1]["timeline_end"]) > _CONTIGUITY_TOLERANCE_SECONDS
+    ):
+        raise ValueError("Previous and replanned segments must cover the same timeline")
+    window_start = _finite_float(window_start, "window_start")
+    window_end = _finite_float(window_end, "window_end")
+    if window_end <= window_start:
+        raise ValueError("window_end must be after window_start")
+
+    plan_start = replanned[0]["timeline_start"]
+    plan_end = replanned[-1]["timeline_end"]
+    return (
+        _clipped_pieces(previous, plan_start, window_start)
+        + _clipped_pieces(replanned, window_start, window_end)
+        + _clipped_pieces(previous, window_end, plan_end)
+    )
+
+
+def _diff_signature(segment: Mapping[str, Any], timestamp: float) -> tuple:
+    source_position = None
+    if segment.get("source_start") is not None:
+        source_range = _proportional_source_range(segment, "source_start", "source_end", timestamp, timestamp)
+        if source_range is not None:
+            source_position = round(source_range[0], 3)
+    return (
+        segment.get("camera_id"),
+        segment.get("secondary_camera_id"),
+        segment.get("layout_mode"),
+        source_position,
+    )
+
+
+def diff_multicam_plans(
+    previous_segments: Sequence[Mapping[str, Any]],
+    current_segments: Sequence[Mapping[str, Any]],
+    target_chunk_duration: Optional[float] = None,
+) -> dict:
+    """Report where two contiguous plans put different pictures on screen.
+
+    Both plans are swept together over the union of their boundaries.  Two
+    pieces match when they show the same cameras in the same layout from the
+    same source position.  Adjacent differing pieces merge into one range;
+    with ``target_chunk_duration`` the chunks those ranges touch are listed.
+    """
+
+    previous = _validated_segments(previous_segments)
+    current = _validated_segments(current_segments)
+    boundaries = sorted(
+        {segment["timeline_start"] for segment in previous + current}
+        | {segment["timeline_end"] for segment in previous + current}
+    )
+    changed_ranges = []
+    previous_cursor = 0
+    current_cursor = 0
+    for start, end in zip(boundaries, boundaries[1:]):
+        if end - start <= _BOUNDARY_EPSILON_SECONDS:
+            continue
+        middle = (start + end) / 2.0
+        while previous_cursor < len(previous) and previous[previous_cursor]["timeline_end"] <= middle:
+            previous_cursor += 1
+        while current_cursor < len(current) and current[current_cursor]["timeline_end"] <= middle:
+            current_cursor += 1
+        before = previous[previous_cursor] if previous_cursor < len(previous) else None
+        after = current[current_cursor] if current_cursor < len(current) else None
+        if before is not None and before["timeline_start"] > middle:
+            before = None
+        if after is not None and after["timeline_start"] > middle:
+            after = None
+        if before is None and after is None:
+            continue
+        if (
+            before is not None
+            and after is not None
+            and _diff_signature(before, middle) == _diff_signature(after, middle)
+        ):
+            continue
+        if changed_ranges and abs(changed_ranges[-1]["end"] - start) <= _BOUNDARY_EPSILON_SECONDS:
+            changed_ranges[-1]["end"] = end
+        else:
+            changed_ranges.append({"start": start, "end": end})
+
+    receipt = {
+        "previous_segment_count": len(previous),
+        "segment_count": len(current),
+        "changed_ranges": changed_ranges,
+        "changed_seconds": sum(item["end"] - item["start"] for item in changed_ranges),
+    }
+    if target_chunk_duration is not None and current:
+        plan_start = current[0]["timeline_start"]
+        plan_end = current[-1]["timeline_end"]
+        indexes = set()
+        for item in changed_ranges:
+            window = multicam_replan_window(
+                plan_start,
+                plan_end,
+                item["start"],
+                item["end"],
+                target_chunk_duration,
+            )
+            indexes.update(window["chunk_indexes"])
+        receipt["changed_chunk_indexes"] = sorted(indexes)
+    return receipt
+
+
 def multicam_chunk_checkpoint_paths(
     temp_root: Union[str, os.PathLike],
     job_id: str,
@@ -378,7 +648,13 @@ def multicam_chunk_checkpoint_paths(
 __all__ = [
     "SourceRangeResolver",
     "build_multicam_chunk_plan",
+    "diff_multicam_plans",
     "multicam_chunk_checkpoint_paths",
+    "multicam_chunk_fingerprints",
     "multicam_chunk_plan_fingerprint",
+    "materialize_multicam_chunk",
+    "multicam_replan_window",
     "partition_multicam_render_segments",
+    "partition_multicam_segment_table",
+    "splice_multicam_replanned_segments",
 ]
@@ -0,0 +1,230 @@
+"""Dead-footage prepass for multicamera sources.
+
+Before the director scores cameras window by window, each camera is run once
+through ffmpeg's ``blackdetect``, ``freezedetect`` and ``signalstats`` filters
+at a few frames per second and a thumbnail-sized resolution.  The filter log
+is parsed into interval lists on the camera's own (source) timeline:
+
+``black_intervals``
+    Runs of black frames (lens cap, camera not yet recording, fade-outs).
+``frozen_intervals``
+    Runs of bit-identical frames (stalled recorder, dropped HDMI feed).
+``placeholder_intervals``
+    Flat, near-uniform frames that are not black (blue "no signal" cards,
+    solid slates).
+
+``dead_intervals`` is their union.  The prepass is ffmpeg-only and imports
+nothing from the worker, so it can run inside the camera-analysis process
+pool next to the visual window analysis.
+"""
+
+import logging
+import os
+import re
+import subprocess
+import time
+
+
+logger = logging.getLogger("MediaWorker")
+
+MULTICAM_FOOTAGE_PREPASS_FPS = 4.0
+MULTICAM_FOOTAGE_PREPASS_WIDTH = 160
+MULTICAM_FOOTAGE_BLACK_MIN_SECONDS = 0.5
+MULTICAM_FOOTAGE_BLACK_PIXEL_THRESHOLD = 0.10
+MULTICAM_FOOTAGE_FREEZE_NOISE = "-60dB"
+MULTICAM_FOOTAGE_FREEZE_MIN_SECONDS = 2.0
+MULTICAM_FOOTAGE_PLACEHOLDER_MIN_SECONDS = 1.0
+MULTICAM_FOOTAGE_FLAT_LUMA_RANGE = 12.0
+MULTICAM_FOOTAGE_DARK_LUMA = 32.0
+
+_PTS_TIME_PATTERN = re.compile(r"pts_time:\s*(-?[0-9.]+)")
+_BLACK_PATTERN = re.compile(r"black_start:\s*(-?[0-9.]+)\s+black_end:\s*(-?[0-9.]+)")
+_FREEZE_START_PATTERN = re.compile(r"lavfi\.freezedetect\.freeze_start=\s*(-?[0-9.]+)")
+_FREEZE_END_PATTERN = re.compile(r"lavfi\.freezedetect\.freeze_end=\s*(-?[0-9.]+)")
+_SIGNALSTATS_PATTERN = re.compile(r"lavfi\.signalstats\.(YLOW|YHIGH|YAVG)=\s*(-?[0-9.]+)")
+
+
+def merge_footage_intervals(*interval_lists, gap_seconds=0.0):
+    intervals = sorted(
+        (float(start), float(end))
+        for interval_list in interval_lists
+        for start, end in interval_list or []
+        if float(end) > float(start)
+    )
+    merged = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1] + gap_seconds:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(round(start, 3), round(end, 3)) for start, end in merged]
+
+
+def footage_interval_coverage(intervals, start_time, end_time):
+    """Fraction of ``[start_time, end_time)`` covered by sorted ``intervals``."""
+    span = float(end_time) - float(start_time)
+    if span <= 0.0:
+        return 0.0
+    covered = 0.0
+    for interval_start, interval_end in intervals or []:
+        if interval_end <= start_time:
+            continue
+        if interval_start >= end_time:
+            break
+        covered += min(end_time, interval_end) - max(start_time, interval_start)
+    return max(0.0, min(1.0, covered / span))
+
+
+def build_multicam_footage_prepass_command(
+    video_path,
+    start_time=0.0,
+    duration=None,
+    fps=MULTICAM_FOOTAGE_PREPASS_FPS,
+    width=MULTICAM_FOOTAGE_PREPASS_WIDTH,
+):
+    filters = ",".join(
+        [
+            f"fps={float(fps):.3f}",
+            f"scale={int(width)}:-2:flags=area",
+            (
+                f"blackdetect=d={MULTICAM_FOOTAGE_BLACK_MIN_SECONDS}"
+                f":pix_th={MULTICAM_FOOTAGE_BLACK_PIXEL_THRESHOLD}"
+            ),
+            f"freezedetect=n={MULTICAM_FOOTAGE_FREEZE_NOISE}:d={MULTICAM_FOOTAGE_FREEZE_MIN_SECONDS}",
+            "signalstats",
+            "metadata=mode=print",
+        ]
+    )
+    cmd = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "info"]
+    if float(start_time or 0.0) > 0.0:
+        cmd.extend(["-ss", f"{float(start_time):.3f}"])
+    if duration is not None and float(duration) > 0.0:
+        cmd.extend(["-t", f"{float(duration):.3f}"])
+    cmd.extend(["-i", video_path, "-map", "0:v:0", "-an", "-vf", filters, "-f", "null", "-"])
+    return cmd
+
+
+def _close_runs(flags, frame_times, frame_interval, min_seconds):
+    intervals = []
+    run_start = None
+    for flagged, frame_time in zip(flags, frame_times):
+        if flagged and run_start is None:
+            run_start = frame_time
+        elif not flagged and run_start is not None:
+            if frame_time - run_start >= min_seconds:
+                intervals.append((run_start, frame_time))
+            run_start = None
+    if run_start is not None and frame_times:
+        run_end = frame_times[-1] + frame_interval
+        if run_end - run_start >= min_seconds:
+            intervals.append((run_start, run_end))
+    return intervals
+
+
+def parse_multicam_footage_prepass_log(
+    log_text,
+    start_time=0.0,
+    end_time=None,
+    fps=MULTICAM_FOOTAGE_PREPASS_FPS,
+):
+    """Parse the prepass filter log into source-timeline interval lists.
+
+    ffmpeg reports times relative to the ``-ss`` seek point; ``start_time`` is
+    added back so intervals line up with the camera file.
+    """
+    frame_interval = 1.0 / max(0.1, float(fps))
+    black_intervals = []
+    frozen_intervals = []
+    open_freeze_start = None
+    frame_times = []
+    frame_stats = []
+    current_stats = None
+
+    for line in (log_text or "").splitlines():
+        pts_match = _PTS_TIME_PATTERN.search(line)
+        if pts_match:
+            current_stats = {}
+            frame_times.append(float(pts_match.group(1)))
+            frame_stats.append(current_stats)
+            continue
+        stats_match = _SIGNALSTATS_PATTERN.search(line)
+        if stats_match and current_stats is not None:
+            current_stats[stats_match.group(1)] = float(stats_match.group(2))
+            continue
+        black_match = _BLACK_PATTERN.search(line)
+        if black_match:
+            black_intervals.append((float(black_match.group(1)), float(black_match.group(2))))
+            continue
+        freeze_start_match = _FREEZE_START_PATTERN.search(line)
+        if freeze_start_match:
+            open_freeze_start = float(freeze_start_match.group(1))
+            continue
+        freeze_end_match = _FREEZE_END_PATTERN.search(line)
+        if freeze_end_match and open_freeze_start is not None:
+            frozen_intervals.append((open_freeze_start, float(freeze_end_match.group(1))))
+            open_freeze_start = None
+
+    relative_end = (frame_times[-1] + frame_interval) if frame_times else 0.0
+    if end_time is not None:
+        relative_end = max(relative_end, float(end_time) - float(start_time or 0.0))
+    if open_freeze_start is not None and relative_end > open_freeze_start:
+        # freezedetect only reports the end of a freeze once motion resumes.
+        frozen_intervals.append((open_freeze_start, relative_end))
+
+    placeholder_flags = []
+    for stats in frame_stats:
+        luma_low = stats.get("YLOW")
+        luma_high = stats.get("YHIGH")
+        luma_average = stats.get("YAVG", 0.0)
+        placeholder_flags.append(
+            luma_low is not None
+            and luma_high is not None
+            and luma_average > MULTICAM_FOOTAGE_DARK_LUMA
+            and (luma_high - luma_low) <= MULTICAM_FOOTAGE_FLAT_LUMA_RANGE
+        )
+    placeholder_intervals = _close_runs(
+        placeholder_flags,
+        frame_times,
+        frame_interval,
+        MULTICAM_FOOTAGE_PLACEHOLDER_MIN_SECONDS,
+    )
+
+    offset = float(start_time or 0.0)
+
+    def to_source(intervals):
+        return merge_footage_intervals([(start + offset, end + offset) for start, end in intervals])
+
+    black_intervals = to_source(black_intervals)
+    frozen_intervals = to_source(frozen_intervals)
+    placeholder_intervals = to_source(placeholder_intervals)
+    return {
+        "black_intervals": black_intervals,
+        "frozen_intervals": frozen_intervals,
+        "placeholder_intervals": placeholder_intervals,
+        "dead_intervals": merge_footage_intervals(black_intervals, frozen_intervals, placeholder_intervals),
+        "frame_count": len(frame_times),
+    }
+
+
+def analyze_multicam_footage_prepass(video_path, start_time=0.0, duration=None):
+    """Run the blackdetect/freezedetect/signalstats prepass over one camera."""
+    started_at = time.perf_counter()
+    cmd = build_multicam_footage_prepass_command(video_path, start_time=start_time, duration=duration)
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, errors="ignore")
+    if result.returncode != 0:
+        raise RuntimeError(f"footage prepass failed for {os.path.basename(str(video_path))}: {result.stderr[-400:]}")
+    end_time = None
+    if duration is not None:
+        end_time = float(start_time or 0.0) + float(duration)
+    receipt = parse_multicam_footage_prepass_log(result.stderr, start_time=start_time, end_time=end_time)
+    dead_seconds = sum(end - start for start, end in receipt["dead_intervals"])
+    receipt.update(
+        {
+            "status": "active",
+            "window_start": round(float(start_time or 0.0), 6),
+            "window_duration": round(float(duration), 6) if duration is not None else None,
+            "dead_seconds": round(dead_seconds, 3),
+            "elapsed_seconds": round(time.perf_counter() - started_at, 3),
+        }
+    )
+    return receipt
@@ -18,6 +18,7 @@ _RUNNER_PROCESS_STARTED_AT = datetime.datetime.now(datetime.timezone.utc)
 import requests
 
 import main_media_server as worker
+from resource_scheduler import read_cgroup_resource_allocation, read_cgroup_usage
 
 
 def _error_text(error):
@@ -51,54 +52,12 @@ def _task_retry_context():
 
 def _read_cloud_run_resource_allocation():
     """Read the actual task cgroup limits for durable cost telemetry."""
-    allocated_vcpu = float(os.cpu_count() or 1)
-    memory_limit_bytes = None
-    try:
-        with open("/sys/fs/cgroup/cpu.max", "r", encoding="utf-8") as cpu_file:
-            quota_text, period_text = cpu_file.read().strip().split()[:2]
-        if quota_text != "max":
-            allocated_vcpu = max(0.001, float(quota_text) / max(1.0, float(period_text)))
-    except Exception:
-        pass
-    try:
-        with open("/sys/fs/cgroup/memory.max", "r", encoding="utf-8") as memory_file:
-            memory_text = memory_file.read().strip()
-        if memory_text != "max":
-            memory_limit_bytes = max(0, int(memory_text))
-    except Exception:
-        pass
-    return round(allocated_vcpu, 3), memory_limit_bytes
+    return read_cgroup_resource_allocation()
 
 
 def _read_cloud_run_actual_usage():
     """Read metered cgroup CPU use and peak resident memory for right-sizing."""
-    cpu_usage_seconds = None
-    memory_current_bytes = None
-    memory_peak_bytes = None
-    try:
-        with open("/sys/fs/cgroup/cpu.stat", "r", encoding="utf-8") as cpu_file:
-            cpu_stats = dict(
-                line.split(None, 1)
-                for line in cpu_file.read().splitlines()
-                if len(line.split(None, 1)) == 2
-            )
-        cpu_usage_seconds = float(cpu_stats.get("usage_usec", 0.0)) / 1_000_000.0
-    except Exception:
-        pass
-    for path, target in (
-        ("/sys/fs/cgroup/memory.current", "current"),
-        ("/sys/fs/cgroup/memory.peak", "peak"),
-    ):
-        try:
-            with open(path, "r", encoding="utf-8") as memory_file:
-                value = int(memory_file.read().strip())
-            if target == "current":
-                memory_current_bytes = value
-            else:
-                memory_peak_bytes = value
-        except Exception:
-            pass
-    return cpu_usage_seconds, memory_current_bytes, memory_peak_bytes
+    return read_cgroup_usage()
 
 
 def _datetime_value(value):
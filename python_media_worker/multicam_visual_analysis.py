@@ -0,0 +1,880 @@
+"""CPU-bound per-camera visual analysis for multicamera renders.
+
+This module deliberately imports only OpenCV, NumPy and the stdlib-only
+resource scheduler so process-pool workers can load it without pulling in
+the FastAPI app, Firebase, or Whisper.  Camera analyses are dispatched to a shared ``ProcessPoolExecutor`` whose workers cap
+OpenCV's own thread pool, so several cameras analyze side by side instead of
+contending for the GIL and for OpenCV threads inside the event-loop process.
+Window scores cross the process boundary as compact NumPy arrays and are
+expanded into the director's dict form in the parent.
+"""
+
+import asyncio
+import functools
+import logging
+import math
+import multiprocessing
+import os
+import pickle
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import cv2
+import numpy as np
+
+try:
+    from .resource_scheduler import effective_cpu_count, shared_scheduler
+except ImportError:
+    from resource_scheduler import effective_cpu_count, shared_scheduler
+
+
+logger = logging.getLogger("MediaWorker")
+
+
+def clamp_float(value, minimum, maximum):
+    try:
+        numeric_value = float(value)
+    except Exception:
+        numeric_value = minimum
+    return max(minimum, min(maximum, numeric_value))
+
+
+def combine_multicam_filter_chains(*chains):
+    parts = []
+    for chain in chains:
+        safe_chain = str(chain or "").strip().strip(",")
+        if safe_chain:
+            parts.append(safe_chain)
+    return ",".join(parts)
+
+
+multicam_face_detector = None
+
+def get_multicam_face_detector():
+    global multicam_face_detector
+    if multicam_face_detector is not None:
+        return multicam_face_detector
+
+    cascade_path = os.path.join(cv2.data.haarcascades, "haarcascade_frontalface_default.xml")
+    if not os.path.exists(cascade_path):
+        multicam_face_detector = None
+        return None
+
+    detector = cv2.CascadeClassifier(cascade_path)
+    multicam_face_detector = detector if not detector.empty() else None
+    return multicam_face_detector
+
+
+def estimate_multicam_placeholder_penalty(frame):
+    if frame is None or getattr(frame, "size", 0) == 0:
+        return 0.0
+
+    try:
+        preview = cv2.resize(frame, (96, 54), interpolation=cv2.INTER_AREA)
+        preview_float = preview.astype(np.float32)
+        hsv = cv2.cvtColor(preview, cv2.COLOR_BGR2HSV)
+
+        column_texture = np.mean(np.std(preview_float, axis=0))
+        column_means = np.mean(preview_float, axis=0)
+        column_deltas = np.linalg.norm(np.diff(column_means, axis=0), axis=1)
+        adjacent_delta = float(np.percentile(column_deltas, 88)) if column_deltas.size else 0.0
+        low_texture_ratio = float(np.mean(np.std(preview_float, axis=0) < 14.0))
+        saturation_mean = float(np.mean(hsv[:, :, 1]))
+        gray = cv2.cvtColor(preview, cv2.COLOR_BGR2GRAY)
+        vertical_edges = float(np.mean(np.abs(cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=3))))
+        horizontal_edges = float(np.mean(np.abs(cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=3))))
+        vertical_dominance = vertical_edges / max(1.0, horizontal_edges)
+
+        saturated_pixels = hsv[:, :, 1] > 92
+        hue_bins = 0
+        if np.any(saturated_pixels):
+            hue_bins = len(np.unique((hsv[:, :, 0][saturated_pixels] / 15).astype(np.int32)))
+
+        if saturation_mean > 140.0 and vertical_dominance > 1.8 and adjacent_delta > 20.0:
+            return round(clamp_float(0.46 + ((vertical_dominance - 1.8) * 0.08), 0.0, 0.72), 4)
+
+        if saturation_mean < 65.0 or low_texture_ratio < 0.58 or hue_bins < 4:
+            return 0.0
+
+        stripe_score = clamp_float(((16.0 - column_texture) / 16.0), 0.0, 1.0)
+        band_transition_score = clamp_float((adjacent_delta - 18.0) / 44.0, 0.0, 1.0)
+        palette_score = 1.0 if 5 <= hue_bins <= 10 else 0.35
+        vertical_pattern_score = clamp_float((vertical_dominance - 1.4) / 1.3, 0.0, 1.0)
+
+        return round(
+            clamp_float(
+                (stripe_score * 0.28)
+                + (band_transition_score * 0.16)
+                + (low_texture_ratio * 0.14)
+                + (palette_score * 0.12)
+                + (vertical_pattern_score * 0.3),
+                0.0,
+                0.72,
+            ),
+            4,
+        )
+    except Exception:
+        return 0.0
+
+
+
+MULTICAM_VISUAL_WINDOW_TIME_FIELDS = ("start_time", "end_time", "sample_time")
+MULTICAM_VISUAL_WINDOW_SCORE_FIELDS = (
+    "face_score",
+    "motion_score",
+    "lower_face_motion",
+    "upper_body_motion",
+    "visual_speaking_score",
+    "visual_speaking_confidence",
+    "face_area_ratio",
+    "face_center_x",
+    "placeholder_penalty",
+    "face_count",
+)
+
+
+def _empty_multicam_visual_window_arrays():
+    return (
+        np.zeros((0, len(MULTICAM_VISUAL_WINDOW_TIME_FIELDS)), dtype=np.float64),
+        np.zeros((0, len(MULTICAM_VISUAL_WINDOW_SCORE_FIELDS)), dtype=np.float32),
+    )
+
+
+def analyze_multicam_visual_window_arrays(video_path, source_offset, overlap_start, overlap_duration, interval_seconds):
+    """Score one camera and return ``(times, scores)`` arrays.
+
+    ``times`` is float64 ``[windows, 3]`` so multi-hour timestamps keep their
+    millisecond precision; ``scores`` is float32 ``[windows, 10]`` in
+    ``MULTICAM_VISUAL_WINDOW_SCORE_FIELDS`` order, with a missing face center
+    stored as NaN.  This is the process-pool entry point: two small buffers
+    pickle far cheaper than thousands of per-window dicts.
+    """
+    safe_duration = max(0.0, float(overlap_duration or 0.0))
+    if safe_duration <= 0.0:
+        return _empty_multicam_visual_window_arrays()
+
+    capture = cv2.VideoCapture(video_path)
+    if not capture.isOpened():
+        return _empty_multicam_visual_window_arrays()
+
+    detector = get_multicam_face_detector()
+    time_rows = []
+    score_rows = []
+    previous_gray = None
+    current_start = 0.0
+    step = clamp_float(interval_seconds, 0.75, 10.0)
+
+    try:
+        def _roi_motion(gray_frame, prev_gray_frame, roi):
+            if prev_gray_frame is None or prev_gray_frame.shape != gray_frame.shape:
+                return 0.0
+            x1, y1, x2, y2 = roi
+            h, w = gray_frame.shape[:2]
+            x1 = int(clamp_float(x1, 0, max(0, w - 1)))
+            x2 = int(clamp_float(x2, x1 + 1, w))
+            y1 = int(clamp_float(y1, 0, max(0, h - 1)))
+            y2 = int(clamp_float(y2, y1 + 1, h))
+            if x2 <= x1 or y2 <= y1:
+                return 0.0
+            current_crop = gray_frame[y1:y2, x1:x2]
+            previous_crop = prev_gray_frame[y1:y2, x1:x2]
+            if current_crop.size == 0 or previous_crop.size == 0:
+                return 0.0
+            return clamp_float(float(np.mean(cv2.absdiff(current_crop, previous_crop))) / 28.0, 0.0, 1.0)
+
+        while current_start < safe_duration - 0.001:
+            current_end = min(safe_duration, current_start + step)
+            midpoint = current_start + ((current_end - current_start) / 2.0)
+            relative_time = float(overlap_start or 0.0) + midpoint - float(source_offset or 0.0)
+            capture.set(cv2.CAP_PROP_POS_MSEC, max(0.0, relative_time) * 1000.0)
+            success, frame = capture.read()
+
+            face_score = 0.0
+            motion_score = 0.0
+            face_count = 0
+            placeholder_penalty = 0.0
+            lower_face_motion = 0.0
+            upper_body_motion = 0.0
+            visual_speaking_score = 0.0
+            visual_speaking_confidence = 0.0
+            face_area_ratio = 0.0
+            face_center_x = None
+            if success and frame is not None:
+                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                placeholder_penalty = estimate_multicam_placeholder_penalty(frame)
+                primary_face = None
+                if detector is not None:
+                    min_face = max(24, min(gray.shape[0], gray.shape[1]) // 7)
+                    faces = detector.detectMultiScale(
+                        gray,
+                        scaleFactor=1.1,
+                        minNeighbors=4,
+                        minSize=(min_face, min_face),
+                    )
+                    face_count = len(faces)
+                    if face_count:
+                        frame_area = float(gray.shape[0] * gray.shape[1]) or 1.0
+                        face_area = sum(w * h for (_, _, w, h) in faces)
+                        face_area_ratio = clamp_float(face_area / frame_area, 0.0, 1.0)
+                        face_score = min(1.0, (face_count * 0.22) + ((face_area / frame_area) * 8.0))
+                        primary_face = max(faces, key=lambda item: item[2] * item[3])
+                        px, _py, pw, _ph = [float(v) for v in primary_face]
+                        face_center_x = clamp_float((px + (pw / 2.0)) / max(1.0, float(gray.shape[1])), 0.0, 1.0)
+
+                if previous_gray is not None and previous_gray.shape == gray.shape:
+                    motion_delta = cv2.absdiff(gray, previous_gray)
+                    motion_score = min(1.0, float(np.mean(motion_delta)) / 28.0)
+                    height, width = gray.shape[:2]
+                    if primary_face is not None:
+                        x, y, w, h = [int(v) for v in primary_face]
+                        lower_face_motion = _roi_motion(
+                            gray,
+                            previous_gray,
+                            (x + (w * 0.12), y + (h * 0.48), x + (w * 0.88), y + (h * 1.05)),
+                        )
+                        upper_body_motion = _roi_motion(
+                            gray,
+                            previous_gray,
+                            (x - (w * 0.35), y + (h * 0.45), x + (w * 1.35), y + (h * 2.35)),
+                        )
+                        visual_speaking_confidence = clamp_float(0.45 + (face_score * 0.45), 0.0, 1.0)
+                    else:
+                        # If the face detector misses a turned/partial face, use the speaker-safe center band
+                        # as a fallback instead of blindly trusting noisy camera audio.
+                        lower_face_motion = _roi_motion(
+                            gray,
+                            previous_gray,
+                            (width * 0.28, height * 0.18, width * 0.72, height * 0.68),
+                        )
+                        upper_body_motion = _roi_motion(
+                            gray,
+                            previous_gray,
+                            (width * 0.18, height * 0.30, width * 0.82, height * 0.90),
+                        )
+                        visual_speaking_confidence = 0.28 if upper_body_motion > 0.04 else 0.12
+
+                    visual_speaking_score = clamp_float(
+                        (lower_face_motion * 0.62)
+                        + (upper_body_motion * 0.26)
+                        + (motion_score * 0.12),
+                        0.0,
+                        1.0,
+                    )
+                previous_gray = gray
+
+            time_rows.append((current_start, current_end, midpoint))
+            score_rows.append(
+                (
+                    face_score,
+                    motion_score,
+                    lower_face_motion,
+                    upper_body_motion,
+                    visual_speaking_score,
+                    visual_speaking_confidence,
+                    face_area_ratio,
+                    face_center_x if face_center_x is not None else np.nan,
+                    placeholder_penalty,
+                    face_count,
+                )
+            )
+            current_start = current_end
+    finally:
+        capture.release()
+
+    if not time_rows:
+        return _empty_multicam_visual_window_arrays()
+    return (
+        np.asarray(time_rows, dtype=np.float64),
+        np.asarray(score_rows, dtype=np.float32),
+    )
+
+
+def multicam_visual_windows_from_arrays(times, scores):
+    """Expand ``analyze_multicam_visual_window_arrays`` output into window dicts."""
+    windows = []
+    for time_row, score_row in zip(np.asarray(times).tolist(), np.asarray(scores).tolist()):
+        window = {
+            name: round(float(value), 3)
+            for name, value in zip(MULTICAM_VISUAL_WINDOW_TIME_FIELDS, time_row)
+        }
+        for name, value in zip(MULTICAM_VISUAL_WINDOW_SCORE_FIELDS, score_row):
+            if name == "face_count":
+                window[name] = int(round(value))
+            elif name == "face_center_x" and not np.isfinite(value):
+                window[name] = None
+            else:
+                window[name] = round(float(value), 4)
+        windows.append(window)
+    return windows
+
+
+def analyze_multicam_visual_windows(video_path, source_offset, overlap_start, overlap_duration, interval_seconds):
+    times, scores = analyze_multicam_visual_window_arrays(
+        video_path,
+        source_offset,
+        overlap_start,
+        overlap_duration,
+        interval_seconds,
+    )
+    return multicam_visual_windows_from_arrays(times, scores)
+
+
+MULTICAM_COLOR_LUMA_BINS = 256
+MULTICAM_COLOR_FACE_LUMA_BINS = 1024
+_LUMA_WEIGHTS = np.asarray((0.2126, 0.7152, 0.0722), dtype=np.float32)
+
+
+def multicam_histogram_percentile(histogram, percentile, value_range=(0.0, 256.0)):
+    """Linear-interpolated percentile of values summarized by ``histogram``.
+
+    Bins are equal-width over ``value_range``; values inside a bin are treated
+    as uniformly spread, so the error is bounded by one bin width.
+    """
+    counts = np.asarray(histogram, dtype=np.float64)
+    total = float(counts.sum())
+    if total <= 0.0:
+        return 0.0
+    low, high = float(value_range[0]), float(value_range[1])
+    bin_width = (high - low) / float(len(counts))
+    target = clamp_float(percentile, 0.0, 100.0) / 100.0 * total
+    cumulative = np.cumsum(counts)
+    index = int(np.searchsorted(cumulative, target, side="left"))
+    index = min(index, len(counts) - 1)
+    previous = float(cumulative[index - 1]) if index > 0 else 0.0
+    within = (target - previous) / counts[index] if counts[index] > 0 else 0.0
+    return low + (index + clamp_float(within, 0.0, 1.0)) * bin_width
+
+
+def _load_multicam_color_face_detectors():
+    detector_specs = [
+        ("frontal_default", "haarcascade_frontalface_default.xml", False),
+        ("frontal_alt2", "haarcascade_frontalface_alt2.xml", False),
+        ("profile", "haarcascade_profileface.xml", False),
+        ("profile_mirrored", "haarcascade_profileface.xml", True),
+    ]
+    face_detectors = []
+    for method, filename, mirrored in detector_specs:
+        detector_path = os.path.join(cv2.data.haarcascades, filename)
+        detector = cv2.CascadeClassifier(detector_path)
+        if not detector.empty():
+            face_detectors.append((method, detector, mirrored))
+    return face_detectors
+
+
+def _sample_multicam_face_exposure_pixels(frame, face_detectors, width, height):
+    """Return ``(kind, rgb_pixels, method)`` for one frame's exposure subject.
+
+    ``kind`` is ``"haar_face"``, ``"skin_subject"`` or ``None`` when neither a
+    face nor a plausible skin region was found.
+    """
+    frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+    gray = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY)
+    equalized_gray = cv2.equalizeHist(gray)
+    detection_candidates = []
+    for method, detector, mirrored in face_detectors:
+        detector_input = cv2.flip(equalized_gray, 1) if mirrored else equalized_gray
+        detections = detector.detectMultiScale(
+            detector_input,
+            scaleFactor=1.07,
+            minNeighbors=3,
+            minSize=(24, 24),
+            maxSize=(int(width * 0.48), int(height * 0.86)),
+        )
+        for x, y, face_width, face_height in detections:
+            mapped_x = width - int(x) - int(face_width) if mirrored else int(x)
+            detection_candidates.append(
+                (
+                    int(face_width) * int(face_height),
+                    mapped_x,
+                    int(y),
+                    int(face_width),
+                    int(face_height),
+                    method,
+                )
+            )
+
+    if detection_candidates:
+        _area, x, y, face_width, face_height, method = max(detection_candidates)
+        inset_x = max(1, int(face_width * 0.10))
+        inset_y = max(1, int(face_height * 0.10))
+        face_rgb = frame[
+            y + inset_y : y + face_height - inset_y,
+            x + inset_x : x + face_width - inset_x,
+        ].reshape((-1, 3))
+        if face_rgb.size > 0:
+            return "haar_face", face_rgb, method
+
+    # Cascades can still miss dark skin, side profiles, hats, or a
+    # container image whose Haar data is incomplete. Use a bounded
+    # upper-frame skin-region estimate for exposure only; record it as
+    # a subject fallback instead of pretending it was a face detection.
+    ycrcb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2YCrCb)
+    skin_mask = cv2.inRange(
+        ycrcb,
+        np.array([20, 122, 68], dtype=np.uint8),
+        np.array([245, 188, 142], dtype=np.uint8),
+    )
+    skin_mask[int(height * 0.84) :, :] = 0
+    kernel = np.ones((3, 3), np.uint8)
+    skin_mask = cv2.morphologyEx(skin_mask, cv2.MORPH_OPEN, kernel)
+    skin_mask = cv2.morphologyEx(skin_mask, cv2.MORPH_CLOSE, kernel, iterations=2)
+    component_count, _labels, stats, centroids = cv2.connectedComponentsWithStats(
+        skin_mask,
+        connectivity=8,
+    )
+    fallback_candidates = []
+    frame_area = float(width * height)
+    for component_index in range(1, component_count):
+        x, y, region_width, region_height, region_area = [
+            int(value) for value in stats[component_index]
+        ]
+        if region_area < frame_area * 0.0015 or region_area > frame_area * 0.09:
+            continue
+        if region_width < 12 or region_height < 14:
+            continue
+        aspect = float(region_width) / max(1.0, float(region_height))
+        center_x, center_y = centroids[component_index]
+        if aspect < 0.38 or aspect > 1.85 or center_y > height * 0.72:
+            continue
+        edge_penalty = 0.65 if center_x < width * 0.04 or center_x > width * 0.96 else 1.0
+        upper_weight = 1.25 - min(0.65, float(center_y) / max(1.0, height))
+        fallback_candidates.append(
+            (region_area * edge_penalty * upper_weight, x, y, region_width, region_height)
+        )
+    if fallback_candidates:
+        _score, x, y, region_width, region_height = max(fallback_candidates)
+        # Tall skin components often include neck/arms. Keep the upper,
+        # face-sized portion so clothing and furniture cannot set skin exposure.
+        sampled_height = min(region_height, max(18, int(region_width * 1.30)))
+        pad_x = max(2, int(region_width * 0.10))
+        pad_y = max(2, int(sampled_height * 0.08))
+        x0 = max(0, x - pad_x)
+        x1 = min(width, x + region_width + pad_x)
+        y0 = max(0, y - pad_y)
+        y1 = min(height, y + sampled_height + pad_y)
+        subject_rgb = frame[y0:y1, x0:x1].reshape((-1, 3))
+        if subject_rgb.size > 0:
+            return "skin_subject", subject_rgb, None
+    return None, None, None
+
+
+class MulticamColorHistogramAccumulator:
+    """Constant-memory color statistics accumulated one frame at a time.
+
+    Global means and luma variance are kept as running float64 sums.  The
+    neutral-surface white point needs a luma floor that is itself a
+    percentile of the whole sample, so low-saturation pixels are binned into
+    per-luma channel histograms; once every frame has been seen the floor is
+    resolved and the qualifying luma rows are summed into channel histograms
+    for the medians.  Memory is a few megabytes regardless of duration.
+    """
+
+    def __init__(self):
+        self.pixel_count = 0
+        self.frame_count = 0
+        self.channel_sums = np.zeros(3, dtype=np.float64)
+        self.luma_sum = 0.0
+        self.luma_square_sum = 0.0
+        self.chroma_sum = 0.0
+        self.luma_histogram = np.zeros(MULTICAM_COLOR_LUMA_BINS, dtype=np.int64)
+        # [mask, luma_bin, channel, value]: mask 0 is the strict neutral
+        # candidate set, mask 1 the relaxed fallback set.
+        self.neutral_histograms = np.zeros((2, MULTICAM_COLOR_LUMA_BINS, 3, 256), dtype=np.int64)
+        self.face_luma_histograms = {
+            "haar_face": np.zeros(MULTICAM_COLOR_FACE_LUMA_BINS, dtype=np.int64),
+            "skin_subject": np.zeros(MULTICAM_COLOR_FACE_LUMA_BINS, dtype=np.int64),
+        }
+        self.face_luma_sums = {"haar_face": 0.0, "skin_subject": 0.0}
+
+    def add_frame(self, frame):
+        pixels = frame.reshape((-1, 3))
+        channels = pixels.astype(np.float32)
+        luma = channels @ _LUMA_WEIGHTS
+        red = channels[:, 0]
+        blue = channels[:, 2]
+        chroma = np.sqrt(((red - luma) ** 2) + ((blue - luma) ** 2))
+        max_channel = pixels.max(axis=1)
+        min_channel = pixels.min(axis=1)
+        saturation = (max_channel.astype(np.float32) - min_channel) / np.maximum(max_channel, 1).astype(np.float32)
+
+        self.pixel_count += int(pixels.shape[0])
+        self.frame_count += 1
+        self.channel_sums += channels.sum(axis=0, dtype=np.float64)
+        self.luma_sum += float(luma.sum(dtype=np.float64))
+        self.luma_square_sum += float(np.square(luma, dtype=np.float64).sum())
+        self.chroma_sum += float(chroma.sum(dtype=np.float64))
+
+        luma_bins = np.clip(luma.astype(np.int32), 0, MULTICAM_COLOR_LUMA_BINS - 1)
+        self.luma_histogram += np.bincount(luma_bins, minlength=MULTICAM_COLOR_LUMA_BINS)
+
+        candidate_masks = (
+            (saturation <= 0.28) & (max_channel < 252),
+            saturation <= 0.38,
+        )
+        flat_size = MULTICAM_COLOR_LUMA_BINS * 256
+        for mask_index, mask in enumerate(candidate_masks):
+            if not np.any(mask):
+                continue
+            masked_bins = luma_bins[mask] * 256
+            masked_pixels = pixels[mask]
+            for channel in range(3):
+                self.neutral_histograms[mask_index, :, channel, :] += np.bincount(
+                    masked_bins + masked_pixels[:, channel],
+                    minlength=flat_size,
+                ).reshape((MULTICAM_COLOR_LUMA_BINS, 256))
+
+    def add_face_pixels(self, kind, rgb_pixels):
+        face_luma = rgb_pixels.astype(np.float32) @ _LUMA_WEIGHTS
+        face_bins = np.clip(
+            (face_luma * (MULTICAM_COLOR_FACE_LUMA_BINS / 256.0)).astype(np.int32),
+            0,
+            MULTICAM_COLOR_FACE_LUMA_BINS - 1,
+        )
+        self.face_luma_histograms[kind] += np.bincount(face_bins, minlength=MULTICAM_COLOR_FACE_LUMA_BINS)
+        self.face_luma_sums[kind] += float(face_luma.sum(dtype=np.float64))
+
+    def luma_percentile(self, percentile):
+        return multicam_histogram_percentile(self.luma_histogram, percentile)
+
+    def neutral_channel_histograms(self, mask_index, luma_floor, luma_ceiling):
+        first_bin = int(np.clip(math.ceil(luma_floor), 0, MULTICAM_COLOR_LUMA_BINS))
+        last_bin = int(np.clip(math.floor(luma_ceiling), -1, MULTICAM_COLOR_LUMA_BINS - 1))
+        if last_bin < first_bin:
+            return np.zeros((3, 256), dtype=np.int64)
+        return self.neutral_histograms[mask_index, first_bin : last_bin + 1].sum(axis=0)
+
+    def profile(self, safe_start, safe_duration):
+        total = float(max(1, self.pixel_count))
+        mean_r, mean_g, mean_b = (self.channel_sums / total).tolist()
+        mean_luma = self.luma_sum / total
+        luma_variance = max(0.0, (self.luma_square_sum / total) - (mean_luma ** 2))
+        profile = {
+            "sample_start_seconds": round(safe_start, 3),
+            "sample_duration_seconds": round(safe_duration, 3),
+            "sample_frame_count": int(self.frame_count),
+            "mean_r": round(float(mean_r), 3),
+            "mean_g": round(float(mean_g), 3),
+            "mean_b": round(float(mean_b), 3),
+            "mean_luma": round(float(mean_luma), 3),
+            "contrast_luma": round(float(math.sqrt(luma_variance)), 3),
+            "mean_chroma": round(float(self.chroma_sum / total), 3),
+            "warmth": round(float((mean_r - mean_b) / 255.0), 5),
+            "green_bias": round(float((mean_g - ((mean_r + mean_b) / 2.0)) / 255.0), 5),
+        }
+
+        neutral_luma_floor = max(96.0, self.luma_percentile(55.0))
+        neutral_histograms = self.neutral_channel_histograms(0, neutral_luma_floor, 245.0)
+        neutral_count = float(neutral_histograms[0].sum())
+        if neutral_count / total < 0.015:
+            neutral_histograms = self.neutral_channel_histograms(
+                1,
+                max(88.0, self.luma_percentile(60.0)),
+                248.0,
+            )
+            neutral_count = float(neutral_histograms[0].sum())
+        if neutral_count > 0:
+            # Channel values are exact uint8 levels, so report the median
+            # level itself rather than an interpolated position inside it.
+            neutral_median = [
+                float(np.searchsorted(np.cumsum(neutral_histograms[channel]), neutral_count / 2.0, side="left"))
+                for channel in range(3)
+            ]
+            profile.update({
+                "neutral_sample_ratio": round(neutral_count / total, 5),
+                "neutral_median_r": round(neutral_median[0], 3),
+                "neutral_median_g": round(neutral_median[1], 3),
+                "neutral_median_b": round(neutral_median[2], 3),
+            })
+        return profile
+
+
+def analyze_multicam_color_profile(video_path, sample_start=0.0, sample_duration=90.0, pre_filter=""):
+    # Twelve 480x270 frames are still cheap, while retaining enough facial
+    # structure for profile/angled podcast guests. Production previously used
+    # one 320x180 frontal cascade; a zero-detection result silently reduced the
+    # promised face-aware grade to a whole-frame average.
+    #
+    # Frames are read from the ffmpeg pipe one at a time and folded into
+    # MulticamColorHistogramAccumulator, so memory stays flat no matter how
+    # long the sample window is.
+    width = 480
+    height = 270
+    frame_bytes = width * height * 3
+    safe_start = max(0.0, float(sample_start or 0.0))
+    safe_duration = max(1.0, float(sample_duration or 1.0))
+    analysis_filter = combine_multicam_filter_chains(
+        pre_filter,
+        f"fps=1/5,scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height},format=rgb24",
+    )
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-ss",
+        f"{safe_start:.3f}",
+        "-t",
+        f"{safe_duration:.3f}",
+        "-i",
+        video_path,
+        "-vf",
+        analysis_filter,
+        "-f",
+        "rawvideo",
+        "-",
+    ]
+
+    accumulator = MulticamColorHistogramAccumulator()
+    face_detection_count = 0
+    subject_midtone_sample_count = 0
+    face_detection_methods = set()
+    face_analysis_enabled = True
+    try:
+        face_detectors = _load_multicam_color_face_detectors()
+    except Exception as face_error:
+        logger.warning("Multicam face exposure analysis skipped: %s", face_error)
+        face_detectors = []
+        face_analysis_enabled = False
+
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+        try:
+            while True:
+                buffer = process.stdout.read(frame_bytes)
+                if not buffer or len(buffer) < frame_bytes:
+                    break
+                frame = np.frombuffer(buffer, dtype=np.uint8).reshape((height, width, 3))
+                accumulator.add_frame(frame)
+                if not face_analysis_enabled:
+                    continue
+                try:
+                    kind, subject_pixels, method = _sample_multicam_face_exposure_pixels(
+                        frame,
+                        face_detectors,
+                        width,
+                        height,
+                    )
+                except Exception as face_error:
+                    logger.warning("Multicam face exposure analysis skipped: %s", face_error)
+                    face_analysis_enabled = False
+                    continue
+                if kind is None:
+                    continue
+                accumulator.add_face_pixels(kind, subject_pixels)
+                if kind == "haar_face":
+                    face_detection_count += 1
+                    face_detection_methods.add(method)
+                else:
+                    subject_midtone_sample_count += 1
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+        stderr_file.seek(0)
+        stderr_text = stderr_file.read().decode("utf-8", errors="ignore")
+
+    if returncode != 0:
+        raise RuntimeError(stderr_text[-500:] or "ffmpeg color analysis failed")
+    if accumulator.frame_count <= 0:
+        raise RuntimeError("ffmpeg color analysis returned no video frames")
+
+    profile = accumulator.profile(safe_start, safe_duration)
+    exposure_kind = "haar_face" if face_detection_count else "skin_subject"
+    face_histogram = accumulator.face_luma_histograms[exposure_kind]
+    face_pixel_count = float(face_histogram.sum())
+    if face_pixel_count > 0:
+        profile.update({
+            "face_detection_count": face_detection_count,
+            "face_detection_methods": sorted(face_detection_methods),
+            "subject_midtone_sample_count": subject_midtone_sample_count,
+            "face_exposure_source": "haar_face" if face_detection_count else "skin_subject_fallback",
+            "face_luma_mean": round(accumulator.face_luma_sums[exposure_kind] / face_pixel_count, 3),
+            "face_luma_median": round(multicam_histogram_percentile(face_histogram, 50.0), 3),
+            "face_luma_p90": round(multicam_histogram_percentile(face_histogram, 90.0), 3),
+        })
+    else:
+        profile["face_detection_count"] = 0
+        profile["face_detection_methods"] = []
+        profile["subject_midtone_sample_count"] = 0
+        profile["face_exposure_source"] = "global_frame_fallback"
+    return profile
+
+
+_multicam_analysis_executor = None
+_multicam_analysis_executor_shape = None
+
+
+def multicam_analysis_process_pool_enabled():
+    raw_value = str(os.getenv("MULTICAM_ANALYSIS_PROCESS_POOL", "true")).strip().lower()
+    return raw_value in {"1", "true", "yes", "on"}
+
+
+def multicam_analysis_available_cpus():
+    return effective_cpu_count()
+
+
+def get_multicam_analysis_pool_shape(job_count):
+    """Return ``(worker_count, opencv_threads_per_worker)`` for ``job_count`` cameras."""
+    available_cpus = multicam_analysis_available_cpus()
+    configured_workers = int(os.getenv("MULTICAM_ANALYSIS_PROCESS_WORKERS", "0") or 0)
+    worker_limit = configured_workers if configured_workers > 0 else available_cpus
+    if configured_workers <= 0:
+        # Each worker decodes a camera; only as many as the memory budget holds.
+        worker_limit = min(worker_limit, shared_scheduler().memory_process_limit("analysis") or worker_limit)
+    worker_count = max(1, min(max(1, int(job_count or 1)), worker_limit, available_cpus))
+    configured_threads = int(os.getenv("MULTICAM_ANALYSIS_CV_THREADS", "0") or 0)
+    cv_threads = configured_threads if configured_threads > 0 else max(1, available_cpus // worker_count)
+    return worker_count, cv_threads
+
+
+def _init_multicam_analysis_worker(cv_threads):
+    # Each camera gets its own process, so OpenCV's internal pool only needs
+    # this worker's share of the host. Left at the default, N workers would
+    # each spin up one thread per core and thrash.
+    safe_threads = max(1, int(cv_threads or 1))
+    for name in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[name] = str(safe_threads)
+    cv2.setNumThreads(safe_threads)
+    try:
+        cv2.ocl.setUseOpenCL(False)
+    except Exception:
+        pass
+
+
+def get_multicam_analysis_executor(worker_count, cv_threads):
+    global _multicam_analysis_executor, _multicam_analysis_executor_shape
+    shape = (int(worker_count), int(cv_threads))
+    if _multicam_analysis_executor is not None and _multicam_analysis_executor_shape == shape:
+        return _multicam_analysis_executor
+
+    shutdown_multicam_analysis_executor()
+    # fork() from a process that already runs gRPC/Firebase and asyncio threads
+    # can deadlock the child, so workers start clean by default.
+    start_method = str(os.getenv("MULTICAM_ANALYSIS_PROCESS_START_METHOD", "spawn") or "spawn").strip().lower()
+    _multicam_analysis_executor = ProcessPoolExecutor(
+        max_workers=shape[0],
+        mp_context=multiprocessing.get_context(start_method),
+        initializer=_init_multicam_analysis_worker,
+        initargs=(shape[1],),
+    )
+    _multicam_analysis_executor_shape = shape
+    return _multicam_analysis_executor
+
+
+def shutdown_multicam_analysis_executor():
+    global _multicam_analysis_executor, _multicam_analysis_executor_shape
+    executor = _multicam_analysis_executor
+    _multicam_analysis_executor = None
+    _multicam_analysis_executor_shape = None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _timed_multicam_analysis_call(fn, args, kwargs):
+    started_at = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started_at
+
+
+def _is_process_pool_dispatchable(fn):
+    try:
+        pickle.dumps(fn)
+    except Exception:
+        return False
+    return True
+
+
+async def run_multicam_camera_analyses(fn, jobs, job_context=None):
+    """Run ``fn(*args, **kwargs)`` for each ``(args, kwargs)`` job, one camera per process.
+
+    Returns ``(results, receipt)``. ``results`` follows ``jobs`` order and holds
+    the exception instead of a value for a camera whose analysis raised, so
+    callers keep their per-camera failure handling. Callables that cannot be
+    pickled (test doubles, closures) and pools that fail to start run inline on
+    a worker thread, one job at a time, which matches the previous behavior.
+    """
+    safe_jobs = [(tuple(args or ()), dict(kwargs or {})) for args, kwargs in (jobs or [])]
+    if not safe_jobs:
+        return [], {"mode": "empty", "job_count": 0}
+
+    loop = asyncio.get_running_loop()
+    started_at = time.perf_counter()
+    results = [None] * len(safe_jobs)
+    elapsed = [None] * len(safe_jobs)
+    worker_count, cv_threads = get_multicam_analysis_pool_shape(len(safe_jobs))
+    mode = "process_pool"
+    if not multicam_analysis_process_pool_enabled() or not _is_process_pool_dispatchable(fn):
+        mode = "inline"
+
+    if mode == "process_pool":
+        # Cameras are handed to the pool as the scheduler admits them, so a
+        # worker does not start another decode while the task is out of memory.
+        limiter = shared_scheduler().limiter("analysis", worker_count)
+
+        async def dispatch(args, kwargs):
+            async with limiter:
+                return await loop.run_in_executor(executor, _timed_multicam_analysis_call, fn, args, kwargs)
+
+        try:
+            executor = get_multicam_analysis_executor(worker_count, cv_threads)
+            futures = [dispatch(args, kwargs) for args, kwargs in safe_jobs]
+        except Exception as pool_error:
+            logger.warning("MULTICAM ANALYSIS POOL unavailable %s: %s", job_context, pool_error)
+            shutdown_multicam_analysis_executor()
+            mode = "inline"
+        else:
+            outcomes = await asyncio.gather(*futures, return_exceptions=True)
+            pool_broken = False
+            for index, outcome in enumerate(outcomes):
+                if isinstance(outcome, BrokenProcessPool):
+                    pool_broken = True
+                    results[index] = outcome
+                elif isinstance(outcome, BaseException):
+                    results[index] = outcome
+                else:
+                    results[index], elapsed[index] = outcome
+            if pool_broken:
+                # A worker died (usually OOM). Retry only the lost cameras
+                # in-process rather than failing the whole render.
+                logger.warning("MULTICAM ANALYSIS POOL broken %s; retrying lost cameras inline", job_context)
+                shutdown_multicam_analysis_executor()
+                for index, (args, kwargs) in enumerate(safe_jobs):
+                    if isinstance(results[index], BrokenProcessPool):
+                        try:
+                            results[index], elapsed[index] = await loop.run_in_executor(
+                                None,
+                                functools.partial(_timed_multicam_analysis_call, fn, args, kwargs),
+                            )
+                        except Exception as inline_error:
+                            results[index] = inline_error
+
+    if mode == "inline":
+        worker_count, cv_threads = 1, None
+        for index, (args, kwargs) in enumerate(safe_jobs):
+            try:
+                results[index], elapsed[index] = await loop.run_in_executor(
+                    None,
+                    functools.partial(_timed_multicam_analysis_call, fn, args, kwargs),
+                )
+            except Exception as inline_error:
+                results[index] = inline_error
+
+    receipt = {
+        "mode": mode,
+        "job_count": len(safe_jobs),
+        "worker_count": worker_count,
+        "opencv_threads_per_worker": cv_threads,
+        "elapsed_seconds": round(time.perf_counter() - started_at, 3),
+        "job_elapsed_seconds": [round(value, 3) if value is not None else None for value in elapsed],
+        "failed_job_count": sum(1 for result in results if isinstance(result, BaseException)),
+    }
+    logger.info(
+        "MULTICAM ANALYSIS %s %s: %s",
+        getattr(fn, "__name__", "analysis"),
+        job_context,
+        receipt,
+    )
+    return results, receipt
@@ -0,0 +1,60 @@
+"""Memoized results for the pre-render plan audits.
+
+The layout-contract, director-truth and switch-latency audits run after the
+director, inside every repair pass (initial and final audit), again before
+render and once more for the final quality gate, often on a plan no pass
+changed.  ``PlanAuditCache`` keeps each audit's result under a fingerprint of
+the plan fields it reads plus everything else it depends on, so repeating an
+audit on an unchanged plan is a dictionary lookup.
+
+Results are stored and returned as deep copies: callers embed audits in
+receipts and may annotate them, and that must not leak into later hits.
+"""
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+def plan_audit_fingerprint(segments, fields, context=()):
+    """Digest of ``fields`` of every segment, in plan order, plus ``context``."""
+    digest = hashlib.sha256(repr(tuple(context)).encode("utf-8"))
+    for segment in segments or []:
+        item = segment or {}
+        digest.update(repr(tuple(item.get(field) for field in fields)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class PlanAuditCache:
+    def __init__(self, max_entries=64):
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Copy of the stored result for ``key``, or None."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(result)
+
+    def put(self, key, result):
+        stored = copy.deepcopy(result)
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
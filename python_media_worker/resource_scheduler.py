@@ -0,0 +1,283 @@
+"""CPU and memory budget for the worker's FFmpeg and analysis processes.
+
+Segment encodes, visual proxies and per-camera analysis used to size
+themselves from separate environment variables (one render at a time, four
+x264 threads, two proxies) whatever the task actually had.  The
+``ResourceScheduler`` reads the cgroup v2 CPU quota and memory limit once,
+plans each workload's process concurrency and threads per process from them,
+and hands out ``AdaptiveLimiter`` slots that stop admitting new processes
+while observed CPU use is saturated or memory headroom runs low.
+
+Limits are re-planned only when a scheduler is created; pressure is sampled
+from ``cpu.stat``, ``memory.current`` and ``memory.stat`` at admission time,
+at most once per ``sample_seconds``.  Memory headroom leaves out reclaimable
+page cache: media jobs fill it within seconds of reading their inputs, and
+counting it would hold admission at one process while little memory is
+actually in use.
+"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+# Threads one process of each workload keeps busy, and its typical resident
+# memory.  1080p x264 ultrafast stops scaling at about four threads.
+WORKLOADS = {
+    "encode": (4, int(os.getenv("MULTICAM_ENCODE_PROCESS_MEMORY_MB", "1024") or 1024) * 1024 * 1024),
+    "proxy": (4, int(os.getenv("MULTICAM_PROXY_PROCESS_MEMORY_MB", "768") or 768) * 1024 * 1024),
+    "analysis": (1, int(os.getenv("MULTICAM_ANALYSIS_PROCESS_MEMORY_MB", "384") or 384) * 1024 * 1024),
+}
+
+# Frames one open video decoder keeps buffered (references plus frame-thread
+# queues), and its demuxer and codec overhead on top of them.
+DECODER_BUFFERED_FRAMES = 24
+DECODER_OVERHEAD_BYTES = 32 * 1024 * 1024
+
+
+def decoder_memory_bytes(width, height):
+    """Typical resident memory of one decoded 8-bit 4:2:0 video input at ``width`` x ``height``."""
+    frame_bytes = max(1, int(width)) * max(1, int(height)) * 3 // 2
+    return DECODER_OVERHEAD_BYTES + frame_bytes * DECODER_BUFFERED_FRAMES
+
+
+def read_cgroup_resource_allocation(root=CGROUP_ROOT):
+    """``(vcpu, memory_limit_bytes)`` from the cgroup limits; the CPU count and None when unlimited."""
+    allocated_vcpu = float(os.cpu_count() or 1)
+    memory_limit_bytes = None
+    try:
+        with open(os.path.join(root, "cpu.max"), "r", encoding="utf-8") as cpu_file:
+            quota_text, period_text = cpu_file.read().strip().split()[:2]
+        if quota_text != "max":
+            allocated_vcpu = max(0.001, float(quota_text) / max(1.0, float(period_text)))
+    except Exception:
+        pass
+    try:
+        with open(os.path.join(root, "memory.max"), "r", encoding="utf-8") as memory_file:
+            memory_text = memory_file.read().strip()
+        if memory_text != "max":
+            memory_limit_bytes = max(0, int(memory_text))
+    except Exception:
+        pass
+    return round(allocated_vcpu, 3), memory_limit_bytes
+
+
+def read_cgroup_usage(root=CGROUP_ROOT):
+    """``(cpu_usage_seconds, memory_current_bytes, memory_peak_bytes)``; None for anything unreadable."""
+    cpu_usage_seconds = None
+    memory_current_bytes = None
+    memory_peak_bytes = None
+    try:
+        with open(os.path.join(root, "cpu.stat"), "r", encoding="utf-8") as cpu_file:
+            cpu_stats = dict(
+                line.split(None, 1)
+                for line in cpu_file.read().splitlines()
+                if len(line.split(None, 1)) == 2
+            )
+        cpu_usage_seconds = float(cpu_stats.get("usage_usec", 0.0)) / 1_000_000.0
+    except Exception:
+        pass
+    for name in ("memory.current", "memory.peak"):
+        try:
+            with open(os.path.join(root, name), "r", encoding="utf-8") as memory_file:
+                value = int(memory_file.read().strip())
+        except Exception:
+            continue
+        if name == "memory.current":
+            memory_current_bytes = value
+        else:
+            memory_peak_bytes = value
+    return cpu_usage_seconds, memory_current_bytes, memory_peak_bytes
+
+
+def read_cgroup_memory_in_use(root=CGROUP_ROOT):
+    """``memory.current`` less reclaimable page cache (file pages that are not shmem/tmpfs); None if unreadable."""
+    try:
+        with open(os.path.join(root, "memory.current"), "r", encoding="utf-8") as memory_file:
+            memory_current = int(memory_file.read().strip())
+    except Exception:
+        return None
+    try:
+        with open(os.path.join(root, "memory.stat"), "r", encoding="utf-8") as stat_file:
+            memory_stats = dict(
+                line.split(None, 1)
+                for line in stat_file.read().splitlines()
+                if len(line.split(None, 1)) == 2
+            )
+        reclaimable = int(memory_stats.get("file", 0)) - int(memory_stats.get("shmem", 0))
+    except Exception:
+        return memory_current
+    return max(0, memory_current - max(0, reclaimable))
+
+
+def read_cgroup_pressure_usage(root=CGROUP_ROOT):
+    """``(cpu_usage_seconds, memory_in_use_bytes, memory_peak_bytes)`` for admission decisions."""
+    cpu_usage_seconds, _memory_current, memory_peak_bytes = read_cgroup_usage(root)
+    return cpu_usage_seconds, read_cgroup_memory_in_use(root), memory_peak_bytes
+
+
+def affinity_cpu_count():
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except (AttributeError, OSError):
+        return max(1, int(os.cpu_count() or 1))
+
+
+def effective_cpu_count(vcpu=None):
+    """Cores worth scheduling on: the visible cores, capped by the cgroup CPU quota."""
+    if vcpu is None:
+        vcpu, _memory_limit_bytes = read_cgroup_resource_allocation()
+    # A fractional quota still lets a process run on every core, only for
+    # less time, so round up before capping at the visible cores.
+    return max(1, min(affinity_cpu_count(), int(math.ceil(float(vcpu) - 0.05))))
+
+
+class ResourceScheduler:
+    def __init__(
+        self,
+        vcpu=None,
+        memory_limit_bytes=None,
+        usage_reader=read_cgroup_pressure_usage,
+        memory_headroom_floor=0.15,
+        cpu_busy_utilization=0.92,
+        sample_seconds=1.0,
+    ):
+        if vcpu is None:
+            vcpu, cgroup_memory = read_cgroup_resource_allocation()
+            if memory_limit_bytes is None:
+                memory_limit_bytes = cgroup_memory
+        self.vcpu = float(vcpu)
+        self.memory_limit_bytes = memory_limit_bytes
+        self.cpus = effective_cpu_count(self.vcpu)
+        self.memory_headroom_floor = float(memory_headroom_floor)
+        self.cpu_busy_utilization = float(cpu_busy_utilization)
+        self.sample_seconds = float(sample_seconds)
+        self._usage_reader = usage_reader
+        self._lock = threading.Lock()
+        self._last_sample = None
+        self._pressure = {"cpu_utilization": None, "memory_headroom": None}
+
+    def memory_process_limit(self, workload):
+        """Processes of ``workload`` that fit in the memory budget; None without a memory limit."""
+        if not self.memory_limit_bytes:
+            return None
+        _threads_per_process, memory_per_process = WORKLOADS[workload]
+        return max(1, int((self.memory_limit_bytes * 0.75) // memory_per_process))
+
+    def plan(self, workload, job_count=None):
+        """``{"concurrency", "threads"}`` for ``workload``, capped at ``job_count`` processes."""
+        threads_per_process, _memory_per_process = WORKLOADS[workload]
+        concurrency = max(1, self.cpus // threads_per_process)
+        memory_limit = self.memory_process_limit(workload)
+        if memory_limit is not None:
+            concurrency = min(concurrency, memory_limit)
+        if job_count is not None:
+            concurrency = min(concurrency, max(1, int(job_count)))
+        return {"concurrency": concurrency, "threads": max(1, self.cpus // concurrency)}
+
+    def inputs_per_process(self, workload, input_memory_bytes, max_inputs, concurrency=None):
+        """Decoded inputs one ``workload`` process may open with ``concurrency`` of them running.
+
+        The first input is part of the workload's own footprint; every extra
+        one costs ``input_memory_bytes`` out of the process's share of the
+        memory budget.
+        """
+        max_inputs = max(1, int(max_inputs))
+        if not self.memory_limit_bytes:
+            return max_inputs
+        if concurrency is None:
+            concurrency = self.plan(workload)["concurrency"]
+        _threads_per_process, memory_per_process = WORKLOADS[workload]
+        share = (self.memory_limit_bytes * 0.75) / max(1, int(concurrency))
+        extra_inputs = int(max(0.0, share - memory_per_process) // max(1, int(input_memory_bytes)))
+        return max(1, min(max_inputs, 1 + extra_inputs))
+
+    def pressure(self):
+        """Latest ``cpu_utilization`` (share of the quota) and ``memory_headroom`` (unreclaimable use vs the limit)."""
+        now = time.monotonic()
+        with self._lock:
+            if self._last_sample is not None and now - self._last_sample[0] < self.sample_seconds:
+                return dict(self._pressure)
+            cpu_seconds, memory_in_use, _memory_peak = self._usage_reader()
+            if self._last_sample is not None and cpu_seconds is not None and self._last_sample[1] is not None:
+                elapsed = max(1e-6, now - self._last_sample[0])
+                self._pressure["cpu_utilization"] = max(0.0, (cpu_seconds - self._last_sample[1]) / elapsed / self.vcpu)
+            if memory_in_use is not None and self.memory_limit_bytes:
+                self._pressure["memory_headroom"] = max(0.0, 1.0 - (memory_in_use / self.memory_limit_bytes))
+            self._last_sample = (now, cpu_seconds)
+            return dict(self._pressure)
+
+    def admission_limit(self, limit, active):
+        """How many processes may run now out of a planned ``limit`` with ``active`` running."""
+        pressure = self.pressure()
+        if pressure["memory_headroom"] is not None and pressure["memory_headroom"] < self.memory_headroom_floor:
+            return 1
+        if pressure["cpu_utilization"] is not None and pressure["cpu_utilization"] >= self.cpu_busy_utilization:
+            return max(1, min(limit, active))
+        return max(1, limit)
+
+    def limiter(self, workload, limit=None):
+        return AdaptiveLimiter(self, workload, limit if limit is not None else self.plan(workload)["concurrency"])
+
+    def snapshot(self):
+        return {
+            "vcpu": self.vcpu,
+            "cpus": self.cpus,
+            "memory_limit_bytes": self.memory_limit_bytes,
+            "plans": {workload: self.plan(workload) for workload in WORKLOADS},
+            **self.pressure(),
+        }
+
+
+_shared_scheduler = None
+_shared_scheduler_lock = threading.Lock()
+
+
+def shared_scheduler():
+    """The process-wide scheduler, planned from this task's cgroup on first use."""
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = ResourceScheduler()
+        return _shared_scheduler
+
+
+class AdaptiveLimiter:
+    """Async semaphore whose limit shrinks under CPU or memory pressure.
+
+    One slot is always available when nothing is running, so pressure can
+    slow work down but never stall it.  An idle limiter rebinds to whichever
+    event loop enters it next, so one limiter can be shared module-wide.
+    """
+
+    def __init__(self, scheduler, workload, limit):
+        self.scheduler = scheduler
+        self.workload = workload
+        self.limit = max(1, int(limit))
+        self.active = 0
+        self.throttled = 0
+        self._condition = None
+        self._loop = None
+
+    async def __aenter__(self):
+        loop = asyncio.get_running_loop()
+        if self._condition is None or (self._loop is not loop and not self.active):
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        async with self._condition:
+            while self.active and self.active >= self.scheduler.admission_limit(self.limit, self.active):
+                if self.active < self.limit:
+                    self.throttled += 1
+                await self._condition.wait()
+            self.active += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        async with self._condition:
+            self.active -= 1
+            self._condition.notify()
+        return False
@@ -0,0 +1,328 @@
+"""Scene-cut detection and motion sampling on the shared low-res frame stream.
+
+This replaces PySceneDetect's ``ContentDetector`` for clip analysis.  The
+detector runs as a ``media_frame_stream`` consumer, so scene cuts and the
+frame-difference motion curve come out of one sequential ffmpeg decode
+instead of two independent decoders (one of which seeked per sample).
+
+Each sampled frame is reduced to a small HSV image.  Two signals are
+measured between consecutive samples:
+
+* the mean absolute H/S/V delta on a 0-255 scale (the same quantity
+  ``ContentDetector`` thresholds at 27), and
+* the Bhattacharyya distance between hue/saturation histograms, which stays
+  low during fast camera moves inside one shot but jumps on a real cut.
+
+A sample is a cut when its delta is a clear local peak against the
+surrounding samples (adaptive ratio, which suppresses sustained motion) or
+when both the delta and the histogram distance clear their fixed
+thresholds.  Cuts closer than ``min_scene_seconds`` are merged.
+
+Scene boundaries are returned as ``SceneTime`` values, floats that also
+expose ``get_seconds()``, so existing callers such as
+``align_clip_to_scenes`` keep working unchanged.
+"""
+
+import logging
+import os
+from collections import deque
+
+import cv2
+import numpy as np
+
+try:
+    from .media_frame_stream import run_shared_frame_pass
+except ImportError:
+    from media_frame_stream import run_shared_frame_pass
+
+
+logger = logging.getLogger("MediaWorker")
+
+SCENE_DETECT_DEFAULT_SAMPLE_FPS = 4.0
+SCENE_DETECT_DEFAULT_MAX_LONG_EDGE = 320
+SCENE_DETECT_ANALYSIS_LONG_EDGE = 192
+SCENE_DETECT_CONTENT_THRESHOLD = 27.0
+SCENE_DETECT_MIN_CONTENT = 15.0
+SCENE_DETECT_HISTOGRAM_THRESHOLD = 0.32
+SCENE_DETECT_ADAPTIVE_RATIO = 3.0
+SCENE_DETECT_ADAPTIVE_WINDOW = 2
+SCENE_DETECT_MIN_SCENE_SECONDS = 0.6
+
+
+class SceneTime(float):
+    """Seconds on the source timeline, compatible with scenedetect timecodes."""
+
+    def get_seconds(self):
+        return float(self)
+
+
+def get_scene_detect_sample_fps():
+    try:
+        value = float(os.getenv("SCENE_DETECT_SAMPLE_FPS", str(SCENE_DETECT_DEFAULT_SAMPLE_FPS)))
+    except ValueError:
+        value = SCENE_DETECT_DEFAULT_SAMPLE_FPS
+    return max(1.0, min(12.0, value))
+
+
+def get_scene_detect_max_long_edge():
+    try:
+        value = int(os.getenv("SCENE_DETECT_MAX_LONG_EDGE", str(SCENE_DETECT_DEFAULT_MAX_LONG_EDGE)))
+    except ValueError:
+        value = SCENE_DETECT_DEFAULT_MAX_LONG_EDGE
+    return max(96, value)
+
+
+def probe_frame_size(video_path):
+    capture = cv2.VideoCapture(video_path)
+    try:
+        if not capture.isOpened():
+            return 0, 0
+        return (
+            int(capture.get(cv2.CAP_PROP_FRAME_WIDTH) or 0),
+            int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT) or 0),
+        )
+    finally:
+        capture.release()
+
+
+def build_scene_list(cut_times, end_time, start_time=0.0):
+    """Turn cut times into ``[(SceneTime start, SceneTime end), ...]``.
+
+    Like ``SceneManager.get_scene_list()`` an input without cuts yields an
+    empty list so callers fall back to timed windows.
+    """
+    safe_end = float(end_time or 0.0)
+    cuts = sorted(float(value) for value in cut_times or [] if start_time < float(value) < safe_end)
+    if not cuts:
+        return []
+    boundaries = [float(start_time)] + cuts + [safe_end]
+    return [
+        (SceneTime(round(boundaries[index], 4)), SceneTime(round(boundaries[index + 1], 4)))
+        for index in range(len(boundaries) - 1)
+    ]
+
+
+class SceneCutDetector:
+    """Stream consumer that emits scene boundaries with adaptive thresholds."""
+
+    def __init__(
+        self,
+        sample_fps=None,
+        content_threshold=SCENE_DETECT_CONTENT_THRESHOLD,
+        min_content=SCENE_DETECT_MIN_CONTENT,
+        histogram_threshold=SCENE_DETECT_HISTOGRAM_THRESHOLD,
+        adaptive_ratio=SCENE_DETECT_ADAPTIVE_RATIO,
+        adaptive_window=SCENE_DETECT_ADAPTIVE_WINDOW,
+        min_scene_seconds=SCENE_DETECT_MIN_SCENE_SECONDS,
+        duration=None,
+    ):
+        self.sample_fps = float(sample_fps or get_scene_detect_sample_fps())
+        self.content_threshold = float(content_threshold)
+        self.min_content = float(min_content)
+        self.histogram_threshold = float(histogram_threshold)
+        self.adaptive_ratio = float(adaptive_ratio)
+        self.adaptive_window = max(1, int(adaptive_window))
+        self.min_scene_seconds = max(0.0, float(min_scene_seconds))
+        self.duration = float(duration or 0.0)
+        self.analysis_size = None
+        self.frame_interval = 1.0 / self.sample_fps
+        self.start_time = None
+        self.last_frame_time = None
+        self.previous_hsv = None
+        self.previous_histogram = None
+        # Only three floats per sample are retained (no frames), so a
+        # multi-hour input at 4 fps stays well under a few MB.
+        self.times = []
+        self.content_scores = []
+        self.histogram_scores = []
+        self.pending = deque()
+        self.cut_times = []
+
+    def bind_stream(self, stream_width, stream_height, fps):
+        scale = min(1.0, SCENE_DETECT_ANALYSIS_LONG_EDGE / float(max(stream_width, stream_height, 1)))
+        self.analysis_size = (
+            max(16, int(round(stream_width * scale))),
+            max(16, int(round(stream_height * scale))),
+        )
+        self.frame_interval = 1.0 / float(fps or self.sample_fps)
+
+    def _frame_features(self, frame):
+        if self.analysis_size and (frame.shape[1], frame.shape[0]) != self.analysis_size:
+            frame = cv2.resize(frame, self.analysis_size, interpolation=cv2.INTER_AREA)
+        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+        histogram = cv2.calcHist([hsv], [0, 1], None, [16, 8], [0, 180, 0, 256])
+        cv2.normalize(histogram, histogram, alpha=1.0, norm_type=cv2.NORM_L1)
+        return hsv, histogram
+
+    def consume(self, frame_time, frame):
+        hsv, histogram = self._frame_features(frame)
+        if self.start_time is None:
+            self.start_time = float(frame_time)
+        if self.previous_hsv is not None:
+            channel_deltas = cv2.absdiff(hsv, self.previous_hsv).reshape((-1, 3)).mean(axis=0)
+            content_score = float(channel_deltas.mean())
+            histogram_score = float(
+                cv2.compareHist(self.previous_histogram, histogram, cv2.HISTCMP_BHATTACHARYYA)
+            )
+            self.times.append(float(frame_time))
+            self.content_scores.append(content_score)
+            self.histogram_scores.append(histogram_score)
+            self.pending.append(len(self.content_scores) - 1)
+            self._decide_ready()
+        self.previous_hsv = hsv
+        self.previous_histogram = histogram
+        self.last_frame_time = float(frame_time)
+
+    def _decide_ready(self, flush=False):
+        newest = len(self.content_scores) - 1
+        while self.pending and (flush or self.pending[0] + self.adaptive_window <= newest):
+            self._decide(self.pending.popleft())
+
+    def _decide(self, index):
+        content_score = self.content_scores[index]
+        if content_score < self.min_content:
+            return
+        first = max(0, index - self.adaptive_window)
+        last = min(len(self.content_scores), index + self.adaptive_window + 1)
+        neighbours = self.content_scores[first:index] + self.content_scores[index + 1:last]
+        neighbour_average = (sum(neighbours) / len(neighbours)) if neighbours else 0.0
+        adaptive_ratio = content_score / max(neighbour_average, 1e-3)
+        is_cut = adaptive_ratio >= self.adaptive_ratio or (
+            content_score >= self.content_threshold
+            and self.histogram_scores[index] >= self.histogram_threshold
+        )
+        if not is_cut:
+            return
+        cut_time = self.times[index]
+        previous_boundary = self.cut_times[-1] if self.cut_times else self.start_time
+        if cut_time - previous_boundary < self.min_scene_seconds:
+            return
+        self.cut_times.append(cut_time)
+
+    def end_time(self):
+        if self.last_frame_time is None:
+            return self.duration
+        return max(self.duration, self.last_frame_time + self.frame_interval)
+
+    def finish(self):
+        self._decide_ready(flush=True)
+        if self.start_time is None:
+            return []
+        return build_scene_list(self.cut_times, self.end_time(), start_time=self.start_time)
+
+
+class VisualMotionSampler:
+    """Stream consumer producing frame-difference motion samples.
+
+    Emits ``(t, motion)`` on a ``sample_interval`` grid where ``motion`` is the
+    mean absolute 160x90 gray difference to the previous grid sample, 0-1.
+    """
+
+    def __init__(self, sample_interval=1.0):
+        self.sample_interval = max(0.05, float(sample_interval or 1.0))
+        self.sample_fps = 1.0 / self.sample_interval
+        self.half_frame = 0.0
+        self.next_sample_time = None
+        self.previous_gray = None
+        self.samples = []
+
+    def bind_stream(self, stream_width, stream_height, fps):
+        self.half_frame = 0.5 / float(fps or self.sample_fps)
+
+    def consume(self, frame_time, frame):
+        if self.next_sample_time is None:
+            self.next_sample_time = 0.0
+            while self.next_sample_time + self.sample_interval <= frame_time + self.half_frame:
+                self.next_sample_time += self.sample_interval
+        if frame_time + self.half_frame < self.next_sample_time:
+            return
+        sample_time = self.next_sample_time
+        while self.next_sample_time <= frame_time + self.half_frame:
+            self.next_sample_time += self.sample_interval
+        small = cv2.resize(frame, (160, 90), interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        if self.previous_gray is not None:
+            motion = float(np.mean(cv2.absdiff(gray, self.previous_gray))) / 255.0
+            self.samples.append((round(sample_time, 6), motion))
+        self.previous_gray = gray
+
+    def finish(self):
+        return self.samples
+
+
+def detect_scenes_and_motion(
+    video_path,
+    width=None,
+    height=None,
+    motion_interval=1.0,
+    duration=None,
+    sample_fps=None,
+):
+    """Run scene-cut detection (and optionally motion sampling) in one decode.
+
+    Returns ``(scene_list, motion_scores, receipt)``. Pass
+    ``motion_interval=None`` to skip motion sampling.
+    """
+    if not width or not height:
+        width, height = probe_frame_size(video_path)
+    if not width or not height:
+        return [], [], {"status": "unreadable"}
+
+    detector = SceneCutDetector(sample_fps=sample_fps, duration=duration)
+    consumers = [detector]
+    motion_sampler = None
+    if motion_interval:
+        motion_sampler = VisualMotionSampler(motion_interval)
+        consumers.append(motion_sampler)
+
+    results, receipt = run_shared_frame_pass(
+        video_path,
+        consumers,
+        width,
+        height,
+        max_long_edge=get_scene_detect_max_long_edge(),
+    )
+    scene_list = results[0]
+    motion_scores = results[1] if motion_sampler is not None else []
+    receipt = dict(receipt)
+    receipt["scene_count"] = len(scene_list)
+    receipt["cut_count"] = len(detector.cut_times)
+    logger.info(
+        "Scene detection: %s scenes from %s frames at %.2ffps (%sx%s).",
+        len(scene_list),
+        receipt.get("frame_count"),
+        float(receipt.get("fps") or 0.0),
+        receipt.get("width"),
+        receipt.get("height"),
+    )
+    return scene_list, motion_scores, receipt
+
+
+def sample_visual_motion(video_path, sample_interval=1.0, width=None, height=None):
+    """Motion samples alone, for callers that do not need scene cuts.
+
+    Returns ``[(t, motion), ...]``; higher values mean more movement.
+    """
+    if not width or not height:
+        width, height = probe_frame_size(video_path)
+    if not width or not height:
+        return []
+    results, _receipt = run_shared_frame_pass(
+        video_path,
+        [VisualMotionSampler(sample_interval)],
+        width,
+        height,
+        max_long_edge=get_scene_detect_max_long_edge(),
+    )
+    return results[0]
+
+
+def detect_scene_list(video_path, width=None, height=None, duration=None):
+    scene_list, _motion, _receipt = detect_scenes_and_motion(
+        video_path,
+        width=width,
+        height=height,
+        motion_interval=None,
+        duration=duration,
+    )
+    return scene_list
@@ -0,0 +1,192 @@
+"""Columnar storage for long multicam plans.
+
+A director segment is a dict of roughly 25 keys: a handful of floats, a
+handful of short strings drawn from a tiny vocabulary (camera ids, layout
+modes, reasons), and a few nested lists such as ``ranked_sources``.  At a few
+hundred segments that is fine; at several thousand the per-dict overhead and
+the repeated ``dict(segment)`` copies in every pass dominate.
+
+``SegmentTable`` keeps one NumPy structured array row per segment for the
+numeric and string fields (strings are interned into a shared pool and stored
+as int32 codes), plus a per-row dict holding only the remaining keys by
+reference.  Slices and timeline chunks are NumPy views over the same rows, so
+cutting a plan into checkpoint chunks copies nothing; the render's checkpoint
+plan is partitioned this way (``multicam_chunking``) and rebuilds a chunk's
+dicts only when that chunk renders.
+
+Conversion back to dicts is lossless: key order, ``None`` versus a missing
+key, and value types all round-trip, so JSON written from ``to_segments()``
+is byte-identical to JSON written from the original plan.  Only values whose
+type is exactly ``float`` (numeric columns) or ``str``/``None`` (text
+columns) are columnized; anything else stays in the row's extras.
+"""
+
+import numpy as np
+
+NUMERIC_FIELDS = (
+    "timeline_start",
+    "timeline_end",
+    "source_start",
+    "source_end",
+    "secondary_source_start",
+    "secondary_source_end",
+    "layout_confidence",
+    "director_score",
+)
+TEXT_FIELDS = (
+    "camera_id",
+    "secondary_camera_id",
+    "layout_mode",
+    "layout_reason",
+    "audio_leader_camera_id",
+    "raw_audio_leader_camera_id",
+    "audio_decision_reason",
+    "editorial_decision_reason",
+)
+
+_ABSENT = -1
+_NONE = -2
+_NUMERIC_BITS = {name: 1 << index for index, name in enumerate(NUMERIC_FIELDS)}
+_NUMERIC_SET = frozenset(NUMERIC_FIELDS)
+_TEXT_SET = frozenset(TEXT_FIELDS)
+
+ROW_DTYPE = np.dtype(
+    [(name, np.float64) for name in NUMERIC_FIELDS]
+    + [(name, np.int32) for name in TEXT_FIELDS]
+    + [("numeric_present", np.uint16), ("key_order", np.int32)]
+)
+
+
+class InternPool:
+    """Append-only value <-> code table shared by a table and its views."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def code(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def __len__(self):
+        return len(self.values)
+
+
+class SegmentTable:
+    __slots__ = ("rows", "extras", "strings", "orders")
+
+    def __init__(self, rows, extras, strings, orders):
+        self.rows = rows
+        self.extras = extras
+        self.strings = strings
+        self.orders = orders
+
+    @classmethod
+    def from_segments(cls, segments, strings=None, orders=None):
+        segments = [segment for segment in segments or [] if segment is not None]
+        strings = strings if strings is not None else InternPool()
+        orders = orders if orders is not None else InternPool()
+        nan = float("nan")
+        numeric = {name: [nan] * len(segments) for name in NUMERIC_FIELDS}
+        text = {name: [_ABSENT] * len(segments) for name in TEXT_FIELDS}
+        present_bits = [0] * len(segments)
+        key_orders = [0] * len(segments)
+        extras = []
+        for index, segment in enumerate(segments):
+            present = 0
+            extra = None
+            for key, value in segment.items():
+                if key in _NUMERIC_SET and type(value) is float and value == value:
+                    numeric[key][index] = value
+                    present |= _NUMERIC_BITS[key]
+                elif key in _TEXT_SET and (value is None or type(value) is str):
+                    text[key][index] = _NONE if value is None else strings.code(value)
+                else:
+                    if extra is None:
+                        extra = {}
+                    extra[key] = value
+            present_bits[index] = present
+            key_orders[index] = orders.code(tuple(segment.keys()))
+            extras.append(extra)
+
+        rows = np.empty(len(segments), dtype=ROW_DTYPE)
+        for name, values in numeric.items():
+            rows[name] = values
+        for name, values in text.items():
+            rows[name] = values
+        rows["numeric_present"] = present_bits
+        rows["key_order"] = key_orders
+        return cls(rows, extras, strings, orders)
+
+    def __len__(self):
+        return int(self.rows.shape[0])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SegmentTable(self.rows[index], self.extras[index], self.strings, self.orders)
+        return self.segment(index)
+
+    def __iter__(self):
+        return iter(self.to_segments())
+
+    def segment(self, index):
+        """Rebuild one segment dict exactly as it was stored."""
+        position = range(len(self))[index]
+        return self._rebuild(self.rows[position : position + 1], self.extras[position : position + 1])[0]
+
+    def to_segments(self):
+        return self._rebuild(self.rows, self.extras)
+
+    def _rebuild(self, rows, extras):
+        numeric = {name: rows[name].tolist() for name in NUMERIC_FIELDS}
+        text = {name: rows[name].tolist() for name in TEXT_FIELDS}
+        present_bits = rows["numeric_present"].tolist()
+        key_orders = rows["key_order"].tolist()
+        values = self.strings.values
+        orders = self.orders.values
+        segments = []
+        for index, extra in enumerate(extras):
+            present = present_bits[index]
+            segment = {}
+            for key in orders[key_orders[index]]:
+                if key in _NUMERIC_SET and present & _NUMERIC_BITS[key]:
+                    segment[key] = numeric[key][index]
+                elif key in _TEXT_SET and text[key][index] != _ABSENT:
+                    code = text[key][index]
+                    segment[key] = None if code == _NONE else values[code]
+                else:
+                    segment[key] = extra[key]
+            segments.append(segment)
+        return segments
+
+    def column(self, name):
+        """Numeric columns as a float64 view (NaN where absent); text columns decoded."""
+        if name in _NUMERIC_SET:
+            return self.rows[name]
+        if name in _TEXT_SET:
+            values = self.strings.values
+            return [None if code < 0 else values[code] for code in self.rows[name].tolist()]
+        raise KeyError(name)
+
+    def codes(self, name):
+        """Interned codes for a text column, for vectorized equality tests."""
+        if name not in _TEXT_SET:
+            raise KeyError(name)
+        return self.rows[name]
+
+    def chunk(self, start, end):
+        """View of the rows overlapping ``[start, end)`` on a sorted, contiguous plan."""
+        first = int(np.searchsorted(self.rows["timeline_end"], float(start), side="right"))
+        last = int(np.searchsorted(self.rows["timeline_start"], float(end), side="left"))
+        return self[first:max(first, last)]
+
+    @property
+    def nbytes(self):
+        """Bytes held by the row array; extras are shared references."""
+        return int(self.rows.nbytes)
@@ -0,0 +1,121 @@
+"""Immutable interval index over a multicam plan's segments.
+
+Audits, repair passes, caption layout and the episode harness all need "the
+segment covering time t" or "the segments overlapping [a, b)".  Scanning the
+plan for every probe makes those passes quadratic on long episodes.
+
+``SegmentTimeline`` sorts the intervals once and keeps a running maximum of
+their ends (a flattened interval tree).  A point or range query bisects to
+the last interval starting before the probe and walks back only while an
+earlier interval could still reach it, so plans with non-overlapping
+segments answer in O(log N) and overlaps cost O(log N + k).
+
+Intervals are ``[start, end)``.  Stdlib only, so the local harnesses can use
+it without the worker's dependencies.
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+def _plan_start(item):
+    return float(item.get("timeline_start", 0.0) or 0.0)
+
+
+def _plan_end(item):
+    start = float(item.get("timeline_start", 0.0) or 0.0)
+    return float(item.get("timeline_end", start) or start)
+
+
+def _pair_start(item):
+    return float(item[0])
+
+
+def _pair_end(item):
+    return float(item[1])
+
+
+class SegmentTimeline:
+    __slots__ = ("items", "starts", "ends", "_order", "_reach")
+
+    def __init__(self, items, start_of=_plan_start, end_of=_plan_end):
+        entries = []
+        for index, item in enumerate(items or []):
+            if item is None:
+                continue
+            try:
+                start = float(start_of(item))
+                end = float(end_of(item))
+            except (TypeError, ValueError, KeyError, IndexError, AttributeError):
+                continue
+            entries.append((start, index, end, item))
+        entries.sort(key=lambda entry: (entry[0], entry[1]))
+        self.starts = [entry[0] for entry in entries]
+        self._order = [entry[1] for entry in entries]
+        self.ends = [entry[2] for entry in entries]
+        self.items = [entry[3] for entry in entries]
+        reach = []
+        furthest = float("-inf")
+        for end in self.ends:
+            furthest = max(furthest, end)
+            reach.append(furthest)
+        self._reach = reach
+
+    @classmethod
+    def from_keys(cls, items, start_key, end_key):
+        """Index dicts whose bounds live under ``start_key``/``end_key``."""
+        return cls(
+            items,
+            start_of=lambda item: float(item.get(start_key, 0.0) or 0.0),
+            end_of=lambda item: float(item.get(end_key, 0.0) or 0.0),
+        )
+
+    @classmethod
+    def from_pairs(cls, intervals):
+        """Index ``(start, end)`` pairs such as silence or dead-footage intervals."""
+        return cls(intervals, start_of=_pair_start, end_of=_pair_end)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    @property
+    def end(self):
+        return self._reach[-1] if self._reach else 0.0
+
+    def _covering_positions(self, timestamp, end_tolerance=0.0):
+        position = bisect_right(self.starts, timestamp) - 1
+        found = []
+        while position >= 0 and self._reach[position] + end_tolerance > timestamp:
+            if self.ends[position] + end_tolerance > timestamp:
+                found.append(position)
+            position -= 1
+        return found
+
+    def covering(self, timestamp, end_tolerance=0.0):
+        """Items with ``start <= t < end + end_tolerance``, in their original order."""
+        positions = self._covering_positions(float(timestamp), end_tolerance)
+        positions.sort(key=lambda position: self._order[position])
+        return [self.items[position] for position in positions]
+
+    def at(self, timestamp, default=None, end_tolerance=0.0):
+        """The first item (in original order) covering ``timestamp``."""
+        positions = self._covering_positions(float(timestamp), end_tolerance)
+        if not positions:
+            return default
+        return self.items[min(positions, key=lambda position: self._order[position])]
+
+    def contains(self, timestamp):
+        return bool(self._covering_positions(float(timestamp)))
+
+    def overlapping(self, start, end):
+        """Items with ``item_start < end`` and ``item_end > start``, ordered by start."""
+        start = float(start)
+        position = bisect_left(self.starts, float(end)) - 1
+        found = []
+        while position >= 0 and self._reach[position] > start:
+            if self.ends[position] > start:
+                found.append(position)
+            position -= 1
+        return [self.items[position] for position in reversed(found)]
@@ -0,0 +1,73 @@
+import random
+import unittest
+
+import numpy as np
+
+import python_media_worker.main_media_server as worker
+from python_media_worker.activity_timeseries import TimeSeries
+
+
+def brute_nearest(points, target):
+    return min(points, key=lambda point: abs(point[0] - target))
+
+
+class TimeSeriesTests(unittest.TestCase):
+    def test_lookups_match_linear_scans(self):
+        rng = random.Random(7)
+        points = [(round(rng.uniform(0, 300), 2), rng.uniform(0, 1)) for _ in range(500)]
+        series = TimeSeries([point[0] for point in points], [point[1] for point in points])
+
+        for target in [rng.uniform(-5, 305) for _ in range(200)]:
+            self.assertAlmostEqual(series.nearest(target), brute_nearest(points, target)[1])
+            in_window = [value for time, value in points if abs(time - target) <= 0.6]
+            expected = float(np.median(in_window)) if in_window else None
+            self.assertEqual(series.median_within(target, 0.6) is None, expected is None)
+            if expected is not None:
+                self.assertAlmostEqual(series.median_within(target, 0.6), expected)
+            in_range = [value for time, value in points if target <= time < target + 12.0]
+            if in_range:
+                self.assertAlmostEqual(series.mean_between(target, target + 12.0), sum(in_range) / len(in_range))
+
+    def test_ties_resolve_to_the_earlier_sample(self):
+        series = TimeSeries([0.0, 1.0, 1.0, 2.0], [10.0, 20.0, 30.0, 40.0])
+
+        self.assertEqual(series.nearest(0.5), 10.0)
+        self.assertEqual(series.nearest(1.2), 20.0)
+        self.assertEqual(series.index_at_or_before(1.5), 1)
+        self.assertIsNone(series.index_at_or_after(2.5))
+        np.testing.assert_allclose(series.rolling_median([1.0, 9.0], 0.5), [25.0, np.nan])
+
+
+class WorkerActivityLookupTests(unittest.TestCase):
+    def test_activity_helpers_keep_their_semantics(self):
+        windows = [
+            {"time": 0.0, "db": -20.0, "activity": 0.9},
+            {"time": 0.5, "db": -30.0, "activity": 0.5},
+            {"time": 1.0, "db": -40.0, "activity": 0.1},
+            {"time": 4.0, "db": -25.0},
+        ]
+
+        self.assertEqual(worker.get_audio_activity_score_at_source_time(windows, 0.6), 0.5)
+        self.assertEqual(worker.get_audio_activity_score_near_source_time(windows, 0.5, window_seconds=1.1), 0.5)
+        # No window within reach falls back to the nearest sample's dB-derived score.
+        self.assertAlmostEqual(worker.get_audio_activity_score_near_source_time(windows, 3.6), (48.0 - 25.0) / 28.0)
+        self.assertEqual(worker.get_audio_db_near_source_time(windows, 0.25, window_seconds=1.0), -25.0)
+        self.assertEqual(worker.get_audio_db_near_source_time([(0.0, -12.0), (2.0, -18.0)], 1.5), -18.0)
+
+        sources = [{"id": "cam-a", "timeline_audio_activity_windows": windows}]
+        self.assertAlmostEqual(worker.get_multicam_timeline_activity_average(sources, "cam-a", 0.0, 1.0), 0.7)
+        self.assertIsNone(worker.get_multicam_timeline_activity_average(sources, "cam-a", 2.0, 1.0))
+
+    def test_timeline_and_subject_samples(self):
+        self.assertEqual(worker._sample_timeline_metric([(0.0, 1.0), "bad", (3.0, 2.0)], 2.0), 2.0)
+        self.assertEqual(worker._sample_timeline_metric([], 2.0, default=-36.0), -36.0)
+
+        subjects = [{"time": 1.0, "x": 0.2}, None, {"time": 3.0, "x": 0.8}]
+        self.assertEqual(worker._nearest_subject_sample(subjects, 2.4)["x"], 0.8)
+        self.assertEqual(worker._subject_sample_at_or_before(subjects, 2.9)["x"], 0.2)
+        self.assertEqual(worker._subject_sample_at_or_after(subjects, 1.1)["x"], 0.8)
+        self.assertEqual(worker._subject_sample_at_or_before(subjects, 0.5)["x"], 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
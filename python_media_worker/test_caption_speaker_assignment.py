@@ -0,0 +1,121 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import python_media_worker.main_media_server as worker
+
+
+def windows(levels, step=0.5, key="db"):
+    return [{"time": round(index * step, 3), key: value, "activity": 0.0 if key == "db" else value} for index, value in enumerate(levels)]
+
+
+def transcript(*word_times):
+    return {
+        "segments": [
+            {
+                "start": word_times[0][0],
+                "end": word_times[-1][1],
+                "words": [{"start": start, "end": end, "word": " hi"} for start, end in word_times],
+            }
+        ]
+    }
+
+
+RENDER_SEGMENTS = [
+    {"camera_id": "host", "timeline_start": 0.0, "timeline_end": 2.0, "source_start": 0.0},
+    {"camera_id": "guest", "timeline_start": 2.0, "timeline_end": 4.0, "source_start": 12.0},
+]
+
+
+class CaptionSpeakerAssignmentTests(unittest.TestCase):
+    def test_mean_activity_weights_partial_windows(self):
+        means = worker.mean_activity_over_intervals(
+            [0.0, 0.5, 1.0], [1.0, 3.0, 5.0], np.array([0.25, 0.0, 5.0]), np.array([0.75, 1.5, 6.0])
+        )
+
+        self.assertAlmostEqual(means[0], 2.0)
+        self.assertAlmostEqual(means[1], 3.0)
+        self.assertTrue(np.isnan(means[2]))
+
+    def test_timeline_channel_activity_assigns_words_without_decoding(self):
+        sources = [
+            {"id": "host", "timeline_audio_activity_windows": windows([-20, -20, -20, -20, -45, -45, -45, -45])},
+            {"id": "guest", "timeline_audio_activity_windows": windows([-45, -45, -45, -45, -20, -20, -20, -20])},
+        ]
+        result = transcript((0.4, 0.8), (2.5, 2.9), (1.95, 2.05))
+
+        with mock.patch.object(worker, "extract_caption_channel_samples", side_effect=AssertionError("decoded")):
+            receipt = worker.build_caption_word_speaker_assignments(
+                "master.mp4", result, RENDER_SEGMENTS, activity_sources=sources
+            )
+
+        words = result["segments"][0]["words"]
+        self.assertEqual(receipt["method"], "cached_timeline_channel_activity_per_word")
+        self.assertEqual(words[0]["caption_speaker_camera_id"], "host")
+        self.assertEqual(words[1]["caption_speaker_camera_id"], "guest")
+        self.assertEqual(words[0]["caption_speaker_confidence"], 0.95)
+        # Straddling the handover, both channels average out to a tie.
+        self.assertNotIn("caption_speaker_camera_id", words[2])
+        self.assertEqual((receipt["assigned_word_count"], receipt["ambiguous_word_count"]), (2, 1))
+
+    def test_words_beside_a_mid_window_speaker_change_keep_their_side(self):
+        # Host speaks until 2.2 s and the guest after, so the 2.0-2.5 s window
+        # mixes both; only interpolating toward the neighbouring windows puts
+        # the words either side of the change back with their speaker.
+        loud, quiet = 10 ** -2.0, 10 ** -4.5
+        host_mixed = 10 * np.log10(0.4 * loud + 0.6 * quiet)
+        guest_mixed = 10 * np.log10(0.6 * loud + 0.4 * quiet)
+        sources = [
+            {"id": "host", "timeline_audio_activity_windows": windows([-20, -20, -20, -20, host_mixed, -45, -45, -45])},
+            {"id": "guest", "timeline_audio_activity_windows": windows([-45, -45, -45, -45, guest_mixed, -20, -20, -20])},
+        ]
+        result = transcript((2.0, 2.15), (2.3, 2.45))
+
+        worker.build_caption_word_speaker_assignments("master.mp4", result, RENDER_SEGMENTS, activity_sources=sources)
+
+        words = result["segments"][0]["words"]
+        self.assertEqual([word.get("caption_speaker_camera_id") for word in words], ["host", "guest"])
+
+    def test_interpolated_activity_leans_toward_the_neighbouring_window(self):
+        starts, ends = np.array([0.5, 0.75, 0.0]), np.array([0.75, 1.0, 1.5])
+        stepped = worker.mean_activity_over_intervals([0.0, 0.5, 1.0], [0.0, 4.0, 8.0], starts, ends)
+        interpolated = worker.mean_activity_over_intervals([0.0, 0.5, 1.0], [0.0, 4.0, 8.0], starts, ends, interpolate=True)
+
+        np.testing.assert_allclose(stepped, [4.0, 4.0, 4.0])
+        np.testing.assert_allclose(interpolated, [3.0, 5.0, 4.0])
+
+    def test_source_time_activity_is_mapped_through_render_segments(self):
+        sources = [
+            {"id": "host", "offset_seconds": 0.0, "sync_rate": 1.0, "audio_activity_windows": windows([0.9] * 4 + [0.1] * 4, key="activity")},
+            # The guest camera started 10 s earlier, so its source clock runs 10 s ahead.
+            {
+                "id": "guest",
+                "offset_seconds": -10.0,
+                "sync_rate": 1.0,
+                "audio_activity_windows": windows([0.0] * 24 + [0.8] * 4, key="activity"),
+            },
+        ]
+        result = transcript((0.5, 0.9), (2.5, 3.0))
+
+        receipt = worker.build_caption_word_speaker_assignments("master.mp4", result, RENDER_SEGMENTS, activity_sources=sources)
+
+        words = result["segments"][0]["words"]
+        self.assertEqual(receipt["method"], "cached_source_activity_per_word")
+        self.assertEqual([word.get("caption_speaker_camera_id") for word in words], ["host", "guest"])
+
+    def test_decodes_the_master_when_no_activity_is_cached(self):
+        samples = np.zeros((8000 * 2, 2), dtype=np.float32)
+        samples[:8000, 1] = 0.4
+        result = transcript((0.2, 0.6))
+
+        with mock.patch.object(worker, "extract_caption_channel_samples", return_value=(samples, 8000)) as decode:
+            receipt = worker.build_caption_word_speaker_assignments("master.mp4", result, RENDER_SEGMENTS)
+
+        decode.assert_called_once()
+        self.assertEqual(receipt["method"], "stereo_channel_rms_per_word")
+        self.assertEqual(result["segments"][0]["words"][0]["caption_speaker_camera_id"], "guest")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+import shutil
+import subprocess
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from unittest import mock
+
+from python_media_worker import chunked_transcription as chunking
+import python_media_worker.main_media_server as worker
+
+
+def word(start, end, text):
+    return {"start": start, "end": end, "word": text, "probability": 0.9}
+
+
+class ChunkedTranscriptionTests(unittest.TestCase):
+    def test_chunks_end_in_silence_nearest_the_target_length(self):
+        silences = [(20.0, 21.0), (70.0, 71.0), (95.0, 96.0), (180.0, 181.0)]
+
+        chunks = chunking.plan_transcription_chunks(240.0, silences, min_seconds=30, target_seconds=75, max_seconds=120)
+
+        self.assertEqual([(chunk["start"], chunk["end"]) for chunk in chunks], [(0.0, 70.5), (70.5, 180.5), (180.5, 240.0)])
+        self.assertFalse(any(chunk["forced_end"] for chunk in chunks))
+        self.assertEqual([(chunk["audio_start"], chunk["audio_end"]) for chunk in chunks][1], (70.5, 180.5))
+
+    def test_speech_without_silence_is_force_split_with_overlap(self):
+        chunks = chunking.plan_transcription_chunks(250.0, [], min_seconds=30, max_seconds=120, overlap_seconds=1.5)
+
+        self.assertEqual([(chunk["start"], chunk["end"]) for chunk in chunks], [(0.0, 120.0), (120.0, 250.0)])
+        self.assertTrue(chunks[0]["forced_end"])
+        self.assertEqual((chunks[0]["audio_start"], chunks[0]["audio_end"]), (0.0, 121.5))
+        self.assertEqual((chunks[1]["audio_start"], chunks[1]["audio_end"]), (118.5, 250.0))
+
+    def test_short_input_is_a_single_chunk(self):
+        chunks = chunking.plan_transcription_chunks(42.0, [(10.0, 11.0)])
+
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual((chunks[0]["start"], chunks[0]["end"]), (0.0, 42.0))
+
+    def test_stitch_keeps_overlap_words_once_and_offsets_times(self):
+        first = {"index": 0, "start": 0.0, "end": 10.0, "audio_start": 0.0, "audio_end": 11.0, "forced_end": True}
+        second = {"index": 1, "start": 10.0, "end": 20.0, "audio_start": 9.0, "audio_end": 20.0, "forced_end": False}
+        first_result = {
+            "language": "en",
+            "segments": [
+                {"id": 0, "start": 8.0, "end": 10.9, "text": " one two three", "words": [
+                    word(8.0, 8.5, " one"), word(9.2, 9.7, " two"), word(10.1, 10.9, " three"),
+                ]},
+            ],
+        }
+        second_result = {
+            "language": "en",
+            "segments": [
+                {"id": 0, "start": 0.2, "end": 3.0, "text": " two three four", "words": [
+                    word(0.2, 0.7, " two"), word(1.1, 1.9, " three"), word(2.5, 3.0, " four"),
+                ]},
+            ],
+        }
+
+        stitched = chunking.stitch_transcription_chunks([(second, second_result), (first, first_result)])
+
+        words = [item for segment in stitched["segments"] for item in segment["words"]]
+        self.assertEqual([item["word"] for item in words], [" one", " two", " three", " four"])
+        self.assertEqual([item["start"] for item in words], [8.0, 9.2, 10.1, 11.5])
+        self.assertEqual([segment["id"] for segment in stitched["segments"]], [0, 1])
+        self.assertEqual(stitched["segments"][0]["text"], " one two")
+        self.assertEqual(stitched["text"], "one two three four")
+        self.assertEqual(stitched["language"], "en")
+
+    def test_stitch_without_word_timestamps_uses_segment_midpoints(self):
+        first = {"index": 0, "start": 0.0, "end": 10.0, "audio_start": 0.0, "audio_end": 11.0, "forced_end": True}
+        second = {"index": 1, "start": 10.0, "end": 20.0, "audio_start": 9.0, "audio_end": 20.0, "forced_end": False}
+
+        stitched = chunking.stitch_transcription_chunks(
+            [
+                (first, {"segments": [{"start": 1.0, "end": 4.0, "text": "a"}, {"start": 9.5, "end": 11.0, "text": "b"}]}),
+                (second, {"segments": [{"start": 0.5, "end": 2.0, "text": "b"}, {"start": 3.0, "end": 6.0, "text": "c"}]}),
+            ]
+        )
+
+        self.assertEqual([(segment["start"], segment["text"]) for segment in stitched["segments"]], [(1.0, "a"), (9.5, "b"), (12.0, "c")])
+
+    @unittest.skipUnless(shutil.which("ffmpeg"), "ffmpeg is required")
+    def test_parallel_runner_pins_first_chunk_language_and_reports_timings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            audio_path = str(Path(tmp) / "speech.wav")
+            subprocess.run(
+                ["ffmpeg", "-nostdin", "-loglevel", "error", "-y", "-f", "lavfi", "-i", "sine=frequency=300:duration=9", audio_path],
+                check=True,
+            )
+            chunks = chunking.plan_transcription_chunks(9.0, [], min_seconds=2, max_seconds=3, overlap_seconds=0.5)
+            calls = []
+            lock = threading.Lock()
+
+            def transcribe_chunk(audio, language):
+                with lock:
+                    calls.append((len(audio), language))
+                return {"language": language or "af", "segments": [{"start": 0.6, "end": 1.4, "text": "x", "words": []}]}
+
+            stitched, receipt = chunking.transcribe_chunks_in_parallel(audio_path, chunks, transcribe_chunk, workers=3)
+
+        self.assertEqual(receipt["chunk_count"], 3)
+        self.assertEqual(receipt["worker_count"], 2)
+        self.assertEqual(calls[0], (56000, None))
+        self.assertEqual(sorted(language for _length, language in calls[1:]), ["af", "af"])
+        self.assertEqual(stitched["language"], "af")
+        self.assertEqual([segment["start"] for segment in stitched["segments"]], [0.6, 3.1, 6.1])
+        self.assertTrue(all(chunk["elapsed_seconds"] is not None for chunk in receipt["chunks"]))
+
+
+class ChunkedTranscriptionGateTests(unittest.TestCase):
+    def gate(self, engine, workers, configured=None):
+        environment = {"WHISPER_CHUNKED_TRANSCRIPTION": configured} if configured is not None else {}
+        with (
+            mock.patch.dict("os.environ", environment),
+            mock.patch.object(worker, "get_transcription_engine", return_value=engine),
+            mock.patch.object(worker, "get_transcription_chunk_workers", return_value=workers),
+            mock.patch.object(worker, "get_media_duration", return_value=900.0),
+        ):
+            if configured is None:
+                worker.os.environ.pop("WHISPER_CHUNKED_TRANSCRIPTION", None)
+            return worker.should_chunk_transcription("long.wav")
+
+    def test_chunking_defaults_on_only_for_parallel_faster_whisper(self):
+        self.assertTrue(self.gate("faster", 4))
+        self.assertFalse(self.gate("faster", 1))
+        self.assertFalse(self.gate("openai", 1))
+
+    def test_explicit_setting_overrides_the_default(self):
+        self.assertTrue(self.gate("openai", 1, configured="true"))
+        self.assertFalse(self.gate("faster", 4, configured="false"))
+
+
+class ChunkedTranscriptionEngineTests(unittest.TestCase):
+    def transcribe(self, audio_path, start_faster):
+        whisper_model = mock.Mock()
+        whisper_model.transcribe.return_value = {"language": "en", "segments": [], "text": ""}
+        with (
+            mock.patch.dict(
+                "os.environ",
+                {"WHISPER_CHUNK_MIN_SECONDS": "2", "WHISPER_CHUNK_TARGET_SECONDS": "3", "WHISPER_CHUNK_MAX_SECONDS": "3"},
+            ),
+            mock.patch.object(worker, "get_transcription_engine", return_value="faster"),
+            mock.patch.object(worker, "get_transcription_chunk_workers", return_value=3),
+            mock.patch.object(worker, "detect_silence_intervals_sync", return_value=[]),
+            mock.patch.object(worker, "start_faster_whisper_transcription", side_effect=start_faster),
+            mock.patch.object(worker, "get_whisper_model", return_value=whisper_model),
+            mock.patch.object(worker, "whisper", object()),
+        ):
+            worker.os.environ.pop("FASTER_WHISPER_STRICT", None)
+            result = worker.transcribe_with_hints_chunked(audio_path, language="en")
+        return result, whisper_model
+
+    def test_faster_whisper_failure_falls_back_once_for_the_whole_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            audio_path = str(Path(tmp) / "speech.wav")
+            subprocess.run(
+                ["ffmpeg", "-nostdin", "-loglevel", "error", "-y", "-f", "lavfi", "-i", "sine=frequency=300:duration=9", audio_path],
+                check=True,
+            )
+            result, whisper_model = self.transcribe(audio_path, RuntimeError("no ctranslate2"))
+
+        # One openai-whisper pass over the file, never one per parallel chunk.
+        whisper_model.transcribe.assert_called_once()
+        self.assertEqual(whisper_model.transcribe.call_args.args[0], audio_path)
+        self.assertEqual(result["engine"], "openai-whisper")
+        self.assertNotIn("chunking", result)
+
+    def test_engine_label_comes_from_the_chunk_results(self):
+        def start_faster(audio, **options):
+            return iter([{"start": 0.6, "end": 1.4, "text": "x", "words": []}]), mock.Mock(language="en", duration=3.0)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            audio_path = str(Path(tmp) / "speech.wav")
+            subprocess.run(
+                ["ffmpeg", "-nostdin", "-loglevel", "error", "-y", "-f", "lavfi", "-i", "sine=frequency=300:duration=9", audio_path],
+                check=True,
+            )
+            result, whisper_model = self.transcribe(audio_path, start_faster)
+
+        whisper_model.transcribe.assert_not_called()
+        self.assertEqual(result["engine"], "faster-whisper")
+        self.assertEqual(result["chunking"]["chunk_count"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
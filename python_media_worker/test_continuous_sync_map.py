@@ -0,0 +1,103 @@
+import random
+import unittest
+
+import numpy as np
+
+import python_media_worker.main_media_server as worker
+from python_media_worker.continuous_sync_map import CompiledSyncMap
+from python_media_worker.job_cache import job_cache_scope
+
+
+def anchor(timeline, source, status="accepted"):
+    return {"status": status, "corrected_timeline_seconds": timeline, "source_position_seconds": source}
+
+
+def scan_map(anchors, timeline_value):
+    """The original per-call filter, sort and linear scan."""
+    anchors = sorted(
+        [item for item in anchors if item["status"] == "accepted"],
+        key=lambda item: item["corrected_timeline_seconds"],
+    )
+    points = [(item["corrected_timeline_seconds"], item["source_position_seconds"]) for item in anchors]
+    if timeline_value <= points[0][0]:
+        left, right = points[0], points[1]
+    elif timeline_value >= points[-1][0]:
+        left, right = points[-2], points[-1]
+    else:
+        left, right = points[0], points[-1]
+        for index in range(len(points) - 1):
+            if points[index][0] <= timeline_value <= points[index + 1][0]:
+                left, right = points[index], points[index + 1]
+                break
+    if abs(right[0] - left[0]) < 1e-6:
+        return None
+    return left[1] + ((timeline_value - left[0]) / (right[0] - left[0])) * (right[1] - left[1])
+
+
+class CompiledSyncMapTests(unittest.TestCase):
+    def test_matches_the_scalar_scan_inside_and_outside_the_anchors(self):
+        rng = random.Random(3)
+        anchors = [anchor(300.0 * index + rng.uniform(-5, 5), 300.0 * index + rng.uniform(-2, 2)) for index in range(12)]
+        anchors.append(anchor(450.0, 9000.0, status="rejected_low_confidence"))
+        rng.shuffle(anchors)
+        compiled = CompiledSyncMap.from_anchors(anchors)
+
+        targets = [rng.uniform(-200, 3800) for _ in range(300)] + [item["corrected_timeline_seconds"] for item in anchors]
+        batch = compiled.to_source_many(targets)
+        for target, mapped in zip(targets, batch):
+            self.assertAlmostEqual(mapped, scan_map(anchors, target), places=9)
+            self.assertAlmostEqual(compiled.to_source(target), mapped, places=12)
+
+    def test_zero_width_pairs_and_short_maps_do_not_map(self):
+        self.assertIsNone(CompiledSyncMap.from_anchors([anchor(0.0, 0.0), anchor(5.0, 5.0, status="error")]))
+
+        compiled = CompiledSyncMap.from_anchors([anchor(0.0, 0.0), anchor(10.0, 10.5), anchor(10.0, 11.0)])
+        self.assertIsNone(compiled.to_source(12.0))
+        self.assertIsNone(scan_map([anchor(0.0, 0.0), anchor(10.0, 10.5), anchor(10.0, 11.0)], 12.0))
+        self.assertAlmostEqual(compiled.to_source(5.0), 5.25)
+
+    def test_inverse_round_trips_only_when_source_is_increasing(self):
+        compiled = CompiledSyncMap.from_anchors([anchor(0.0, 2.0), anchor(100.0, 103.0), anchor(200.0, 201.0)])
+        timelines = np.linspace(-20.0, 230.0, 26)
+
+        self.assertTrue(compiled.invertible)
+        np.testing.assert_allclose(compiled.to_timeline_many(compiled.to_source_many(timelines)), timelines)
+
+        folded = CompiledSyncMap.from_anchors([anchor(0.0, 10.0), anchor(100.0, 5.0)])
+        self.assertFalse(folded.invertible)
+        self.assertIsNone(folded.to_timeline(7.0))
+
+
+class WorkerSyncMapTests(unittest.TestCase):
+    def setUp(self):
+        self.enterContext(job_cache_scope())
+        self.source = {"id": "cam1", "offset_seconds": 4.0, "sync_rate": 1.001}
+        worker.activate_continuous_sync_map(
+            self.source, [anchor(10.0, 6.0), anchor(400.0, 397.5), anchor(800.0, 798.0)]
+        )
+
+    def test_batch_and_inverse_agree_with_the_scalar_helpers(self):
+        timeline_starts = np.arange(0.0, 900.0, 7.5)
+        batch = worker.get_source_starts_for_timeline(self.source, 2.0, timeline_starts)
+
+        for timeline_start, source_start in zip(timeline_starts, batch):
+            self.assertAlmostEqual(source_start, worker.get_source_start_for_timeline(self.source, 2.0, timeline_start))
+            self.assertAlmostEqual(worker.get_timeline_for_source_position(self.source, 2.0, source_start), timeline_start)
+
+    def test_sources_without_a_map_use_offset_and_rate(self):
+        plain = {"id": "cam2", "offset_seconds": 4.0, "sync_rate": 1.001}
+
+        self.assertTrue(np.isnan(worker.map_timelines_to_source_with_continuous_sync(plain, [1.0, 2.0])).all())
+        np.testing.assert_allclose(worker.get_source_starts_for_timeline(plain, 1.0, [9.0]), [6.006])
+        self.assertAlmostEqual(worker.get_timeline_for_source_position(plain, 1.0, 6.006), 9.0)
+
+    def test_reactivating_the_map_recompiles(self):
+        self.assertAlmostEqual(worker.map_timeline_to_source_with_continuous_sync(self.source, 410.0), 407.5125)
+
+        worker.activate_continuous_sync_map(self.source, [anchor(0.0, 10.0), anchor(500.0, 510.0)])
+
+        self.assertAlmostEqual(worker.map_timeline_to_source_with_continuous_sync(self.source, 410.0), 420.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
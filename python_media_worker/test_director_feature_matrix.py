@@ -0,0 +1,133 @@
+import random
+import unittest
+
+import numpy as np
+
+import python_media_worker.main_media_server as worker
+from python_media_worker.director_feature_matrix import DirectorFeatureMatrix
+from python_media_worker.job_cache import job_cache_scope
+
+
+def director_source(camera_id, rng, duration=60.0, **extra):
+    source = {
+        "id": camera_id,
+        "duration": duration,
+        "offset_seconds": rng.uniform(-1.5, 1.5),
+        "sync_rate": 1.0,
+        "has_audio": True,
+        "placeholder_score": 0.1,
+        "window_scores": [
+            {
+                "face_score": rng.random(),
+                "motion_score": rng.random(),
+                "visual_speaking_score": rng.random(),
+                "visual_speaking_confidence": rng.random(),
+                "placeholder_penalty": rng.random() * 0.3,
+            }
+            for _ in range(40)
+        ],
+        "audio_activity_windows": [
+            {"time": index * 0.37, "activity": rng.random(), "db": rng.uniform(-60.0, -10.0)}
+            for index in range(150)
+        ],
+    }
+    source.update(extra)
+    return source
+
+
+class DirectorFeatureMatrixTests(unittest.TestCase):
+    def test_matrix_matches_scalar_sampling(self):
+        rng = random.Random(2)
+        sources = [
+            director_source("cam1", rng),
+            director_source("cam2", rng, duration=30.0, dead_footage_intervals=[(5.0, 9.0)]),
+        ]
+        tuning = worker.get_multicam_switch_tuning("balanced", 1.5)
+
+        matrix = worker.build_multicam_director_feature_matrix(sources, 0.0, 45.0, 1.5, 1.5, tuning)
+
+        self.assertEqual(matrix.shape[:2], (30, 2))
+        for window, current_time in enumerate(matrix.times.tolist()):
+            for column, source in enumerate(sources):
+                relative_time = worker.get_source_start_for_timeline(source, 0.0, current_time)
+                windows = source["audio_activity_windows"]
+                current = worker.get_audio_activity_score_near_source_time(windows, relative_time, window_seconds=1.1)
+                upcoming = worker.get_audio_activity_score_near_source_time(windows, relative_time + 0.45, window_seconds=0.8)
+                db = max(
+                    worker.get_audio_db_near_source_time(windows, relative_time, window_seconds=1.1),
+                    worker.get_audio_db_near_source_time(windows, relative_time + 0.45, window_seconds=0.8),
+                )
+                self.assertEqual(matrix["current_audio_activity"][window, column], current)
+                self.assertEqual(matrix["audio_activity"][window, column], max(current, upcoming * 0.92))
+                self.assertEqual(matrix["audio_db"][window, column], db)
+                live = 0.0 <= relative_time < source["duration"] and not worker.is_time_in_silence(
+                    relative_time, source.get("dead_footage_intervals")
+                )
+                self.assertEqual(bool(matrix["available"][window, column]), live)
+
+        ranks = matrix["audio_rank"]
+        any_live = (matrix["available"] > 0).any(axis=1)
+        both = (matrix["available"] > 0).all(axis=1)
+        leaders = np.argmax(np.where(matrix["available"] > 0, matrix["audio_activity"], -1.0), axis=1)
+        np.testing.assert_array_equal(ranks[np.arange(len(matrix)), leaders][any_live], 0.0)
+        self.assertTrue(((ranks >= 0) == (matrix["available"] > 0)).all())
+        self.assertTrue(set(ranks[both].ravel().tolist()) <= {0.0, 1.0})
+
+    def test_interval_membership_matches_scalar_lookups(self):
+        rng = random.Random(9)
+        intervals = []
+        for _ in range(40):
+            start = round(rng.uniform(0.0, 60.0), 2)
+            intervals.append((start, round(start + rng.uniform(0.0, 6.0), 2)))
+        times = np.concatenate([np.linspace(-2.0, 70.0, 721), np.array([start for start, _end in intervals])])
+
+        np.testing.assert_array_equal(
+            worker.times_in_intervals(times, intervals),
+            [worker.is_time_in_silence(value, iter(intervals)) for value in times.tolist()],
+        )
+        self.assertFalse(worker.times_in_intervals(times, None).any())
+
+    def test_matrix_is_memoized_within_a_job_until_evidence_changes(self):
+        rng = random.Random(3)
+        sources = [director_source("cam1", rng), director_source("cam2", rng)]
+        tuning = worker.get_multicam_switch_tuning("balanced", 2.0)
+
+        with job_cache_scope():
+            first = worker.build_multicam_director_feature_matrix(sources, 0.0, 40.0, 2.0, 2.0, tuning)
+            self.assertIs(worker.build_multicam_director_feature_matrix(sources, 0.0, 40.0, 2.0, 2.0, tuning), first)
+            self.assertIsNot(worker.build_multicam_director_feature_matrix(sources, 0.0, 40.0, 0.5, 2.0, tuning), first)
+
+            sources[1]["audio_activity_windows"] = [{"time": 0.0, "activity": 1.0}]
+            rebuilt = worker.build_multicam_director_feature_matrix(sources, 0.0, 40.0, 2.0, 2.0, tuning)
+            self.assertIsNot(rebuilt, first)
+            self.assertEqual(rebuilt["current_audio_activity"][:, 1].tolist(), [1.0] * len(rebuilt))
+
+        # The next job starts from scratch rather than reusing this one's matrix.
+        with job_cache_scope():
+            self.assertIsNot(worker.build_multicam_director_feature_matrix(sources, 0.0, 40.0, 2.0, 2.0, tuning), rebuilt)
+
+    def test_dominant_speaker_runs_are_memoized_per_job(self):
+        sources = [
+            {"id": camera_id, "timeline_audio_activity_windows": [{"time": index * 0.5, "activity": level} for index in range(8)]}
+            for camera_id, level in (("cam1", 0.9), ("cam2", 0.1))
+        ]
+
+        with job_cache_scope() as scope:
+            runs = worker.multicam_dominant_speaker_runs(sources, 0.34, 0.14)
+            self.assertIs(worker.multicam_dominant_speaker_runs(sources, 0.34, 0.14), runs)
+            self.assertIsNot(worker.multicam_dominant_speaker_runs(sources, 0.5, 0.14), runs)
+            self.assertEqual(scope.entry_count(), 2)
+        self.assertEqual(scope.entry_count(), 0)
+
+    def test_window_rows_skip_unavailable_cameras(self):
+        matrix = DirectorFeatureMatrix([0.0, 1.0], ["a", "b"])
+        matrix["available"] = [[1.0, 0.0], [1.0, 1.0]]
+        matrix["audio_activity"] = [[0.2, 0.9], [0.3, 0.4]]
+
+        self.assertEqual([camera for camera, _ in matrix.window_rows(0)], ["a"])
+        self.assertEqual(matrix.window_rows(1)[1][1]["audio_activity"], 0.4)
+        np.testing.assert_array_equal(matrix.rank_descending("audio_activity"), [[0.0, -1.0], [1.0, 0.0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
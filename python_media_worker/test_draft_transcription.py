@@ -0,0 +1,60 @@
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import python_media_worker.main_media_server as worker
+
+
+class DraftTranscriptRefinementTests(unittest.TestCase):
+    def test_only_top_windows_are_retranscribed_with_the_refinement_model(self):
+        candidates = [
+            {"id": "a", "start": 10.0, "end": 30.0, "text": "draft a"},
+            {"id": "b", "start": 40.0, "end": 55.0, "text": "draft b"},
+            {"id": "c", "start": 70.0, "end": 90.0, "text": "draft c"},
+        ]
+        windows = []
+        models = []
+
+        def fake_load(path, start, duration):
+            windows.append((round(start, 2), round(duration, 2)))
+            return np.zeros(16000, dtype=np.float32)
+
+        def fake_transcribe(audio, **options):
+            models.append(options["model_name"])
+            return {"segments": [{"start": 0.0, "end": 1.0, "text": f" refined {len(models)}"}]}
+
+        with mock.patch.object(worker, "load_transcription_audio_window", side_effect=fake_load), mock.patch.object(
+            worker, "transcribe_with_hints_uncached", side_effect=fake_transcribe
+        ):
+            refined, receipt = worker.refine_draft_transcript_windows(
+                "analysis.mp4", candidates, model_name="small", max_windows=2
+            )
+
+        self.assertEqual(windows, [(9.4, 21.2), (39.4, 16.2)])
+        self.assertEqual(models, ["small", "small"])
+        self.assertEqual([candidate["text"] for candidate in refined], ["refined 1", "refined 2", "draft c"])
+        self.assertEqual(refined[0]["transcriptTier"], "refined")
+        self.assertNotIn("transcriptTier", refined[2])
+        self.assertEqual(receipt["refinedIds"], ["a", "b"])
+        self.assertEqual(candidates[0]["text"], "draft a")
+
+    def test_failed_window_keeps_its_draft_text(self):
+        with mock.patch.object(worker, "load_transcription_audio_window", side_effect=RuntimeError("decode failed")):
+            refined, receipt = worker.refine_draft_transcript_windows(
+                "analysis.mp4", [{"id": "a", "start": 0.0, "end": 12.0, "text": "draft"}]
+            )
+
+        self.assertEqual(refined[0]["text"], "draft")
+        self.assertEqual(receipt["refinedWindows"], 0)
+
+    def test_draft_model_defaults_to_tiny(self):
+        with mock.patch.dict(os.environ, {"PROMO_DRAFT_WHISPER_MODEL": ""}):
+            self.assertEqual(worker.get_promo_draft_whisper_model_name(), "tiny")
+        with mock.patch.dict(os.environ, {"PROMO_DRAFT_WHISPER_MODEL": "Base"}):
+            self.assertEqual(worker.get_promo_draft_whisper_model_name(), "base")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import asyncio
+import unittest
+
+from python_media_worker.job_cache import (
+    JobScopedCache,
+    job_cache_active,
+    job_cache_scope,
+    job_cache_scoped,
+    list_fingerprint,
+)
+
+
+class JobScopedCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache = JobScopedCache(max_entries=2)
+        self.builds = []
+
+    def lookup(self, points, key="metric"):
+        def build():
+            self.builds.append(len(points))
+            return sum(points)
+
+        return self.cache.get(points, key, list_fingerprint(points), build)
+
+    def test_entries_live_only_inside_the_scope(self):
+        points = [1.0, 2.0]
+
+        self.lookup(points)
+        self.assertFalse(job_cache_active())
+        with job_cache_scope() as scope:
+            self.assertTrue(job_cache_active())
+            self.lookup(points)
+            self.lookup(points)
+            with job_cache_scope() as nested:
+                self.assertIs(nested, scope)
+                self.lookup(points)
+            self.assertEqual(scope.entry_count(), 1)
+        self.assertEqual(scope.entry_count(), 0)
+        self.lookup(points)
+
+        self.assertEqual(self.builds, [2, 2, 2])
+
+    def test_rebuilds_when_the_list_grows(self):
+        points = [1.0, 2.0]
+
+        with job_cache_scope():
+            self.lookup(points)
+            points.append(3.0)
+            self.assertEqual(self.lookup(points), 6.0)
+            self.lookup(points)
+
+        self.assertEqual(self.builds, [2, 3])
+
+    def test_concurrent_jobs_keep_separate_entries(self):
+        points = [1.0, 2.0]
+        scopes = []
+
+        @job_cache_scoped
+        async def job():
+            self.lookup(points)
+            await asyncio.sleep(0)
+            self.lookup(points)
+            with job_cache_scope() as scope:
+                scopes.append(scope)
+
+        async def run_both():
+            await asyncio.gather(job(), job())
+
+        asyncio.run(run_both())
+
+        self.assertEqual(self.builds, [2, 2])
+        self.assertIsNot(scopes[0], scopes[1])
+        self.assertEqual([scope.entry_count() for scope in scopes], [0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
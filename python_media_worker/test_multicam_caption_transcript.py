@@ -0,0 +1,124 @@
+import asyncio
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import python_media_worker.main_media_server as worker
+
+
+def fake_transcript():
+    return {
+        "text": "hello there general kenobi",
+        "segments": [
+            {
+                "id": 0,
+                "start": 0.5,
+                "end": 2.0,
+                "text": "hello there",
+                "words": [
+                    {"start": 0.5, "end": 1.0, "word": " hello", "probability": 0.9},
+                    {"start": 1.1, "end": 2.0, "word": " there", "probability": 0.9},
+                ],
+            },
+            {
+                "id": 1,
+                "start": 5.5,
+                "end": 7.0,
+                "text": "general kenobi",
+                "words": [
+                    {"start": 5.5, "end": 6.0, "word": " general", "probability": 0.9},
+                    {"start": 6.1, "end": 7.0, "word": " kenobi", "probability": 0.9},
+                ],
+            },
+        ],
+    }
+
+
+class MulticamCaptionTranscriptTests(unittest.TestCase):
+    def test_shift_moves_words_onto_output_timeline_and_clips(self):
+        mapped = worker.shift_multicam_caption_transcript(fake_transcript(), -1.0, 5.5)
+
+        self.assertEqual([segment["id"] for segment in mapped["segments"]], [0, 1])
+        self.assertEqual(mapped["segments"][0]["start"], 0.0)
+        self.assertEqual(mapped["segments"][0]["words"], [{"start": 0.1, "end": 1.0, "word": " there", "probability": 0.9}])
+        self.assertEqual([word["word"] for word in mapped["segments"][1]["words"]], [" general", " kenobi"])
+        self.assertEqual(mapped["segments"][1]["end"], 5.5)
+
+        trimmed = worker.shift_multicam_caption_transcript(fake_transcript(), 0.0, 4.0)
+        self.assertEqual(trimmed["text"], "hello there")
+
+    def test_camera_audio_bed_source_prefers_primary_and_inferred_anchor(self):
+        sources = [
+            {"id": "a", "has_audio": False, "offset_seconds": 0.0},
+            {"id": "b", "has_audio": True, "offset_seconds": 2.0},
+        ]
+        source_map = {source["id"]: source for source in sources}
+        segments = [
+            {"camera_id": "a", "timeline_start": 0.0, "source_start": 8.0},
+            {"camera_id": "b", "timeline_start": 4.0, "source_start": 12.5},
+        ]
+
+        audio_source, anchor = worker.resolve_multicam_camera_audio_bed_source(source_map, sources, "a", segments, 10.0)
+
+        self.assertEqual(audio_source["id"], "b")
+        self.assertEqual(anchor, 8.5)
+        self.assertEqual(
+            worker.resolve_multicam_camera_audio_bed_source({}, [sources[0]], None, segments, 10.0),
+            (None, None),
+        )
+
+    @unittest.skipUnless(shutil.which("ffmpeg"), "ffmpeg is required")
+    def test_clean_audio_is_transcribed_once_and_cached_by_audio_hash(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            audio_path = str(Path(tmp) / "clean.wav")
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-nostdin",
+                    "-loglevel",
+                    "error",
+                    "-y",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "sine=frequency=440:duration=12",
+                    audio_path,
+                ],
+                check=True,
+            )
+            transcribed_paths = []
+
+            def fake_transcribe(path, **kwargs):
+                transcribed_paths.append(path)
+                self.assertTrue(kwargs["word_timestamps"])
+                return fake_transcript()
+
+            with mock.patch.object(worker, "whisper", object()), mock.patch.object(
+                worker, "transcribe_with_hints_uncached", side_effect=fake_transcribe
+            ), mock.patch.dict(os.environ, {"TRANSCRIPT_CACHE_DIR": tmp, "TRANSCRIPT_CACHE_FIRESTORE": "0"}):
+                first = asyncio.run(worker.prepare_multicam_caption_transcript(audio_path, 2.0, 6.0, "job-a"))
+                second = asyncio.run(worker.prepare_multicam_caption_transcript(audio_path, 2.0, 6.0, "job-b"))
+
+        self.assertEqual(first["status"], "ready")
+        self.assertFalse(first["cache_hit"])
+        self.assertTrue(second["cache_hit"])
+        self.assertEqual(len(transcribed_paths), 1)
+        self.assertEqual(first["audio_sha256"], second["audio_sha256"])
+        self.assertEqual(first["window_start_seconds"], 2.0)
+        self.assertEqual(second["transcript"]["segments"], first["transcript"]["segments"])
+        self.assertFalse(os.path.exists(transcribed_paths[0]))
+
+    def test_failed_prepass_never_raises(self):
+        with mock.patch.object(worker, "whisper", None):
+            receipt = asyncio.run(worker.prepare_multicam_caption_transcript("/missing.wav", 0.0, 5.0, "job-c"))
+
+        self.assertEqual(receipt["status"], "failed")
+        self.assertNotIn("transcript", receipt)
+
+
+if __name__ == "__main__":
+    unittest.main()
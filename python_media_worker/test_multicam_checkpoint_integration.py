@@ -347,7 +347,23 @@ class MulticamCheckpointIntegrationTests(unittest.TestCase):
                 )
             )
 
-            cleanup = worker.delete_multicam_checkpoint_prefix("job-123")
+            # Finished renders keep their chunks for re-planning by default.
+            retained = worker.finish_multicam_checkpoint_storage(
+                "job-123",
+                "temp/multicam-checkpoints/job-123/plan",
+                [uploaded],
+            )
+            self.assertEqual(retained["status"], "retained_for_replan")
+            self.assertEqual(retained["retained_bytes"], len(b"deterministic-checkpoint-payload"))
+            self.assertEqual(retained["retention_hours"], 24)
+            self.assertIn(storage_path, bucket.objects)
+
+            with mock.patch.object(worker, "MULTICAM_RETAIN_CHECKPOINTS_FOR_REPLAN", False):
+                cleanup = worker.finish_multicam_checkpoint_storage(
+                    "job-123",
+                    "temp/multicam-checkpoints/job-123/plan",
+                    [uploaded],
+                )
             self.assertEqual(cleanup["deleted"], 1)
             self.assertNotIn(storage_path, bucket.objects)
             self.assertIn(other_path, bucket.objects)
@@ -0,0 +1,224 @@
+import asyncio
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import python_media_worker.main_media_server as worker
+from python_media_worker.resource_scheduler import ResourceScheduler
+
+
+def cut_segment(start, end, camera_id, layout_mode="cut"):
+    return {
+        "camera_id": camera_id,
+        "timeline_start": start,
+        "timeline_end": end,
+        "source_start": start + 0.5,
+        "source_end": end + 0.5,
+        "layout_mode": layout_mode,
+    }
+
+
+def probe_frame_count(path):
+    output = subprocess.run(
+        [
+            "ffprobe",
+            "-v",
+            "error",
+            "-count_frames",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "stream=nb_read_frames",
+            "-of",
+            "default=nw=1:nk=1",
+            path,
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return int(output.strip())
+
+
+class MulticamChunkRenderUnitTests(unittest.TestCase):
+    def test_cut_runs_are_grouped_around_composites(self):
+        segments = [cut_segment(float(index), float(index + 1), "cam1") for index in range(6)]
+        cut_plans = [{"index": 0}, {"index": 1}, None, {"index": 3}, {"index": 4}, {"index": 5}]
+
+        units = worker.plan_multicam_chunk_render_units(segments, cut_plans, max_inputs=2)
+
+        self.assertEqual([(offset, len(items)) for offset, items, _ in units], [(0, 2), (2, 1), (3, 2), (5, 1)])
+        self.assertEqual(units[1][2], [None])
+
+    def test_cut_run_inputs_shrink_with_the_largest_render_input(self):
+        sources = [{"id": "cam1", "path": "cam1.mp4"}, {"id": "cam2", "path": "cam2.mp4", "render_path": "cam2_proxy.mp4"}]
+        dimensions = {"cam1.mp4": (3840, 2160), "cam2_proxy.mp4": (1280, 720)}
+        scheduler = ResourceScheduler(vcpu=16.0, memory_limit_bytes=2 * 1024 ** 3, usage_reader=lambda: (None, None, None))
+
+        with mock.patch.object(worker, "resource_scheduler", scheduler), mock.patch.object(
+            worker, "get_video_dimensions", side_effect=lambda path: dimensions[path]
+        ):
+            self.assertEqual(worker.multicam_cut_run_max_inputs(sources, 1), 2)
+            self.assertEqual(worker.multicam_cut_run_max_inputs(sources[1:], 1), worker.MULTICAM_CHUNK_CUT_RENDER_MAX_INPUTS)
+
+    def test_composites_and_out_of_bounds_cuts_stay_per_segment(self):
+        sources = [{"id": "cam1", "label": "Cam 1", "path": "cam1.mp4", "duration": 4.0}]
+        source_map = {"cam1": sources[0]}
+
+        def plan(segment):
+            return worker.multicam_chunk_cut_plan(segment, source_map, sources, {})
+
+        self.assertIsNotNone(plan(cut_segment(0.0, 1.0, "cam1")))
+        self.assertIsNone(plan(cut_segment(0.0, 1.0, "cam1", layout_mode="pip")))
+        self.assertIsNone(plan(cut_segment(3.0, 4.0, "cam1")))
+
+    def test_camera_tracks_split_at_every_own_boundary(self):
+        sources = [
+            {"id": camera_id, "label": camera_id, "path": f"{camera_id}.mp4", "duration": 20.0}
+            for camera_id in ("cam1", "cam2", "cam3")
+        ]
+        source_map = {source["id"]: source for source in sources}
+        segments = [
+            cut_segment(0.0, 1.0, "cam1"),
+            cut_segment(1.0, 2.5, "cam2"),
+            cut_segment(2.5, 3.0, "cam1"),
+            cut_segment(3.0, 4.0, "cam2", layout_mode="pip"),
+            cut_segment(4.0, 5.0, "cam1"),
+            cut_segment(5.0, 6.0, "cam3"),
+        ]
+        cut_plans = [worker.multicam_chunk_cut_plan(segment, source_map, sources, {}) for segment in segments]
+
+        tracks = worker.plan_multicam_camera_tracks(cut_plans, segments)
+
+        self.assertEqual([track["camera_id"] for track in tracks], ["cam1"])
+        track = tracks[0]
+        self.assertEqual(track["split_frames"], [30, 75, 90, 120])
+        self.assertEqual(track["pieces"], [0, None, 2, None, 4])
+        self.assertEqual(track["piece_frame_counts"], [30, 45, 15, 30, 30])
+        self.assertEqual(track["cut_plan"]["frame_count"], 150)
+        self.assertAlmostEqual(track["cut_plan"]["input_seek"], 0.5)
+
+        drifting = [dict(segment) for segment in segments]
+        drifting[4]["source_start"] += 0.1
+        drifting[4]["source_end"] += 0.1
+        drifting_plans = [worker.multicam_chunk_cut_plan(segment, source_map, sources, {}) for segment in drifting]
+        self.assertEqual(worker.plan_multicam_camera_tracks(drifting_plans, drifting), [])
+
+
+@unittest.skipUnless(shutil.which("ffmpeg") and shutil.which("ffprobe"), "ffmpeg is required")
+class MulticamCutRunRenderTests(unittest.TestCase):
+    def test_cut_run_is_frame_exact_against_the_master_timeline(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            sources = []
+            for camera_id, size in (("cam1", "320x180"), ("cam2", "180x320")):
+                path = str(Path(tmp) / f"{camera_id}.mp4")
+                subprocess.run(
+                    [
+                        "ffmpeg",
+                        "-nostdin",
+                        "-loglevel",
+                        "error",
+                        "-y",
+                        "-f",
+                        "lavfi",
+                        "-i",
+                        f"testsrc2=size={size}:rate=30:duration=4",
+                        "-pix_fmt",
+                        "yuv420p",
+                        path,
+                    ],
+                    check=True,
+                )
+                sources.append({"id": camera_id, "label": camera_id, "path": path, "duration": 4.0})
+            source_map = {source["id"]: source for source in sources}
+            # Quarter-frame boundaries: per-segment rounding would drift here.
+            boundaries = [0.0, 0.7083, 1.3125, 2.0458, 2.9]
+            segments = [
+                cut_segment(start, end, ("cam1", "cam2")[index % 2])
+                for index, (start, end) in enumerate(zip(boundaries, boundaries[1:]))
+            ]
+            cut_plans = [worker.multicam_chunk_cut_plan(segment, source_map, sources, {}) for segment in segments]
+            output_path = str(Path(tmp) / "run.mp4")
+
+            receipt = asyncio.run(
+                worker.render_multicam_cut_run(
+                    cut_plans,
+                    output_path,
+                    0,
+                    output_width=320,
+                    output_height=180,
+                    job_id="test",
+                )
+            )
+            frame_count = probe_frame_count(output_path)
+
+        expected = worker.multicam_timeline_frame_count(boundaries[0], boundaries[-1])
+        self.assertEqual(sum(plan["frame_count"] for plan in cut_plans), expected)
+        self.assertEqual(frame_count, expected)
+        self.assertEqual(receipt["frame_count"], expected)
+        self.assertEqual(receipt["segment_count"], 4)
+        self.assertTrue(receipt["ok"])
+
+    def test_camera_track_pieces_stream_copy_to_exact_segments(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "cam1.mp4")
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-nostdin",
+                    "-loglevel",
+                    "error",
+                    "-y",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "testsrc2=size=320x180:rate=30:duration=4",
+                    "-pix_fmt",
+                    "yuv420p",
+                    path,
+                ],
+                check=True,
+            )
+            sources = [{"id": "cam1", "label": "cam1", "path": path, "duration": 4.0}]
+            source_map = {"cam1": sources[0]}
+            segments = [
+                cut_segment(0.0, 0.7083, "cam1"),
+                cut_segment(1.3125, 2.0458, "cam1"),
+                cut_segment(2.0458, 2.9, "cam1"),
+            ]
+            cut_plans = [worker.multicam_chunk_cut_plan(segment, source_map, sources, {}) for segment in segments]
+            track = worker.plan_multicam_camera_tracks(cut_plans, segments)[0]
+            track_path = str(Path(tmp) / "track.mp4")
+
+            async def render_and_split():
+                await worker.render_multicam_cut_run(
+                    [track["cut_plan"]],
+                    track_path,
+                    0,
+                    output_width=320,
+                    output_height=180,
+                    job_id="test",
+                    keyframe_frames=track["split_frames"],
+                )
+                return await worker.split_multicam_camera_track(
+                    track_path,
+                    track["split_frames"],
+                    str(Path(tmp) / "piece_%04d.mp4"),
+                    "test",
+                )
+
+            piece_paths = asyncio.run(render_and_split())
+            piece_frames = [probe_frame_count(piece_path) for piece_path in piece_paths]
+
+        self.assertEqual(track["pieces"], [0, None, 1, 2])
+        self.assertEqual(piece_frames, track["piece_frame_counts"])
+        for piece_frame_count, segment_offset in zip(piece_frames, track["pieces"]):
+            if segment_offset is not None:
+                self.assertEqual(piece_frame_count, cut_plans[segment_offset]["frame_count"])
+
+
+if __name__ == "__main__":
+    unittest.main()
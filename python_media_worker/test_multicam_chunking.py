@@ -1,14 +1,36 @@
 import copy
+import json
 import tempfile
 import unittest
 from pathlib import Path
 
+import numpy as np
+
+import python_media_worker.main_media_server as worker
 from python_media_worker.multicam_chunking import (
     build_multicam_chunk_plan,
+    diff_multicam_plans,
+    materialize_multicam_chunk,
     multicam_chunk_checkpoint_paths,
+    multicam_chunk_fingerprints,
     multicam_chunk_plan_fingerprint,
+    multicam_replan_window,
     partition_multicam_render_segments,
+    partition_multicam_segment_table,
+    splice_multicam_replanned_segments,
 )
+from python_media_worker.segment_table import SegmentTable
+
+
+def plan_segment(start, end, camera_id, layout_mode="cut"):
+    return {
+        "timeline_start": start,
+        "timeline_end": end,
+        "camera_id": camera_id,
+        "source_start": start + 10.0,
+        "source_end": end + 10.0,
+        "layout_mode": layout_mode,
+    }
 
 
 class MulticamChunkingTests(unittest.TestCase):
@@ -256,6 +278,57 @@ class MulticamChunkingTests(unittest.TestCase):
         changed[0]["segments"][0]["layout_mode"] = "pip"
         self.assertNotEqual(first["fingerprint"], multicam_chunk_plan_fingerprint(changed))
 
+    def test_table_chunks_are_views_that_materialize_to_the_dict_partition(self):
+        segments = [
+            dict(
+                plan_segment(float(index) * 7.5, float(index + 1) * 7.5, f"cam{index % 3}"),
+                layout_reason="sustained_isolated_handoff",
+                ranked_sources=[{"camera_id": f"cam{index % 3}", "score": 0.5}],
+            )
+            for index in range(200)
+        ]
+        table = SegmentTable.from_segments(segments)
+
+        views = partition_multicam_segment_table(table, 300.0)
+        expected = partition_multicam_render_segments(segments, 300.0)
+
+        self.assertEqual(len(views), 5)
+        # Every chunk is a view of the one validated row buffer.
+        for view in views[1:]:
+            self.assertIs(view["rows"].rows.base, views[0]["rows"].rows.base)
+            self.assertFalse(np.shares_memory(view["rows"].rows, views[0]["rows"].rows))
+        self.assertEqual(sum(len(view["rows"]) for view in views), 200)
+        # Plans from dicts and from a table agree byte for byte at the JSON boundary.
+        self.assertEqual(
+            json.dumps([materialize_multicam_chunk(view) for view in views]),
+            json.dumps(expected),
+        )
+        self.assertEqual(
+            json.dumps([materialize_multicam_chunk(view) for view in partition_multicam_segment_table(segments, 300.0)]),
+            json.dumps(expected),
+        )
+        copied = materialize_multicam_chunk(views[0])["segments"][0]
+        shared = materialize_multicam_chunk(views[0], copy_values=False)["segments"][0]
+        self.assertIsNot(copied["ranked_sources"], segments[0]["ranked_sources"])
+        self.assertIs(shared["ranked_sources"], segments[0]["ranked_sources"])
+
+    def test_table_chunks_clip_rows_that_cross_a_boundary(self):
+        segments = [plan_segment(0.0, 250.0, "cam1"), plan_segment(250.0, 400.0, "cam2")]
+
+        views = partition_multicam_segment_table(SegmentTable.from_segments(segments), 300.0)
+        pieces = [materialize_multicam_chunk(view)["segments"] for view in views]
+
+        self.assertEqual([len(view["rows"]) for view in views], [2, 1])
+        self.assertEqual(pieces[0][1]["timeline_end"], 300.0)
+        self.assertEqual(pieces[0][1]["source_end"], 310.0)
+        self.assertEqual(pieces[1][0]["timeline_start"], 300.0)
+        self.assertEqual(pieces[1][0]["source_start"], 310.0)
+        with self.assertRaisesRegex(ValueError, "gap before segment 1"):
+            partition_multicam_segment_table(
+                SegmentTable.from_segments([plan_segment(0.0, 10.0, "cam1"), plan_segment(11.0, 20.0, "cam2")]),
+                300.0,
+            )
+
     def test_checkpoint_paths_are_deterministic_and_do_not_touch_disk(self):
         fingerprint = multicam_chunk_plan_fingerprint([])
         with tempfile.TemporaryDirectory() as temp_root:
@@ -270,5 +343,81 @@ class MulticamChunkingTests(unittest.TestCase):
             self.assertFalse(Path(first["directory"]).exists())
 
 
+class MulticamReplanTests(unittest.TestCase):
+    def setUp(self):
+        self.previous = [plan_segment(0.0, 250.0, "cam1"), plan_segment(250.0, 700.0, "cam2"), plan_segment(700.0, 1000.0, "cam1")]
+        # The re-run director also drifted a cut outside the edited range.
+        self.replanned = [
+            plan_segment(0.0, 250.0, "cam1"),
+            plan_segment(250.0, 420.0, "cam2"),
+            plan_segment(420.0, 480.0, "cam3"),
+            plan_segment(480.0, 720.0, "cam2"),
+            plan_segment(720.0, 1000.0, "cam1"),
+        ]
+
+    def test_window_snaps_to_the_partition_grid(self):
+        self.assertEqual(
+            multicam_replan_window(0.0, 1000.0, 420.0, 480.0, 300.0, margin_seconds=5.0),
+            {"start": 300.0, "end": 600.0, "chunk_indexes": [1]},
+        )
+        self.assertEqual(multicam_replan_window(0.0, 1000.0, 595.0, 610.0, 300.0)["chunk_indexes"], [1, 2])
+        self.assertEqual(multicam_replan_window(0.0, 1000.0, 1000.0, 1000.0, 300.0)["end"], 1000.0)
+
+    def test_splice_keeps_untouched_chunk_fingerprints(self):
+        window = multicam_replan_window(0.0, 1000.0, 420.0, 480.0, 300.0)
+        spliced = splice_multicam_replanned_segments(self.previous, self.replanned, window["start"], window["end"])
+
+        self.assertEqual(spliced[-1], self.previous[-1])
+        self.assertEqual((spliced[1]["timeline_end"], spliced[1]["source_end"]), (300.0, 310.0))
+        before = multicam_chunk_fingerprints(build_multicam_chunk_plan(self.previous, 300.0)["chunks"], {"tier": "premium"})
+        after = multicam_chunk_fingerprints(build_multicam_chunk_plan(spliced, 300.0)["chunks"], {"tier": "premium"})
+        self.assertEqual([left == right for left, right in zip(before, after)], [True, False, True, True])
+        self.assertNotEqual(before, multicam_chunk_fingerprints(build_multicam_chunk_plan(self.previous, 300.0)["chunks"], {"tier": "fast"}))
+
+        diff = diff_multicam_plans(self.previous, spliced, 300.0)
+        self.assertEqual(diff["changed_ranges"], [{"start": 420.0, "end": 480.0}])
+        self.assertEqual(diff["changed_chunk_indexes"], [1])
+
+    def test_spliced_segments_do_not_share_nested_values_with_either_plan(self):
+        for segment in self.previous + self.replanned:
+            segment["ranked_sources"] = [{"camera_id": segment["camera_id"], "score": 0.5}]
+        window = multicam_replan_window(0.0, 1000.0, 420.0, 480.0, 300.0)
+
+        spliced = splice_multicam_replanned_segments(self.previous, self.replanned, window["start"], window["end"])
+        for segment in spliced:
+            segment["ranked_sources"][0]["score"] = 1.0
+
+        self.assertEqual(
+            {item["ranked_sources"][0]["score"] for item in self.previous + self.replanned},
+            {0.5},
+        )
+
+    def test_diff_ignores_boundaries_but_sees_source_shifts(self):
+        split = [plan_segment(0.0, 100.0, "cam1"), plan_segment(100.0, 200.0, "cam1")]
+        self.assertEqual(diff_multicam_plans([plan_segment(0.0, 200.0, "cam1")], split)["changed_seconds"], 0.0)
+
+        shifted = copy.deepcopy(split)
+        shifted[1]["source_start"] += 0.5
+        shifted[1]["source_end"] += 0.5
+        self.assertEqual(diff_multicam_plans(split, shifted)["changed_ranges"], [{"start": 100.0, "end": 200.0}])
+
+    def test_worker_resolves_window_and_falls_back_on_mismatched_plans(self):
+        request = worker.RenderMultiCamRequest(
+            sources=[],
+            previousPlan={"job_id": "job-1", "segments": self.previous, "render_checkpoint": {"plan_fingerprint": "ab"}},
+            replanRange=[420.0, 480.0],
+        )
+        previous = worker.resolve_multicam_previous_plan(request)
+        self.assertEqual((previous["job_id"], previous["plan_fingerprint"]), ("job-1", "ab"))
+
+        receipt = worker.resolve_multicam_replan_window(request, previous, self.replanned, 300.0)
+        self.assertEqual(receipt["status"], "partial")
+        self.assertEqual(receipt["window"], {"start": 300.0, "end": 600.0})
+
+        shorter = self.replanned[:-1]
+        receipt = worker.resolve_multicam_replan_window(request, previous, shorter, 300.0)
+        self.assertEqual((receipt["status"], receipt["window"]), ("full_replan_incompatible_previous_plan", None))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -14,6 +14,11 @@ class MulticamDirectorRuleTests(unittest.TestCase):
             {"id": "cam1", "label": "Camera 1"},
             {"id": "cam2", "label": "Camera 2"},
         ]
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        patcher = mock.patch.object(worker, "WORKER_TMP_DIR", scratch.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def signed_safe_qa_receipt(self, request, duration=1200):
         receipt = {
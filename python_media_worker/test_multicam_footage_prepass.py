@@ -0,0 +1,134 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from python_media_worker import multicam_footage_prepass as prepass
+
+
+def signalstats_frame(frame_time, low, high, average):
+    return "\n".join(
+        [
+            f"[Parsed_metadata_5 @ 0x1] frame:0    pts:0       pts_time:{frame_time}",
+            f"[Parsed_metadata_5 @ 0x1] lavfi.signalstats.YLOW={low}",
+            f"[Parsed_metadata_5 @ 0x1] lavfi.signalstats.YAVG={average}",
+            f"[Parsed_metadata_5 @ 0x1] lavfi.signalstats.YHIGH={high}",
+        ]
+    )
+
+
+class MulticamFootagePrepassTests(unittest.TestCase):
+    def test_filter_log_becomes_source_timeline_intervals(self):
+        frames = []
+        for index in range(24):
+            frame_time = index * 0.25
+            if 2.0 <= frame_time < 3.5:
+                frames.append(signalstats_frame(frame_time, 72, 74, 73.0))
+            elif 1.0 <= frame_time < 2.0:
+                frames.append(signalstats_frame(frame_time, 16, 16, 16.0))
+            else:
+                frames.append(signalstats_frame(frame_time, 30, 210, 120.0))
+        log_text = "\n".join(
+            frames
+            + [
+                "[blackdetect @ 0x2] black_start:1 black_end:2 black_duration:1",
+                "[Parsed_metadata_5 @ 0x1] lavfi.freezedetect.freeze_start=1",
+                "[Parsed_metadata_5 @ 0x1] lavfi.freezedetect.freeze_end=3.5",
+                "[Parsed_metadata_5 @ 0x1] lavfi.freezedetect.freeze_start=5",
+            ]
+        )
+
+        receipt = prepass.parse_multicam_footage_prepass_log(log_text, start_time=10.0, end_time=16.5)
+
+        self.assertEqual(receipt["black_intervals"], [(11.0, 12.0)])
+        self.assertEqual(receipt["placeholder_intervals"], [(12.0, 13.5)])
+        # freezedetect never reported an end, so the freeze runs to the window end.
+        self.assertEqual(receipt["frozen_intervals"], [(11.0, 13.5), (15.0, 16.5)])
+        self.assertEqual(receipt["dead_intervals"], [(11.0, 13.5), (15.0, 16.5)])
+        self.assertEqual(receipt["frame_count"], 24)
+
+    def test_short_flat_runs_are_not_placeholders(self):
+        log_text = "\n".join(
+            signalstats_frame(index * 0.25, 72, 74, 73.0) if index in (3, 4) else signalstats_frame(index * 0.25, 30, 210, 120.0)
+            for index in range(12)
+        )
+
+        self.assertEqual(prepass.parse_multicam_footage_prepass_log(log_text)["placeholder_intervals"], [])
+
+    def test_interval_merge_and_coverage(self):
+        merged = prepass.merge_footage_intervals([(4.0, 6.0), (0.0, 1.0)], [(0.5, 2.0), (7.0, 7.0)])
+
+        self.assertEqual(merged, [(0.0, 2.0), (4.0, 6.0)])
+        self.assertAlmostEqual(prepass.footage_interval_coverage(merged, 1.0, 5.0), 0.5)
+        self.assertEqual(prepass.footage_interval_coverage(merged, 3.0, 3.0), 0.0)
+
+    @unittest.skipUnless(shutil.which("ffmpeg"), "ffmpeg is required")
+    def test_prepass_finds_black_placeholder_and_frozen_ranges(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            video_path = str(Path(tmp) / "camera.mp4")
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-nostdin",
+                    "-loglevel",
+                    "error",
+                    "-y",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "testsrc2=size=320x180:rate=30:duration=3",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "color=c=black:size=320x180:rate=30:duration=2",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "color=c=0x2040a0:size=320x180:rate=30:duration=2",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "testsrc2=size=320x180:rate=30:duration=3",
+                    "-filter_complex",
+                    "[0:v][1:v][2:v][3:v]concat=n=4:v=1:a=0",
+                    "-pix_fmt",
+                    "yuv420p",
+                    video_path,
+                ],
+                check=True,
+            )
+
+            receipt = prepass.analyze_multicam_footage_prepass(video_path, start_time=0.5, duration=9.0)
+
+        self.assertEqual(receipt["status"], "active")
+        self.assertEqual(receipt["black_intervals"], [(3.0, 5.0)])
+        self.assertEqual(receipt["placeholder_intervals"], [(5.0, 7.0)])
+        self.assertEqual(receipt["dead_intervals"], [(3.0, 7.0)])
+
+
+class DirectorDeadFootageTests(unittest.TestCase):
+    def test_frozen_exclusion_can_be_disabled(self):
+        import python_media_worker.main_media_server as worker
+
+        prepass_receipt = {
+            "black_intervals": [[1.0, 2.0]],
+            "frozen_intervals": [[1.0, 4.0]],
+            "placeholder_intervals": [[8.0, 9.0]],
+        }
+
+        self.assertEqual(
+            worker.multicam_dead_footage_intervals_for_director(prepass_receipt),
+            [(1.0, 4.0), (8.0, 9.0)],
+        )
+        with mock.patch.dict(os.environ, {"MULTICAM_EXCLUDE_FROZEN_FOOTAGE": "0"}):
+            self.assertEqual(
+                worker.multicam_dead_footage_intervals_for_director(prepass_receipt),
+                [(1.0, 2.0), (8.0, 9.0)],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
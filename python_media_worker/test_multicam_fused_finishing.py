@@ -0,0 +1,188 @@
+import asyncio
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+import python_media_worker.main_media_server as worker
+
+
+WATERMARK_FILTER = "drawtext=text='x'"
+
+
+def transcript_receipt():
+    return {
+        "status": "ready",
+        "transcript": {
+            "segments": [
+                {
+                    "start": 0.5,
+                    "end": 1.5,
+                    "text": "hello there",
+                    "words": [
+                        {"start": 0.5, "end": 1.0, "word": " hello"},
+                        {"start": 1.0, "end": 1.5, "word": " there"},
+                    ],
+                }
+            ]
+        },
+    }
+
+
+def decode_gray_frames(path, width=320, height=180):
+    raw = subprocess.run(
+        ["ffmpeg", "-nostdin", "-loglevel", "error", "-i", path, "-f", "rawvideo", "-pix_fmt", "gray", "-"],
+        check=True,
+        capture_output=True,
+    ).stdout
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, height, width).astype(np.float64)
+
+
+class MulticamFusedFinishingTests(unittest.TestCase):
+    def test_only_the_watermark_is_fused(self):
+        finishing = worker.prepare_multicam_fused_finishing(WATERMARK_FILTER)
+
+        self.assertEqual(finishing, {"watermark_filter": WATERMARK_FILTER})
+        self.assertEqual(worker.multicam_finishing_filter(finishing), WATERMARK_FILTER)
+        self.assertEqual(
+            worker.append_multicam_finishing_filter("[0:v]null[v]", finishing),
+            (f"[0:v]null[v];[v]{WATERMARK_FILTER}[finished]", "[finished]"),
+        )
+        self.assertIsNone(worker.prepare_multicam_fused_finishing(None))
+        self.assertEqual(worker.append_multicam_finishing_filter("[0:v]null[v]", None), ("[0:v]null[v]", "[v]"))
+
+    def test_chunk_fingerprint_follows_the_watermark(self):
+        finishing = worker.prepare_multicam_fused_finishing(WATERMARK_FILTER)
+        restyled = worker.prepare_multicam_fused_finishing("drawtext=text='y'")
+
+        self.assertEqual(
+            worker.multicam_finishing_fingerprint(finishing),
+            worker.multicam_finishing_fingerprint(dict(finishing)),
+        )
+        self.assertNotEqual(
+            worker.multicam_finishing_fingerprint(finishing),
+            worker.multicam_finishing_fingerprint(restyled),
+        )
+        self.assertIsNone(worker.multicam_finishing_fingerprint(None))
+
+    def finish_in_render_order(self, brand_watermark_filter):
+        """Start the transcript, fuse, encode and finish in the order the render does."""
+        burned = {}
+
+        async def burn(output_path, job_id, output_width, output_height, **options):
+            burned.update(options)
+            return {"status": "burned_in", "video_encoder": "libx264"}
+
+        async def run():
+            transcript_started = asyncio.Event()
+
+            async def transcript():
+                transcript_started.set()
+                await asyncio.sleep(0.05)
+                return transcript_receipt()
+
+            caption_transcript_task = asyncio.create_task(transcript())
+            fused_finishing = worker.prepare_multicam_fused_finishing(brand_watermark_filter)
+            # The segment encodes run while the transcript is still going.
+            await transcript_started.wait()
+            self.assertFalse(caption_transcript_task.done())
+            with mock.patch.object(worker, "burn_multicam_word_captions", side_effect=burn), mock.patch.object(
+                worker, "apply_multicam_brand_watermark"
+            ) as watermark_pass:
+                receipts = await worker.finish_multicam_master(
+                    "master.mp4",
+                    "job",
+                    320,
+                    180,
+                    fused_finishing=fused_finishing,
+                    burn_captions=True,
+                    caption_style="podcast_clean",
+                    caption_transcript_task=caption_transcript_task,
+                    brand_watermark_enabled=True,
+                    brand_watermark_text="AutoPromote",
+                    brand_watermark_filter=WATERMARK_FILTER,
+                    render_segments=[],
+                    activity_sources=[],
+                    overlap_start=0.0,
+                )
+            watermark_pass.assert_not_called()
+            return receipts
+
+        caption_receipt, brand_watermark_receipt = asyncio.run(run())
+        return caption_receipt, brand_watermark_receipt, burned
+
+    def test_captions_burn_after_mux_from_the_finished_transcript(self):
+        caption_receipt, brand_watermark_receipt, burned = self.finish_in_render_order(WATERMARK_FILTER)
+
+        self.assertEqual(caption_receipt["status"], "burned_in")
+        self.assertEqual(burned["transcript_receipt"], transcript_receipt())
+        # The watermark is already in the encodes; the caption pass must not draw it twice.
+        self.assertIsNone(burned["extra_video_filter"])
+        self.assertEqual(brand_watermark_receipt["status"], "burned_in")
+        self.assertTrue(brand_watermark_receipt["fused_into_render"])
+
+    def test_caption_pass_draws_the_watermark_when_fusion_is_off(self):
+        with mock.patch.object(worker, "MULTICAM_FUSED_FINISHING", False):
+            caption_receipt, brand_watermark_receipt, burned = self.finish_in_render_order(WATERMARK_FILTER)
+
+        self.assertEqual(caption_receipt["status"], "burned_in")
+        self.assertEqual(burned["extra_video_filter"], WATERMARK_FILTER)
+        self.assertEqual(brand_watermark_receipt["status"], "burned_in_with_captions")
+
+    @unittest.skipUnless(shutil.which("ffmpeg"), "ffmpeg is required")
+    def test_watermark_lands_on_every_frame_of_a_cut_run(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source_path = str(Path(tmp) / "cam1.mp4")
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-nostdin",
+                    "-loglevel",
+                    "error",
+                    "-y",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "color=c=0x202020:size=320x180:rate=30:duration=4",
+                    "-pix_fmt",
+                    "yuv420p",
+                    source_path,
+                ],
+                check=True,
+            )
+            sources = [{"id": "cam1", "label": "cam1", "path": source_path, "duration": 4.0}]
+            segment = {
+                "camera_id": "cam1",
+                "timeline_start": 1.0,
+                "timeline_end": 2.0,
+                "source_start": 1.0,
+                "source_end": 2.0,
+                "layout_mode": "cut",
+            }
+            cut_plan = worker.multicam_chunk_cut_plan(segment, {"cam1": sources[0]}, sources, {})
+            output_path = str(Path(tmp) / "run.mp4")
+
+            asyncio.run(
+                worker.render_multicam_cut_run(
+                    [cut_plan],
+                    output_path,
+                    0,
+                    output_width=320,
+                    output_height=180,
+                    job_id="test",
+                    finishing=worker.prepare_multicam_fused_finishing("drawbox=x=0:y=0:w=160:h=180:color=white:t=fill"),
+                )
+            )
+            frames = decode_gray_frames(output_path)
+
+        self.assertEqual(len(frames), 30)
+        self.assertTrue(np.all(frames[:, :, :150].mean(axis=(1, 2)) > 200))
+        self.assertTrue(np.all(frames[:, :, 170:].mean(axis=(1, 2)) < 60))
+
+
+if __name__ == "__main__":
+    unittest.main()
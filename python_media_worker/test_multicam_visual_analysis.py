@@ -0,0 +1,147 @@
+import asyncio
+import math
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from python_media_worker import multicam_visual_analysis as analysis
+
+
+class MulticamVisualAnalysisTests(unittest.TestCase):
+    def tearDown(self):
+        analysis.shutdown_multicam_analysis_executor()
+
+    def test_window_arrays_expand_to_director_window_dicts(self):
+        times = np.asarray([[0.0, 1.5, 0.75], [10799.25, 10800.0, 10799.625]], dtype=np.float64)
+        scores = np.asarray(
+            [
+                [0.4123, 0.1, 0.2, 0.3, 0.55, 0.9, 0.05, 0.3333, 0.0, 2],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 0.12, 0.0, np.nan, 0.72, 0],
+            ],
+            dtype=np.float32,
+        )
+
+        windows = analysis.multicam_visual_windows_from_arrays(times, scores)
+
+        self.assertEqual(len(windows), 2)
+        self.assertEqual(
+            list(windows[0].keys()),
+            [
+                "start_time",
+                "end_time",
+                "sample_time",
+                *analysis.MULTICAM_VISUAL_WINDOW_SCORE_FIELDS,
+            ],
+        )
+        self.assertEqual(windows[0]["face_score"], 0.4123)
+        self.assertEqual(windows[0]["face_center_x"], 0.3333)
+        self.assertEqual(windows[0]["face_count"], 2)
+        self.assertIsInstance(windows[0]["face_count"], int)
+        self.assertEqual(windows[1]["sample_time"], 10799.625)
+        self.assertIsNone(windows[1]["face_center_x"])
+        self.assertEqual(windows[1]["placeholder_penalty"], 0.72)
+
+    def test_unreadable_camera_returns_empty_compact_arrays(self):
+        times, scores = analysis.analyze_multicam_visual_window_arrays("/nonexistent/cam.mp4", 0.0, 0.0, 30.0, 1.0)
+
+        self.assertEqual(times.shape, (0, 3))
+        self.assertEqual(scores.shape, (0, len(analysis.MULTICAM_VISUAL_WINDOW_SCORE_FIELDS)))
+        self.assertEqual(analysis.analyze_multicam_visual_windows("/nonexistent/cam.mp4", 0.0, 0.0, 30.0, 1.0), [])
+
+    def test_histogram_percentile_stays_within_one_bin_of_numpy(self):
+        values = np.random.default_rng(7).uniform(0.0, 255.0, size=50000)
+        histogram = np.bincount(values.astype(np.int32), minlength=256)
+
+        for percentile in (10.0, 55.0, 90.0):
+            self.assertAlmostEqual(
+                analysis.multicam_histogram_percentile(histogram, percentile),
+                float(np.percentile(values, percentile)),
+                delta=1.0,
+            )
+        self.assertEqual(analysis.multicam_histogram_percentile(np.zeros(256), 50.0), 0.0)
+
+    def test_color_accumulator_matches_full_array_statistics(self):
+        rng = np.random.default_rng(11)
+        frames = [rng.integers(0, 256, size=(27, 48, 3), dtype=np.uint8) for _ in range(5)]
+        frames.append(np.full((27, 48, 3), (180, 176, 170), dtype=np.uint8))
+        accumulator = analysis.MulticamColorHistogramAccumulator()
+        for frame in frames:
+            accumulator.add_frame(frame)
+
+        profile = accumulator.profile(0.0, 30.0)
+
+        pixels = np.concatenate([frame.reshape((-1, 3)) for frame in frames]).astype(np.float32)
+        luma = (0.2126 * pixels[:, 0]) + (0.7152 * pixels[:, 1]) + (0.0722 * pixels[:, 2])
+        self.assertEqual(profile["sample_frame_count"], 6)
+        self.assertAlmostEqual(profile["mean_r"], float(np.mean(pixels[:, 0])), places=2)
+        self.assertAlmostEqual(profile["mean_luma"], float(np.mean(luma)), places=2)
+        self.assertAlmostEqual(profile["contrast_luma"], float(np.std(luma)), places=2)
+        self.assertEqual(profile["neutral_median_r"], 180.0)
+        self.assertEqual(profile["neutral_median_g"], 176.0)
+        self.assertEqual(profile["neutral_median_b"], 170.0)
+        self.assertEqual(accumulator.neutral_histograms.nbytes, 2 * 256 * 3 * 256 * 8)
+
+    def test_pool_shape_splits_opencv_threads_across_camera_workers(self):
+        with mock.patch.object(analysis, "multicam_analysis_available_cpus", return_value=8), mock.patch.dict(
+            os.environ, {}, clear=True
+        ):
+            self.assertEqual(analysis.get_multicam_analysis_pool_shape(3), (3, 2))
+            self.assertEqual(analysis.get_multicam_analysis_pool_shape(12), (8, 1))
+        with mock.patch.object(analysis, "multicam_analysis_available_cpus", return_value=8), mock.patch.dict(
+            os.environ,
+            {"MULTICAM_ANALYSIS_PROCESS_WORKERS": "2", "MULTICAM_ANALYSIS_CV_THREADS": "3"},
+            clear=True,
+        ):
+            self.assertEqual(analysis.get_multicam_analysis_pool_shape(3), (2, 3))
+        # Without an explicit worker count, only as many cameras as fit in memory decode at once.
+        tight = mock.Mock(memory_process_limit=mock.Mock(return_value=2))
+        with mock.patch.object(analysis, "multicam_analysis_available_cpus", return_value=8), mock.patch.object(
+            analysis, "shared_scheduler", return_value=tight
+        ), mock.patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(analysis.get_multicam_analysis_pool_shape(6), (2, 4))
+
+    def test_camera_analyses_run_in_process_pool_in_job_order(self):
+        jobs = [((4.0,), {}), ((9.0,), {}), ((-1.0,), {})]
+
+        results, receipt = asyncio.run(analysis.run_multicam_camera_analyses(math.sqrt, jobs, job_context="unit"))
+
+        self.assertEqual(receipt["mode"], "process_pool")
+        self.assertEqual(results[:2], [2.0, 3.0])
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual(receipt["failed_job_count"], 1)
+        self.assertEqual(len(receipt["job_elapsed_seconds"]), 3)
+
+    def test_unpicklable_analysis_runs_inline_sequentially(self):
+        calls = []
+
+        def fake_profile(path, sample_start=0.0):
+            calls.append(path)
+            if path == "bad.mp4":
+                raise RuntimeError("ffmpeg color analysis failed")
+            return {"path": path, "sample_start": sample_start}
+
+        results, receipt = asyncio.run(
+            analysis.run_multicam_camera_analyses(
+                fake_profile,
+                [(("a.mp4",), {"sample_start": 1.0}), (("bad.mp4",), {}), (("c.mp4",), {})],
+            )
+        )
+
+        self.assertEqual(receipt["mode"], "inline")
+        self.assertEqual(calls, ["a.mp4", "bad.mp4", "c.mp4"])
+        self.assertEqual(results[0], {"path": "a.mp4", "sample_start": 1.0})
+        self.assertIsInstance(results[1], RuntimeError)
+        self.assertEqual(results[2]["path"], "c.mp4")
+
+    def test_process_pool_can_be_disabled(self):
+        with mock.patch.dict(os.environ, {"MULTICAM_ANALYSIS_PROCESS_POOL": "0"}):
+            results, receipt = asyncio.run(analysis.run_multicam_camera_analyses(math.sqrt, [((16.0,), {})]))
+
+        self.assertEqual(receipt["mode"], "inline")
+        self.assertEqual(results, [4.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
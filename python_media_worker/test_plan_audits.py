@@ -0,0 +1,91 @@
+import unittest
+
+import python_media_worker.main_media_server as worker
+
+
+def activity_source(camera_id, activity):
+    return {
+        "id": camera_id,
+        "focus_x": 0.4,
+        "timeline_audio_activity_windows": [
+            {"time": index * 0.5, "activity": value} for index, value in enumerate(activity)
+        ],
+    }
+
+
+def plan_segment(start, end, camera_id, **extra):
+    segment = {"timeline_start": start, "timeline_end": end, "camera_id": camera_id, "layout_mode": "cut"}
+    segment.update(extra)
+    return segment
+
+
+class PlanAuditTests(unittest.TestCase):
+    def setUp(self):
+        worker.plan_audit_cache.clear()
+        self.sources = [
+            activity_source("cam1", [0.8] * 8 + [0.05] * 12),
+            activity_source("cam2", [0.05] * 8 + [0.8] * 12),
+        ]
+        self.segments = [
+            plan_segment(0.0, 4.0, "cam1"),
+            plan_segment(
+                4.0,
+                7.5,
+                "cam1",
+                layout_mode="pip",
+                secondary_camera_id="cam2",
+                audio_leader_camera_id="cam2",
+                raw_audio_leader_camera_id="cam2",
+                audio_decision_reliable=True,
+                audio_decision_reason="clean_audio_owner",
+            ),
+            plan_segment(7.5, 10.0, "cam2"),
+        ]
+
+    def test_one_sweep_matches_each_audit_and_is_memoized(self):
+        combined = worker.run_multicam_plan_audits(self.segments, self.sources, 1920, 1080)
+        worker.plan_audit_cache.clear()
+
+        self.assertEqual(
+            combined["layout_contract"],
+            worker.audit_multicam_layout_contract(self.segments, self.sources, 1920, 1080),
+        )
+        self.assertEqual(
+            combined["director_truth"],
+            worker.audit_multicam_director_active_speaker_truth(self.segments, self.sources),
+        )
+        self.assertEqual(
+            combined["switch_latency"],
+            worker.audit_multicam_director_switch_latency(self.segments, self.sources),
+        )
+        self.assertEqual(
+            {name: audit["status"] for name, audit in combined.items()},
+            {"layout_contract": "failed", "director_truth": "failed", "switch_latency": "failed"},
+        )
+
+        hits = worker.plan_audit_cache.hits
+        again = worker.run_multicam_plan_audits(self.segments, self.sources, 1920, 1080)
+        self.assertEqual(again, combined)
+        self.assertEqual(worker.plan_audit_cache.hits, hits + 3)
+
+        # Hits are copies, so annotating one never leaks into the next.
+        again["switch_latency"]["issues"].clear()
+        self.assertTrue(worker.audit_multicam_director_switch_latency(self.segments, self.sources)["issues"])
+
+    def test_changed_plan_or_inputs_are_re_audited(self):
+        before = worker.audit_multicam_director_switch_latency(self.segments, self.sources)
+        self.assertEqual(before["status"], "failed")
+
+        fixed = [dict(segment) for segment in self.segments]
+        fixed[1]["camera_id"] = "cam2"
+        fixed[1]["layout_mode"] = "cut"
+        self.assertEqual(worker.audit_multicam_director_switch_latency(fixed, self.sources)["status"], "passed")
+
+        layout = worker.audit_multicam_layout_contract(self.segments, self.sources, 1920, 1080)
+        self.sources[0]["focus_x"] = 0.7
+        moved = worker.audit_multicam_layout_contract(self.segments, self.sources, 1920, 1080)
+        self.assertNotEqual(layout["pip_geometry_samples"], moved["pip_geometry_samples"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from python_media_worker import resource_scheduler
+from python_media_worker.resource_scheduler import ResourceScheduler
+
+
+class ResourceSchedulerTests(unittest.TestCase):
+    def test_cgroup_limits_and_usage_are_read_from_v2_files(self):
+        with tempfile.TemporaryDirectory() as root:
+            Path(root, "cpu.max").write_text("600000 100000\n")
+            Path(root, "memory.max").write_text(str(4 * 1024 ** 3))
+            Path(root, "cpu.stat").write_text("usage_usec 2500000\nuser_usec 2000000\n")
+            Path(root, "memory.current").write_text("1048576")
+
+            self.assertEqual(resource_scheduler.read_cgroup_resource_allocation(root), (6.0, 4 * 1024 ** 3))
+            self.assertEqual(resource_scheduler.read_cgroup_usage(root), (2.5, 1048576, None))
+            self.assertEqual(resource_scheduler.read_cgroup_memory_in_use(root), 1048576)
+
+            # Page cache is reclaimable; tmpfs/shmem pages are not.
+            Path(root, "memory.current").write_text(str(3 * 1024 ** 3))
+            Path(root, "memory.stat").write_text(
+                f"anon {512 * 1024 ** 2}\nfile {2560 * 1024 ** 2}\nshmem {256 * 1024 ** 2}\ninactive_file 100\n"
+            )
+            self.assertEqual(resource_scheduler.read_cgroup_memory_in_use(root), 768 * 1024 ** 2)
+            self.assertEqual(resource_scheduler.read_cgroup_pressure_usage(root), (2.5, 768 * 1024 ** 2, None))
+
+            Path(root, "cpu.max").write_text("max 100000\n")
+            Path(root, "memory.max").write_text("max\n")
+            with mock.patch.object(resource_scheduler.os, "cpu_count", return_value=3):
+                self.assertEqual(resource_scheduler.read_cgroup_resource_allocation(root), (3.0, None))
+
+    def test_plans_split_cores_and_respect_memory(self):
+        with mock.patch.object(resource_scheduler, "affinity_cpu_count", return_value=32):
+            eight_vcpu = ResourceScheduler(vcpu=8.0, memory_limit_bytes=32 * 1024 ** 3, usage_reader=lambda: (None, None, None))
+            small = ResourceScheduler(vcpu=1.5, memory_limit_bytes=None, usage_reader=lambda: (None, None, None))
+            tight_memory = ResourceScheduler(vcpu=16.0, memory_limit_bytes=2 * 1024 ** 3, usage_reader=lambda: (None, None, None))
+
+        self.assertEqual(eight_vcpu.plan("encode"), {"concurrency": 2, "threads": 4})
+        self.assertEqual(eight_vcpu.plan("encode", job_count=1), {"concurrency": 1, "threads": 8})
+        self.assertEqual(eight_vcpu.plan("analysis")["concurrency"], 8)
+        self.assertEqual(small.plan("encode"), {"concurrency": 1, "threads": 2})
+        self.assertEqual(tight_memory.plan("encode"), {"concurrency": 1, "threads": 16})
+
+    def test_cut_run_inputs_fit_the_encode_memory_share(self):
+        with mock.patch.object(resource_scheduler, "affinity_cpu_count", return_value=32):
+            roomy = ResourceScheduler(vcpu=8.0, memory_limit_bytes=32 * 1024 ** 3, usage_reader=lambda: (None, None, None))
+            tight = ResourceScheduler(vcpu=16.0, memory_limit_bytes=2 * 1024 ** 3, usage_reader=lambda: (None, None, None))
+            unlimited = ResourceScheduler(vcpu=8.0, memory_limit_bytes=None, usage_reader=lambda: (None, None, None))
+        full_hd = resource_scheduler.decoder_memory_bytes(1920, 1080)
+        uhd = resource_scheduler.decoder_memory_bytes(3840, 2160)
+
+        self.assertGreater(uhd, 3 * full_hd)
+        self.assertEqual(roomy.inputs_per_process("encode", full_hd, 6, concurrency=2), 6)
+        # 1.5 GiB budget, 1 GiB for the encode itself: four extra 1080p decoders.
+        self.assertEqual(tight.inputs_per_process("encode", full_hd, 6), 5)
+        self.assertEqual(tight.inputs_per_process("encode", uhd, 6), 2)
+        self.assertEqual(tight.inputs_per_process("encode", full_hd, 6, concurrency=4), 1)
+        self.assertEqual(unlimited.inputs_per_process("encode", uhd, 6), 6)
+
+    def test_pressure_throttles_admission_but_never_stalls(self):
+        usage = {"cpu": 0.0, "memory": 0}
+
+        def reader():
+            return usage["cpu"], usage["memory"], None
+
+        scheduler = ResourceScheduler(vcpu=4.0, memory_limit_bytes=1000, usage_reader=reader, sample_seconds=0.0)
+        self.assertEqual(scheduler.admission_limit(3, 1), 3)
+
+        usage["memory"] = 900
+        self.assertEqual(scheduler.admission_limit(3, 2), 1)
+
+        usage["memory"] = 0
+        with mock.patch.object(resource_scheduler.time, "monotonic", side_effect=[100.0, 101.0]):
+            scheduler._last_sample = None
+            scheduler.pressure()
+            usage["cpu"] = 4.0
+            self.assertEqual(scheduler.admission_limit(3, 2), 2)
+
+        async def run_jobs(limiter):
+            running = []
+            peak = []
+
+            async def job():
+                async with limiter:
+                    running.append(1)
+                    peak.append(len(running))
+                    await asyncio.sleep(0.01)
+                    running.pop()
+
+            await asyncio.gather(*[job() for _ in range(6)])
+            return max(peak)
+
+        # A full page cache alone does not throttle admission.
+        with tempfile.TemporaryDirectory() as root:
+            Path(root, "memory.current").write_text("950")
+            Path(root, "memory.stat").write_text("anon 200\nfile 750\nshmem 0\n")
+            cached = ResourceScheduler(
+                vcpu=4.0,
+                memory_limit_bytes=1000,
+                usage_reader=lambda: (None, resource_scheduler.read_cgroup_memory_in_use(root), None),
+                sample_seconds=0.0,
+            )
+            self.assertEqual(cached.admission_limit(3, 2), 3)
+
+        starved = ResourceScheduler(vcpu=4.0, memory_limit_bytes=1000, usage_reader=lambda: (None, 990, None), sample_seconds=0.0)
+        self.assertEqual(asyncio.run(run_jobs(starved.limiter("encode", 3))), 1)
+        idle = ResourceScheduler(vcpu=4.0, memory_limit_bytes=1000, usage_reader=lambda: (None, 0, None), sample_seconds=0.0)
+        shared = idle.limiter("encode", 3)
+        self.assertEqual(asyncio.run(run_jobs(shared)), 3)
+        # Module-wide limiters outlive one event loop.
+        self.assertEqual(asyncio.run(run_jobs(shared)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
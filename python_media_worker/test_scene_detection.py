@@ -0,0 +1,116 @@
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from python_media_worker import scene_detection
+
+
+def feed(consumer, frames, fps=4.0):
+    consumer.bind_stream(frames[0].shape[1], frames[0].shape[0], fps)
+    for index, frame in enumerate(frames):
+        consumer.consume(index / fps, frame)
+    return consumer.finish()
+
+
+def noisy_frame(rng, base_bgr, shift=0):
+    frame = np.empty((90, 160, 3), dtype=np.uint8)
+    frame[:] = base_bgr
+    gradient = np.tile(np.linspace(0, 60, 160, dtype=np.float32), (90, 1))
+    frame[:, :, 1] = np.clip(frame[:, :, 1] + np.roll(gradient, shift, axis=1), 0, 255).astype(np.uint8)
+    noise = rng.integers(-4, 5, size=frame.shape)
+    return np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+class SceneDetectionTests(unittest.TestCase):
+    def test_hard_cuts_produce_contiguous_scene_boundaries(self):
+        rng = np.random.default_rng(3)
+        frames = (
+            [noisy_frame(rng, (30, 60, 160)) for _ in range(12)]
+            + [noisy_frame(rng, (170, 90, 20)) for _ in range(10)]
+            + [noisy_frame(rng, (40, 200, 60)) for _ in range(8)]
+        )
+
+        scenes = feed(scene_detection.SceneCutDetector(sample_fps=4.0), frames)
+
+        self.assertEqual([(start.get_seconds(), end.get_seconds()) for start, end in scenes], [(0.0, 3.0), (3.0, 5.5), (5.5, 7.5)])
+
+    def test_sustained_motion_inside_one_shot_is_not_a_cut(self):
+        rng = np.random.default_rng(5)
+        frames = [noisy_frame(rng, (80, 80, 80), shift=index * 23) for index in range(40)]
+
+        self.assertEqual(feed(scene_detection.SceneCutDetector(sample_fps=4.0), frames), [])
+
+    def test_cuts_closer_than_min_scene_length_are_merged(self):
+        self.assertEqual(
+            scene_detection.build_scene_list([2.0, 9.5], 8.0),
+            [(0.0, 2.0), (2.0, 8.0)],
+        )
+        detector = scene_detection.SceneCutDetector(sample_fps=4.0, min_scene_seconds=1.0)
+        rng = np.random.default_rng(9)
+        colors = [(30, 60, 160)] * 8 + [(170, 90, 20)] * 2 + [(40, 200, 60)] * 8
+        scenes = feed(detector, [noisy_frame(rng, color) for color in colors])
+
+        self.assertEqual(detector.cut_times, [2.0])
+        self.assertEqual(len(scenes), 2)
+
+    def test_scene_times_behave_like_floats_and_timecodes(self):
+        value = scene_detection.SceneTime(12.5)
+
+        self.assertEqual(value.get_seconds(), 12.5)
+        self.assertEqual(value + 1.0, 13.5)
+
+    def test_motion_sampler_emits_interval_grid_from_faster_stream(self):
+        frames = [np.full((90, 160, 3), (index // 4) * 40, dtype=np.uint8) for index in range(12)]
+
+        samples = feed(scene_detection.VisualMotionSampler(1.0), frames)
+
+        self.assertEqual([time for time, _motion in samples], [1.0, 2.0])
+        self.assertAlmostEqual(samples[0][1], 40.0 / 255.0)
+
+    @unittest.skipUnless(shutil.which("ffmpeg"), "ffmpeg is required")
+    def test_shared_pass_detects_cuts_and_motion_in_one_decode(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            video_path = str(Path(tmp) / "scenes.mp4")
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-nostdin",
+                    "-loglevel",
+                    "error",
+                    "-y",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "testsrc=size=320x180:rate=30:duration=4",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "color=c=red:size=320x180:rate=30:duration=3",
+                    "-filter_complex",
+                    "[0:v][1:v]concat=n=2:v=1:a=0",
+                    "-pix_fmt",
+                    "yuv420p",
+                    video_path,
+                ],
+                check=True,
+            )
+
+            scenes, motion, receipt = scene_detection.detect_scenes_and_motion(video_path, motion_interval=1.0)
+            motion_only = scene_detection.sample_visual_motion(video_path, 1.0)
+
+        self.assertEqual(receipt["consumers"], ["SceneCutDetector", "VisualMotionSampler"])
+        self.assertEqual([(start.get_seconds(), end.get_seconds()) for start, end in scenes], [(0.0, 4.0), (4.0, 7.0)])
+        self.assertEqual([time for time, _motion in motion], [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        self.assertGreater(motion[3][1], 0.2)
+        # Decoded at the sampler's own rate, so frames can differ by a few ms.
+        self.assertEqual([time for time, _motion in motion_only], [time for time, _motion in motion])
+        for (_time, alone), (_shared_time, shared) in zip(motion_only, motion):
+            self.assertAlmostEqual(alone, shared, delta=0.02)
+
+
+if __name__ == "__main__":
+    unittest.main()
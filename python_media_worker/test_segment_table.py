@@ -0,0 +1,62 @@
+import json
+import unittest
+
+import numpy as np
+
+from python_media_worker.segment_table import SegmentTable
+
+
+def director_segment(start, end, camera_id, **extra):
+    segment = {
+        "camera_id": camera_id,
+        "timeline_start": start,
+        "timeline_end": end,
+        "source_start": start + 2.5,
+        "source_end": end + 2.5,
+        "layout_mode": "cut",
+        "layout_reason": "sustained_isolated_handoff",
+        "secondary_camera_id": None,
+        "layout_confidence": 0.7,
+        "ranked_sources": [{"camera_id": camera_id, "score": 0.5}],
+    }
+    segment.update(extra)
+    return segment
+
+
+class SegmentTableTests(unittest.TestCase):
+    def test_round_trip_is_lossless_json(self):
+        plan = [
+            director_segment(0.0, 4.0, "cam1"),
+            director_segment(4.0, 9.5, "cam2", render_merged_segment_count=2, audio_decision_reliable=True),
+            {"timeline_end": 12.0, "timeline_start": 9.5, "camera_id": "cam1", "layout_confidence": 1, "layout_mode": 7},
+        ]
+        del plan[1]["secondary_camera_id"]
+
+        table = SegmentTable.from_segments(plan)
+        restored = table.to_segments()
+
+        self.assertEqual(json.dumps(restored), json.dumps(plan))
+        self.assertIs(type(restored[2]["layout_confidence"]), int)
+        self.assertNotIn("secondary_camera_id", restored[1])
+        self.assertIs(restored[0]["ranked_sources"], plan[0]["ranked_sources"])
+        self.assertEqual(table[-1], plan[-1])
+
+    def test_strings_are_interned_and_chunks_are_views(self):
+        plan = [director_segment(float(index), float(index + 1), f"cam{index % 3}") for index in range(600)]
+        table = SegmentTable.from_segments(plan)
+
+        self.assertEqual(len(table.strings), 5)
+        codes = table.codes("camera_id")
+        self.assertEqual(int((codes == codes[0]).sum()), 200)
+
+        chunk = table.chunk(300.0, 600.0)
+        self.assertTrue(np.shares_memory(chunk.rows, table.rows))
+        self.assertEqual(len(chunk), 300)
+        self.assertEqual(chunk[0]["timeline_start"], 300.0)
+        np.testing.assert_array_equal(chunk.column("timeline_end"), np.arange(301.0, 601.0))
+        self.assertEqual(chunk.column("camera_id")[:3], ["cam0", "cam1", "cam2"])
+        self.assertEqual(len(table.chunk(299.5, 300.5)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import random
+import unittest
+from unittest import mock
+
+import python_media_worker.main_media_server as worker
+from python_media_worker.job_cache import job_cache_scope
+from python_media_worker.segment_timeline import SegmentTimeline
+
+
+def plan_segment(start, end, camera_id="cam1"):
+    return {"timeline_start": start, "timeline_end": end, "camera_id": camera_id}
+
+
+class SegmentTimelineTests(unittest.TestCase):
+    def test_point_and_range_queries_match_scans_with_overlaps(self):
+        rng = random.Random(5)
+        segments = []
+        for index in range(300):
+            start = round(rng.uniform(0, 600), 2)
+            segments.append(plan_segment(start, round(start + rng.uniform(0, 12), 2), f"cam{index}"))
+        segments.append(None)
+        timeline = SegmentTimeline(segments)
+
+        for probe in [rng.uniform(-5, 620) for _ in range(300)]:
+            covering = [item for item in segments if item and item["timeline_start"] <= probe < item["timeline_end"]]
+            self.assertEqual(timeline.covering(probe), covering)
+            self.assertIs(timeline.at(probe), covering[0] if covering else None)
+            self.assertEqual(timeline.contains(probe), bool(covering))
+
+            end = probe + rng.uniform(0, 20)
+            ordered = sorted((item for item in segments if item), key=lambda item: item["timeline_start"])
+            overlapping = [item for item in ordered if item["timeline_start"] < end and item["timeline_end"] > probe]
+            self.assertEqual(timeline.overlapping(probe, end), overlapping)
+
+    def test_intervals_are_half_open_with_optional_end_tolerance(self):
+        timeline = SegmentTimeline.from_keys([{"start": 0.0, "end": 2.0}, {"start": 2.0, "end": 4.0}], "start", "end")
+
+        self.assertEqual(timeline.at(2.0)["start"], 2.0)
+        self.assertIsNone(timeline.at(4.0))
+        self.assertEqual(timeline.at(4.03, end_tolerance=0.05)["start"], 2.0)
+        self.assertEqual(timeline.end, 4.0)
+
+    def test_pairs_index_silence_intervals(self):
+        silence = [(10.0, 12.0), (1.0, 3.0)]
+
+        self.assertTrue(worker.is_time_in_silence(2.5, silence))
+        self.assertFalse(worker.is_time_in_silence(3.0, silence))
+        self.assertTrue(worker.is_time_in_silence(11.0, iter(silence)))
+        self.assertFalse(worker.is_time_in_silence(5.0, []))
+
+    def test_silence_timeline_is_built_once_per_job_and_never_outside_one(self):
+        silence = [(10.0, 12.0), (1.0, 3.0)]
+
+        with mock.patch.object(worker.SegmentTimeline, "from_pairs", wraps=SegmentTimeline.from_pairs) as from_pairs:
+            for time_value in (0.5, 2.0, 11.0):
+                worker.is_time_in_silence(time_value, silence)
+            self.assertEqual(from_pairs.call_count, 0)
+            with job_cache_scope():
+                results = [worker.is_time_in_silence(time_value, silence) for time_value in (0.5, 2.0, 11.0)]
+            self.assertEqual(from_pairs.call_count, 1)
+
+        self.assertEqual(results, [False, True, True])
+
+
+class WorkerSegmentLookupTests(unittest.TestCase):
+    def test_caption_segment_lookup_keeps_end_slack(self):
+        context = [{"start": 0.0, "end": 5.0, "camera_id": "a"}, {"start": 5.2, "end": 9.0, "camera_id": "b"}]
+
+        self.assertEqual(worker.find_multicam_caption_segment(context, 5.04)["camera_id"], "a")
+        self.assertIsNone(worker.find_multicam_caption_segment(context, 5.1))
+        self.assertIsNone(worker.find_multicam_caption_segment(None, 1.0))
+
+    def test_switch_latency_audit_finds_first_compliant_segment(self):
+        def source(camera_id, activity):
+            return {
+                "id": camera_id,
+                "timeline_audio_activity_windows": [
+                    {"time": index * 0.5, "activity": value} for index, value in enumerate(activity)
+                ],
+            }
+
+        sources = [source("cam1", [0.8] * 8 + [0.05] * 12), source("cam2", [0.05] * 8 + [0.8] * 12)]
+        segments = [plan_segment(0.0, 4.0, "cam1"), plan_segment(4.0, 7.5, "cam1"), plan_segment(7.5, 10.0, "cam2")]
+
+        audit = worker.audit_multicam_director_switch_latency(segments, sources)
+
+        self.assertEqual(audit["status"], "failed")
+        issue = audit["issues"][0]
+        self.assertEqual((issue["owner_camera_id"], issue["first_compliant_time"]), ("cam2", 7.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+import os
+import shutil
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+
+from python_media_worker import speech_gating as gating
+
+
+SAMPLE_RATE = 16000
+
+
+def synth_programme(layout):
+    """Build audio from ``[(kind, seconds)]`` with kind in silence/speech/music."""
+    pieces = []
+    for kind, seconds in layout:
+        t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+        if kind == "speech":
+            # Syllable-rate amplitude modulation, the way voiced speech rises and falls.
+            pieces.append(0.5 * np.abs(np.sin(2 * np.pi * 3.0 * t)) * np.sin(2 * np.pi * 220.0 * t))
+        elif kind == "music":
+            pieces.append(0.3 * np.sin(2 * np.pi * 440.0 * t))
+        else:
+            pieces.append(np.zeros(t.size))
+    return np.concatenate(pieces).astype(np.float32)
+
+
+class SpeechSpanPlanningTests(unittest.TestCase):
+    def test_padding_merges_close_runs_and_drops_blips(self):
+        activity = np.zeros(200, dtype=np.float32)
+        activity[20:60] = 1.0  # 1.0-3.0 s
+        activity[70:100] = 1.0  # 3.5-5.0 s, within the merge gap
+        activity[150:152] = 1.0  # 0.1 s blip
+
+        spans = gating.plan_speech_spans(activity, 10.0, bins_per_second=20)
+
+        self.assertEqual(spans, [(0.65, 5.35)])
+
+    def test_silence_intervals_and_music_mask_remove_activity(self):
+        activity = np.ones(400, dtype=np.float32)
+        music = np.zeros(400, dtype=bool)
+        music[200:400] = True
+
+        spans = gating.plan_speech_spans(
+            activity, 20.0, bins_per_second=20, silence_intervals=[(0.0, 4.0)], music_mask=music, pad_seconds=0.0
+        )
+
+        self.assertEqual(spans, [(4.0, 10.0)])
+
+    def test_music_bed_mask_needs_a_long_steady_run(self):
+        rms, _normalized = gating.speech_energy_envelope(
+            synth_programme([("speech", 8), ("music", 10), ("speech", 4), ("music", 3)]), SAMPLE_RATE
+        )
+
+        mask = gating.music_bed_mask(rms)
+
+        self.assertFalse(mask[: 8 * 20].any())
+        self.assertTrue(mask[9 * 20 : 17 * 20].all())
+        self.assertFalse(mask[22 * 20 :].any())
+
+    def test_gated_timestamps_map_back_to_source_time(self):
+        samples = np.ones(SAMPLE_RATE * 20, dtype=np.float32)
+        gated, span_map = gating.build_speech_gated_audio(samples, [(2.0, 5.0), (10.0, 12.0)], SAMPLE_RATE, gap_seconds=0.5)
+
+        self.assertEqual(gated.size, int(5.5 * SAMPLE_RATE))
+        result = gating.remap_gated_transcript(
+            {
+                "segments": [
+                    {"start": 0.5, "end": 3.2, "text": "a", "words": [{"start": 3.6, "end": 4.0, "word": " b"}]},
+                ]
+            },
+            span_map,
+            source_duration=20.0,
+        )
+        segment = result["segments"][0]
+        # 3.2 s lands in the silent gap and snaps to the end of the first span.
+        self.assertEqual((segment["start"], segment["end"]), (2.5, 5.0))
+        self.assertEqual((segment["words"][0]["start"], segment["words"][0]["end"]), (10.1, 10.5))
+        self.assertEqual(result["duration"], 20.0)
+
+    def test_streamed_blocks_gate_like_the_whole_array(self):
+        samples = np.arange(SAMPLE_RATE * 20, dtype=np.int16)
+        spans = [(0.5, 3.25), (3.3, 3.31), (9.99, 14.0), (19.5, 25.0)]
+        whole, whole_map = gating.build_speech_gated_audio(samples, spans, SAMPLE_RATE, gap_seconds=0.5)
+        pieces = []
+
+        streamed_map = gating.gate_speech_blocks(
+            (samples[index : index + 7001] for index in range(0, samples.size, 7001)),
+            spans,
+            SAMPLE_RATE,
+            pieces.append,
+            gap_seconds=0.5,
+        )
+
+        self.assertEqual(streamed_map, whole_map)
+        np.testing.assert_array_equal(np.concatenate(pieces), whole)
+        self.assertEqual(streamed_map[-1]["gated_end"] - streamed_map[-1]["gated_start"], 0.5)
+
+    def test_scanner_matches_the_whole_array_envelope(self):
+        samples = synth_programme([("speech", 3), ("music", 2)])
+        scanner = gating.SpeechEnergyScanner(SAMPLE_RATE)
+        for index in range(0, samples.size, 333):
+            scanner.feed(samples[index : index + 333])
+
+        rms, _normalized = gating.speech_energy_envelope(samples, SAMPLE_RATE)
+
+        np.testing.assert_allclose(scanner.finish(), rms, rtol=1e-5)
+        self.assertEqual(scanner.sample_count, samples.size)
+
+
+class RecordingFasterWhisperModel:
+    def __init__(self):
+        self.paths = []
+
+    def transcribe(self, path, **options):
+        self.paths.append(path)
+        with wave.open(path, "rb") as wav_file:
+            duration = wav_file.getnframes() / float(wav_file.getframerate())
+        segments = [SimpleNamespace(id=0, start=1.0, end=2.0, text=" first", words=[])]
+        return iter(segments), SimpleNamespace(language="en", duration=duration)
+
+
+@unittest.skipUnless(shutil.which("ffmpeg"), "ffmpeg is required")
+class WorkerSpeechGatingTests(unittest.TestCase):
+    def setUp(self):
+        import python_media_worker.main_media_server as worker
+
+        self.worker = worker
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.audio_path = str(Path(self.tmp.name) / "episode.wav")
+        gating.write_speech_gated_wav(
+            self.audio_path,
+            synth_programme([("silence", 12), ("speech", 10), ("music", 15), ("speech", 8), ("silence", 10)]),
+            SAMPLE_RATE,
+        )
+        self.model = RecordingFasterWhisperModel()
+        patches = [
+            mock.patch.object(worker, "get_transcription_engine", return_value="faster"),
+            mock.patch.object(worker, "get_faster_whisper_model", return_value=self.model),
+            mock.patch.object(worker, "WORKER_TMP_DIR", self.tmp.name),
+            mock.patch.dict(os.environ, {"TRANSCRIPT_CACHE_DIR": self.tmp.name, "TRANSCRIPT_CACHE_FIRESTORE": "0"}),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_only_speech_is_transcribed_and_timestamps_are_source_time(self):
+        result = self.worker.transcribe_with_hints(self.audio_path, use_cache=False)
+
+        receipt = result["speech_gating"]
+        self.assertEqual(receipt["span_count"], 2)
+        self.assertLess(receipt["speech_seconds"], 20.0)
+        self.assertEqual(result["duration"], 55.0)
+        self.assertNotEqual(self.model.paths[0], self.audio_path)
+        self.assertFalse(os.path.exists(self.model.paths[0]))
+        # Gated 1.0 s sits inside the first span, which starts a padding width before 12 s.
+        self.assertAlmostEqual(result["segments"][0]["start"], 12.65, delta=0.1)
+
+    def test_mostly_speech_is_decided_from_one_streamed_decode(self):
+        speech_path = str(Path(self.tmp.name) / "talk.wav")
+        gating.write_speech_gated_wav(speech_path, synth_programme([("speech", 40)]), SAMPLE_RATE)
+        decodes = []
+        original = self.worker.iter_transcription_audio_blocks
+
+        def counting_blocks(*args, **kwargs):
+            decodes.append(kwargs.get("audio_filter"))
+            return original(*args, **kwargs)
+
+        with mock.patch.object(self.worker, "iter_transcription_audio_blocks", side_effect=counting_blocks):
+            self.assertIsNone(self.worker.prepare_speech_gated_audio(speech_path))
+            self.assertIsNotNone(self.worker.prepare_speech_gated_audio(self.audio_path))
+
+        # One silencedetect+envelope decode each; only the gated file decodes again.
+        self.assertEqual([bool(audio_filter) for audio_filter in decodes], [True, True, False])
+
+    def test_stream_fallback_reuses_the_prepared_gating(self):
+        prepared = []
+        starts = []
+        original_prepare = self.worker.prepare_speech_gated_audio
+        original_start = self.worker.start_faster_whisper_transcription
+
+        def counting_prepare(path):
+            prepared.append(path)
+            return original_prepare(path)
+
+        def fail_first_start(*args, **kwargs):
+            starts.append(args[0])
+            if len(starts) == 1:
+                raise RuntimeError("no stream")
+            return original_start(*args, **kwargs)
+
+        with (
+            mock.patch.object(self.worker, "prepare_speech_gated_audio", side_effect=counting_prepare),
+            mock.patch.object(self.worker, "start_faster_whisper_transcription", side_effect=fail_first_start),
+        ):
+            segments = list(self.worker.iter_transcribe_with_hints(self.audio_path))
+
+        self.assertEqual(prepared, [self.audio_path])
+        self.assertEqual(starts[0], starts[1])
+        self.assertAlmostEqual(segments[0]["start"], 12.65, delta=0.1)
+        self.assertFalse(os.path.exists(self.model.paths[0]))
+
+    def test_gating_can_be_disabled(self):
+        with mock.patch.dict(os.environ, {"WHISPER_SPEECH_GATING": "0"}):
+            result = self.worker.transcribe_with_hints(self.audio_path, use_cache=False)
+
+        self.assertNotIn("speech_gating", result)
+        self.assertEqual(self.model.paths, [self.audio_path])
+
+
+if __name__ == "__main__":
+    unittest.main()
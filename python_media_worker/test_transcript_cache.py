@@ -0,0 +1,147 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from python_media_worker import transcript_cache as cache
+
+
+def word_transcript(language="en"):
+    return {
+        "text": "hello there",
+        "language": language,
+        "segments": [
+            {
+                "id": 0,
+                "start": 0.5,
+                "end": 2.0,
+                "text": "hello there",
+                "words": [
+                    {"start": 0.5, "end": 1.0, "word": " hello", "probability": 0.9},
+                    {"start": 1.1, "end": 2.0, "word": " there", "probability": 0.9},
+                ],
+            }
+        ],
+    }
+
+
+def variant(**overrides):
+    options = {"engine": "faster", "model_name": "small", "task": None, "language": None, "word_timestamps": False, "prompt": "p"}
+    options.update(overrides)
+    return cache.build_transcript_cache_variant(**options)
+
+
+class TranscriptCacheLookupTests(unittest.TestCase):
+    def setUp(self):
+        self.entries = {}
+
+    def store(self, stored_variant, transcript):
+        key = cache.transcript_cache_key("audio", stored_variant)
+        self.entries[key] = cache.build_transcript_cache_entry("audio", stored_variant, transcript)
+
+    def read_entry(self, key):
+        return self.entries.get(key), "memory"
+
+    def test_word_timestamp_run_satisfies_plain_request(self):
+        self.store(variant(word_timestamps=True), word_transcript())
+
+        transcript, receipt = cache.lookup_cached_transcript("audio", variant(), self.read_entry)
+
+        self.assertFalse(receipt["exact"])
+        self.assertTrue(receipt["satisfied_by"]["word_timestamps"])
+        self.assertEqual(transcript["segments"][0]["words"], [])
+        self.assertEqual(transcript["segments"][0]["text"], "hello there")
+
+    def test_plain_run_does_not_satisfy_word_request(self):
+        self.store(variant(), word_transcript())
+
+        self.assertEqual(
+            cache.lookup_cached_transcript("audio", variant(word_timestamps=True), self.read_entry),
+            (None, None),
+        )
+
+    def test_translate_and_transcribe_never_share_entries(self):
+        self.store(variant(task="translate", word_timestamps=True), word_transcript())
+
+        self.assertEqual(cache.lookup_cached_transcript("audio", variant(), self.read_entry), (None, None))
+        transcript, _receipt = cache.lookup_cached_transcript("audio", variant(task="translate"), self.read_entry)
+        self.assertIsNotNone(transcript)
+
+    def test_auto_language_run_satisfies_matching_explicit_language(self):
+        self.store(variant(), word_transcript(language="af"))
+
+        transcript, receipt = cache.lookup_cached_transcript("audio", variant(language="af"), self.read_entry)
+        self.assertEqual(transcript["language"], "af")
+        self.assertIsNone(receipt["satisfied_by"]["language"])
+        self.assertEqual(cache.lookup_cached_transcript("audio", variant(language="en"), self.read_entry), (None, None))
+
+    def test_expired_entries_and_other_models_miss(self):
+        self.store(variant(), word_transcript())
+        for entry in self.entries.values():
+            entry["created_at"] -= 3600
+
+        self.assertEqual(cache.lookup_cached_transcript("audio", variant(), self.read_entry, max_age_seconds=60), (None, None))
+        self.assertEqual(cache.lookup_cached_transcript("audio", variant(model_name="base"), self.read_entry), (None, None))
+
+    @unittest.skipUnless(shutil.which("ffmpeg"), "ffmpeg is required")
+    def test_fingerprint_ignores_container_and_video(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            wav_path = str(Path(tmp) / "voice.wav")
+            mkv_path = str(Path(tmp) / "voice.mkv")
+            other_path = str(Path(tmp) / "other.wav")
+            silent_path = str(Path(tmp) / "silent.mp4")
+            ffmpeg = ["ffmpeg", "-nostdin", "-loglevel", "error", "-y"]
+            subprocess.run(ffmpeg + ["-f", "lavfi", "-i", "sine=frequency=300:duration=3", "-ar", "16000", wav_path], check=True)
+            subprocess.run(
+                ffmpeg
+                + ["-f", "lavfi", "-i", "testsrc2=size=64x64:rate=10:duration=3", "-i", wav_path]
+                + ["-c:v", "mpeg4", "-c:a", "copy", mkv_path],
+                check=True,
+            )
+            subprocess.run(ffmpeg + ["-f", "lavfi", "-i", "sine=frequency=500:duration=3", "-ar", "16000", other_path], check=True)
+            subprocess.run(ffmpeg + ["-f", "lavfi", "-i", "testsrc2=size=64x64:rate=10:duration=1", "-c:v", "mpeg4", silent_path], check=True)
+
+            first = cache.fingerprint_transcription_audio(wav_path)
+            self.assertEqual(cache.fingerprint_transcription_audio(mkv_path), first)
+            self.assertNotEqual(cache.fingerprint_transcription_audio(other_path), first)
+            self.assertIsNone(cache.fingerprint_transcription_audio(silent_path))
+
+
+@unittest.skipUnless(shutil.which("ffmpeg"), "ffmpeg is required")
+class WorkerTranscriptCacheTests(unittest.TestCase):
+    def test_second_caller_reuses_the_first_transcript(self):
+        import python_media_worker.main_media_server as worker
+
+        with tempfile.TemporaryDirectory() as tmp:
+            audio_path = str(Path(tmp) / "upload.wav")
+            subprocess.run(
+                ["ffmpeg", "-nostdin", "-loglevel", "error", "-y", "-f", "lavfi", "-i", "sine=frequency=440:duration=4", audio_path],
+                check=True,
+            )
+            calls = []
+
+            def fake_uncached(path, **kwargs):
+                calls.append(kwargs)
+                return {**word_transcript(), "engine": "faster-whisper"}
+
+            with mock.patch.object(worker, "transcribe_with_hints_uncached", side_effect=fake_uncached), mock.patch.object(
+                worker, "get_transcription_engine", return_value="faster"
+            ), mock.patch.dict(os.environ, {"TRANSCRIPT_CACHE_DIR": tmp, "TRANSCRIPT_CACHE_FIRESTORE": "0"}):
+                captions = worker.transcribe_with_hints(audio_path, word_timestamps=True)
+                analysis = worker.transcribe_with_hints(audio_path)
+                translated = worker.transcribe_with_hints(audio_path, task="translate")
+                uncached = worker.transcribe_with_hints(audio_path, use_cache=False)
+
+        self.assertFalse(captions["transcript_cache"]["hit"])
+        self.assertTrue(analysis["transcript_cache"]["hit"])
+        self.assertEqual(analysis["segments"][0]["words"], [])
+        self.assertFalse(translated["transcript_cache"]["hit"])
+        self.assertNotIn("transcript_cache", uncached)
+        self.assertEqual([call["task"] for call in calls], [None, "translate", None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import asyncio
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import python_media_worker.main_media_server as worker
+
+
+class FakeFasterWhisperModel:
+    def __init__(self, segment_count=4, duration=8.0):
+        self.segment_count = segment_count
+        self.duration = duration
+        self.decoded = []
+        self.calls = 0
+
+    def transcribe(self, path, **options):
+        self.calls += 1
+
+        def decode():
+            for index in range(self.segment_count):
+                self.decoded.append(index)
+                yield SimpleNamespace(
+                    id=index,
+                    start=index * 2.0,
+                    end=index * 2.0 + 1.5,
+                    text=f" line {index}",
+                    words=[],
+                )
+
+        return decode(), SimpleNamespace(language="en", duration=self.duration)
+
+
+@unittest.skipUnless(shutil.which("ffmpeg"), "ffmpeg is required")
+class TranscriptionStreamingTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.audio_path = str(Path(self.tmp.name) / "speech.wav")
+        subprocess.run(
+            ["ffmpeg", "-nostdin", "-loglevel", "error", "-y", "-f", "lavfi", "-i", "sine=frequency=320:duration=8", self.audio_path],
+            check=True,
+        )
+        self.model = FakeFasterWhisperModel()
+        patches = [
+            mock.patch.object(worker, "get_transcription_engine", return_value="faster"),
+            mock.patch.object(worker, "get_faster_whisper_model", return_value=self.model),
+            mock.patch.object(worker, "should_chunk_transcription", return_value=False),
+            mock.patch.dict(os.environ, {"TRANSCRIPT_CACHE_DIR": self.tmp.name, "TRANSCRIPT_CACHE_FIRESTORE": "0"}),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_segments_are_yielded_while_decoding_and_cached_when_complete(self):
+        progress = []
+        summary = {}
+        stream = worker.iter_transcribe_with_hints(self.audio_path, on_progress=progress.append, summary=summary)
+
+        first = next(stream)
+        self.assertEqual(first["text"], " line 0")
+        self.assertEqual(self.model.decoded, [0])
+        rest = list(stream)
+
+        self.assertEqual([segment["id"] for segment in rest], [1, 2, 3])
+        self.assertEqual(progress, sorted(progress))
+        self.assertEqual(progress[-1], 1.0)
+        self.assertEqual(summary["language"], "en")
+        self.assertFalse(summary["transcript_cache"]["hit"])
+
+        cached = worker.transcribe_with_hints(self.audio_path)
+        self.assertTrue(cached["transcript_cache"]["hit"])
+        self.assertEqual([segment["text"] for segment in cached["segments"]], [" line 0", " line 1", " line 2", " line 3"])
+        self.assertEqual(self.model.calls, 1)
+
+    def test_abandoned_stream_does_not_populate_the_cache(self):
+        stream = worker.iter_transcribe_with_hints(self.audio_path)
+        next(stream)
+        stream.close()
+
+        result = worker.transcribe_with_hints(self.audio_path)
+
+        self.assertFalse(result["transcript_cache"]["hit"])
+        self.assertEqual(self.model.calls, 2)
+
+    def test_async_stream_publishes_throttled_job_progress(self):
+        updates = []
+
+        async def collect():
+            return [
+                segment
+                async for segment in worker.stream_transcribe_with_hints(
+                    self.audio_path,
+                    job_id="job-stream",
+                    progress_range=(40, 60),
+                )
+            ]
+
+        with mock.patch.object(worker, "update_firestore_job", side_effect=lambda job_id, data: updates.append(data)):
+            segments = asyncio.run(collect())
+
+        self.assertEqual(len(segments), 4)
+        # The first update goes out immediately, the rest are throttled until completion.
+        self.assertEqual([update["progress"] for update in updates], [44, 60])
+        self.assertEqual(updates[-1]["transcriptionProgress"], 1.0)
+
+
+class TranscriptWindowStreamingTests(unittest.TestCase):
+    def test_windows_close_before_the_stream_ends(self):
+        consumed = []
+
+        def segments():
+            for start in (0.0, 4.0, 8.0, 30.0, 34.0):
+                consumed.append(start)
+                yield {"start": start, "end": start + 3.5, "text": "why does this work", "transcriptConfidence": 0.8}
+
+        windows = worker.iter_transcript_windows(segments(), {"why": 10})
+        first = next(windows)
+
+        self.assertEqual((first["start"], first["end"]), (0.0, 11.5))
+        self.assertEqual(consumed, [0.0, 4.0, 8.0, 30.0])
+        self.assertEqual(worker.build_transcript_windows(segments(), {"why": 10})[1]["id"], "speech_1")
+
+
+class CaptionEventStreamingTests(unittest.TestCase):
+    def test_per_segment_events_rebuild_the_whole_script(self):
+        segments = [
+            {
+                "start": 0.0,
+                "end": 1.4,
+                "text": " one two three four five six seven",
+                "words": [{"start": index * 0.2, "end": index * 0.2 + 0.18, "word": f" w{index}"} for index in range(7)],
+            },
+            {"start": 1.5, "end": 2.0, "text": "You.", "words": []},
+            {"start": 2.0, "end": 3.0, "text": "plain text", "words": []},
+        ]
+        style = worker.resolve_ass_caption_style("karaoke", "top", 1.1)
+        streamed = []
+        for segment in segments:
+            streamed.extend(worker.build_ass_caption_segment_events(segment, style))
+
+        self.assertEqual(
+            "\n".join(worker.build_ass_caption_header(style, 720, 1280) + streamed),
+            worker.generate_ass_captions({"segments": segments}, "karaoke", 720, 1280, "top", 1.1),
+        )
+        self.assertTrue(streamed[-1].endswith(",plain text"))
+        self.assertFalse(any(",You." in event for event in streamed))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -48,29 +48,18 @@ class ViralClipAudioTests(unittest.TestCase):
                 overlays=[],
             )
 
-            result = None
-            try:
-                with mock.patch.object(
-                    worker,
-                    "upload_file_to_firebase",
-                    return_value="https://storage.example.com/viral.mp4",
-                ):
-                    result = asyncio.run(worker.render_viral_clip_impl(request))
+            with mock.patch.object(worker, "WORKER_TMP_DIR", temp_dir), mock.patch.object(
+                worker,
+                "upload_file_to_firebase",
+                return_value="https://storage.example.com/viral.mp4",
+            ):
+                result = asyncio.run(worker.render_viral_clip_impl(request))
 
-                self.assertEqual(result["status"], "completed")
-                self.assertTrue(result["audio_proof"]["expected"])
-                self.assertTrue(result["audio_proof"]["verified"])
-                self.assertEqual(result["audio_proof"]["codec"], "aac")
-                self.assertGreaterEqual(result["audio_proof"]["channels"], 1)
-            finally:
-                if result:
-                    for suffix in ("", "_trimmed.mp4"):
-                        candidate = result.get("output_path") if not suffix else os.path.join(
-                            os.path.dirname(result["output_path"]),
-                            f"{result['job_id']}{suffix}",
-                        )
-                        if candidate and os.path.exists(candidate):
-                            os.remove(candidate)
+            self.assertEqual(result["status"], "completed")
+            self.assertTrue(result["audio_proof"]["expected"])
+            self.assertTrue(result["audio_proof"]["verified"])
+            self.assertEqual(result["audio_proof"]["codec"], "aac")
+            self.assertGreaterEqual(result["audio_proof"]["channels"], 1)
 
     def test_viral_render_materializes_remote_source_with_http_fallback_helper(self):
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -87,31 +76,27 @@ class ViralClipAudioTests(unittest.TestCase):
                 shutil.copy(source_path, local_path)
                 return local_path
 
-            result = None
-            try:
-                with (
-                    mock.patch.object(
-                        worker,
-                        "materialize_video_input",
-                        side_effect=fake_materialize,
-                    ) as materialize,
-                    mock.patch.object(
-                        worker,
-                        "upload_file_to_firebase",
-                        return_value="https://storage.example.com/viral.mp4",
-                    ),
-                ):
-                    result = asyncio.run(worker.render_viral_clip_impl(request))
+            with (
+                mock.patch.object(worker, "WORKER_TMP_DIR", temp_dir),
+                mock.patch.object(
+                    worker,
+                    "materialize_video_input",
+                    side_effect=fake_materialize,
+                ) as materialize,
+                mock.patch.object(
+                    worker,
+                    "upload_file_to_firebase",
+                    return_value="https://storage.example.com/viral.mp4",
+                ),
+            ):
+                result = asyncio.run(worker.render_viral_clip_impl(request))
 
-                self.assertEqual(result["status"], "completed")
-                materialize.assert_awaited_once_with(
-                    request.video_url,
-                    mock.ANY,
-                    keep_audio=True,
-                )
-            finally:
-                if result and result.get("output_path") and os.path.exists(result["output_path"]):
-                    os.remove(result["output_path"])
+            self.assertEqual(result["status"], "completed")
+            materialize.assert_awaited_once_with(
+                request.video_url,
+                mock.ANY,
+                keep_audio=True,
+            )
 
 
 if __name__ == "__main__":
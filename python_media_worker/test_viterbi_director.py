@@ -0,0 +1,55 @@
+import itertools
+import unittest
+
+import numpy as np
+
+import python_media_worker.main_media_server as worker
+from python_media_worker.local_director_audit_benchmark import build_episode
+from python_media_worker.viterbi_director import path_cost, solve_camera_path
+
+
+class ViterbiDirectorTests(unittest.TestCase):
+    def test_solver_matches_brute_force_with_young_shot_penalties(self):
+        rng = np.random.default_rng(3)
+        for _ in range(60):
+            windows = int(rng.integers(1, 7))
+            cameras = int(rng.integers(1, 4))
+            emissions = rng.uniform(-1.0, 1.0, size=(windows, cameras))
+            emissions[rng.uniform(size=emissions.shape) < 0.15] = np.inf
+            switch_cost = float(rng.uniform(0.0, 1.0))
+            min_shot = int(rng.integers(1, 5))
+            young_cost = float(rng.uniform(0.0, 2.0))
+
+            best = min(
+                path_cost(emissions, path, switch_cost, min_shot, young_cost)
+                for path in itertools.product(range(cameras), repeat=windows)
+            )
+            if not np.isfinite(best):
+                with self.assertRaises(ValueError):
+                    solve_camera_path(emissions, switch_cost, min_shot, young_cost)
+                continue
+            path, total = solve_camera_path(emissions, switch_cost, min_shot, young_cost)
+            self.assertAlmostEqual(total, best)
+            self.assertAlmostEqual(path_cost(emissions, list(path), switch_cost, min_shot, young_cost), best)
+
+    def test_viterbi_mode_plan_passes_director_audits(self):
+        request, sources = build_episode(300.0, 3, 7)
+        request.directorMode = "viterbi"
+
+        segments = worker.build_multicam_segments_from_switches(request, sources, 0.0, 300.0)
+
+        self.assertEqual(worker.resolve_multicam_director_mode(request), "viterbi")
+        self.assertTrue(segments)
+        self.assertTrue(all(segment["layout_reason"].startswith("viterbi_") for segment in segments))
+        self.assertEqual(worker.audit_multicam_director_switch_latency(segments, sources)["status"], "passed")
+        self.assertEqual(worker.audit_multicam_director_active_speaker_truth(segments, sources)["status"], "passed")
+
+    def test_unknown_director_mode_falls_back_to_heuristic(self):
+        request, _sources = build_episode(10.0, 2, 1)
+        request.director_mode = "oracle"
+
+        self.assertEqual(worker.resolve_multicam_director_mode(request), "heuristic")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,232 @@
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import cv2
+import numpy as np
+
+from python_media_worker import media_frame_stream
+from python_media_worker import watermark_analysis as watermark
+
+
+def reference_region_score(frame, region):
+    x, y, region_w, region_h = region
+    roi = frame[y:y + region_h, x:x + region_w]
+    gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+    edges = cv2.Canny(cv2.GaussianBlur(gray, (3, 3), 0), 80, 160)
+    edge_density = cv2.countNonZero(edges) / float(edges.size or 1)
+    bright_density = float(np.mean(gray > 208))
+    return (edge_density * 0.55) + (bright_density * 0.30) + ((float(gray.std()) / 255.0) * 0.15)
+
+
+class WatermarkAnalysisTests(unittest.TestCase):
+    def test_integral_image_scores_match_per_crop_statistics(self):
+        frame = np.full((360, 640, 3), 40, dtype=np.uint8)
+        cv2.putText(frame, "LOGO", (20, 60), cv2.FONT_HERSHEY_SIMPLEX, 1.6, (255, 255, 255), 3)
+        regions = watermark.build_watermark_regions(640, 360)
+        rects = [rects[0] for rects in regions.values()]
+
+        statistics = watermark.WatermarkFrameStatistics(frame)
+        scores = statistics.score_regions(rects)
+
+        for rect, score in zip(rects, scores):
+            self.assertAlmostEqual(float(score), reference_region_score(frame, rect), delta=0.02)
+        self.assertGreater(scores[0], 0.1)
+        self.assertLess(max(scores[1:]), 0.01)
+
+    def test_regions_outside_the_frame_score_zero(self):
+        statistics = watermark.WatermarkFrameStatistics(np.full((90, 160, 3), 255, dtype=np.uint8))
+
+        scores = statistics.score_regions([(200, 10, 30, 30), (150, 80, 40, 40)])
+
+        self.assertEqual(scores[0], 0.0)
+        self.assertAlmostEqual(scores[1], 0.30)
+
+    def test_nearest_frame_cursor_assigns_each_sample_once(self):
+        cursor = watermark._NearestFrameCursor([0.1, 0.45, 0.55, 2.0, 9.0])
+        cursor.bind(2.0)
+
+        matched = {frame_time: cursor.take(frame_time) for frame_time in (0.0, 0.5, 1.0, 1.5, 2.0)}
+
+        self.assertEqual(matched[0.0], [0.1])
+        self.assertEqual(matched[0.5], [0.45, 0.55])
+        self.assertEqual(matched[2.0], [2.0])
+        self.assertEqual(cursor.pending[cursor.position:], [9.0])
+
+    def test_preview_indexes_match_previous_sheet_selection(self):
+        self.assertEqual(watermark.select_watermark_preview_indexes(4, 6), [0, 1, 2, 3])
+        self.assertEqual(watermark.select_watermark_preview_indexes(20, 6), [0, 3, 6, 9, 12, 15])
+        self.assertEqual(watermark.select_watermark_preview_indexes(0, 6), [])
+
+    def test_frame_stream_dimensions_are_even_and_never_upscale(self):
+        self.assertEqual(media_frame_stream.frame_stream_dimensions(1080, 1920, 960), (540, 960))
+        self.assertEqual(media_frame_stream.frame_stream_dimensions(321, 241, 960), (320, 240))
+
+    @unittest.skipUnless(shutil.which("ffmpeg"), "ffmpeg is required")
+    def test_single_pass_scores_schedule_previews_and_tracks_manual_region(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            video_path = str(Path(tmp) / "watermark.mp4")
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-nostdin",
+                    "-loglevel",
+                    "error",
+                    "-y",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "color=c=0x335577:size=360x640:rate=10",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "testsrc=size=64x40:rate=10",
+                    "-filter_complex",
+                    "[0:v][1:v]overlay=x='if(lt(t,3),12,W-w-12)':y='if(lt(t,3),12,H-h-46)'",
+                    "-t",
+                    "6",
+                    "-pix_fmt",
+                    "yuv420p",
+                    video_path,
+                ],
+                check=True,
+            )
+
+            result = watermark.run_watermark_analysis_pass(
+                video_path,
+                360,
+                640,
+                6.0,
+                window_seconds=3.0,
+                max_preview_frames=2,
+                manual_regions=[{"left": 3.0, "top": 1.5, "width": 18.0, "height": 6.5, "seed_time": 1.0}],
+            )
+
+        self.assertEqual(result["stream"]["status"], "active")
+        self.assertEqual([window["keys"] for window in result["windows"]], [("top_left",), ("bottom_right",)])
+        self.assertEqual(result["preview_sheet"].shape, (270, 960, 3))
+        positions = result["manual_positions"][0]
+        self.assertLessEqual(abs(positions[1.0][0] - 12), 2)
+        late_box = positions[max(positions)]
+        self.assertLessEqual(abs(late_box[0] - (360 - 64 - 12)), 3)
+        self.assertLessEqual(abs(late_box[1] - (640 - 40 - 46)), 3)
+
+
+@unittest.skipUnless(shutil.which("ffmpeg"), "ffmpeg is required")
+class WatermarkStreamScaleTests(unittest.TestCase):
+    """1080x1920 sources stream at 540x960, half the scale the gates were tuned on."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        background = cv2.GaussianBlur(
+            cv2.resize(
+                np.random.default_rng(7).integers(0, 255, (120, 68, 3), dtype=np.uint8),
+                (1080, 1920),
+                interpolation=cv2.INTER_CUBIC,
+            ),
+            (0, 0),
+            6,
+        )
+        logo = np.full((80, 200, 3), 30, dtype=np.uint8)
+        cv2.putText(logo, "TikTok", (8, 58), cv2.FONT_HERSHEY_SIMPLEX, 1.6, (255, 255, 255), 3)
+        cls.background = background
+        cls.logo = logo
+        background_path = str(Path(cls.tmp.name) / "background.png")
+        logo_path = str(Path(cls.tmp.name) / "logo.png")
+        cv2.imwrite(background_path, background)
+        cv2.imwrite(logo_path, logo)
+        cls.video_path = str(Path(cls.tmp.name) / "portrait.mp4")
+        subprocess.run(
+            [
+                "ffmpeg",
+                "-nostdin",
+                "-loglevel",
+                "error",
+                "-y",
+                "-loop",
+                "1",
+                "-framerate",
+                "10",
+                "-i",
+                background_path,
+                "-loop",
+                "1",
+                "-framerate",
+                "10",
+                "-i",
+                logo_path,
+                "-filter_complex",
+                "[0:v][1:v]overlay=x='if(lt(t,4),30,830)':y='if(lt(t,4),40,1740)'",
+                "-t",
+                "8",
+                "-c:v",
+                "libx264",
+                "-preset",
+                "ultrafast",
+                "-crf",
+                "12",
+                "-pix_fmt",
+                "yuv420p",
+                cls.video_path,
+            ],
+            check=True,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_stream_scores_stay_on_the_full_resolution_scale(self):
+        result = watermark.run_watermark_analysis_pass(self.video_path, 1080, 1920, 8.0, window_seconds=4.0)
+
+        self.assertEqual((result["stream"]["width"], result["stream"]["height"]), (540, 960))
+        self.assertEqual([window["keys"] for window in result["windows"]], [("top_left",), ("bottom_right",)])
+        frame = self.background.copy()
+        frame[40:120, 30:230] = self.logo
+        regions = watermark.build_watermark_regions(1080, 1920)
+        full_scores = watermark.WatermarkFrameStatistics(frame).score_regions([rects[0] for rects in regions.values()])
+        for key, full_score in zip(regions, full_scores):
+            self.assertAlmostEqual(result["windows"][0]["scores"][key], float(full_score), delta=0.015)
+
+    def test_late_seed_tracks_backwards_with_a_bounded_buffer(self):
+        region = {"left": 830 / 10.8, "top": 1740 / 19.2, "width": 200 / 10.8, "height": 80 / 19.2, "seed_time": 6.3}
+        consumer = watermark.ManualRegionTrackingConsumer(1080, 1920, 8.0, region, max_pending_frames=2)
+
+        media_frame_stream.run_shared_frame_pass(self.video_path, [consumer], 1080, 1920, duration=8.0, max_long_edge=960)
+        self.assertEqual(len(consumer.pending_before_seed), 0)
+        self.assertGreater(len(consumer.unbuffered_before_seed), 2)
+        positions = consumer.resolve_unbuffered_before_seed(self.video_path, max_long_edge=960)
+
+        self.assertEqual(set(positions), set(consumer.needed_times))
+        for time_value, (x, y, _w, _h) in positions.items():
+            expected = (30, 40) if time_value < 4.0 else (830, 1740)
+            self.assertLessEqual(abs(x - expected[0]), 3, time_value)
+            self.assertLessEqual(abs(y - expected[1]), 3, time_value)
+
+    def test_target_time_tracking_decodes_only_the_sampled_span(self):
+        region = {"left": 830 / 10.8, "top": 1740 / 19.2, "width": 200 / 10.8, "height": 80 / 19.2, "seed_time": 6.3}
+        with mock.patch.object(
+            watermark, "run_shared_frame_pass", wraps=watermark.run_shared_frame_pass
+        ) as frame_pass:
+            positions = watermark.track_manual_region_positions(
+                self.video_path, 1080, 1920, 8.0, region, target_time=7.5
+            )
+
+        start_time = frame_pass.call_args.kwargs["start_time"]
+        duration = frame_pass.call_args.kwargs["duration"]
+        self.assertGreater(start_time, 5.5)
+        self.assertLessEqual(start_time, 6.3)
+        self.assertGreaterEqual(start_time + duration, 7.5)
+        self.assertLess(duration, 2.5)
+        self.assertEqual(set(positions), {6.3, 7.2, 7.5})
+        for x, y, _w, _h in positions.values():
+            self.assertLessEqual(abs(x - 830), 3)
+            self.assertLessEqual(abs(y - 1740), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from python_media_worker import whisper_model_manager as manager_module
+from python_media_worker.whisper_model_manager import WhisperModelManager
+
+
+def fixed_estimate(model_name, compute_type=None):
+    return {"tiny": 100.0, "base": 200.0, "small": 400.0}[model_name]
+
+
+class WhisperModelManagerTests(unittest.TestCase):
+    def setUp(self):
+        # Keep memory accounting on the estimate table, independent of host RSS.
+        patcher = mock.patch.object(manager_module, "read_process_rss_mb", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_concurrent_requests_load_a_model_once(self):
+        manager = WhisperModelManager(estimate_memory_mb=fixed_estimate)
+        loads = []
+
+        def loader():
+            loads.append(threading.current_thread().name)
+            time.sleep(0.05)
+            return object()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(manager.get("small", loader, model_name="small")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(loads), 1)
+        self.assertEqual(len({id(result) for result in results}), 1)
+        snapshot = manager.snapshot()
+        self.assertEqual(snapshot["models"][0]["hits"], 3)
+        self.assertEqual(snapshot["models"][0]["memory_source"], "estimate")
+
+    def test_least_recently_used_models_are_evicted_over_budget(self):
+        manager = WhisperModelManager(memory_limit_mb=650, estimate_memory_mb=fixed_estimate)
+        manager.get("tiny", object, model_name="tiny")
+        manager.get("base", object, model_name="base")
+        manager.get("tiny", object, model_name="tiny")
+        manager.get("small", object, model_name="small")
+
+        snapshot = manager.snapshot()
+        self.assertEqual([model["key"] for model in snapshot["models"]], ["tiny", "small"])
+        self.assertEqual(snapshot["resident_memory_mb"], 500.0)
+        self.assertEqual(snapshot["evictions"], 1)
+
+    def test_failed_load_lets_the_next_caller_retry(self):
+        manager = WhisperModelManager(estimate_memory_mb=fixed_estimate)
+
+        def broken_loader():
+            raise ValueError("unsupported compute type")
+
+        with self.assertRaises(ValueError):
+            manager.get("base", broken_loader, model_name="base")
+        self.assertIsNotNone(manager.get("base", object, model_name="base"))
+        self.assertEqual(manager.snapshot()["loading"], [])
+
+    def test_preload_stays_within_budget_and_reports_readiness(self):
+        manager = WhisperModelManager(memory_limit_mb=500, estimate_memory_mb=fixed_estimate)
+        jobs = [
+            ("small", "small", None, lambda: manager.get("small", object, model_name="small")),
+            ("base", "base", None, lambda: manager.get("base", object, model_name="base")),
+            ("tiny", "tiny", None, lambda: manager.get("tiny", object, model_name="tiny")),
+        ]
+
+        manager.preload_in_background(jobs).join(timeout=5)
+
+        preload = manager.snapshot()["preload"]
+        self.assertEqual(preload["status"], "ready")
+        self.assertEqual(preload["ready"], ["small", "tiny"])
+        self.assertEqual(preload["skipped"], ["base"])
+
+    def test_int8_estimates_are_halved(self):
+        self.assertEqual(manager_module.estimate_whisper_model_memory_mb("small", "int8"), 350.0)
+        self.assertEqual(manager_module.estimate_whisper_model_memory_mb("large-v3"), 3600.0)
+
+    def test_memory_limit_comes_from_the_shared_cgroup_reader(self):
+        with tempfile.TemporaryDirectory() as root:
+            Path(root, "memory.max").write_text(str(6 * 1024 ** 3))
+            self.assertEqual(manager_module.read_cgroup_memory_limit_mb(root), 6144.0)
+            Path(root, "memory.max").write_text("max\n")
+            self.assertIsNone(manager_module.read_cgroup_memory_limit_mb(root))
+
+
+class WorkerWhisperPreloadTests(unittest.TestCase):
+    def test_auto_preload_resolves_configured_models_and_health_reports_pool(self):
+        import python_media_worker.main_media_server as worker
+
+        with mock.patch.dict(
+            os.environ,
+            {"WHISPER_PRELOAD_MODELS": "auto", "MULTICAM_CAPTION_WHISPER_MODEL": "medium", "PROMO_WHISPER_MODEL": "base", "WHISPER_MODEL": "small"},
+        ), mock.patch.object(worker, "get_transcription_engine", return_value="openai"):
+            self.assertEqual(worker.get_whisper_preload_model_names(), ["medium", "small", "base"])
+        with mock.patch.dict(os.environ, {"WHISPER_PRELOAD_MODELS": "base, tiny ,base"}):
+            self.assertEqual(worker.get_whisper_preload_model_names(), ["base", "tiny"])
+        with mock.patch.dict(os.environ, {"WHISPER_PRELOAD_MODELS": "none"}):
+            self.assertIsNone(worker.start_whisper_model_preload())
+
+        self.assertIn("preload", worker.health_check()["whisperModels"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""Persistent Whisper transcript cache keyed by decoded-audio content.
+
+The same upload is typically transcribed several times (Smart Promo analysis,
+viral render, captions).  Each transcript is stored under a key built from a
+SHA-256 of the decoded 16 kHz mono PCM (so remuxes and container changes of
+the same audio share entries) plus the settings that change Whisper's output:
+engine, model, task, language, prompt and whether word timestamps were
+requested.
+
+Lookups allow partial reuse where the cached result is a superset of the
+request:
+
+* a word-timestamp run satisfies a request without word timestamps;
+* an auto-detect run satisfies an explicit-language request when the detected
+  language matches.
+
+A ``translate`` result never satisfies ``transcribe`` (or vice versa).
+
+Storage is pluggable: callers pass ``read_entry(key)`` / ``write_entry(key,
+entry)`` callables so the worker can layer disk and Firestore without this
+module importing either.
+"""
+
+import hashlib
+import json
+import logging
+import subprocess
+import time
+
+
+logger = logging.getLogger("MediaWorker")
+
+TRANSCRIPT_CACHE_VERSION = 1
+TRANSCRIPT_FINGERPRINT_SAMPLE_RATE = 16000
+
+_fingerprint_memo = {}
+
+
+def fingerprint_transcription_audio(input_path, sample_rate=TRANSCRIPT_FINGERPRINT_SAMPLE_RATE, file_identity=None):
+    """SHA-256 of ``input_path``'s first audio stream decoded to mono s16le.
+
+    Returns ``None`` when the file has no decodable audio.  ``file_identity``
+    (e.g. path/size/mtime) memoizes the hash for the life of the process.
+    """
+    if file_identity is not None and file_identity in _fingerprint_memo:
+        return _fingerprint_memo[file_identity]
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        input_path,
+        "-map",
+        "0:a:0",
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        str(int(sample_rate)),
+        "-f",
+        "s16le",
+        "-",
+    ]
+    digest = hashlib.sha256()
+    byte_count = 0
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        for block in iter(lambda: process.stdout.read(1024 * 1024), b""):
+            digest.update(block)
+            byte_count += len(block)
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+    if returncode != 0 or byte_count == 0:
+        return None
+    fingerprint = digest.hexdigest()
+    if file_identity is not None:
+        _fingerprint_memo[file_identity] = fingerprint
+    return fingerprint
+
+
+def build_transcript_cache_variant(*, engine, model_name, task=None, language=None, word_timestamps=False, prompt=""):
+    return {
+        "engine": str(engine or "default"),
+        "model_name": str(model_name or "default").strip().lower(),
+        "task": str(task or "transcribe").strip().lower(),
+        "language": (str(language).strip().lower() or None) if language else None,
+        "word_timestamps": bool(word_timestamps),
+        "prompt_sha256": hashlib.sha256(str(prompt or "").encode("utf-8")).hexdigest()[:16],
+    }
+
+
+def transcript_cache_key(audio_fingerprint, variant):
+    payload = json.dumps(
+        {"version": TRANSCRIPT_CACHE_VERSION, "audio": audio_fingerprint, **variant},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:40]
+
+
+def transcript_cache_candidates(variant):
+    """Variants that can satisfy ``variant``, best first, with a required detected language."""
+    word_options = [variant["word_timestamps"]] + ([True] if not variant["word_timestamps"] else [])
+    candidates = [({**variant, "word_timestamps": words}, None) for words in word_options]
+    if variant["language"]:
+        candidates.extend(
+            ({**variant, "language": None, "word_timestamps": words}, variant["language"])
+            for words in word_options
+        )
+    return candidates
+
+
+def adapt_cached_transcript(transcript, word_timestamps):
+    """Shape a cached result like a fresh run with ``word_timestamps``."""
+    adapted = dict(transcript or {})
+    if not word_timestamps:
+        adapted["segments"] = [{**segment, "words": []} for segment in adapted.get("segments") or []]
+    return adapted
+
+
+def lookup_cached_transcript(audio_fingerprint, variant, read_entry, max_age_seconds=None):
+    """Return ``(transcript, cache_receipt)`` for the best reusable entry, else ``(None, None)``."""
+    if not audio_fingerprint:
+        return None, None
+    now = time.time()
+    for candidate, required_language in transcript_cache_candidates(variant):
+        key = transcript_cache_key(audio_fingerprint, candidate)
+        try:
+            entry, source = read_entry(key)
+        except Exception as exc:
+            logger.debug("Transcript cache read failed for %s: %s", key, exc)
+            continue
+        if not isinstance(entry, dict) or not isinstance(entry.get("transcript"), dict):
+            continue
+        if max_age_seconds is not None and now - float(entry.get("created_at") or 0.0) > float(max_age_seconds):
+            continue
+        transcript = entry["transcript"]
+        if required_language and str(transcript.get("language") or "").lower() != required_language:
+            continue
+        return adapt_cached_transcript(transcript, variant["word_timestamps"]), {
+            "hit": True,
+            "key": key,
+            "source": source,
+            "exact": candidate == variant,
+            "satisfied_by": candidate,
+        }
+    return None, None
+
+
+def build_transcript_cache_entry(audio_fingerprint, variant, transcript):
+    return {
+        "version": TRANSCRIPT_CACHE_VERSION,
+        "audio_fingerprint": audio_fingerprint,
+        "variant": variant,
+        "created_at": time.time(),
+        "transcript": transcript,
+    }
@@ -0,0 +1,104 @@
+"""Global min-cost camera path for the auto director.
+
+The heuristic director walks the timeline once and then patches its switch
+list (smoothing, accent caps, owner reconciliation) before the repair passes
+fix what the patches broke.  This module instead chooses the camera for every
+analysis window at once: a Viterbi pass over ``windows x cameras`` finds the
+path with the lowest total of
+
+* per-window emission costs (low where a camera should be on screen, ``inf``
+  where it must not be), plus
+* ``switch_cost`` for every cut, plus
+* ``young_shot_cost`` scaled by how far short of ``min_shot_windows`` a shot
+  is when the path cuts away from it.
+
+To price short shots the state is ``(camera, shot age)``, with age capped at
+``min_shot_windows - 1``, so one step costs O(cameras x (cameras + ages)).
+The work inside a step is vectorized over states.
+"""
+
+import numpy as np
+
+
+def young_shot_penalties(min_shot_windows, young_shot_cost):
+    """Cost of cutting away from a shot that has been on screen ``age + 1`` windows."""
+    ages = max(1, int(min_shot_windows))
+    shown = np.arange(1, ages + 1, dtype=np.float64)
+    return float(young_shot_cost) * np.clip(1.0 - (shown / ages), 0.0, 1.0)
+
+
+def path_cost(emission_costs, path, switch_cost, min_shot_windows=1, young_shot_cost=0.0):
+    """Total cost of ``path`` under the same model the solver minimizes."""
+    emission_costs = np.asarray(emission_costs, dtype=np.float64)
+    penalties = young_shot_penalties(min_shot_windows, young_shot_cost)
+    total = 0.0
+    age = 0
+    for window, camera in enumerate(path):
+        if window and camera != path[window - 1]:
+            total += float(switch_cost) + penalties[min(age, penalties.size - 1)]
+            age = 0
+        elif window:
+            age += 1
+        total += float(emission_costs[window, camera])
+    return total
+
+
+def solve_camera_path(emission_costs, switch_cost, min_shot_windows=1, young_shot_cost=0.0):
+    """Camera index per window on the min-cost path, and that path's cost.
+
+    ``emission_costs`` is ``[windows, cameras]``.  A window whose costs are all
+    ``inf`` makes every path infeasible; callers relax such windows first.
+    """
+    emissions = np.asarray(emission_costs, dtype=np.float64)
+    window_count, camera_count = emissions.shape
+    if window_count == 0 or camera_count == 0:
+        return np.zeros(0, dtype=np.int64), 0.0
+
+    penalties = young_shot_penalties(min_shot_windows, young_shot_cost)
+    ages = penalties.size
+    cameras = np.arange(camera_count)
+    # Flat state index is camera * ages + age.
+    stay_from = (cameras[:, None] * ages) + np.maximum(np.arange(ages) - 1, 0)[None, :]
+    back = np.zeros((window_count, camera_count, ages), dtype=np.int32)
+
+    costs = np.full((camera_count, ages), np.inf)
+    costs[:, 0] = emissions[0]
+    for window in range(1, window_count):
+        leave = costs + penalties[None, :]
+        leave_age = np.argmin(leave, axis=1)
+        leave_cost = leave[cameras, leave_age]
+
+        next_costs = np.full((camera_count, ages), np.inf)
+        pointers = np.zeros((camera_count, ages), dtype=np.int32)
+        if ages > 1:
+            next_costs[:, 1:] = costs[:, :-1]
+            pointers[:, 1:] = stay_from[:, 1:]
+            # The capped age absorbs both the previous cap and the age just below it.
+            keep_capped = costs[:, -1] <= costs[:, -2]
+            next_costs[:, -1] = np.where(keep_capped, costs[:, -1], costs[:, -2])
+            pointers[:, -1] = np.where(keep_capped, cameras * ages + ages - 1, cameras * ages + ages - 2)
+        else:
+            next_costs[:, 0] = costs[:, 0]
+            pointers[:, 0] = cameras * ages
+
+        if camera_count > 1:
+            order = np.argsort(leave_cost, kind="stable")
+            best, runner_up = order[0], order[1]
+            source = np.where(cameras == best, runner_up, best)
+            switch_in = leave_cost[source] + float(switch_cost)
+            take_switch = switch_in < next_costs[:, 0]
+            next_costs[:, 0] = np.where(take_switch, switch_in, next_costs[:, 0])
+            pointers[:, 0] = np.where(take_switch, source * ages + leave_age[source], pointers[:, 0])
+
+        costs = next_costs + emissions[window][:, None]
+        back[window] = pointers
+
+    state = int(np.argmin(costs))
+    total = float(costs.flat[state])
+    path = np.zeros(window_count, dtype=np.int64)
+    for window in range(window_count - 1, -1, -1):
+        path[window] = state // ages
+        state = int(back[window].flat[state]) if window else state
+    if not np.isfinite(total):
+        raise ValueError("No feasible camera path")
+    return path, total
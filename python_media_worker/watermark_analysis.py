@@ -0,0 +1,980 @@
+"""Watermark region detection, preview sheets, and manual-region tracking.
+
+Everything here runs on one ``media_frame_stream`` pass: the source is decoded
+once at low resolution and the schedule scorer, the preview-sheet collector,
+and any manual-region trackers all consume the same frames.  Region
+statistics come from per-frame integral images (summed-area tables) of the
+edge map, the bright-pixel mask, and gray/gray-squared values, so every
+candidate region is scored with four lookups per table instead of re-running
+blur/Canny/threshold on each crop.
+
+Coordinates in and out of this module are always in source pixels; the
+stream scale is applied internally.
+"""
+
+import collections
+import logging
+import math
+import os
+
+import cv2
+import numpy as np
+
+try:
+    from .media_frame_stream import resolve_frame_stream_fps, run_shared_frame_pass
+except ImportError:
+    from media_frame_stream import resolve_frame_stream_fps, run_shared_frame_pass
+
+
+logger = logging.getLogger("MediaWorker")
+
+WATERMARK_ANALYSIS_DEFAULT_MAX_LONG_EDGE = 960
+# TM_CCOEFF_NORMED is normalized per window, so this holds at the stream
+# scale too: at 960 px true matches still score ~1.0 and logo-free frames
+# stay in the same 0.25-0.35 band they did at full resolution.
+WATERMARK_TRACKING_MATCH_THRESHOLD = 0.18
+WATERMARK_TRACKING_DEFAULT_MAX_PENDING_FRAMES = 48
+
+
+def clamp_float(value, minimum, maximum):
+    try:
+        numeric_value = float(value)
+    except Exception:
+        numeric_value = minimum
+    return max(minimum, min(maximum, numeric_value))
+
+
+def get_watermark_analysis_max_long_edge():
+    return max(
+        240,
+        int(
+            os.getenv("WATERMARK_ANALYSIS_MAX_LONG_EDGE", str(WATERMARK_ANALYSIS_DEFAULT_MAX_LONG_EDGE))
+            or WATERMARK_ANALYSIS_DEFAULT_MAX_LONG_EDGE
+        ),
+    )
+
+
+def get_watermark_tracking_max_pending_frames():
+    return max(
+        1,
+        int(
+            os.getenv("WATERMARK_TRACKING_MAX_PENDING_FRAMES", str(WATERMARK_TRACKING_DEFAULT_MAX_PENDING_FRAMES))
+            or WATERMARK_TRACKING_DEFAULT_MAX_PENDING_FRAMES
+        ),
+    )
+
+
+def build_watermark_regions(width, height):
+    width = max(int(width or 1080), 320)
+    height = max(int(height or 1920), 320)
+
+    margin_x = max(18, int(width * 0.018))
+    top_margin = max(18, int(height * 0.018))
+    bottom_margin = max(68, int(height * 0.052))
+    logo_w = max(88, int(width * 0.16))
+    logo_h = max(54, int(height * 0.06))
+    username_w = max(124, int(width * 0.22))
+    username_h = max(44, int(height * 0.046))
+    username_gap = max(8, int(width * 0.012))
+    bottom_y = max(top_margin, height - username_h - bottom_margin)
+    bottom_right_x = max(margin_x, width - username_w - margin_x)
+    icon_bottom_y = max(top_margin, bottom_y - max(10, int(height * 0.01)))
+    icon_right_x = max(margin_x, width - logo_w - margin_x)
+
+    return {
+        "top_left": [
+            (margin_x, top_margin, logo_w, logo_h),
+        ],
+        "top_right": [
+            (max(margin_x, width - logo_w - margin_x), top_margin, logo_w, logo_h),
+        ],
+        "bottom_left": [
+            (margin_x, icon_bottom_y, logo_w, logo_h),
+            (margin_x + logo_w - max(4, int(width * 0.006)), bottom_y, username_w, username_h),
+        ],
+        "bottom_right": [
+            (icon_right_x, icon_bottom_y, logo_w, logo_h),
+            (bottom_right_x - logo_w - username_gap + max(4, int(width * 0.006)), bottom_y, username_w, username_h),
+        ],
+    }
+
+
+def get_default_watermark_keys(sample_index):
+    return ("top_left", "bottom_right") if sample_index % 2 == 0 else ("top_right", "bottom_left")
+
+
+def build_window_sample_times(start_time, end_time, samples_per_window):
+    sample_count = max(1, int(samples_per_window or 1))
+    duration = max(0.05, float(end_time) - float(start_time))
+    if sample_count == 1:
+        return [start_time + (duration / 2.0)]
+
+    step = duration / float(sample_count + 1)
+    return [start_time + (step * (index + 1)) for index in range(sample_count)]
+
+
+def choose_watermark_keys(scores, sample_index, previous_keys=None):
+    default_keys = get_default_watermark_keys(sample_index)
+    top_left_score = scores.get("top_left", 0.0)
+    top_right_score = scores.get("top_right", 0.0)
+    bottom_left_score = scores.get("bottom_left", 0.0)
+    bottom_right_score = scores.get("bottom_right", 0.0)
+
+    top_choice = "top_left" if top_left_score >= top_right_score else "top_right"
+    bottom_choice = "bottom_left" if bottom_left_score >= bottom_right_score else "bottom_right"
+
+    selected_keys = []
+    top_gap = abs(top_left_score - top_right_score)
+    bottom_gap = abs(bottom_left_score - bottom_right_score)
+    top_gate = max(0.022, ((top_left_score + top_right_score) / 2.0) + 0.008)
+    bottom_gate = max(0.022, ((bottom_left_score + bottom_right_score) / 2.0) + 0.008)
+
+    if top_gap < 0.012 and previous_keys:
+        previous_top = next((key for key in previous_keys if key.startswith("top_")), None)
+        if previous_top:
+            top_choice = previous_top
+    if bottom_gap < 0.012 and previous_keys:
+        previous_bottom = next((key for key in previous_keys if key.startswith("bottom_")), None)
+        if previous_bottom:
+            bottom_choice = previous_bottom
+
+    if scores.get(top_choice, 0.0) >= top_gate:
+        selected_keys.append(top_choice)
+    if scores.get(bottom_choice, 0.0) >= bottom_gate:
+        selected_keys.append(bottom_choice)
+
+    if not selected_keys:
+        selected_keys = list(default_keys)
+
+    return tuple(dict.fromkeys(selected_keys))
+
+
+def collapse_watermark_windows(windows):
+    collapsed = []
+    for window in windows:
+        if collapsed and collapsed[-1]["keys"] == window["keys"]:
+            previous = collapsed[-1]
+            collapsed[-1] = {
+                **window,
+                "start": previous["start"],
+                "sample_times": previous.get("sample_times", []) + window.get("sample_times", []),
+            }
+        else:
+            collapsed.append(window)
+    return collapsed
+
+
+def clamp_delogo_region(width, height, x, y, region_w, region_h):
+    safe_width = max(int(width or 1080), 32)
+    safe_height = max(int(height or 1920), 32)
+
+    x = int(x)
+    y = int(y)
+    region_w = int(region_w)
+    region_h = int(region_h)
+
+    x = max(1, min(safe_width - 2, x))
+    y = max(1, min(safe_height - 2, y))
+    region_w = max(1, min(safe_width - x - 1, region_w))
+    region_h = max(1, min(safe_height - y - 1, region_h))
+    return x, y, region_w, region_h
+
+
+def read_video_frame_at_time(capture, time_seconds):
+    capture.set(cv2.CAP_PROP_POS_MSEC, max(0.0, float(time_seconds or 0.0)) * 1000.0)
+    success, frame = capture.read()
+    if not success or frame is None:
+        return None
+    return frame
+
+
+def build_tracking_candidate_windows(width, height, region_w, region_h, previous_box=None, seed_box=None):
+    windows = []
+
+    def add_window(x, y, window_w, window_h):
+        x = max(0, min(width - 2, int(x)))
+        y = max(0, min(height - 2, int(y)))
+        window_w = max(region_w + 2, min(width - x, int(window_w)))
+        window_h = max(region_h + 2, min(height - y, int(window_h)))
+        key = (x, y, window_w, window_h)
+        if window_w > region_w and window_h > region_h and key not in windows:
+            windows.append(key)
+
+    def add_local_windows(box, padding_scale_x=2.6, padding_scale_y=2.4):
+        if not box:
+            return
+        box_x, box_y, box_w, box_h = box
+        pad_x = max(40, int(box_w * padding_scale_x), int(width * 0.08))
+        pad_y = max(32, int(box_h * padding_scale_y), int(height * 0.07))
+        add_window(box_x - pad_x, box_y - pad_y, box_w + (pad_x * 2), box_h + (pad_y * 2))
+
+        mirrored_x = max(0, width - box_x - box_w)
+        add_window(mirrored_x - pad_x, box_y - pad_y, box_w + (pad_x * 2), box_h + (pad_y * 2))
+
+    add_local_windows(previous_box)
+    add_local_windows(seed_box, padding_scale_x=3.0, padding_scale_y=2.8)
+
+    corner_w = max(region_w + max(72, int(width * 0.18)), int(width * 0.34))
+    corner_h = max(region_h + max(60, int(height * 0.12)), int(height * 0.24))
+    add_window(0, 0, corner_w, corner_h)
+    add_window(width - corner_w, 0, corner_w, corner_h)
+    add_window(0, height - corner_h, corner_w, corner_h)
+    add_window(width - corner_w, height - corner_h, corner_w, corner_h)
+    add_window(0, max(0, int(height * 0.42)), max(region_w + 80, int(width * 0.42)), max(region_h + 80, int(height * 0.24)))
+    add_window(max(0, int(width * 0.58)), max(0, int(height * 0.42)), max(region_w + 80, int(width * 0.42)), max(region_h + 80, int(height * 0.24)))
+    return windows
+
+
+def locate_template_in_frame(frame, template_gray, width, height, region_w, region_h, previous_box=None, seed_box=None):
+    if frame is None or template_gray is None or template_gray.size == 0:
+        return None
+
+    frame_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    candidate_windows = build_tracking_candidate_windows(width, height, region_w, region_h, previous_box, seed_box)
+    best_match = None
+
+    for window_x, window_y, window_w, window_h in candidate_windows:
+        roi = frame_gray[window_y:window_y + window_h, window_x:window_x + window_w]
+        if roi is None or roi.size == 0:
+            continue
+        if roi.shape[0] <= template_gray.shape[0] or roi.shape[1] <= template_gray.shape[1]:
+            continue
+
+        result = cv2.matchTemplate(roi, template_gray, cv2.TM_CCOEFF_NORMED)
+        _, score, _, max_loc = cv2.minMaxLoc(result)
+        candidate = (
+            window_x + int(max_loc[0]),
+            window_y + int(max_loc[1]),
+            region_w,
+            region_h,
+            float(score),
+        )
+        if best_match is None or candidate[4] > best_match[4]:
+            best_match = candidate
+
+    return best_match
+
+
+def build_manual_tracking_times(seed_time, duration, sample_interval, target_time=None):
+    safe_duration = max(0.0, float(duration or 0.0))
+    safe_seed = clamp_float(seed_time, 0.0, safe_duration if safe_duration > 0 else 0.0)
+    safe_interval = clamp_float(sample_interval, 0.35, 2.0)
+
+    if target_time is not None:
+        safe_target = clamp_float(target_time, 0.0, safe_duration if safe_duration > 0 else 0.0)
+        times = {round(safe_seed, 3), round(safe_target, 3)}
+        if safe_target >= safe_seed:
+            current_time = safe_seed
+            while current_time < safe_target:
+                times.add(round(current_time, 3))
+                current_time += safe_interval
+        else:
+            current_time = safe_seed
+            while current_time > safe_target:
+                times.add(round(current_time, 3))
+                current_time -= safe_interval
+        return sorted(times)
+
+    times = {0.0, round(safe_seed, 3), round(safe_duration, 3)}
+    current_time = 0.0
+    while current_time < safe_duration:
+        times.add(round(current_time, 3))
+        current_time += safe_interval
+    times.add(round(safe_duration, 3))
+    return sorted(times)
+
+
+class WatermarkFrameStatistics:
+    """Integral images for O(1) watermark scoring of any rectangle in a frame.
+
+    ``stream_scale`` is the stream-to-source linear scale.  Canny edges are one
+    pixel wide at any resolution, so a logo's edge pixels shrink linearly with
+    the frame while region areas shrink quadratically and edge density grows
+    roughly as ``1 / stream_scale``.  Multiplying it back keeps scores on the
+    full-resolution scale the ``choose_watermark_keys`` gates were tuned on.
+    """
+
+    def __init__(self, frame, stream_scale=1.0):
+        self.stream_scale = max(1e-3, min(1.0, float(stream_scale or 1.0)))
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        blurred = cv2.GaussianBlur(gray, (3, 3), 0)
+        edges = cv2.Canny(blurred, 80, 160)
+        self.height, self.width = gray.shape[:2]
+        self.edge_integral = cv2.integral((edges > 0).astype(np.uint8), sdepth=cv2.CV_32S)
+        self.bright_integral = cv2.integral((gray > 208).astype(np.uint8), sdepth=cv2.CV_32S)
+        self.gray_integral, self.gray_square_integral = cv2.integral2(
+            gray,
+            sdepth=cv2.CV_64F,
+            sqdepth=cv2.CV_64F,
+        )
+
+    @staticmethod
+    def _box_sums(integral, x0, y0, x1, y1):
+        return (
+            integral[y1, x1].astype(np.float64)
+            - integral[y0, x1]
+            - integral[y1, x0]
+            + integral[y0, x0]
+        )
+
+    def score_regions(self, regions):
+        """Score ``[N, 4]`` ``(x, y, w, h)`` regions at once; returns an ``[N]`` array.
+
+        Regions are clipped to the frame like NumPy slicing would clip them;
+        a region with no pixels left scores 0.
+        """
+        rects = np.asarray(regions, dtype=np.int64).reshape((-1, 4))
+        if rects.size == 0:
+            return np.zeros(0, dtype=np.float64)
+        x0 = np.clip(rects[:, 0], 0, self.width)
+        y0 = np.clip(rects[:, 1], 0, self.height)
+        x1 = np.clip(rects[:, 0] + rects[:, 2], 0, self.width)
+        y1 = np.clip(rects[:, 1] + rects[:, 3], 0, self.height)
+        x1 = np.maximum(x0, x1)
+        y1 = np.maximum(y0, y1)
+        area = ((x1 - x0) * (y1 - y0)).astype(np.float64)
+        safe_area = np.maximum(area, 1.0)
+
+        edge_density = self._box_sums(self.edge_integral, x0, y0, x1, y1) / safe_area * self.stream_scale
+        bright_density = self._box_sums(self.bright_integral, x0, y0, x1, y1) / safe_area
+        mean = self._box_sums(self.gray_integral, x0, y0, x1, y1) / safe_area
+        mean_square = self._box_sums(self.gray_square_integral, x0, y0, x1, y1) / safe_area
+        contrast_score = np.sqrt(np.maximum(0.0, mean_square - (mean ** 2))) / 255.0
+        scores = (edge_density * 0.55) + (bright_density * 0.30) + (contrast_score * 0.15)
+        return np.where(area > 0.0, scores, 0.0)
+
+    def score_region(self, region):
+        return float(self.score_regions([region])[0])
+
+
+def score_watermark_region(frame, region):
+    if frame is None or getattr(frame, "size", 0) == 0:
+        return 0.0
+    return WatermarkFrameStatistics(frame).score_region(region)
+
+
+def scale_watermark_rect(rect, scale_x, scale_y):
+    x, y, region_w, region_h = rect
+    return (
+        int(round(x * scale_x)),
+        int(round(y * scale_y)),
+        max(1, int(round(region_w * scale_x))),
+        max(1, int(round(region_h * scale_y))),
+    )
+
+
+def plan_watermark_windows(duration, window_seconds=2.4, samples_per_window=3):
+    """Return the ``(start, end, sample_times)`` windows the schedule scorer samples."""
+    safe_duration = max(0.0, float(duration or 0.0))
+    clamped_window = clamp_float(window_seconds, 1.2, 5.0)
+    clamped_samples = max(1, min(5, int(samples_per_window or 3)))
+    windows = []
+    current_start = 0.0
+    while current_start < safe_duration:
+        current_end = min(safe_duration, current_start + clamped_window)
+        windows.append(
+            (current_start, current_end, build_window_sample_times(current_start, current_end, clamped_samples))
+        )
+        current_start = current_end
+    return windows
+
+
+def select_watermark_preview_indexes(window_count, max_preview_frames=6):
+    if window_count <= 0:
+        return []
+    target_count = max(1, min(int(max_preview_frames or 6), window_count))
+    if window_count <= target_count:
+        return list(range(window_count))
+    step = max(1, window_count // target_count)
+    return list(range(0, window_count, step))[:target_count]
+
+
+class _NearestFrameCursor:
+    """Match sorted sample times to the nearest frame of a fixed-rate stream."""
+
+    def __init__(self, sample_times):
+        self.pending = sorted(set(float(value) for value in sample_times))
+        self.position = 0
+        self.half_period = 0.5
+
+    def bind(self, fps):
+        self.half_period = 0.5 / max(0.05, float(fps or 1.0))
+
+    def take(self, frame_time):
+        matched = []
+        while (
+            self.position < len(self.pending)
+            and self.pending[self.position] < frame_time + self.half_period - 1e-9
+        ):
+            matched.append(self.pending[self.position])
+            self.position += 1
+        return matched
+
+
+def annotate_watermark_preview_frame(frame, regions, window, scale_x=1.0, scale_y=1.0):
+    annotated = frame.copy()
+    text_scale = max(0.45, min(1.0, (scale_x + scale_y) / 2.0))
+    for key, rects in regions.items():
+        color = (64, 64, 64)
+        thickness = 1
+        if key in window["keys"]:
+            color = (0, 220, 255) if key.startswith("top_") else (0, 255, 120)
+            thickness = max(1, int(round(3 * text_scale)))
+        for rect in rects:
+            x, y, region_w, region_h = scale_watermark_rect(rect, scale_x, scale_y)
+            cv2.rectangle(annotated, (x, y), (x + region_w, y + region_h), color, thickness)
+
+    cv2.putText(
+        annotated,
+        f"{window['start']:.1f}s-{window['end']:.1f}s | {', '.join(window['keys'])}",
+        (int(24 * text_scale), int(36 * text_scale)),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        0.82 * text_scale,
+        (255, 255, 255),
+        max(1, int(round(2 * text_scale))),
+        cv2.LINE_AA,
+    )
+    cv2.putText(
+        annotated,
+        f"confidence={window.get('confidence', 0):.3f}",
+        (int(24 * text_scale), int(68 * text_scale)),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        0.68 * text_scale,
+        (240, 240, 240),
+        max(1, int(round(2 * text_scale))),
+        cv2.LINE_AA,
+    )
+    return cv2.resize(annotated, (480, 270))
+
+
+def assemble_watermark_preview_sheet(preview_tiles):
+    if not preview_tiles:
+        return None
+
+    preview_tiles = list(preview_tiles)
+    while len(preview_tiles) % 2 != 0:
+        preview_tiles.append(np.zeros_like(preview_tiles[0]))
+
+    rows = []
+    for index in range(0, len(preview_tiles), 2):
+        rows.append(cv2.hconcat(preview_tiles[index:index + 2]))
+
+    return cv2.vconcat(rows) if len(rows) > 1 else rows[0]
+
+
+class WatermarkScheduleConsumer:
+    """Frame-stream consumer that scores corner regions per window.
+
+    With ``max_preview_frames`` it also keeps the first sampled frame of the
+    preview windows and renders the annotated preview sheet in ``finish()``.
+    ``score_windows=False`` turns it into a preview-only collector for
+    already-analyzed windows.
+    """
+
+    def __init__(
+        self,
+        width,
+        height,
+        duration,
+        window_seconds=2.4,
+        samples_per_window=3,
+        max_preview_frames=0,
+        analyzed_windows=None,
+    ):
+        self.width = int(width)
+        self.height = int(height)
+        self.regions = build_watermark_regions(width, height)
+        self.region_keys = list(self.regions.keys())
+        self.score_windows = analyzed_windows is None
+        if self.score_windows:
+            self.planned_windows = plan_watermark_windows(duration, window_seconds, samples_per_window)
+        else:
+            self.planned_windows = [
+                (float(window["start"]), float(window["end"]), list(window.get("sample_times") or [window["start"]]))
+                for window in analyzed_windows
+            ]
+        self.analyzed_windows = analyzed_windows
+        self.aggregated_scores = [np.zeros(len(self.region_keys), dtype=np.float64) for _ in self.planned_windows]
+        self.captured_samples = [0] * len(self.planned_windows)
+        self.preview_indexes = (
+            select_watermark_preview_indexes(len(self.planned_windows), max_preview_frames)
+            if max_preview_frames
+            else []
+        )
+        self.preview_frames = {}
+        self.sample_owners = {}
+        for window_index, (_start, _end, sample_times) in enumerate(self.planned_windows):
+            sample_list = sample_times if self.score_windows else sample_times[:1]
+            for sample_time in sample_list:
+                self.sample_owners.setdefault(float(sample_time), []).append(window_index)
+        self.preview_sample_times = {
+            float(self.planned_windows[index][2][0]): index for index in self.preview_indexes
+        }
+        self.cursor = _NearestFrameCursor(self.sample_owners.keys())
+        samples_per_second = [
+            len(sample_times) / max(0.05, end - start) for start, end, sample_times in self.planned_windows
+        ]
+        self.sample_fps = min(8.0, 2.0 * max(samples_per_second)) if samples_per_second else 0.0
+        self.scale_x = 1.0
+        self.scale_y = 1.0
+        self.stream_scale = 1.0
+        self.stream_regions = None
+
+    def bind_stream(self, stream_width, stream_height, fps):
+        self.scale_x = float(stream_width) / float(max(1, self.width))
+        self.scale_y = float(stream_height) / float(max(1, self.height))
+        self.stream_scale = (self.scale_x + self.scale_y) / 2.0
+        # Only the first rect per corner is scored, matching the schedule's
+        # original logo-box heuristic; the username rects are delogo-only.
+        self.stream_regions = np.asarray(
+            [
+                scale_watermark_rect(self.regions[key][0], self.scale_x, self.scale_y)
+                if self.regions[key]
+                else (0, 0, 0, 0)
+                for key in self.region_keys
+            ],
+            dtype=np.int64,
+        )
+        self.cursor.bind(fps)
+
+    def consume(self, frame_time, frame):
+        matched_times = self.cursor.take(frame_time)
+        if not matched_times:
+            return
+        statistics = None
+        for sample_time in matched_times:
+            if self.score_windows:
+                if statistics is None:
+                    statistics = WatermarkFrameStatistics(frame, stream_scale=self.stream_scale)
+                    region_scores = statistics.score_regions(self.stream_regions)
+                for window_index in self.sample_owners.get(sample_time, []):
+                    self.aggregated_scores[window_index] += region_scores
+                    self.captured_samples[window_index] += 1
+            preview_index = self.preview_sample_times.get(sample_time)
+            if preview_index is not None and preview_index not in self.preview_frames:
+                self.preview_frames[preview_index] = frame.copy()
+
+    def _build_windows(self):
+        windows = []
+        previous_keys = None
+        for sample_index, (start, end, sample_times) in enumerate(self.planned_windows):
+            captured_samples = self.captured_samples[sample_index]
+            if captured_samples > 0:
+                averaged = self.aggregated_scores[sample_index] / float(captured_samples)
+                averaged_scores = {key: float(averaged[index]) for index, key in enumerate(self.region_keys)}
+                selected_keys = choose_watermark_keys(averaged_scores, sample_index, previous_keys)
+            else:
+                averaged_scores = {key: 0.0 for key in self.region_keys}
+                selected_keys = get_default_watermark_keys(sample_index)
+
+            sorted_scores = sorted(averaged_scores.values(), reverse=True)
+            confidence = round((sorted_scores[0] - sorted_scores[2]) if len(sorted_scores) >= 3 else sorted_scores[0], 4)
+            windows.append(
+                {
+                    "start": round(start, 3),
+                    "end": round(end, 3),
+                    "keys": tuple(selected_keys),
+                    "scores": {key: round(value, 4) for key, value in averaged_scores.items()},
+                    "sample_times": [round(value, 3) for value in sample_times],
+                    "captured_samples": captured_samples,
+                    "confidence": confidence,
+                }
+            )
+            previous_keys = tuple(selected_keys)
+        return windows
+
+    def finish(self):
+        windows = self._build_windows() if self.score_windows else list(self.analyzed_windows or [])
+        preview_tiles = [
+            annotate_watermark_preview_frame(
+                self.preview_frames[index],
+                self.regions,
+                windows[index],
+                self.scale_x,
+                self.scale_y,
+            )
+            for index in self.preview_indexes
+            if index in self.preview_frames and index < len(windows)
+        ]
+        return {
+            "windows": windows if self.score_windows else None,
+            "preview_sheet": assemble_watermark_preview_sheet(preview_tiles),
+        }
+
+
+def manual_region_seed_box(width, height, region):
+    left = max(0.0, min(100.0, float(region.get("left", 0.0))))
+    top = max(0.0, min(100.0, float(region.get("top", 0.0))))
+    region_w_pct = max(1.0, min(100.0, float(region.get("width", 0.0))))
+    region_h_pct = max(1.0, min(100.0, float(region.get("height", 0.0))))
+    seed_x = int((left / 100.0) * width)
+    seed_y = int((top / 100.0) * height)
+    seed_w = max(32, int((region_w_pct / 100.0) * width))
+    seed_h = max(24, int((region_h_pct / 100.0) * height))
+    return clamp_delogo_region(width, height, seed_x, seed_y, seed_w, seed_h)
+
+
+class ManualRegionTrackingConsumer:
+    """Frame-stream consumer that template-tracks one manual watermark box.
+
+    Frames after the seed are matched as they stream past.  Sampled frames
+    before the seed are held as grayscale stream frames until the seed frame
+    supplies the template, then tracked backwards.  At most
+    ``max_pending_frames`` are held (the ones nearest the seed); earlier
+    samples are only remembered by time and tracked afterwards by
+    ``resolve_unbuffered_before_seed`` with seeked decodes of the lead-in.
+    """
+
+    def __init__(
+        self,
+        width,
+        height,
+        duration,
+        region,
+        target_time=None,
+        sample_interval=0.9,
+        max_pending_frames=None,
+    ):
+        safe_duration = max(0.0, float(duration or 0.0))
+        self.width = int(width)
+        self.height = int(height)
+        self.seed_time = clamp_float(region.get("seed_time", 0.0), 0.0, safe_duration if safe_duration > 0 else 0.0)
+        self.seed_key = round(self.seed_time, 3)
+        self.seed_box = manual_region_seed_box(width, height, region)
+        self.times = build_manual_tracking_times(self.seed_time, safe_duration, sample_interval, target_time)
+        self.needed_times = sorted(set(self.times) | {self.seed_key})
+        self.cursor = _NearestFrameCursor(self.needed_times)
+        self.sample_fps = 2.0 / clamp_float(sample_interval, 0.35, 2.0)
+        self.stream_fps = self.sample_fps
+        self.scale_x = 1.0
+        self.scale_y = 1.0
+        self.template_gray = None
+        self.seed_failed = False
+        self.max_pending_frames = max(
+            1,
+            int(max_pending_frames if max_pending_frames is not None else get_watermark_tracking_max_pending_frames()),
+        )
+        self.pending_before_seed = collections.deque(maxlen=self.max_pending_frames)
+        self.unbuffered_before_seed = []
+        self.backward_box = self.seed_box
+        self.forward_box = self.seed_box
+        self.positions = {self.seed_key: self.seed_box}
+
+    def bind_stream(self, stream_width, stream_height, fps):
+        self.scale_x = float(stream_width) / float(max(1, self.width))
+        self.scale_y = float(stream_height) / float(max(1, self.height))
+        self.stream_fps = float(fps)
+        self.cursor.bind(fps)
+
+    def _track(self, frame_gray, previous_box):
+        box_w, box_h = self.seed_box[2], self.seed_box[3]
+        best_match = locate_template_in_stream_frame(
+            frame_gray,
+            self.template_gray,
+            self.width,
+            self.height,
+            box_w,
+            box_h,
+            self.scale_x,
+            self.scale_y,
+            previous_box=previous_box,
+            seed_box=self.seed_box,
+        )
+        if best_match and best_match[4] >= WATERMARK_TRACKING_MATCH_THRESHOLD:
+            return clamp_delogo_region(self.width, self.height, best_match[0], best_match[1], box_w, box_h)
+        return previous_box
+
+    def _track_backwards(self, pending_frames):
+        for pending_time, pending_gray in reversed(pending_frames):
+            self.backward_box = self._track(pending_gray, self.backward_box)
+            self.positions[pending_time] = self.backward_box
+
+    def consume(self, frame_time, frame):
+        matched_times = self.cursor.take(frame_time)
+        if not matched_times or self.seed_failed:
+            return
+        frame_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        for time_value in matched_times:
+            if self.template_gray is None and time_value < self.seed_key:
+                if len(self.pending_before_seed) == self.max_pending_frames:
+                    self.unbuffered_before_seed.append(self.pending_before_seed[0][0])
+                self.pending_before_seed.append((time_value, frame_gray))
+            elif time_value == self.seed_key:
+                x, y, box_w, box_h = scale_watermark_rect(self.seed_box, self.scale_x, self.scale_y)
+                template = frame_gray[y:y + box_h, x:x + box_w]
+                if template is None or template.size == 0:
+                    self.seed_failed = True
+                    return
+                self.template_gray = template.copy()
+                self._track_backwards(self.pending_before_seed)
+                self.pending_before_seed.clear()
+            elif self.template_gray is not None:
+                self.forward_box = self._track(frame_gray, self.forward_box)
+                self.positions[time_value] = self.forward_box
+
+    def finish(self):
+        if self.template_gray is None or self.seed_failed:
+            return {time_value: self.seed_box for time_value in self.times}
+        # Samples past the last decoded frame keep the last tracked box, the
+        # same as an unreadable frame did with per-sample seeking.
+        for time_value in self.needed_times:
+            if time_value > self.seed_key and time_value not in self.positions:
+                self.positions[time_value] = self.forward_box
+        return dict(self.positions)
+
+    def resolve_unbuffered_before_seed(self, video_path, max_long_edge=None):
+        """Track the pre-seed samples that did not fit the pending buffer.
+
+        The lead-in is decoded again in buffer-sized blocks walking back from
+        the seed, each block a seeked ``run_shared_frame_pass`` of only its
+        own span, so memory stays at ``max_pending_frames`` frames however
+        late the seed is.  Returns the completed positions.
+        """
+        positions = self.finish()
+        if self.template_gray is None or self.seed_failed or not self.unbuffered_before_seed or not video_path:
+            return positions
+        remaining = sorted(self.unbuffered_before_seed)
+        self.unbuffered_before_seed = []
+        frame_period = 1.0 / max(0.05, self.stream_fps)
+        while remaining:
+            block = remaining[-self.max_pending_frames:]
+            remaining = remaining[:-self.max_pending_frames]
+            collector = _SampledGrayFrameCollector(block, self.stream_fps)
+            # Start on the forward pass's frame grid so every sample lands on
+            # the same frame it would have been buffered from.
+            block_start = math.floor(block[0] * self.stream_fps) * frame_period
+            results, _receipt = run_shared_frame_pass(
+                video_path,
+                [collector],
+                self.width,
+                self.height,
+                duration=(block[-1] - block_start) + frame_period,
+                start_time=block_start,
+                max_long_edge=max_long_edge,
+            )
+            collected = results[0]
+            self._track_backwards(collected)
+            # Samples the block decode could not reach keep the nearest
+            # tracked box, like samples past the end of the forward pass.
+            for time_value in block:
+                self.positions.setdefault(time_value, self.backward_box)
+        return dict(self.positions)
+
+
+class _SampledGrayFrameCollector:
+    """Keep the grayscale stream frames nearest to a few sample times."""
+
+    def __init__(self, sample_times, fps):
+        self.sample_fps = float(fps)
+        self.cursor = _NearestFrameCursor(sample_times)
+        self.frames = []
+
+    def bind_stream(self, stream_width, stream_height, fps):
+        self.cursor.bind(fps)
+
+    def consume(self, frame_time, frame):
+        matched_times = self.cursor.take(frame_time)
+        if matched_times:
+            frame_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            self.frames.extend((time_value, frame_gray) for time_value in matched_times)
+
+    def finish(self):
+        return self.frames
+
+
+def locate_template_in_stream_frame(
+    frame_gray,
+    template_gray,
+    width,
+    height,
+    region_w,
+    region_h,
+    scale_x,
+    scale_y,
+    previous_box=None,
+    seed_box=None,
+):
+    """``locate_template_in_frame`` for a downscaled gray frame.
+
+    Candidate windows are planned in source pixels, searched in stream
+    pixels, and the match is mapped back to source pixels.
+    """
+    if frame_gray is None or template_gray is None or template_gray.size == 0:
+        return None
+
+    candidate_windows = build_tracking_candidate_windows(width, height, region_w, region_h, previous_box, seed_box)
+    best_match = None
+    for window in candidate_windows:
+        window_x, window_y, window_w, window_h = scale_watermark_rect(window, scale_x, scale_y)
+        roi = frame_gray[window_y:window_y + window_h, window_x:window_x + window_w]
+        if roi is None or roi.size == 0:
+            continue
+        if roi.shape[0] <= template_gray.shape[0] or roi.shape[1] <= template_gray.shape[1]:
+            continue
+
+        result = cv2.matchTemplate(roi, template_gray, cv2.TM_CCOEFF_NORMED)
+        _, score, _, max_loc = cv2.minMaxLoc(result)
+        candidate = (
+            int(round((window_x + int(max_loc[0])) / max(scale_x, 1e-6))),
+            int(round((window_y + int(max_loc[1])) / max(scale_y, 1e-6))),
+            region_w,
+            region_h,
+            float(score),
+        )
+        if best_match is None or candidate[4] > best_match[4]:
+            best_match = candidate
+
+    return best_match
+
+
+def sampled_frame_pass_window(consumers):
+    """Return ``(start_time, duration)`` covering every consumer's sample times.
+
+    The start is snapped down to the stream's frame grid so each sample lands
+    on the same frame a decode from zero would give it.  A pass with no
+    samples returns ``(0.0, None)``.
+    """
+    active_consumers = [consumer for consumer in consumers if consumer is not None]
+    sample_times = [time_value for consumer in active_consumers for time_value in consumer.cursor.pending]
+    if not sample_times:
+        return 0.0, None
+    fps = resolve_frame_stream_fps(active_consumers)
+    frame_period = 1.0 / fps
+    start_time = max(0.0, math.floor(min(sample_times) * fps) * frame_period)
+    return start_time, (max(sample_times) - start_time) + frame_period
+
+
+def run_watermark_analysis_pass(
+    video_path,
+    width,
+    height,
+    duration,
+    window_seconds=2.4,
+    samples_per_window=3,
+    max_preview_frames=0,
+    manual_regions=None,
+    target_time=None,
+    include_schedule=True,
+):
+    """Score the corner schedule, build the preview sheet, and track manual
+    regions from a single decode of ``video_path``.
+
+    Returns ``{"windows", "preview_sheet", "manual_positions", "stream"}``;
+    ``manual_positions`` follows ``manual_regions`` order and is ``None`` for
+    regions that do not request tracking.
+    """
+    safe_duration = max(0.0, float(duration or 0.0))
+    schedule_consumer = None
+    if include_schedule and safe_duration > 0.0:
+        schedule_consumer = WatermarkScheduleConsumer(
+            width,
+            height,
+            safe_duration,
+            window_seconds=window_seconds,
+            samples_per_window=samples_per_window,
+            max_preview_frames=max_preview_frames,
+        )
+    tracking_consumers = []
+    for region in manual_regions or []:
+        if bool(region.get("track", True)):
+            tracking_consumers.append(
+                ManualRegionTrackingConsumer(width, height, safe_duration, region, target_time=target_time)
+            )
+        else:
+            tracking_consumers.append(None)
+
+    active_consumers = [schedule_consumer, *tracking_consumers]
+    # A target_time preview only samples between the seed and the target.
+    start_time, sampled_duration = sampled_frame_pass_window(active_consumers)
+    results, stream_receipt = run_shared_frame_pass(
+        video_path,
+        active_consumers,
+        width,
+        height,
+        duration=sampled_duration,
+        start_time=start_time,
+        max_long_edge=get_watermark_analysis_max_long_edge(),
+    )
+    results_by_consumer = {
+        id(consumer): result
+        for consumer, result in zip([consumer for consumer in active_consumers if consumer is not None], results)
+    }
+    for consumer in tracking_consumers:
+        if consumer is not None and consumer.unbuffered_before_seed:
+            results_by_consumer[id(consumer)] = consumer.resolve_unbuffered_before_seed(
+                video_path,
+                max_long_edge=get_watermark_analysis_max_long_edge(),
+            )
+    schedule_result = results_by_consumer.get(id(schedule_consumer)) if schedule_consumer else None
+    return {
+        "windows": (schedule_result or {}).get("windows") or [],
+        "preview_sheet": (schedule_result or {}).get("preview_sheet"),
+        "manual_positions": [
+            results_by_consumer.get(id(consumer)) if consumer is not None else None
+            for consumer in tracking_consumers
+        ],
+        "stream": stream_receipt,
+    }
+
+
+def analyze_dynamic_watermark_schedule(video_path, width, height, duration, mode, window_seconds=2.4, samples_per_window=3):
+    safe_duration = max(0.0, float(duration or 0.0))
+    if safe_duration <= 0 or not video_path:
+        return []
+    return run_watermark_analysis_pass(
+        video_path,
+        width,
+        height,
+        safe_duration,
+        window_seconds=window_seconds,
+        samples_per_window=samples_per_window,
+    )["windows"]
+
+
+def create_watermark_preview_sheet(video_path, width, height, analyzed_windows, max_preview_frames=6):
+    if not analyzed_windows or not video_path:
+        return None
+
+    consumer = WatermarkScheduleConsumer(
+        width,
+        height,
+        max(float(window["end"]) for window in analyzed_windows),
+        max_preview_frames=max_preview_frames,
+        analyzed_windows=analyzed_windows,
+    )
+    results, _receipt = run_shared_frame_pass(
+        video_path,
+        [consumer],
+        width,
+        height,
+        max_long_edge=get_watermark_analysis_max_long_edge(),
+    )
+    return results[0]["preview_sheet"]
+
+
+def track_manual_region_positions(video_path, width, height, duration, region, target_time=None, sample_interval=0.9):
+    safe_duration = max(0.0, float(duration or 0.0))
+    consumer = ManualRegionTrackingConsumer(
+        width,
+        height,
+        safe_duration,
+        region,
+        target_time=target_time,
+        sample_interval=sample_interval,
+    )
+    if len(consumer.times) <= 1 or not video_path:
+        return {consumer.times[0] if consumer.times else consumer.seed_key: consumer.seed_box}
+
+    start_time, sampled_duration = sampled_frame_pass_window([consumer])
+    results, _receipt = run_shared_frame_pass(
+        video_path,
+        [consumer],
+        width,
+        height,
+        duration=sampled_duration,
+        start_time=start_time,
+        max_long_edge=get_watermark_analysis_max_long_edge(),
+    )
+    if consumer.unbuffered_before_seed:
+        return consumer.resolve_unbuffered_before_seed(video_path, max_long_edge=get_watermark_analysis_max_long_edge())
+    return results[0]
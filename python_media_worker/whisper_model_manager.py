@@ -0,0 +1,214 @@
+"""Resident Whisper model pool with preloading and memory-aware LRU eviction.
+
+The worker can need several Whisper models at once (promo analysis on
+``base``, captions on their own model, everything else on ``small``), and
+each load costs seconds to tens of seconds.  ``WhisperModelManager`` keeps
+loaded models keyed by engine/device/compute type/name, loads each key at
+most once even under concurrent requests, and evicts the least recently
+used models when the resident total would exceed a memory budget.
+
+Memory per model is measured as the process RSS growth across the load,
+falling back to a size table when the measurement is unusable (another
+thread allocating at the same time, non-Linux hosts).  Evicted models are
+only dropped from the pool; callers still holding one keep it alive until
+they finish.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    from .resource_scheduler import CGROUP_ROOT, read_cgroup_resource_allocation
+except ImportError:
+    from resource_scheduler import CGROUP_ROOT, read_cgroup_resource_allocation
+
+
+logger = logging.getLogger("MediaWorker")
+
+# Approximate resident size in MB of a float32 load; int8 roughly halves it.
+WHISPER_MODEL_MEMORY_ESTIMATES_MB = {
+    "tiny": 150,
+    "base": 260,
+    "small": 700,
+    "medium": 1800,
+    "large": 3600,
+    "turbo": 1900,
+    "distil": 1700,
+}
+WHISPER_MODEL_DEFAULT_ESTIMATE_MB = 1000
+
+
+def estimate_whisper_model_memory_mb(model_name, compute_type=None):
+    name = str(model_name or "").strip().lower()
+    estimate = WHISPER_MODEL_DEFAULT_ESTIMATE_MB
+    for prefix in ("distil", "turbo", "large", "medium", "small", "base", "tiny"):
+        if prefix in name:
+            estimate = WHISPER_MODEL_MEMORY_ESTIMATES_MB[prefix]
+            break
+    if str(compute_type or "").startswith("int8"):
+        estimate *= 0.5
+    return float(estimate)
+
+
+def read_process_rss_mb():
+    try:
+        with open("/proc/self/status", "r", encoding="utf-8") as status_file:
+            for line in status_file:
+                if line.startswith("VmRSS:"):
+                    return float(line.split()[1]) / 1024.0
+    except Exception:
+        pass
+    return None
+
+
+def read_cgroup_memory_limit_mb(root=CGROUP_ROOT):
+    _allocated_vcpu, memory_limit_bytes = read_cgroup_resource_allocation(root)
+    if memory_limit_bytes is None:
+        return None
+    return memory_limit_bytes / (1024.0 * 1024.0)
+
+
+class WhisperModelManager:
+    def __init__(self, memory_limit_mb=None, estimate_memory_mb=estimate_whisper_model_memory_mb):
+        self.memory_limit_mb = float(memory_limit_mb) if memory_limit_mb else None
+        self.estimate_memory_mb = estimate_memory_mb
+        self._lock = threading.Lock()
+        self._models = OrderedDict()
+        self._entries = {}
+        self._loading = {}
+        self._evictions = 0
+        self._preload = {"status": "idle", "requested": [], "ready": [], "skipped": [], "failed": []}
+
+    def resident_memory_mb(self):
+        with self._lock:
+            return sum(self._entries[key]["memory_mb"] for key in self._models)
+
+    def peek(self, key):
+        with self._lock:
+            return self._models.get(key)
+
+    def get(self, key, loader, *, model_name=None, compute_type=None):
+        """Return the model for ``key``, calling ``loader()`` once if it is not resident."""
+        while True:
+            with self._lock:
+                if key in self._models:
+                    self._models.move_to_end(key)
+                    entry = self._entries[key]
+                    entry["hits"] += 1
+                    entry["last_used_at"] = time.time()
+                    return self._models[key]
+                pending = self._loading.get(key)
+                if pending is None:
+                    pending = threading.Event()
+                    self._loading[key] = pending
+                    break
+            # Another thread is loading this key; wait and re-check.
+            pending.wait()
+
+        try:
+            rss_before = read_process_rss_mb()
+            started_at = time.perf_counter()
+            model = loader()
+            load_seconds = time.perf_counter() - started_at
+            rss_after = read_process_rss_mb()
+            estimate = self.estimate_memory_mb(model_name, compute_type)
+            measured = (rss_after - rss_before) if rss_before is not None and rss_after is not None else None
+            use_measured = measured is not None and estimate * 0.25 <= measured <= estimate * 4.0
+            memory_mb = measured if use_measured else estimate
+            with self._lock:
+                self._models[key] = model
+                self._entries[key] = {
+                    "model_name": model_name,
+                    "compute_type": compute_type,
+                    "memory_mb": round(float(memory_mb), 1),
+                    "memory_source": "measured" if use_measured else "estimate",
+                    "load_seconds": round(load_seconds, 3),
+                    "loaded_at": time.time(),
+                    "last_used_at": time.time(),
+                    "hits": 0,
+                }
+                evicted = self._evict_locked(keep=key)
+            logger.info(
+                "Whisper model %s loaded in %.1fs (~%.0f MB resident)%s",
+                key,
+                load_seconds,
+                memory_mb,
+                f"; evicted {', '.join(evicted)}" if evicted else "",
+            )
+            return model
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            pending.set()
+
+    def _evict_locked(self, keep=None):
+        if not self.memory_limit_mb:
+            return []
+        evicted = []
+        total = sum(self._entries[key]["memory_mb"] for key in self._models)
+        for key in list(self._models):
+            if total <= self.memory_limit_mb:
+                break
+            if key == keep:
+                continue
+            total -= self._entries[key]["memory_mb"]
+            del self._models[key]
+            self._entries.pop(key, None)
+            self._evictions += 1
+            evicted.append(key)
+        return evicted
+
+    def preload(self, jobs):
+        """Run ``[(label, model_name, compute_type, fetch), ...]`` in order within the memory budget.
+
+        ``fetch()`` is the normal model getter, so preloaded models land under
+        the same keys requests use.  Preloading never evicts: a model that
+        would not fit next to the ones already resident is skipped and loads
+        lazily on first use instead.
+        """
+        with self._lock:
+            self._preload = {
+                "status": "loading",
+                "requested": [job[0] for job in jobs],
+                "ready": [],
+                "skipped": [],
+                "failed": [],
+                "started_at": time.time(),
+            }
+        for label, model_name, compute_type, fetch in jobs:
+            estimate = self.estimate_memory_mb(model_name, compute_type)
+            if self.memory_limit_mb and self.resident_memory_mb() + estimate > self.memory_limit_mb:
+                with self._lock:
+                    self._preload["skipped"].append(label)
+                continue
+            try:
+                if fetch() is None:
+                    raise RuntimeError("model getter returned nothing")
+                with self._lock:
+                    self._preload["ready"].append(label)
+            except Exception as exc:
+                logger.warning("Whisper model preload failed for %s: %s", label, exc)
+                with self._lock:
+                    self._preload["failed"].append({"model": label, "error": str(exc)[-300:]})
+        with self._lock:
+            self._preload["status"] = "failed" if self._preload["failed"] and not self._preload["ready"] else "ready"
+            self._preload["completed_at"] = time.time()
+
+    def preload_in_background(self, jobs):
+        thread = threading.Thread(target=self.preload, args=(list(jobs),), name="whisper-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def snapshot(self):
+        with self._lock:
+            models = [{"key": key, **self._entries[key]} for key in self._models]
+            return {
+                "memory_limit_mb": self.memory_limit_mb,
+                "resident_memory_mb": round(sum(model["memory_mb"] for model in models), 1),
+                "evictions": self._evictions,
+                "loading": sorted(self._loading),
+                "models": models,
+                "preload": dict(self._preload),
+            }